@@ -0,0 +1,97 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Benchmark for the Confluence post-processing of YOLOv1 bounding boxes.
+
+Times TensorflowBoundingBoxesYOLOV1Confluence.confluence on a batch of one image
+with clusters of overlapping boxes of a single class, for an increasing number of
+boxes. Every box scores above the pre-algorithm threshold, so all of them go
+through the Confluence algorithm.
+
+Usage:
+
+    python benchmarks/confluence.py [--boxes N [N ...]] [--repeat N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import numpy.typing as npt
+
+from dioptra.sdk.object_detection.bounding_boxes.postprocessing import (
+    TensorflowBoundingBoxesYOLOV1Confluence,
+)
+
+DEFAULT_BOXES: list[int] = [100, 250, 500, 1000, 2000]
+
+
+def _make_inputs(
+    num_boxes: int, seed: int = 0
+) -> tuple[npt.NDArray, npt.NDArray, npt.NDArray]:
+    """Return boxes, scores, and labels shaped like a batch of one image."""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0.0, 1.0, size=(num_boxes // 8 + 1, 2))
+    box_centers = centers[rng.integers(0, len(centers), size=num_boxes)]
+    box_centers += rng.normal(0.0, 0.02, size=(num_boxes, 2))
+    box_sizes = rng.uniform(0.05, 0.3, size=(num_boxes, 2))
+
+    boxes = np.concatenate(
+        [box_centers - box_sizes / 2, box_centers + box_sizes / 2], axis=1
+    )
+    scores = rng.uniform(0.05, 1.0, size=num_boxes)
+    labels = np.zeros(num_boxes)
+
+    return (
+        boxes[None].astype("float32"),
+        scores[None].astype("float32"),
+        labels[None].astype("int32"),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--boxes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_BOXES,
+        help="Numbers of boxes to time.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of timed runs per size."
+    )
+    args = parser.parse_args()
+
+    confluence = TensorflowBoundingBoxesYOLOV1Confluence.on_grid_shape((7, 7))
+
+    for num_boxes in args.boxes:
+        boxes, scores, labels = _make_inputs(num_boxes)
+        timings = []
+
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            *_, detections = confluence.confluence(boxes, scores, labels)
+            timings.append(time.perf_counter() - start)
+
+        print(
+            f"{num_boxes:>6} boxes: {min(timings):8.3f} s, "
+            f"{int(detections[0]):>5} retained"
+        )
+
+
+if __name__ == "__main__":
+    main()
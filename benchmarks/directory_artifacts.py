@@ -0,0 +1,107 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Benchmark for packing and unpacking directory artifacts.
+
+Compares the time DirectoryArtifactTask takes to serialize and deserialize a
+directory of checkpoint-like files, and the size of the archive it writes:
+
+- gzip: a tar archive compressed with gzip, the default
+- zstd: a tar archive compressed with multi-threaded zstd
+- indexed: a zip archive that is read in place, without extraction
+
+For the indexed archive, the deserialize time includes reading a single member.
+The zstd case is skipped if the zstandard package is not installed.
+
+Usage:
+
+    PYTHONPATH=extra/plugins python benchmarks/directory_artifacts.py \
+        [--files N] [--file-size MB]
+"""
+
+import argparse
+import importlib.util
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from artifacts.tasks import DirectoryArtifactTask
+
+CASES: dict[str, dict[str, Any]] = {
+    "gzip": {"tarball_write_mode": "w:gz"},
+    "zstd": {"tarball_write_mode": "w:zst"},
+    "indexed": {"indexed": True},
+}
+
+
+def _create_directory(path: Path, num_files: int, file_size: int) -> None:
+    """Create files that are half random bytes and half zeros, like model weights."""
+    path.mkdir()
+
+    for index in range(num_files):
+        contents = os.urandom(file_size // 2) + bytes(file_size - file_size // 2)
+        (path / f"shard_{index:03d}.bin").write_bytes(contents)
+
+
+def _run_case(work_dir: Path, name: str, args: dict[str, Any]) -> tuple[float, ...]:
+    """Return the serialize time, deserialize time, and archive size in MB."""
+    start = time.perf_counter()
+    archive = DirectoryArtifactTask.serialize(work_dir, name, "checkpoint", **args)
+    serialize_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = DirectoryArtifactTask.deserialize(work_dir / name, archive.as_posix())
+
+    if not isinstance(result, Path):
+        (result / "shard_000.bin").read_bytes()
+
+    deserialize_seconds = time.perf_counter() - start
+
+    return serialize_seconds, deserialize_seconds, archive.stat().st_size / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--files", type=int, default=16, help="Number of files in the directory."
+    )
+    parser.add_argument(
+        "--file-size", type=int, default=16, help="Size of each file in MB."
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        work_dir = Path(tmp_dir)
+        _create_directory(work_dir / "checkpoint", args.files, args.file_size * 2**20)
+
+        for name, case_args in CASES.items():
+            if name == "zstd" and importlib.util.find_spec("zstandard") is None:
+                print(f"{name:>10}: skipped, zstandard is not installed")
+                continue
+
+            serialize, deserialize, size = _run_case(work_dir, name, case_args)
+            print(
+                f"{name:>10}: {serialize:8.2f} s serialize, "
+                f"{deserialize:8.2f} s deserialize, {size:10.1f} MB"
+            )
+            shutil.rmtree(work_dir / name, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Micro-benchmark for parsing the REST API search query language.
+
+Compares the time to parse a set of representative search strings:
+
+- uncached: the pyparsing grammar on every call
+- packrat: the pyparsing grammar with packrat memoization enabled
+- cached: parse_search_text(), which caches parse results by search text
+
+Usage:
+
+    python benchmarks/search_parser.py [--number N]
+"""
+
+import argparse
+import timeit
+
+import pyparsing as pp
+
+from dioptra.restapi.v1.shared import search_parser
+
+SEARCH_TEXTS = [
+    "tensorflow",
+    "name:tensorflow*",
+    "*queue*, name:tensorflow*",
+    "description:*mnist*,tag:cv",
+    "name:'trial_??', description:\"search all for this\"",
+    '"hello world", tag:gpu?, status:finished, search all for this',
+]
+
+
+def _time_per_call(fn, number: int) -> float:
+    """Return the mean time per call of fn over all search texts in microseconds."""
+
+    def run() -> None:
+        for search_text in SEARCH_TEXTS:
+            fn(search_text)
+
+    # warm up so that the cached case measures cache hits
+    run()
+    return timeit.timeit(run, number=number) / (number * len(SEARCH_TEXTS)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--number", type=int, default=1000, help="Iterations over the search texts."
+    )
+    args = parser.parse_args()
+
+    results = {
+        "uncached": _time_per_call(search_parser._parse_search_text, args.number),
+        "cached": _time_per_call(search_parser.parse_search_text, args.number),
+    }
+
+    pp.ParserElement.enable_packrat()
+    try:
+        results["packrat"] = _time_per_call(
+            search_parser._parse_search_text, args.number
+        )
+    finally:
+        pp.ParserElement.disable_memoization()
+
+    for name, microseconds in results.items():
+        print(f"{name:>10}: {microseconds:10.2f} us/parse")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,9 +14,12 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
+import json
 import pickle
 import tarfile
-from collections.abc import ByteString
+import zipfile
+from collections.abc import ByteString, Iterator
+from functools import partial
 from typing import Callable, Dict, Literal, Optional, Sequence
 
 import numpy as np
@@ -44,6 +47,10 @@ class UnsupportedDataFrameFileFormatError(Exception):
 class UnsupportedTarFileFormatError(Exception):
     """The tar file format was unexpected."""
 
+
+class NumpyArrayDirectoryError(Exception):
+    """The directory of NumPy arrays is missing its index."""
+
 # [example-artifact-task]
 class StringArtifactTask(ArtifactTaskInterface):
     @staticmethod
@@ -100,22 +107,138 @@ class FileArtifactTask(ArtifactTaskInterface):
         return None
 
 
+# The first four bytes of a zstd frame
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+TARBALL_WRITE_MODES = ["w", "w:", "w:gz", "x:bz2", "w:xz", "w:zst"]
+
+
+def _write_zstd_tarball(
+    tarball_path: Path, source_dir: Path, threads: int, level: int
+) -> None:
+    """Write a directory to a tar archive compressed with multi-threaded zstd.
+
+    Args:
+        tarball_path: The path of the archive to write.
+        source_dir: The directory to archive.
+        threads: The number of compression threads. A negative value uses all
+            logical CPUs.
+        level: The zstd compression level.
+    """
+    import zstandard
+
+    compressor = zstandard.ZstdCompressor(level=level, threads=threads)
+
+    with open(tarball_path, "wb") as f, compressor.stream_writer(f) as stream:
+        with tarfile.open(fileobj=stream, mode="w|") as tar:
+            tar.add(source_dir, arcname=source_dir.name)
+
+
+def _extract_zstd_tarball(tarball_path: Path, working_dir: Path) -> list[str]:
+    """Extract a tar archive compressed with zstd.
+
+    Args:
+        tarball_path: The path of the archive.
+        working_dir: The directory to extract the archive into.
+
+    Returns:
+        The names of the archive members.
+    """
+    import zstandard
+
+    decompressor = zstandard.ZstdDecompressor()
+
+    with open(tarball_path, "rb") as f, decompressor.stream_reader(f) as stream:
+        with tarfile.open(fileobj=stream, mode="r|") as tar:
+            tar.extractall(path=working_dir, filter="data")
+            return tar.getnames()
+
+
+def _write_indexed_archive(archive_path: Path, source_dir: Path, level: int) -> None:
+    """Write a directory to a zip archive, which indexes its members.
+
+    Args:
+        archive_path: The path of the archive to write.
+        source_dir: The directory to archive.
+        level: The deflate compression level, from 0 to 9.
+    """
+    with zipfile.ZipFile(
+        archive_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=level
+    ) as archive:
+        archive.write(source_dir, arcname=source_dir.name)
+
+        for path in sorted(source_dir.rglob("*")):
+            arcname = Path(source_dir.name, path.relative_to(source_dir))
+            archive.write(path, arcname=arcname)
+
+
 class DirectoryArtifactTask(ArtifactTaskInterface):
     @staticmethod
     def serialize(
         working_dir: Path,
         name: str,
         contents: str,
-        tarball_write_mode: Literal["w", "w:", "w:gz", "x:bz2", "w:xz"] = "w:gz",
+        tarball_write_mode: Literal[
+            "w", "w:", "w:gz", "x:bz2", "w:xz", "w:zst"
+        ] = "w:gz",
+        indexed: bool = False,
+        compression_threads: int = -1,
+        compression_level: int | None = None,
         **kwargs,
     ) -> Path:
+        """Serializes a directory as an artifact.
+
+        The directory is archived to a tar file, compressed according to
+        `tarball_write_mode`. The `w:zst` mode compresses the archive with zstd on
+        several threads, which is much faster than gzip for large directories such as
+        model checkpoints, and requires the :py:mod:`zstandard` package.
+
+        Setting `indexed` archives the directory to a zip file instead, which indexes
+        its members. Deserializing it does not extract the archive, but returns a
+        :py:class:`zipfile.Path` that reads each member from the archive on demand
+        and must be closed by the caller, see :py:meth:`deserialize`.
+
+        Args:
+            name: The name of the artifact to use for the archive.
+            contents: The path of the directory to archive, relative to
+                `working_dir`.
+            tarball_write_mode: The :py:func:`tarfile.open` mode to write the tar
+                archive with, or `w:zst` for zstd compression. Defaults to `w:gz`.
+            indexed: Whether to write an indexed zip archive. Defaults to False.
+            compression_threads: The number of zstd compression threads. Defaults to
+                -1, which uses all logical CPUs.
+            compression_level: The zstd or zip compression level. Defaults to None,
+                which uses level 3 for zstd and level 6 for zip.
+        """
         source_dir = working_dir / Path(contents)
 
-        tarball_path = working_dir / name
-        tarball_path = tarball_path.with_suffix(".tar")
+        if indexed:
+            archive_path = (working_dir / name).with_suffix(".zip")
+            _write_indexed_archive(
+                archive_path,
+                source_dir,
+                level=6 if compression_level is None else compression_level,
+            )
+            LOGGER.info(
+                "Directory added to indexed archive",
+                directory=source_dir,
+                archive_path=archive_path,
+            )
+            return archive_path
+
+        if tarball_write_mode == "w:zst":
+            tarball_path = (working_dir / name).with_suffix(".tar.zst")
+            _write_zstd_tarball(
+                tarball_path,
+                source_dir,
+                threads=compression_threads,
+                level=3 if compression_level is None else compression_level,
+            )
+
+        else:
+            tarball_path = (working_dir / name).with_suffix(".tar")
 
-        with tarfile.open(tarball_path, tarball_write_mode) as f:
-            f.add(source_dir, arcname=source_dir.name)
+            with tarfile.open(tarball_path, tarball_write_mode) as f:
+                f.add(source_dir, arcname=source_dir.name)
 
         LOGGER.info(
             "Directory added to tar archive",
@@ -125,17 +248,57 @@ class DirectoryArtifactTask(ArtifactTaskInterface):
         return tarball_path
 
     @staticmethod
-    def deserialize(working_dir: Path, path: str, **kwargs) -> Path:
+    def deserialize(working_dir: Path, path: str, **kwargs) -> Path | zipfile.Path:
+        """Deserializes a directory artifact.
+
+        A tar archive is extracted into `working_dir`. An indexed zip archive is not
+        extracted, and the returned :py:class:`zipfile.Path` keeps the archive open
+        to read its members. The caller owns the open archive and should close it
+        with ``path.root.close()`` once it is no longer needed, for example with
+        ``contextlib.closing(path.root)``.
+
+        Args:
+            working_dir: The directory the artifact was downloaded to.
+            path: The path of the archive, relative to `working_dir`.
+
+        Returns:
+            The path of the extracted directory, or a :py:class:`zipfile.Path` to
+            the directory in an indexed archive.
+        """
+        input = Path(working_dir, path)
+
+        # Indexed archives are read in place rather than extracted
+        if input.suffix == ".zip":
+            archive = zipfile.ZipFile(input)
+            names = archive.namelist()
+
+            if len(names) < 1:
+                archive.close()
+                raise UnsupportedTarFileFormatError(
+                    "Zip file must have at least one entry."
+                )
+
+            # The path takes ownership of the archive, see zipfile.Path.root
+            return zipfile.Path(archive, at=names[0].split("/")[0] + "/")
+
+        with open(input, "rb") as f:
+            magic = f.read(len(ZSTD_MAGIC))
+
         name: str
         try:
-            with tarfile.open(Path(working_dir, path), mode="r:*") as tar:
-                tar.extractall(path=working_dir, filter="data")
-                names = tar.getnames()
-                if len(names) < 1:
-                    raise UnsupportedTarFileFormatError(
-                        "Tar file must have at least one entry."
-                    )
-                name = names[0]
+            if magic == ZSTD_MAGIC:
+                names = _extract_zstd_tarball(input, working_dir)
+
+            else:
+                with tarfile.open(input, mode="r:*") as tar:
+                    tar.extractall(path=working_dir, filter="data")
+                    names = tar.getnames()
+
+            if len(names) < 1:
+                raise UnsupportedTarFileFormatError(
+                    "Tar file must have at least one entry."
+                )
+            name = names[0]
         except Exception as e:
             LOGGER.exception("Could not extract from tar file")
             raise e
@@ -144,7 +307,160 @@ class DirectoryArtifactTask(ArtifactTaskInterface):
 
     @staticmethod
     def validation() -> dict[str, Any]:
-        return {"tarball_write_mode": {"enum": ["w", "w:", "w:gz", "x:bz2", "w:xz"]}}
+        return {
+            "tarball_write_mode": {"enum": TARBALL_WRITE_MODES},
+            "indexed": {"type": "boolean"},
+            "compression_threads": {"type": "integer"},
+            "compression_level": {"type": "integer"},
+        }
+
+
+# The Arrow schema metadata key that marks a data frame to deserialize lazily
+ARROW_LAZY_METADATA_KEY = b"dioptra.lazy"
+ARROW_DEFAULT_CHUNK_SIZE = 65536
+DATAFRAME_FORMATS = [
+    "arrow",
+    "csv",
+    "csv.bz2",
+    "csv.gz",
+    "csv.xz",
+    "feather",
+    "json",
+    "pickle",
+    "parquet",
+]
+
+
+class ArrowDataFrameReader(object):
+    """A lazy reader for a data frame stored in the Arrow IPC file format.
+
+    The file is memory mapped each time it is read, so only the record batches and
+    columns that are requested are converted to a :py:class:`~pandas.DataFrame`.
+
+    Attributes:
+        path: The path of the Arrow IPC file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @property
+    def columns(self) -> list[str]:
+        """The names of the columns in the data frame."""
+        import pyarrow as pa
+
+        with pa.memory_map(str(self.path)) as source:
+            return pa.ipc.open_file(source).schema.names
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows in the data frame."""
+        import pyarrow as pa
+
+        with pa.memory_map(str(self.path)) as source:
+            reader = pa.ipc.open_file(source)
+            return sum(
+                reader.get_batch(index).num_rows
+                for index in range(reader.num_record_batches)
+            )
+
+    def iter_batches(
+        self, columns: Sequence[str] | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """Read the data frame one record batch at a time.
+
+        Args:
+            columns: The columns to read. Defaults to None, which reads all columns.
+
+        Yields:
+            A :py:class:`~pandas.DataFrame` for each record batch.
+        """
+        import pyarrow as pa
+
+        with pa.memory_map(str(self.path)) as source:
+            reader = pa.ipc.open_file(source)
+
+            for index in range(reader.num_record_batches):
+                batch = reader.get_batch(index)
+
+                if columns is not None:
+                    batch = batch.select(columns)
+
+                yield batch.to_pandas()
+
+    def read(self, columns: Sequence[str] | None = None) -> pd.DataFrame:
+        """Read the whole data frame.
+
+        Args:
+            columns: The columns to read. Defaults to None, which reads all columns.
+
+        Returns:
+            The data frame.
+        """
+        import pyarrow as pa
+
+        with pa.memory_map(str(self.path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+
+            if columns is not None:
+                table = table.select(columns)
+
+            return table.to_pandas()
+
+
+def _dataframe_to_arrow(
+    contents: pd.DataFrame,
+    path: Path,
+    chunk_size: int = ARROW_DEFAULT_CHUNK_SIZE,
+    lazy: bool = False,
+    **kwargs,
+) -> None:
+    """Write a data frame to an Arrow IPC file in record batches of chunk_size rows.
+
+    Args:
+        contents: The data frame to write.
+        path: The path of the Arrow IPC file.
+        chunk_size: The maximum number of rows in each record batch.
+        lazy: Whether to deserialize the data frame as an ArrowDataFrameReader.
+        kwargs: Additional keyword arguments to pass to
+            :py:meth:`pyarrow.Table.from_pandas`.
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(contents, **kwargs)
+
+    if lazy:
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), ARROW_LAZY_METADATA_KEY: b"true"}
+        )
+
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=chunk_size):
+                writer.write_batch(batch)
+
+
+def _arrow_to_dataframe(path: Path) -> pd.DataFrame | ArrowDataFrameReader:
+    """Read an Arrow IPC file written by _dataframe_to_arrow().
+
+    Args:
+        path: The path of the Arrow IPC file.
+
+    Returns:
+        An ArrowDataFrameReader if the data frame was serialized with `lazy`,
+        otherwise the data frame.
+    """
+    import pyarrow as pa
+
+    reader = ArrowDataFrameReader(path)
+
+    with pa.memory_map(str(path)) as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+
+    if metadata.get(ARROW_LAZY_METADATA_KEY) == b"true":
+        return reader
+
+    return reader.read()
 
 
 class DataframeArtifactTask(ArtifactTaskInterface):
@@ -153,15 +469,19 @@ class DataframeArtifactTask(ArtifactTaskInterface):
         working_dir: Path,
         name: str,
         contents: pd.DataFrame,
-        format: str = "json",
+        format: str = "arrow",
         **kwargs,
     ) -> Path:
         """Serializes a :py:class:`~pandas.DataFrame` as an artifact..
 
         The `format` argument selects the :py:class:`~pandas.DataFrame` serializer,
-        which are all handled using the object's `DataFrame.to_{format}` methods. The
-        string passed to `format` must match one of the following,
+        which are all handled using the object's `DataFrame.to_{format}` methods,
+        except for `arrow`. The string passed to `format` must match one of the
+        following,
 
+        - `arrow` - A binary Arrow IPC file, written in record batches. This is the
+          recommended format, as it is columnar, can be memory mapped, and can be
+          read one record batch or column at a time.
         - `csv[.bz2|.gz|.xz]` - A comma-separated values plain text file with optional
         compression.
         - `feather` - A binary feather file.
@@ -174,12 +494,16 @@ class DataframeArtifactTask(ArtifactTaskInterface):
             :py:class:`~pandas.DataFrame`.
             content: A :py:class:`~pandas.DataFrame` to be stored.
             format: The :py:class:`~pandas.DataFrame` file serialization format.
+                Defaults to `arrow`.
             kwargs: A dictionary of additional keyword arguments to pass to the
-                serializer.
+                serializer. The `arrow` format also accepts `chunk_size`, the maximum
+                number of rows in each record batch, and `lazy`, which deserializes
+                the artifact as an :py:class:`ArrowDataFrameReader` instead of a
+                :py:class:`~pandas.DataFrame`.
 
         Notes:
             The :py:mod:`pyarrow` package must be installed in order to serialize to the
-            feather format.
+            arrow and feather formats.
 
         See Also:
             - :py:meth:`pandas.DataFrame.to_csv`
@@ -190,6 +514,7 @@ class DataframeArtifactTask(ArtifactTaskInterface):
         """
         filepath: Path = working_dir / name
         format_funcs = {
+            "arrow": {"func": partial(_dataframe_to_arrow, contents), "ext": ".arrow"},
             "csv": {"func": contents.to_csv, "ext": ".csv"},
             "csv.bz2": {"func": contents.to_csv, "ext": ".csv.bz2"},
             "csv.gz": {"func": contents.to_csv, "ext": ".csv.gz"},
@@ -221,9 +546,12 @@ class DataframeArtifactTask(ArtifactTaskInterface):
         return df_artifact_path
 
     @staticmethod
-    def deserialize(working_dir: Path, path: str, **kwargs) -> pd.DataFrame:
+    def deserialize(
+        working_dir: Path, path: str, **kwargs
+    ) -> pd.DataFrame | ArrowDataFrameReader:
         input = working_dir / path
         format_funcs = {
+            ".arrow": {"func": _arrow_to_dataframe, "args": {}},
             ".csv": {"func": pd.read_csv, "args": {"index_col": 0}},
             ".bz2": {"func": pd.read_csv, "args": {"index_col": 0}},
             ".gz": {"func": pd.read_csv, "args": {"index_col": 0}},
@@ -248,26 +576,135 @@ class DataframeArtifactTask(ArtifactTaskInterface):
     @staticmethod
     def validation() -> dict[str, Any]:
         return {
-            "format": {
-                "enum": ["csv", "bz2", "gz", "xz", "feather", "json", "pkl", "parquet"]
-            }
+            "format": {"enum": DATAFRAME_FORMATS},
+            "chunk_size": {"type": "integer", "minimum": 1},
+            "lazy": {"type": "boolean"},
         }
 
 
+# The index file of a directory of .npy files, which records the array names in
+# order and the mode used to memory map the arrays when they are loaded
+NPY_DIRECTORY_INDEX = "index.json"
+NPY_DIRECTORY_SUFFIX = ".npydir"
+MMAP_MODES = ["r", "c"]
+
+
+def _save_npy_directory(
+    path: Path,
+    arrays: dict[str, np.ndarray],
+    mmap_mode: Literal["r", "c"],
+    **kwargs,
+) -> Path:
+    """Save arrays as an uncompressed directory of .npy files.
+
+    Unlike a .npz archive, each array in the directory can be memory mapped when it
+    is loaded, so steps that share a large array read it from the page cache instead
+    of each holding a copy in memory.
+
+    Args:
+        path: The path of the directory to create.
+        arrays: The arrays to save, keyed by name.
+        mmap_mode: The mode to memory map the arrays with when they are loaded, "r"
+            for read-only or "c" for copy-on-write.
+        kwargs: Additional keyword arguments to pass to :py:func:`numpy.save`.
+
+    Returns:
+        The path of the directory.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+
+    # The arrays are stored by position, as their names may not be valid file names
+    for index, contents in enumerate(arrays.values()):
+        np.save(path / f"arr_{index}.npy", contents, allow_pickle=False, **kwargs)
+
+    (path / NPY_DIRECTORY_INDEX).write_text(
+        json.dumps({"names": list(arrays), "mmap_mode": mmap_mode})
+    )
+    LOGGER.info(
+        "Arrays saved to directory",
+        directory=path,
+        num_arrays=len(arrays),
+        mmap_mode=mmap_mode,
+    )
+    return path
+
+
+def _load_npy_directory(path: Path, **kwargs) -> dict[str, np.ndarray]:
+    """Load the arrays in a directory of .npy files created by _save_npy_directory().
+
+    Args:
+        path: The path of the directory.
+        kwargs: Additional keyword arguments to pass to :py:func:`numpy.load`. A
+            `mmap_mode` argument overrides the mode recorded in the index.
+
+    Returns:
+        The arrays, keyed by name, in the order they were saved.
+    """
+    try:
+        index = json.loads((path / NPY_DIRECTORY_INDEX).read_text())
+
+    except FileNotFoundError as e:
+        LOGGER.exception("Array directory is missing its index", directory=path)
+        raise NumpyArrayDirectoryError(
+            f"{path} is missing {NPY_DIRECTORY_INDEX}"
+        ) from e
+
+    kwargs.setdefault("mmap_mode", index["mmap_mode"])
+    return {
+        name: np.load(path / f"arr_{position}.npy", **kwargs)
+        for position, name in enumerate(index["names"])
+    }
+
+
 class NumpyArrayArtifactTask(ArtifactTaskInterface):
     @staticmethod
-    def serialize(working_dir: Path, name: str, contents: np.ndarray, **kwargs) -> Path:
+    def serialize(
+        working_dir: Path,
+        name: str,
+        contents: np.ndarray,
+        mmap_mode: Literal["r", "c"] | None = None,
+        **kwargs,
+    ) -> Path:
+        """Serializes a :py:class:`~numpy.ndarray` as an artifact.
+
+        By default the array is saved to a .npy file and read fully into memory when
+        it is deserialized. Setting `mmap_mode` saves the array to a directory that
+        records the mode, and deserializing it returns a :py:class:`~numpy.memmap`,
+        which lets several steps share a large array without copying it.
+
+        Args:
+            name: The name of the artifact to use for the serialized array.
+            contents: The array to be stored.
+            mmap_mode: The mode to memory map the array with when it is deserialized,
+                "r" for read-only or "c" for copy-on-write. Defaults to None, which
+                loads the array into memory.
+            kwargs: A dictionary of additional keyword arguments to pass to
+                :py:func:`numpy.save`.
+        """
+        if mmap_mode is not None:
+            return _save_npy_directory(
+                (working_dir / name).with_suffix(NPY_DIRECTORY_SUFFIX),
+                {"arr_0": contents},
+                mmap_mode=mmap_mode,
+                **kwargs,
+            )
+
         path = (working_dir / name).with_suffix(".npy")
         np.save(path, contents, allow_pickle=False, **kwargs)
         return path
 
     @staticmethod
     def deserialize(working_dir: Path, path: str, **kwargs) -> np.ndarray:
-        return np.load(working_dir / path, **kwargs)
+        input = working_dir / path
+
+        if input.is_dir():
+            return next(iter(_load_npy_directory(input, **kwargs).values()))
+
+        return np.load(input, **kwargs)
 
     @staticmethod
     def validation() -> dict[str, Any] | None:
-        return None
+        return {"mmap_mode": {"enum": MMAP_MODES}}
 
 
 class NumpyArraysArtifactTask(ArtifactTaskInterface):
@@ -277,24 +714,60 @@ class NumpyArraysArtifactTask(ArtifactTaskInterface):
         name: str,
         contents: Sequence[np.ndarray],
         names: Sequence[str] | None = None,
+        mmap_mode: Literal["r", "c"] | None = None,
         **kwargs,
     ) -> Path:
-        path = (working_dir / name).with_suffix(".npy")
-        if names is not None and len(names) == len(contents):
-            np.savez(
-                path, **dict(list(zip(names, contents))), allow_pickle=False, **kwargs
+        """Serializes a sequence of :py:class:`~numpy.ndarray` as an artifact.
+
+        By default the arrays are saved to a .npz archive, which reads each array
+        fully into memory when it is accessed. Setting `mmap_mode` saves the arrays to
+        an uncompressed directory of .npy files instead, and deserializing it memory
+        maps each array with that mode.
+
+        Args:
+            name: The name of the artifact to use for the serialized arrays.
+            contents: The arrays to be stored.
+            names: The names of the arrays. Defaults to None, which names the arrays
+                `arr_0`, `arr_1`, and so on.
+            mmap_mode: The mode to memory map the arrays with when they are
+                deserialized, "r" for read-only or "c" for copy-on-write. Defaults to
+                None, which saves the arrays to a .npz archive.
+            kwargs: A dictionary of additional keyword arguments to pass to the
+                serializer.
+        """
+        if names is None or len(names) != len(contents):
+            names = [f"arr_{index}" for index in range(len(contents))]
+
+        arrays = dict(zip(names, contents))
+
+        if mmap_mode is not None:
+            return _save_npy_directory(
+                (working_dir / name).with_suffix(NPY_DIRECTORY_SUFFIX),
+                arrays,
+                mmap_mode=mmap_mode,
+                **kwargs,
             )
-        else:
-            np.savez(path, *contents, allow_pickle=False)
+
+        path = (working_dir / name).with_suffix(".npz")
+        np.savez(path, **arrays, **kwargs)
         return path
 
     @staticmethod
     def deserialize(working_dir: Path, path: str, **kwargs) -> dict[str, np.ndarray]:
-        return dict(list(np.load(working_dir / path, **kwargs).items()))
+        input = working_dir / path
+
+        if input.is_dir():
+            return _load_npy_directory(input, **kwargs)
+
+        with np.load(input, **kwargs) as arrays:
+            return dict(arrays.items())
 
     @staticmethod
     def validation() -> dict[str, Any] | None:
-        return None
+        return {
+            "names": {"type": "array", "items": {"type": "string"}},
+            "mmap_mode": {"enum": MMAP_MODES},
+        }
 
 
 class PickleArtifactTask(ArtifactTaskInterface):
@@ -23,6 +23,7 @@ from .utils import FileTypes
 
 FILES: Final[str] = "files"
 CONTENTS: Final[str] = "contents"
+BATCH_SUFFIX: Final[str] = ":batch"
 
 T = TypeVar("T")
 
@@ -78,6 +79,8 @@ class ArtifactsCollectionClient(CollectionClient[T]):
         sort_by: str | None = None,
         descending: bool | None = None,
         search: str | None = None,
+        cursor: str | None = None,
+        count_total: bool | None = None,
     ) -> T:
         """Get a list of artifacts.
 
@@ -94,6 +97,11 @@ class ArtifactsCollectionClient(CollectionClient[T]):
                 Optional, defaults to None.
             search: Search for artifacts using the Dioptra API's query
                 language. Optional, defaults to None.
+            cursor: The paging cursor taken from the next or prev link of a previous
+                response, or an empty string to start cursor-based paging. When set,
+                index is ignored. Optional, defaults to None.
+            count_total: Whether to count the total number of results. Optional,
+                defaults to None.
 
         Returns:
             The response from the Dioptra API.
@@ -115,6 +123,12 @@ class ArtifactsCollectionClient(CollectionClient[T]):
         if group_id is not None:
             params["groupId"] = group_id
 
+        if cursor is not None:
+            params["cursor"] = cursor
+
+        if count_total is not None:
+            params["countTotal"] = count_total
+
         return self._session.get(
             self.url,
             params=params,
@@ -178,6 +192,37 @@ class ArtifactsCollectionClient(CollectionClient[T]):
 
         return self._session.post(self.url, json_=json_)
 
+    def create_batch(
+        self,
+        group_id: str | int,
+        job_id: str | int,
+        artifacts: list[dict[str, Any]],
+    ) -> T:
+        """Creates a batch of artifacts produced by a Job in a single request.
+
+        If any artifact in the batch is invalid, no artifacts are created.
+
+        Args:
+            group_id: The id of the group that will own the artifacts.
+            job_id: The id of the job that produced the artifacts.
+            artifacts: A list of dictionaries, one per artifact, with the key
+                "artifact_uri" and the optional keys "plugin_snapshot_id", "task_id",
+                and "description". These have the same meaning as the matching
+                arguments of create().
+
+        Returns:
+            The response from the Dioptra API.
+        """
+        json_: dict[str, Any] = {
+            "group": int(group_id),
+            "job": int(job_id),
+            "artifacts": [
+                _build_batch_artifact_json(artifact) for artifact in artifacts
+            ],
+        }
+
+        return self._session.post(self.url + BATCH_SUFFIX, json_=json_)
+
     def modify_by_id(
         self,
         artifact_id: str | int,
@@ -335,3 +380,18 @@ class ArtifactsSnapshotCollectionClient(SnapshotsSubCollectionClient[T]):
             output_path=contents_path,
             params=params,
         )
+
+
+def _build_batch_artifact_json(artifact: dict[str, Any]) -> dict[str, Any]:
+    json_: dict[str, Any] = {"artifactUri": artifact["artifact_uri"]}
+
+    if artifact.get("plugin_snapshot_id") is not None:
+        json_["pluginSnapshotId"] = int(artifact["plugin_snapshot_id"])
+
+    if artifact.get("task_id") is not None:
+        json_["taskId"] = int(artifact["task_id"])
+
+    if artifact.get("description") is not None:
+        json_["description"] = artifact["description"]
+
+    return json_
@@ -56,3 +56,31 @@ class AuthCollectionClient(CollectionClient[T]):
             The response from the Dioptra API.
         """
         return self._session.post(self.url, "logout", params={"everywhere": everywhere})
+
+    def create_token(self) -> T:
+        """Send a request to the Dioptra API to create an API token.
+
+        The client must be logged in. The token can be passed to use_token() to
+        authenticate another client without a username and password.
+
+        A regular logout does not revoke the token. It remains valid until it expires
+        or the user calls logout(everywhere=True), which revokes all of the user's
+        tokens and sessions.
+
+        Returns:
+            The response from the Dioptra API.
+        """
+        return self._session.post(self.url, "token")
+
+    def use_token(self, token: str | None) -> None:
+        """Authenticate subsequent requests with an API token.
+
+        Token authentication is much cheaper for the Dioptra API to verify than a
+        login, which makes it suited to automated clients such as workers. Calling
+        logout() does not revoke the token, see create_token().
+
+        Args:
+            token: An API token created with create_token(), or None to stop using a
+                token.
+        """
+        self._session.set_auth_token(token)
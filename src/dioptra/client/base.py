@@ -182,6 +182,20 @@ class DioptraSession(ABC, Generic[T]):
         """Close the connection to the API."""
         raise NotImplementedError
 
+    def set_auth_token(self, token: str | None) -> None:
+        """Authenticate subsequent requests with an API token.
+
+        Sessions that support token authentication must override this method.
+
+        Args:
+            token: The API token to send in an "Authorization: Bearer" header, or None
+                to stop sending the header.
+
+        Raises:
+            NotImplementedError: If the session does not support API tokens.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def make_request(
         self,
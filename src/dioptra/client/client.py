@@ -63,6 +63,11 @@ class DioptraClient(Generic[T]):
         self._artifacts = ArtifactsCollectionClient[T](session)
         self._workflows = WorkflowsCollectionClient[T](session)
 
+    @property
+    def session(self) -> DioptraSession[T]:
+        """The Dioptra API session object used by the client."""
+        return self._session
+
     @property
     def users(self) -> UsersCollectionClient[T]:
         """The client for managing Dioptra's /users collection."""
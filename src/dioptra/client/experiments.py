@@ -34,6 +34,7 @@ ARTIFACTS: Final[str] = "artifacts"
 METRICS: Final[str] = "metrics"
 MLFLOW_RUN: Final[str] = "mlflowRun"
 STATUS: Final[str] = "status"
+BATCH_SUFFIX: Final[str] = ":batch"
 
 DRAFT_FIELDS: Final[set[str]] = {"name", "description", "entrypoints"}
 
@@ -263,6 +264,7 @@ class ExperimentJobsSubCollectionClient(SubCollectionClient[T]):
         artifact_values: dict[str, Any] | None = None,
         timeout: str | None = None,
         description: str | None = None,
+        priority: str | None = None,
     ) -> T:
         """Creates a job for an experiment.
 
@@ -284,6 +286,9 @@ class ExperimentJobsSubCollectionClient(SubCollectionClient[T]):
                 stopped. If omitted, the job timeout will use the default set in the
                 API.
             description: The description for the job. Optional, defaults to None.
+            priority: The priority of the job on its queue, one of "high",
+                "default", or "low". If omitted, the job will use the default
+                priority.
 
         Returns:
             The response from the Dioptra API.
@@ -305,10 +310,73 @@ class ExperimentJobsSubCollectionClient(SubCollectionClient[T]):
         if description is not None:
             json_["description"] = description
 
+        if priority is not None:
+            json_["priority"] = priority
+
         return self._session.post(
             self.build_sub_collection_url(experiment_id), json_=json_
         )
 
+    def create_batch(
+        self,
+        experiment_id: str | int,
+        entrypoint_id: int,
+        queue_id: int,
+        jobs: list[dict[str, Any]],
+        entrypoint_snapshot_id: int | None = None,
+        timeout: str | None = None,
+        description: str | None = None,
+        priority: str | None = None,
+    ) -> T:
+        """Creates a batch of jobs for an experiment in a single request.
+
+        The jobs share the entrypoint, queue, and timeout. If any job in the batch is
+        invalid, no jobs are created.
+
+        Args:
+            experiment_id: The experiment id, an integer.
+            entrypoint_id: The id for the entrypoint that the jobs will run.
+            queue_id: The id for the queue that will execute the jobs.
+            jobs: A list of dictionaries, one per job, with the optional keys
+                "values", "artifact_values", and "description". These have the same
+                meaning as the matching arguments of create().
+            entrypoint_snapshot_id: The id for a snapshot associated with the
+                entrypoint. If not specified, the jobs will use the latest version of
+                the entrypoint. Defaults to None.
+            timeout: The maximum alloted time for each job before it times out and is
+                stopped. If omitted, the job timeout will use the default set in the
+                API.
+            description: The description for jobs that do not set their own.
+                Optional, defaults to None.
+            priority: The priority of the jobs on their queue, one of "high",
+                "default", or "low". If omitted, the jobs will use the default
+                priority.
+
+        Returns:
+            The response from the Dioptra API.
+        """
+        json_: dict[str, Any] = {
+            "entrypoint": entrypoint_id,
+            "queue": queue_id,
+            "jobs": [_build_batch_job_json(job) for job in jobs],
+        }
+
+        if entrypoint_snapshot_id is not None:
+            json_["entrypointSnapshot"] = entrypoint_snapshot_id
+
+        if timeout is not None:
+            json_["timeout"] = timeout
+
+        if description is not None:
+            json_["description"] = description
+
+        if priority is not None:
+            json_["priority"] = priority
+
+        return self._session.post(
+            self.build_sub_collection_url(experiment_id) + BATCH_SUFFIX, json_=json_
+        )
+
     def delete_by_id(self, experiment_id: str | int, job_id: str | int) -> T:
         """Delete a job from the experiment.
 
@@ -599,6 +667,8 @@ class ExperimentsCollectionClient(CollectionClient[T]):
         sort_by: str | None = None,
         descending: bool | None = None,
         search: str | None = None,
+        cursor: str | None = None,
+        count_total: bool | None = None,
     ) -> T:
         """Get a list of experiments.
 
@@ -615,6 +685,11 @@ class ExperimentsCollectionClient(CollectionClient[T]):
                 to None.
             search: Search for experiments using the Dioptra API's query language.
                 Optional, defaults to None.
+            cursor: The paging cursor taken from the next or prev link of a previous
+                response, or an empty string to start cursor-based paging. When set,
+                index is ignored. Optional, defaults to None.
+            count_total: Whether to count the total number of results. Optional,
+                defaults to None.
 
         Returns:
             The response from the Dioptra API.
@@ -636,6 +711,12 @@ class ExperimentsCollectionClient(CollectionClient[T]):
         if group_id is not None:
             params["groupId"] = group_id
 
+        if cursor is not None:
+            params["cursor"] = cursor
+
+        if count_total is not None:
+            params["countTotal"] = count_total
+
         return self._session.get(
             self.url,
             params=params,
@@ -775,3 +856,18 @@ class ExperimentsCollectionClient(CollectionClient[T]):
             params["search"] = search
 
         return self._session.get(self.url, str(experiment_id), METRICS, params=params)
+
+
+def _build_batch_job_json(job: dict[str, Any]) -> dict[str, Any]:
+    json_: dict[str, Any] = {}
+
+    if job.get("values") is not None:
+        json_["values"] = job["values"]
+
+    if job.get("artifact_values") is not None:
+        json_["artifactValues"] = job["artifact_values"]
+
+    if job.get("description") is not None:
+        json_["description"] = job["description"]
+
+    return json_
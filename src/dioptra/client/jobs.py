@@ -110,6 +110,8 @@ class JobsCollectionClient(CollectionClient[T]):
         sort_by: str | None = None,
         descending: bool | None = None,
         search: str | None = None,
+        cursor: str | None = None,
+        count_total: bool | None = None,
     ) -> T:
         """Get a list of jobs.
 
@@ -126,6 +128,11 @@ class JobsCollectionClient(CollectionClient[T]):
                 to None.
             search: Search for jobs using the Dioptra API's query language. Optional,
                 defaults to None.
+            cursor: The paging cursor taken from the next or prev link of a previous
+                response, or an empty string to start cursor-based paging. When set,
+                index is ignored. Optional, defaults to None.
+            count_total: Whether to count the total number of results. Optional,
+                defaults to None.
 
         Returns:
             The response from the Dioptra API.
@@ -147,6 +154,12 @@ class JobsCollectionClient(CollectionClient[T]):
         if group_id is not None:
             params["groupId"] = group_id
 
+        if cursor is not None:
+            params["cursor"] = cursor
+
+        if count_total is not None:
+            params["countTotal"] = count_total
+
         return self._session.get(
             self.url,
             params=params,
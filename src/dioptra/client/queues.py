@@ -26,6 +26,7 @@ from .snapshots import SnapshotsSubCollectionClient
 from .tags import TagsSubCollectionClient
 
 DRAFT_FIELDS: Final[set[str]] = {"name", "description"}
+METRICS: Final[str] = "metrics"
 
 T = TypeVar("T")
 
@@ -183,6 +184,8 @@ class QueuesCollectionClient(CollectionClient[T]):
         sort_by: str | None = None,
         descending: bool | None = None,
         search: str | None = None,
+        cursor: str | None = None,
+        count_total: bool | None = None,
     ) -> T:
         """Get a list of queues.
 
@@ -198,6 +201,11 @@ class QueuesCollectionClient(CollectionClient[T]):
                 to None.
             search: Search for queues using the Dioptra API's query language. Optional,
                 defaults to None.
+            cursor: The paging cursor taken from the next or prev link of a previous
+                response, or an empty string to start cursor-based paging. When set,
+                index is ignored. Optional, defaults to None.
+            count_total: Whether to count the total number of results. Optional,
+                defaults to None.
 
         Returns:
             The response from the Dioptra API.
@@ -219,6 +227,12 @@ class QueuesCollectionClient(CollectionClient[T]):
         if group_id is not None:
             params["groupId"] = group_id
 
+        if cursor is not None:
+            params["cursor"] = cursor
+
+        if count_total is not None:
+            params["countTotal"] = count_total
+
         return self._session.get(
             self.url,
             params=params,
@@ -235,13 +249,39 @@ class QueuesCollectionClient(CollectionClient[T]):
         """
         return self._session.get(self.url, str(queue_id))
 
-    def create(self, group_id: int, name: str, description: str | None = None) -> T:
+    def get_metrics(self, window: int | None = None) -> T:
+        """Get the job backlog, wait and run times, and worker use of each queue.
+
+        Args:
+            window: The length of the window, in seconds, of the jobs used to compute
+                queue wait and run durations. Optional, defaults to None, which uses
+                the API default of 1 day.
+
+        Returns:
+            The response from the Dioptra API.
+        """
+        params: dict[str, Any] = {}
+
+        if window is not None:
+            params["window"] = window
+
+        return self._session.get(self.url, METRICS, params=params)
+
+    def create(
+        self,
+        group_id: int,
+        name: str,
+        description: str | None = None,
+        fair_share: str | None = None,
+    ) -> T:
         """Creates a queue.
 
         Args:
             group_id: The id of the group that will own the queue.
             name: The name of the new queue.
             description: The description of the new queue. Optional, defaults to None.
+            fair_share: How workers share the queue between submitters, one of
+                "none", "user", or "group". If omitted, the queue will use "none".
 
         Returns:
             The response from the Dioptra API.
@@ -254,10 +294,17 @@ class QueuesCollectionClient(CollectionClient[T]):
         if description is not None:
             json_["description"] = description
 
+        if fair_share is not None:
+            json_["fairShare"] = fair_share
+
         return self._session.post(self.url, json_=json_)
 
     def modify_by_id(
-        self, queue_id: str | int, name: str, description: str | None
+        self,
+        queue_id: str | int,
+        name: str,
+        description: str | None,
+        fair_share: str | None = None,
     ) -> T:
         """Modify the queue matching the provided id.
 
@@ -266,6 +313,8 @@ class QueuesCollectionClient(CollectionClient[T]):
             name: The new name of the queue.
             description: The new description of the queue. To remove the description,
                 pass None.
+            fair_share: How workers share the queue between submitters, one of
+                "none", "user", or "group". If omitted, the queue will use "none".
 
         Returns:
             The response from the Dioptra API.
@@ -275,6 +324,9 @@ class QueuesCollectionClient(CollectionClient[T]):
         if description is not None:
             json_["description"] = description
 
+        if fair_share is not None:
+            json_["fairShare"] = fair_share
+
         return self._session.put(self.url, str(queue_id), json_=json_)
 
     def delete_by_id(self, queue_id: str | int) -> T:
@@ -230,6 +230,7 @@ class BaseDioptraRequestsSession(DioptraSession[T], ABC, Generic[T]):
         """
         self._scheme, self._netloc, self._path, _, _, _ = urlparse(address)
         self._session: requests.Session | None = None
+        self._auth_token: str | None = None
 
     @property
     def url(self) -> str:
@@ -240,6 +241,7 @@ class BaseDioptraRequestsSession(DioptraSession[T], ABC, Generic[T]):
         """Connect to the API using a requests Session."""
         if self._session is None:
             self._session = requests.Session()
+            self._apply_auth_token(self._session)
 
     def close(self) -> None:
         """Close the connection to the API by closing the requests Session."""
@@ -249,6 +251,39 @@ class BaseDioptraRequestsSession(DioptraSession[T], ABC, Generic[T]):
         self._session.close()
         self._session = None
 
+    def share_connection(self, other: "BaseDioptraRequestsSession[Any]") -> None:
+        """Send requests through the connection of another session.
+
+        The sessions share the connection pool, the login cookies, and the API token,
+        so a login through one session also authenticates the other. Closing either
+        session closes the shared connection.
+
+        Args:
+            other: The session whose connection to share.
+        """
+        self._session = other._get_requests_session()
+        self._auth_token = other._auth_token
+
+    def set_auth_token(self, token: str | None) -> None:
+        """Authenticate subsequent requests with an API token.
+
+        Args:
+            token: The API token to send in an "Authorization: Bearer" header, or None
+                to stop sending the header.
+        """
+        self._auth_token = token
+
+        if self._session is not None:
+            self._apply_auth_token(self._session)
+
+    def _apply_auth_token(self, session: requests.Session) -> None:
+        """Set or remove the Authorization header of a requests Session."""
+        if self._auth_token is None:
+            session.headers.pop("Authorization", None)
+            return None
+
+        session.headers["Authorization"] = f"Bearer {self._auth_token}"
+
     def make_request(
         self,
         method_name: str,
@@ -16,13 +16,8 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 from typing import Any, ClassVar, TypeVar
 
-import structlog
-from structlog.stdlib import BoundLogger
-
 from .base import SubCollectionClient
 
-LOGGER: BoundLogger = structlog.stdlib.get_logger()
-
 T = TypeVar("T")
 
 
@@ -65,6 +65,7 @@ class WorkflowsCollectionClient(CollectionClient[T]):
         config_path: str | None = None,
         resolve_name_conflicts_strategy: Literal["fail", "update", "overwrite"]
         | None = None,
+        run_async: bool = False,
     ):
         """
         Import resources from a archive file or git repository
@@ -80,6 +81,9 @@ class WorkflowsCollectionClient(CollectionClient[T]):
             resolve_name_conflicts_strategy: The strategy for resolving name conflicts.
                 Either "fail", "update", or "overwrite". If None, the API will use "fail" as the
                 default. Defaults to None.
+            run_async: If True, the import runs as a background job and the response
+                contains the id of the import. Use get_resource_import() to follow its
+                progress. Defaults to False.
 
         Raises:
             IllegalArgumentError: If more than one import source is provided or if no
@@ -121,10 +125,24 @@ class WorkflowsCollectionClient(CollectionClient[T]):
         if resolve_name_conflicts_strategy is not None:
             data["resolveNameConflictsStrategy"] = resolve_name_conflicts_strategy
 
+        if run_async:
+            data["runAsync"] = "true"
+
         return self._session.post(
             self.url, RESOURCE_IMPORT, data=data, files=files_ or None
         )
 
+    def get_resource_import(self, import_id: str) -> T:
+        """Get the progress and result of a resource import submitted with run_async.
+
+        Args:
+            import_id: The id of the resource import.
+
+        Returns:
+            The response from the Dioptra API.
+        """
+        return self._session.get(self.url, RESOURCE_IMPORT, import_id)
+
     def commit_draft(
         self,
         draft_id: str | int,
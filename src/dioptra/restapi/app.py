@@ -38,6 +38,7 @@ from dioptra.restapi.utils import setup_injection
 
 from .__version__ import __version__ as DIOPTRA_VERSION
 from .db import db
+from .db.engine import build_engine_options, get_pool_metrics, register_sqlite_pragmas
 from .patches import monkey_patch_flask_restx
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
@@ -64,6 +65,8 @@ def create_app(env: Optional[str] = None, injector: Optional[Injector] = None) -
     from .config import config_by_name
     from .errors import register_error_handlers
     from .routes import register_routes
+    from .v1.auth.service import load_user_from_request as v1_load_user_from_request
+    from .v1.shared.rq_service import RQServiceV1
     from .v1.users.service import load_user as v1_load_user
 
     monkey_patch_flask_restx()
@@ -86,7 +89,9 @@ def create_app(env: Optional[str] = None, injector: Optional[Injector] = None) -
     register_error_handlers(api)
 
     login_manager.user_loader(v1_load_user)
+    login_manager.request_loader(v1_load_user_from_request)
 
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", build_engine_options(app.config))
     db.init_app(app)
     login_manager.init_app(app)
 
@@ -96,6 +101,7 @@ def create_app(env: Optional[str] = None, injector: Optional[Injector] = None) -
         )
 
     with app.app_context():
+        register_sqlite_pragmas(db.engine, app.config)
         migrate.init_app(app, db, render_as_batch=True)
 
     @app.route("/health")
@@ -104,11 +110,24 @@ def create_app(env: Optional[str] = None, injector: Optional[Injector] = None) -
         log = LOGGER.new(request_id=str(uuid.uuid4()))  # noqa: F841
         return jsonify({"status": "healthy", "version": DIOPTRA_VERSION})
 
+    @app.route("/health/db")
+    def health_db():
+        """An endpoint for monitoring the database connection pool."""
+        log = LOGGER.new(request_id=str(uuid.uuid4()))  # noqa: F841
+        return jsonify({"pool": get_pool_metrics(db.engine)})
+
     if not injector:
         modules: List[Callable[..., Any]] = [bind_dependencies]
         register_providers(modules)
         injector = Injector(modules)
 
+    @app.route("/health/rq")
+    def health_rq():
+        """An endpoint for monitoring the job queue connection and enqueue latency."""
+        log = LOGGER.new(request_id=str(uuid.uuid4()))  # noqa: F841
+        probe = injector.get(RQServiceV1).probe()
+        return jsonify(probe), 200 if probe["status"] == "healthy" else 503
+
     setup_injection(api, injector)
 
     return app
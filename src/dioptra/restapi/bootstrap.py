@@ -17,15 +17,15 @@
 """A module for binding configurations to shared services using dependency injection."""
 
 import os
-from dataclasses import dataclass
-from typing import Any, Callable, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Final, List, Optional
 
 from boto3.session import Session
 from botocore.client import BaseClient
 from injector import Binder, Module, provider
 from mlflow import MlflowClient
 from passlib.context import CryptContext
-from redis import Redis
+from redis import BlockingConnectionPool, Redis
 
 from dioptra.restapi.request_scope import request
 from dioptra.restapi.v1.shared.job_run_store import (
@@ -33,7 +33,11 @@ from dioptra.restapi.v1.shared.job_run_store import (
     MlFlowJobRunStore,
 )
 from dioptra.restapi.v1.shared.password_service import PasswordService
-from dioptra.restapi.v1.shared.rq_service import RQServiceV1
+from dioptra.restapi.v1.shared.rq_service import RQQueueCache, RQServiceV1
+
+# The number of seconds to wait for a free connection when the Redis connection pool
+# is limited by RQ_REDIS_MAX_CONNECTIONS.
+RQ_REDIS_POOL_TIMEOUT_DEFAULT: Final[float] = 20.0
 
 
 class JobRunStoreModule(Module):
@@ -49,6 +53,10 @@ class JobRunStoreModule(Module):
 @dataclass
 class RQServiceConfiguration(object):
     redis: Redis
+    queues: RQQueueCache = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.queues = RQQueueCache(self.redis)
 
 
 class RQServiceV1Module(Module):
@@ -57,7 +65,7 @@ class RQServiceV1Module(Module):
     def provide_rq_service_module(
         self, configuration: RQServiceConfiguration
     ) -> RQServiceV1:
-        return RQServiceV1(redis=configuration.redis)
+        return RQServiceV1(redis=configuration.redis, queues=configuration.queues)
 
 
 @dataclass
@@ -73,8 +81,65 @@ class PasswordServiceModule(Module):
         return PasswordService(crypt_context=configuration.crypt_context)
 
 
+def _get_env_number(name: str, type_: Callable[[str], Any]) -> Any:
+    value = os.getenv(name)
+
+    if value is None or value.strip() == "":
+        return None
+
+    try:
+        return type_(value)
+
+    except ValueError as err:
+        raise ValueError(f"Invalid {name} value: {value}.") from err
+
+
+def create_redis_connection() -> Redis:
+    """Create the Redis client used to submit jobs to the RQ queues.
+
+    The connection is configured with the following environment variables:
+
+    - RQ_REDIS_URI: The Redis URI. Defaults to "redis://".
+    - RQ_REDIS_MAX_CONNECTIONS: The maximum number of connections in the pool. When
+      set, requests wait up to RQ_REDIS_POOL_TIMEOUT seconds (default 20) for a free
+      connection instead of opening new ones. Unlimited if unset.
+    - RQ_REDIS_SOCKET_TIMEOUT: The timeout, in seconds, for Redis commands.
+    - RQ_REDIS_SOCKET_CONNECT_TIMEOUT: The timeout, in seconds, for connecting.
+    - RQ_REDIS_HEALTH_CHECK_INTERVAL: Check idle connections that have not been used
+      for this many seconds before reusing them.
+
+    Returns:
+        A Redis client backed by a connection pool.
+    """
+    url = os.getenv("RQ_REDIS_URI", "redis://")
+    options: dict[str, Any] = {
+        "socket_timeout": _get_env_number("RQ_REDIS_SOCKET_TIMEOUT", float),
+        "socket_connect_timeout": _get_env_number(
+            "RQ_REDIS_SOCKET_CONNECT_TIMEOUT", float
+        ),
+        "health_check_interval": _get_env_number("RQ_REDIS_HEALTH_CHECK_INTERVAL", int),
+    }
+    options = {name: value for name, value in options.items() if value is not None}
+    max_connections = _get_env_number("RQ_REDIS_MAX_CONNECTIONS", int)
+
+    if max_connections is None:
+        return Redis.from_url(url, **options)
+
+    pool_timeout = _get_env_number("RQ_REDIS_POOL_TIMEOUT", float)
+    pool = BlockingConnectionPool.from_url(
+        url,
+        max_connections=max_connections,
+        timeout=(
+            pool_timeout if pool_timeout is not None else RQ_REDIS_POOL_TIMEOUT_DEFAULT
+        ),
+        **options,
+    )
+
+    return Redis(connection_pool=pool)
+
+
 def _bind_rq_service_configuration(binder: Binder):
-    redis_conn: Redis = Redis.from_url(os.getenv("RQ_REDIS_URI", "redis://"))
+    redis_conn: Redis = create_redis_connection()
     configuration: RQServiceConfiguration = RQServiceConfiguration(redis=redis_conn)
     binder.bind(RQServiceConfiguration, to=configuration, scope=request)
 
@@ -88,6 +88,120 @@ def _set_max_page_size(default_max: int = 1000) -> int:
     return max_page_size
 
 
+def _get_optional_int(name: str, default: int | None = None) -> int | None:
+    """Read an optional integer setting from an environment variable.
+
+    Args:
+        name: The name of the environment variable.
+        default: The value to use if the environment variable is not set or is
+            empty. Defaults to None.
+
+    Returns:
+        The integer value of the environment variable, or the default.
+
+    Raises:
+        ValueError: If the environment variable is set to a value which can't be
+            converted to an integer.
+    """
+    value = os.getenv(name)
+
+    if value is None or value.strip() == "":
+        return default
+
+    try:
+        return int(value)
+
+    except ValueError as err:
+        raise ValueError(f"Invalid {name} value: {value}. Must be an integer.") from err
+
+
+def _get_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean setting from an environment variable.
+
+    The values "true", "yes", "on", and "1" are True and "false", "no", "off", and
+    "0" are False, in any case.
+
+    Args:
+        name: The name of the environment variable.
+        default: The value to use if the environment variable is not set or is
+            empty. Defaults to False.
+
+    Returns:
+        The boolean value of the environment variable, or the default.
+
+    Raises:
+        ValueError: If the environment variable is set to a value which is not a
+            boolean.
+    """
+    true_values = {"true", "yes", "on", "1"}
+    false_values = {"false", "no", "off", "0"}
+    value = os.getenv(name)
+
+    if value is None or not value.strip():
+        return default
+
+    if value.strip().lower() in true_values:
+        return True
+
+    if value.strip().lower() in false_values:
+        return False
+
+    raise ValueError(
+        f"Invalid {name} value: {value}. "
+        f"Allowed values are {sorted(true_values | false_values)}."
+    )
+
+
+def _set_sqlite_journal_mode(default: str = "wal") -> str | None:
+    """Set the journal mode for file-based SQLite databases.
+
+    The journal mode is set by the environment variable DIOPTRA_SQLITE_JOURNAL_MODE.
+    Setting the variable to "default" keeps the SQLite default journal mode.
+
+    Args:
+        default: The default journal mode. Defaults to "wal".
+
+    Returns:
+        The journal mode, or None to keep the SQLite default.
+    """
+    allowed = {"default", "delete", "truncate", "persist", "memory", "wal", "off"}
+    value = os.getenv("DIOPTRA_SQLITE_JOURNAL_MODE", default).lower()
+
+    if value not in allowed:
+        raise ValueError(
+            f"Invalid DIOPTRA_SQLITE_JOURNAL_MODE value: {value}. "
+            f"Allowed values are {allowed}."
+        )
+
+    return None if value == "default" else value
+
+
+def _set_sqlite_synchronous() -> str | None:
+    """Set the synchronous level for SQLite databases.
+
+    The level is set by the environment variable DIOPTRA_SQLITE_SYNCHRONOUS. If the
+    environment variable is not set, the SQLite default is kept.
+
+    Returns:
+        The synchronous level, or None to keep the SQLite default.
+    """
+    allowed = {"off", "normal", "full", "extra"}
+    value = os.getenv("DIOPTRA_SQLITE_SYNCHRONOUS")
+
+    if value is None:
+        return None
+
+    value = value.lower()
+
+    if value not in allowed:
+        raise ValueError(
+            f"Invalid DIOPTRA_SQLITE_SYNCHRONOUS value: {value}. "
+            f"Allowed values are {allowed}."
+        )
+
+    return value
+
+
 class BaseConfig(object):
     CONFIG_NAME = "base"
     USE_MOCK_EQUIVALENCY = False
@@ -103,6 +217,48 @@ class BaseConfig(object):
     DIOPTRA_SWAGGER_PATH = os.getenv("DIOPTRA_SWAGGER_PATH", "/")
     DIOPTRA_BASE_URL = os.getenv("DIOPTRA_BASE_URL")
     DIOPTRA_MAX_PAGE_SIZE = _set_max_page_size()
+    DIOPTRA_API_TOKEN_MAX_AGE = _get_optional_int("DIOPTRA_API_TOKEN_MAX_AGE")
+    # Seconds to share a logged in user's identity and group memberships across
+    # requests, see dioptra.restapi.db.repository.utils.identity. Unset disables it.
+    DIOPTRA_IDENTITY_CACHE_TTL = _get_optional_int("DIOPTRA_IDENTITY_CACHE_TTL")
+    # Whether the workers run dioptra.worker.fair_share_worker.FairShareWorker, the
+    # default for dioptra-worker-v1. Only that worker listens to the RQ queues of the
+    # non-default job priorities and of fair-share queues, see dioptra.rq.scheduling.
+    # Set it to false if the workers run a stock "rq worker" or another worker class,
+    # and jobs with a non-default priority or on a fair-share queue are rejected
+    # instead of being left on RQ queues that no worker listens to.
+    DIOPTRA_RQ_FAIR_SHARE_WORKER = _get_bool(
+        "DIOPTRA_RQ_FAIR_SHARE_WORKER", default=True
+    )
+    # The RQ queue for resource imports submitted with runAsync, see
+    # dioptra.rq.tasks.run_resource_import. Workers must listen to it.
+    DIOPTRA_RESOURCE_IMPORT_QUEUE = os.getenv(
+        "DIOPTRA_RESOURCE_IMPORT_QUEUE", "resource-imports"
+    )
+    # Maximum total bytes of the files uploaded for a resource import submitted with
+    # runAsync. The uploads are stored in the RQ job, so they are kept in Redis.
+    DIOPTRA_RESOURCE_IMPORT_MAX_UPLOAD_SIZE = _get_optional_int(
+        "DIOPTRA_RESOURCE_IMPORT_MAX_UPLOAD_SIZE", 32 * 1024 * 1024
+    )
+    # Maximum seconds to stream the progress of a resource import before sending a
+    # "timed_out" event and closing the stream.
+    DIOPTRA_RESOURCE_IMPORT_STREAM_TIMEOUT = _get_optional_int(
+        "DIOPTRA_RESOURCE_IMPORT_STREAM_TIMEOUT", 3600
+    )
+
+    # Database engine and connection pool settings, see dioptra.restapi.db.engine.
+    # Pool settings left unset use the SQLAlchemy defaults.
+    DIOPTRA_DB_POOL_SIZE = _get_optional_int("DIOPTRA_DB_POOL_SIZE")
+    DIOPTRA_DB_MAX_OVERFLOW = _get_optional_int("DIOPTRA_DB_MAX_OVERFLOW")
+    DIOPTRA_DB_POOL_TIMEOUT = _get_optional_int("DIOPTRA_DB_POOL_TIMEOUT")
+    DIOPTRA_DB_POOL_RECYCLE = _get_optional_int("DIOPTRA_DB_POOL_RECYCLE")
+    DIOPTRA_DB_POOL_PRE_PING = not _get_bool("DIOPTRA_DB_DISABLE_POOL_PRE_PING")
+    DIOPTRA_DB_STATEMENT_TIMEOUT = _get_optional_int("DIOPTRA_DB_STATEMENT_TIMEOUT")
+    DIOPTRA_SQLITE_JOURNAL_MODE = _set_sqlite_journal_mode()
+    DIOPTRA_SQLITE_BUSY_TIMEOUT = _get_optional_int(
+        "DIOPTRA_SQLITE_BUSY_TIMEOUT", default=5000
+    )
+    DIOPTRA_SQLITE_SYNCHRONOUS = _set_sqlite_synchronous()
 
 
 class DevelopmentConfig(BaseConfig):
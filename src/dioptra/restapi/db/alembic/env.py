@@ -8,6 +8,7 @@ from alembic import context
 from sqlalchemy import create_engine
 
 from dioptra.restapi.db.custom_types import GUID, TZDateTime
+from dioptra.restapi.db.text_search import TEXT_SEARCH_INDEXES
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -65,6 +66,21 @@ def render_item(type_, obj, autogen_context):
     return False
 
 
+def include_name(name, type_, parent_names):
+    """Exclude the text search indexes, which are not part of the table metadata."""
+
+    if type_ == "table":
+        # FTS5 tables on SQLite come with shadow tables that share the table prefix
+        return not any(
+            name.startswith(index.fts_table_name) for index in TEXT_SEARCH_INDEXES
+        )
+
+    if type_ == "index":
+        return name not in {index.index_name for index in TEXT_SEARCH_INDEXES}
+
+    return True
+
+
 def run_migrations_offline():
     """Run migrations in 'offline' mode.
 
@@ -115,6 +131,7 @@ def run_migrations_online():
             target_metadata=target_metadata,
             process_revision_directives=process_revision_directives,
             render_item=render_item,
+            include_name=include_name,
             **current_app.extensions["migrate"].configure_args,
         )
 
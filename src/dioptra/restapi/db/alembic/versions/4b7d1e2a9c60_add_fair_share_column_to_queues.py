@@ -0,0 +1,31 @@
+"""Add a fair_share column to the queues table.
+
+The column sets how workers share a queue between the users or groups submitting
+jobs to it. Existing queues keep dispatching jobs in submission order.
+
+Revision ID: 4b7d1e2a9c60
+Revises: 9a4c2e8b7f31
+Create Date: 2025-10-06 10:41:17.582930
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4b7d1e2a9c60"
+down_revision = "9a4c2e8b7f31"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "queues",
+        sa.Column("fair_share", sa.Text(), nullable=False, server_default="none"),
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("queues", schema=None) as batch_op:
+        batch_op.drop_column("fair_share")
@@ -0,0 +1,197 @@
+"""Store plugin file contents once per distinct SHA-256 hash.
+
+The contents move from the plugin_files table to a new plugin_file_contents table,
+keyed by the hex digest of their SHA-256 hash, and plugin file snapshots reference
+them by hash. Snapshots with identical contents share a single row. The text search
+index over the contents moves to the new table.
+
+Revision ID: 7e2b5c9d4a18
+Revises: 4b7d1e2a9c60
+Create Date: 2025-10-13 15:27:09.846152
+
+"""
+
+import hashlib
+
+import sqlalchemy as sa
+from alembic import op
+
+from dioptra.restapi.db.text_search import (
+    TextSearchIndex,
+    get_create_statements,
+    get_drop_statements,
+)
+
+# revision identifiers, used by Alembic.
+revision = "7e2b5c9d4a18"
+down_revision = "4b7d1e2a9c60"
+branch_labels = None
+depends_on = None
+
+SQLITE_DIALECT = "sqlite"
+
+CONTENTS_HASH_FK = "fk_plugin_files_contents_hash_plugin_file_contents"
+
+# Number of plugin files to read and update at a time
+BATCH_SIZE = 500
+
+OLD_TEXT_SEARCH_INDEX = TextSearchIndex(
+    "plugin_files", "contents", "resource_snapshot_id"
+)
+NEW_TEXT_SEARCH_INDEX = TextSearchIndex(
+    "plugin_file_contents", "contents", "plugin_file_contents_id"
+)
+
+plugin_files = sa.table(
+    "plugin_files",
+    sa.column("resource_snapshot_id", sa.BigInteger()),
+    sa.column("contents", sa.Text()),
+    sa.column("contents_hash", sa.String(64)),
+)
+plugin_file_contents = sa.table(
+    "plugin_file_contents",
+    sa.column("contents_hash", sa.String(64)),
+    sa.column("contents", sa.Text()),
+)
+
+
+def upgrade():
+    dialect_name = op.get_context().dialect.name
+
+    op.create_table(
+        "plugin_file_contents",
+        sa.Column(
+            "plugin_file_contents_id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            nullable=False,
+        ),
+        sa.Column("contents_hash", sa.String(length=64), nullable=False),
+        sa.Column("contents", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "plugin_file_contents_id", name=op.f("pk_plugin_file_contents")
+        ),
+    )
+    op.create_index(
+        op.f("ix_plugin_file_contents_contents_hash"),
+        "plugin_file_contents",
+        ["contents_hash"],
+        unique=True,
+    )
+    # SQLite alters plugin_files in place, as a batch table copy would drop the
+    # table while other tables still reference it
+    if dialect_name == SQLITE_DIALECT:
+        op.execute(
+            "ALTER TABLE plugin_files ADD COLUMN contents_hash VARCHAR(64) "
+            f"CONSTRAINT {CONTENTS_HASH_FK} "
+            "REFERENCES plugin_file_contents (contents_hash)"
+        )
+
+    else:
+        op.add_column(
+            "plugin_files",
+            sa.Column("contents_hash", sa.String(length=64), nullable=True),
+        )
+        op.create_foreign_key(
+            op.f(CONTENTS_HASH_FK),
+            "plugin_files",
+            "plugin_file_contents",
+            ["contents_hash"],
+            ["contents_hash"],
+        )
+
+    op.create_index(
+        op.f("ix_plugin_files_contents_hash"),
+        "plugin_files",
+        ["contents_hash"],
+        unique=False,
+    )
+
+    _copy_contents_to_blobs()
+    _drop_text_search_index(dialect_name, OLD_TEXT_SEARCH_INDEX)
+    _create_text_search_index(dialect_name, NEW_TEXT_SEARCH_INDEX)
+    op.drop_column("plugin_files", "contents")
+
+
+def downgrade():
+    dialect_name = op.get_context().dialect.name
+
+    op.add_column("plugin_files", sa.Column("contents", sa.Text(), nullable=True))
+    op.execute(
+        plugin_files.update().values(
+            contents=sa.select(plugin_file_contents.c.contents)
+            .where(plugin_file_contents.c.contents_hash == plugin_files.c.contents_hash)
+            .scalar_subquery()
+        )
+    )
+
+    _drop_text_search_index(dialect_name, NEW_TEXT_SEARCH_INDEX)
+    _create_text_search_index(dialect_name, OLD_TEXT_SEARCH_INDEX)
+
+    op.drop_index(op.f("ix_plugin_files_contents_hash"), table_name="plugin_files")
+
+    # SQLite drops the foreign key constraint together with the column
+    if dialect_name != SQLITE_DIALECT:
+        op.drop_constraint(op.f(CONTENTS_HASH_FK), "plugin_files", type_="foreignkey")
+
+    op.drop_column("plugin_files", "contents_hash")
+
+    op.drop_index(
+        op.f("ix_plugin_file_contents_contents_hash"),
+        table_name="plugin_file_contents",
+    )
+    op.drop_table("plugin_file_contents")
+
+
+def _copy_contents_to_blobs():
+    """Store each distinct plugin file contents once and record their hashes."""
+    connection = op.get_bind()
+    stored_hashes: set[str] = set()
+    last_id = None
+
+    while True:
+        stmt = (
+            sa.select(plugin_files.c.resource_snapshot_id, plugin_files.c.contents)
+            .where(plugin_files.c.contents.is_not(None))
+            .order_by(plugin_files.c.resource_snapshot_id)
+            .limit(BATCH_SIZE)
+        )
+
+        if last_id is not None:
+            stmt = stmt.where(plugin_files.c.resource_snapshot_id > last_id)
+
+        rows = connection.execute(stmt).all()
+
+        if not rows:
+            break
+
+        new_blobs = []
+        updates = []
+
+        for resource_snapshot_id, contents in rows:
+            contents_hash = hashlib.sha256(contents.encode("utf-8")).hexdigest()
+            updates.append({"id": resource_snapshot_id, "hash": contents_hash})
+
+            if contents_hash not in stored_hashes:
+                stored_hashes.add(contents_hash)
+                new_blobs.append({"contents_hash": contents_hash, "contents": contents})
+
+        if new_blobs:
+            connection.execute(plugin_file_contents.insert(), new_blobs)
+
+        connection.execute(
+            plugin_files.update()
+            .where(plugin_files.c.resource_snapshot_id == sa.bindparam("id"))
+            .values(contents_hash=sa.bindparam("hash")),
+            updates,
+        )
+        last_id = rows[-1][0]
+
+
+def _create_text_search_index(dialect_name, index):
+    for statement in get_create_statements(dialect_name, index):
+        op.execute(statement)
+
+
+def _drop_text_search_index(dialect_name, index):
+    for statement in get_drop_statements(dialect_name, index):
+        op.execute(statement)
@@ -0,0 +1,84 @@
+"""Add an indexed resource_id column to the draft_resources table.
+
+The column replaces the index over the draft_resources.payload["resource_id"] JSON
+field, which the queries comparing the JSON field as an integer could not use.
+
+Revision ID: 9a4c2e8b7f31
+Revises: c3e1f7a9d2b4
+Create Date: 2025-09-22 14:03:51.604219
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9a4c2e8b7f31"
+down_revision = "c3e1f7a9d2b4"
+branch_labels = None
+depends_on = None
+
+POSTGRES_DIALECT = "postgresql"
+SQLITE_DIALECT = "sqlite"
+
+
+def upgrade():
+    dialect_name = op.get_context().dialect.name
+
+    # SQLite supports these operations natively, so avoid a batch table copy
+    op.add_column(
+        "draft_resources",
+        sa.Column(
+            "resource_id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        op.f("ix_draft_resources_resource_id"),
+        "draft_resources",
+        ["resource_id"],
+        unique=False,
+    )
+    op.drop_index(
+        op.f("ix_draft_resources_payload_resource_id"), table_name="draft_resources"
+    )
+
+    # Backfill the new column from the draft payloads
+    if dialect_name == POSTGRES_DIALECT:
+        op.execute(
+            "UPDATE draft_resources "
+            "SET resource_id = CAST(payload ->> 'resource_id' AS BIGINT)"
+        )
+
+    elif dialect_name == SQLITE_DIALECT:
+        op.execute(
+            "UPDATE draft_resources "
+            "SET resource_id = "
+            "CAST(JSON_EXTRACT(payload, '$.\"resource_id\"') AS INTEGER)"
+        )
+
+
+def downgrade():
+    dialect_name = op.get_context().dialect.name
+
+    op.drop_index(op.f("ix_draft_resources_resource_id"), table_name="draft_resources")
+
+    with op.batch_alter_table("draft_resources", schema=None) as batch_op:
+        batch_op.drop_column("resource_id")
+
+    if dialect_name == POSTGRES_DIALECT:
+        op.create_index(
+            op.f("ix_draft_resources_payload_resource_id"),
+            "draft_resources",
+            [sa.text("CAST(CAST(payload ->> 'resource_id' AS VARCHAR) AS INTEGER)")],
+            unique=False,
+        )
+
+    elif dialect_name == SQLITE_DIALECT:
+        op.create_index(
+            op.f("ix_draft_resources_payload_resource_id"),
+            "draft_resources",
+            [sa.text("CAST(JSON_EXTRACT(payload, '$.\"resource_id\"') AS INTEGER)")],
+            unique=False,
+        )
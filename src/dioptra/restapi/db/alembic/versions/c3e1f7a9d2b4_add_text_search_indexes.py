@@ -0,0 +1,44 @@
+"""Add text search indexes over frequently searched text columns.
+
+Revision ID: c3e1f7a9d2b4
+Revises: ad4f89b2288d
+Create Date: 2025-09-15 09:12:44.318207
+
+"""
+
+from alembic import op
+
+from dioptra.restapi.db.text_search import (
+    TextSearchIndex,
+    get_create_statements,
+    get_drop_statements,
+)
+
+# revision identifiers, used by Alembic.
+revision = "c3e1f7a9d2b4"
+down_revision = "ad4f89b2288d"
+branch_labels = None
+depends_on = None
+
+# The indexed columns at this revision
+TEXT_SEARCH_INDEXES = [
+    TextSearchIndex("resource_snapshots", "description", "resource_snapshot_id"),
+    TextSearchIndex("plugin_files", "contents", "resource_snapshot_id"),
+    TextSearchIndex("tags", "name", "tag_id"),
+]
+
+
+def upgrade():
+    dialect_name = op.get_context().dialect.name
+
+    for index in TEXT_SEARCH_INDEXES:
+        for statement in get_create_statements(dialect_name, index):
+            op.execute(statement)
+
+
+def downgrade():
+    dialect_name = op.get_context().dialect.name
+
+    for index in TEXT_SEARCH_INDEXES:
+        for statement in get_drop_statements(dialect_name, index):
+            op.execute(statement)
@@ -48,6 +48,7 @@ from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass, mapped_column
 from dioptra.restapi.db.models.utils import depth_limited_repr
 
 from .custom_types import GUID, TZDateTime
+from .text_search import create_text_search_indexes, drop_text_search_indexes
 
 intpk = Annotated[
     int, mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
@@ -94,6 +95,18 @@ def _set_sqlite_pragma(
         cursor.close()
 
 
+@event.listens_for(metadata_obj, "after_create")
+def _create_text_search_indexes(target: MetaData, connection: Any, **kw) -> None:
+    """Create the text search indexes after the tables are created."""
+    create_text_search_indexes(connection)
+
+
+@event.listens_for(metadata_obj, "before_drop")
+def _drop_text_search_indexes(target: MetaData, connection: Any, **kw) -> None:
+    """Drop the text search indexes before the tables are dropped."""
+    drop_text_search_indexes(connection)
+
+
 class Base(DeclarativeBase, MappedAsDataclass, repr=False):
     """The base ORM class."""
 
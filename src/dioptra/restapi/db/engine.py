@@ -0,0 +1,217 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Engine configuration and connection pool instrumentation for the REST API database.
+
+The engine options are built from the DIOPTRA_DB_* and DIOPTRA_SQLITE_* settings in
+the Flask configuration, see dioptra.restapi.config.
+"""
+
+import threading
+import time
+from sqlite3 import Connection as SQLite3Connection
+from typing import Any, Final, Mapping
+
+from sqlalchemy import Engine, event, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+POSTGRES_BACKEND: Final[str] = "postgresql"
+SQLITE_BACKEND: Final[str] = "sqlite"
+
+# Maps Flask configuration keys to the matching create_engine() pool arguments
+_POOL_OPTIONS: Final[dict[str, str]] = {
+    "DIOPTRA_DB_POOL_SIZE": "pool_size",
+    "DIOPTRA_DB_MAX_OVERFLOW": "max_overflow",
+    "DIOPTRA_DB_POOL_TIMEOUT": "pool_timeout",
+    "DIOPTRA_DB_POOL_RECYCLE": "pool_recycle",
+}
+
+
+class PoolMetrics(object):
+    """Counters for connection checkouts from a connection pool.
+
+    Attributes:
+        checkouts: The number of connections handed out by the pool.
+        checkout_timeouts: The number of checkouts that gave up waiting for a
+            connection.
+        wait_seconds_total: The total time spent waiting for connections.
+        wait_seconds_max: The longest time spent waiting for a single connection.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_checkout(self, wait_seconds: float, timed_out: bool = False) -> None:
+        """Record a checkout attempt.
+
+        Args:
+            wait_seconds: The time spent waiting for the connection.
+            timed_out: Whether the attempt timed out without a connection.
+        """
+        with self._lock:
+            if timed_out:
+                self.checkout_timeouts += 1
+            else:
+                self.checkouts += 1
+
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """A QueuePool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+
+        try:
+            entry = super()._do_get()
+
+        except PoolTimeoutError:
+            self.metrics.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return entry
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        # Keep the counters when the engine is disposed and the pool is replaced
+        pool.metrics = self.metrics
+        return pool
+
+
+def build_engine_options(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Build the SQLAlchemy engine options from the application configuration.
+
+    Pool settings do not apply to in-memory SQLite databases, which share a single
+    connection.
+
+    Args:
+        config: The Flask application configuration.
+
+    Returns:
+        A dictionary of keyword arguments for sqlalchemy.create_engine().
+    """
+    url = make_url(config["SQLALCHEMY_DATABASE_URI"])
+    backend = url.get_backend_name()
+
+    if backend == SQLITE_BACKEND and url.database in (None, "", ":memory:"):
+        return {}
+
+    options: dict[str, Any] = {"poolclass": InstrumentedQueuePool}
+    options.update(
+        {
+            option: config[key]
+            for key, option in _POOL_OPTIONS.items()
+            if config.get(key) is not None
+        }
+    )
+
+    if backend != SQLITE_BACKEND:
+        options["pool_pre_ping"] = config.get("DIOPTRA_DB_POOL_PRE_PING", True)
+
+    statement_timeout = config.get("DIOPTRA_DB_STATEMENT_TIMEOUT")
+
+    if backend == POSTGRES_BACKEND and statement_timeout is not None:
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={statement_timeout}"
+        }
+
+    return options
+
+
+def register_sqlite_pragmas(engine: Engine, config: Mapping[str, Any]) -> None:
+    """Set the configured SQLite pragmas on each new connection of an engine.
+
+    Args:
+        engine: The engine to configure. Engines for other databases are ignored.
+        config: The Flask application configuration.
+    """
+    if engine.url.get_backend_name() != SQLITE_BACKEND:
+        return None
+
+    pragmas: dict[str, Any] = {
+        "busy_timeout": config.get("DIOPTRA_SQLITE_BUSY_TIMEOUT"),
+        "synchronous": config.get("DIOPTRA_SQLITE_SYNCHRONOUS"),
+    }
+
+    # The journal mode of an in-memory database cannot be changed
+    if engine.url.database not in (None, "", ":memory:"):
+        pragmas["journal_mode"] = config.get("DIOPTRA_SQLITE_JOURNAL_MODE")
+
+    pragmas = {name: value for name, value in pragmas.items() if value is not None}
+
+    if not pragmas:
+        return None
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(
+        dbapi_connection: SQLite3Connection, connection_record: Any
+    ) -> None:
+        cursor = dbapi_connection.cursor()
+
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value};")
+
+        cursor.close()
+
+
+def get_pool_metrics(engine: Engine) -> dict[str, Any]:
+    """Report the state of an engine's connection pool.
+
+    Args:
+        engine: The engine to report on.
+
+    Returns:
+        A dictionary with the pool class and, for queue pools, the pool size,
+        connection counts, and checkout wait statistics.
+    """
+    pool = engine.pool
+    result: dict[str, Any] = {"poolClass": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        result.update(
+            {
+                "size": pool.size(),
+                "checkedIn": pool.checkedin(),
+                "checkedOut": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        )
+
+    metrics = getattr(pool, "metrics", None)
+
+    if isinstance(metrics, PoolMetrics):
+        result.update(
+            {
+                "checkouts": metrics.checkouts,
+                "checkoutTimeouts": metrics.checkout_timeouts,
+                "waitSecondsTotal": metrics.wait_seconds_total,
+                "waitSecondsMax": metrics.wait_seconds_max,
+            }
+        )
+
+    return result
@@ -53,6 +53,7 @@ from .plugins import (
     FunctionTask,
     Plugin,
     PluginFile,
+    PluginFileContents,
     PluginPluginFile,
     PluginTask,
     PluginTaskInputParameter,
@@ -102,6 +103,7 @@ __all__ = [
     "MlModelVersion",
     "Plugin",
     "PluginFile",
+    "PluginFileContents",
     "PluginPluginFile",
     "PluginTask",
     "PluginTaskInputParameter",
@@ -14,7 +14,10 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
-from sqlalchemy import ForeignKey, ForeignKeyConstraint, Index, and_, select
+import hashlib
+from typing import Optional
+
+from sqlalchemy import ForeignKey, ForeignKeyConstraint, Index, String, and_, select
 from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 from dioptra.restapi.db.db import (
@@ -23,7 +26,6 @@ from dioptra.restapi.db.db import (
     db,
     intpk,
     optionaljson_,
-    optionalstr,
     text_,
 )
 
@@ -77,7 +79,13 @@ class PluginFile(ResourceSnapshot):
     resource_snapshot_id: Mapped[intpk] = mapped_column(init=False)
     resource_id: Mapped[bigint] = mapped_column(init=False, nullable=False, index=True)
     filename: Mapped[text_] = mapped_column(nullable=False, index=True)
-    contents: Mapped[optionalstr]
+    contents_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        ForeignKey("plugin_file_contents.contents_hash"),
+        init=False,
+        nullable=True,
+        index=True,
+    )
 
     # Derived fields (read-only)
     plugin_id: Mapped[bigint] = column_property(
@@ -96,10 +104,16 @@ class PluginFile(ResourceSnapshot):
     )
 
     # Relationships
+    contents_blob: Mapped[Optional["PluginFileContents"]] = relationship(lazy="joined")
     tasks: Mapped[list["PluginTask"]] = relationship(
         init=False, back_populates="file", lazy="joined"
     )
 
+    @property
+    def contents(self) -> str | None:
+        """The contents of the plugin file, stored in the plugin_file_contents table."""
+        return None if self.contents_blob is None else self.contents_blob.contents
+
     # Additional settings
     __table_args__ = (  # type: ignore[assignment]
         Index(None, "resource_snapshot_id", "resource_id", unique=True),
@@ -116,6 +130,35 @@ class PluginFile(ResourceSnapshot):
     }
 
 
+class PluginFileContents(db.Model):  # type: ignore[name-defined]
+    """The contents of plugin files, stored once per distinct SHA-256 hash.
+
+    Plugin file snapshots reference their contents by hash, so registering a file
+    whose contents are unchanged does not store the contents again.
+    """
+
+    __tablename__ = "plugin_file_contents"
+
+    # Database fields
+    plugin_file_contents_id: Mapped[intpk] = mapped_column(init=False)
+    contents_hash: Mapped[str] = mapped_column(
+        String(64), nullable=False, unique=True, index=True
+    )
+    contents: Mapped[text_] = mapped_column(nullable=False)
+
+
+def hash_plugin_file_contents(contents: str) -> str:
+    """Compute the key of plugin file contents in the plugin_file_contents table.
+
+    Args:
+        contents: The contents of a plugin file.
+
+    Returns:
+        The hex digest of the SHA-256 hash of the UTF-8 encoded contents.
+    """
+    return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+
 class PluginPluginFile(db.Model):  # type: ignore[name-defined]
     __tablename__ = "plugin_plugin_files"
 
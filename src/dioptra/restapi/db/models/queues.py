@@ -20,6 +20,7 @@ from sqlalchemy import ForeignKeyConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from dioptra.restapi.db.db import bigint, intpk, text_
+from dioptra.rq.scheduling import FAIR_SHARE_NONE
 
 from .resources import ResourceSnapshot
 
@@ -36,6 +37,7 @@ class Queue(ResourceSnapshot):
     resource_snapshot_id: Mapped[intpk] = mapped_column(init=False)
     resource_id: Mapped[bigint] = mapped_column(init=False, nullable=False, index=True)
     name: Mapped[text_] = mapped_column(nullable=False)
+    fair_share: Mapped[text_] = mapped_column(nullable=False, default=FAIR_SHARE_NONE)
 
     # Relationships
     queue_jobs: Mapped[list["QueueJob"]] = relationship(init=False, viewonly=True)
@@ -169,6 +169,9 @@ class DraftResource(db.Model):  # type: ignore[name-defined]
         ForeignKey("users.user_id"), init=False, nullable=False, index=True
     )
     payload: Mapped[json_] = mapped_column(nullable=False)
+    resource_id: Mapped[optionalbigint] = mapped_column(
+        init=False, nullable=True, index=True
+    )
     created_on: Mapped[datetimetz] = mapped_column(init=False, nullable=False)
     last_modified_on: Mapped[datetimetz] = mapped_column(init=False, nullable=False)
 
@@ -190,6 +193,10 @@ class DraftResource(db.Model):  # type: ignore[name-defined]
         self.created_on = timestamp
         self.last_modified_on = timestamp
 
+        # Copy the target resource id out of the payload so that lookups by resource
+        # can use an index. A draft's target resource never changes.
+        self.resource_id = self.payload.get("resource_id")
+
 
 class ResourceSnapshot(db.Model):  # type: ignore[name-defined]
     __tablename__ = "resource_snapshots"
@@ -393,9 +400,3 @@ class SharedResource(db.Model):  # type: ignore[name-defined]
     def __post_init__(self) -> None:
         timestamp = datetime.datetime.now(tz=datetime.timezone.utc)
         self.created_on = timestamp
-
-
-draft_resource_json_resource_id = Index(
-    "ix_draft_resources_payload_resource_id",
-    DraftResource.payload["resource_id"].as_string().cast(Integer),
-)
@@ -152,6 +152,8 @@ class DraftsRepository:
         # TODO: verify that the draft payload is for a draft resource, not a
         # draft modification?  Any other sanity checks necessary?
 
+        # Keep the indexed column in sync with the payload it was copied from
+        draft.resource_id = draft.payload["resource_id"]
         self._session.add(draft)
 
     def create_draft_modification(
@@ -231,6 +233,8 @@ class DraftsRepository:
         # TODO: verify that the draft payload is for a draft modification, not
         # a draft resource?  Any other sanity checks necessary?
 
+        # Keep the indexed column in sync with the payload it was copied from
+        draft.resource_id = resource_id
         self._session.add(draft)
 
     def get(
@@ -378,7 +382,7 @@ class DraftsRepository:
         resource_id = get_resource_id(resource)
 
         stmt = sa.select(DraftResource).where(
-            DraftResource.payload["resource_id"].as_integer() == resource_id,
+            DraftResource.resource_id == resource_id,
             DraftResource.user_id == user_id,
         )
 
@@ -420,7 +424,7 @@ class DraftsRepository:
             sa.select(sa.func.count())
             .select_from(DraftResource)
             .where(
-                DraftResource.payload["resource_id"].as_integer() == resource_id,
+                DraftResource.resource_id == resource_id,
             )
         )
 
@@ -506,11 +510,11 @@ class DraftsRepository:
 
         if draft_type is DraftType.RESOURCE:
             filters.append(
-                DraftResource.payload["resource_id"].as_integer() == None  # noqa: E711
+                DraftResource.resource_id == None  # noqa: E711
             )
         elif draft_type is DraftType.MODIFICATION:
             filters.append(
-                DraftResource.payload["resource_id"].as_integer() != None  # noqa: E711
+                DraftResource.resource_id != None  # noqa: E711
             )
         # else: if DraftType.ALL, don't filter
 
@@ -665,8 +669,8 @@ class DraftsRepository:
             resource_ids_with_drafts = set()
 
         else:
-            stmt = sa.select(DraftResource.payload["resource_id"].as_integer()).where(
-                DraftResource.payload["resource_id"].as_integer().in_(resource_ids),
+            stmt = sa.select(DraftResource.resource_id).where(
+                DraftResource.resource_id.in_(resource_ids),
             )
 
             if user is None:
@@ -707,7 +711,7 @@ class DraftsRepository:
             stmt: sa.Select = (
                 sa.select(sa.literal_column("1"))
                 .select_from(DraftResource)
-                .where(DraftResource.payload["resource_id"].as_integer() == resource_id)
+                .where(DraftResource.resource_id == resource_id)
             )
 
             if user is None:
@@ -39,6 +39,7 @@ from dioptra.restapi.db.repository.utils import (
     construct_sql_query_filters,
     get_group_id,
     group_exists,
+    invalidate_identity,
     user_exists,
 )
 from dioptra.restapi.errors import (
@@ -133,6 +134,7 @@ class GroupRepository:
         )
 
         self.session.add(group)
+        invalidate_identity(group.creator, self.session)
 
     def delete(self, group: Group) -> None:
         """
@@ -430,6 +432,7 @@ class GroupRepository:
                 admin=admin,
             )
             group.managers.append(manager)
+            invalidate_identity(user, self.session)
 
         return manager
 
@@ -468,6 +471,7 @@ class GroupRepository:
             manager = self.session.get(GroupManager, (user.user_id, group.group_id))
             if manager:
                 self.session.delete(manager)
+                invalidate_identity(user, self.session)
 
     def add_member(
         self,
@@ -513,6 +517,7 @@ class GroupRepository:
                 user=user,
             )
             group.members.append(member)
+            invalidate_identity(user, self.session)
 
         return member
 
@@ -579,6 +584,7 @@ class GroupRepository:
                 member = self.session.get(GroupMember, (user.user_id, group.group_id))
                 if member:
                     self.session.delete(member)
+                    invalidate_identity(user, self.session)
 
 
 def _apply_deletion_policy(
@@ -23,13 +23,14 @@ from typing import Any, Final, overload
 
 import dioptra.restapi.db.repository.utils as utils
 from dioptra.restapi.db.models import Group, Queue, Resource, Tag
+from dioptra.restapi.db.text_search import text_match
 
 
 class QueueRepository:
     SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
         "name": lambda x: Queue.name.like(x, escape="/"),
-        "description": lambda x: Queue.description.like(x, escape="/"),
-        "tag": lambda x: Queue.tags.any(Tag.name.like(x, escape="/")),
+        "description": lambda x: text_match(Queue.description, x),
+        "tag": lambda x: Queue.tags.any(text_match(Tag.name, x)),
     }
 
     # Maps a general sort criterion name to a Queue attribute
@@ -270,3 +271,60 @@ class QueueRepository:
             descending,
             deletion_policy,
         )
+
+    def get_by_filters_keyset_paged(
+        self,
+        group: Group | int | None,
+        filters: list[dict],
+        cursor: utils.PageCursor,
+        page_length: int,
+        sort_by: str | None,
+        descending: bool,
+        count_total: bool = True,
+        deletion_policy: utils.DeletionPolicy = utils.DeletionPolicy.NOT_DELETED,
+    ) -> tuple[Sequence[Queue], int | None, utils.PageCursors]:
+        """
+        Get some queues according to search criteria, using keyset
+        pagination.
+
+        Args:
+            group: Limit queues to those owned by this group; None to not
+                limit the search
+            filters: Search criteria, see parse_search_text()
+            cursor: The position of the page within the results
+            page_length: Maximum number of rows in the page; use <= 0 for
+                unlimited length
+            sort_by: Sort criterion; must be a key of SORTABLE_FIELDS.  None
+                to sort by resource snapshot ID.
+            descending: Whether to sort in descending order
+            count_total: Whether to count the total number of matching
+                queues
+            deletion_policy: Whether to look at deleted queues, non-deleted
+                queues, or all queues
+
+        Returns:
+            A 3-tuple including the page of queues, total count of matching
+            queues which exist (None if count_total is False), and the
+            cursors for the adjacent pages
+
+        Raises:
+            SearchParseError: if filters includes a non-searchable field
+            SortParameterValidationError: if sort_by is a non-sortable field
+            EntityDoesNotExistError: if the given group does not exist
+            EntityDeletedError: if the given group is deleted
+        """
+
+        return utils.get_by_filters_keyset_paged(
+            self.session,
+            Queue,
+            self.SORTABLE_FIELDS,
+            self.SEARCHABLE_FIELDS,
+            group,
+            filters,
+            cursor,
+            page_length,
+            sort_by,
+            descending,
+            count_total,
+            deletion_policy,
+        )
@@ -28,15 +28,14 @@ from dioptra.restapi.db.models import (
     Resource,
     Tag,
 )
+from dioptra.restapi.db.text_search import text_match
 
 
 class TypeRepository:
     SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
         "name": lambda x: PluginTaskParameterType.name.like(x, escape="/"),
-        "description": lambda x: PluginTaskParameterType.description.like(
-            x, escape="/"
-        ),
-        "tag": lambda x: PluginTaskParameterType.tags.any(Tag.name.like(x, escape="/")),
+        "description": lambda x: text_match(PluginTaskParameterType.description, x),
+        "tag": lambda x: PluginTaskParameterType.tags.any(text_match(Tag.name, x)),
     }
 
     # Maps a general sort criterion name to an PluginTaskParameterType attribute
@@ -277,6 +276,63 @@ class TypeRepository:
             deletion_policy,
         )
 
+    def get_by_filters_keyset_paged(
+        self,
+        group: Group | int | None,
+        filters: list[dict],
+        cursor: utils.PageCursor,
+        page_length: int,
+        sort_by: str | None,
+        descending: bool,
+        count_total: bool = True,
+        deletion_policy: utils.DeletionPolicy = utils.DeletionPolicy.NOT_DELETED,
+    ) -> tuple[Sequence[PluginTaskParameterType], int | None, utils.PageCursors]:
+        """
+        Get some types according to search criteria, using keyset
+        pagination.
+
+        Args:
+            group: Limit types to those owned by this group; None to not
+                limit the search
+            filters: Search criteria, see parse_search_text()
+            cursor: The position of the page within the results
+            page_length: Maximum number of rows in the page; use <= 0 for
+                unlimited length
+            sort_by: Sort criterion; must be a key of SORTABLE_FIELDS.  None
+                to sort by resource snapshot ID.
+            descending: Whether to sort in descending order
+            count_total: Whether to count the total number of matching
+                types
+            deletion_policy: Whether to look at deleted types, non-deleted
+                types, or all types
+
+        Returns:
+            A 3-tuple including the page of types, total count of matching
+            types which exist (None if count_total is False), and the
+            cursors for the adjacent pages
+
+        Raises:
+            SearchParseError: if filters includes a non-searchable field
+            SortParameterValidationError: if sort_by is a non-sortable field
+            EntityDoesNotExistError: if the given group does not exist
+            EntityDeletedError: if the given group is deleted
+        """
+
+        return utils.get_by_filters_keyset_paged(
+            self.session,
+            PluginTaskParameterType,
+            self.SORTABLE_FIELDS,
+            self.SEARCHABLE_FIELDS,
+            group,
+            filters,
+            cursor,
+            page_length,
+            sort_by,
+            descending,
+            count_total,
+            deletion_policy,
+        )
+
     def delete(self, type_: PluginTaskParameterType | int) -> None:
         """
         Delete a type.  No-op if the type is already deleted.
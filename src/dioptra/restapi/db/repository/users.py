@@ -39,6 +39,7 @@ from dioptra.restapi.db.repository.utils import (
     construct_sql_query_filters,
     get_group_id,
     get_user_id,
+    invalidate_identity,
     user_exists,
 )
 from dioptra.restapi.errors import EntityDoesNotExistError
@@ -126,6 +127,7 @@ class UserRepository:
         elif exists_result is ExistenceResult.EXISTS:
             lock = UserLock(UserLockTypes.DELETE, user)
             self.session.add(lock)
+            invalidate_identity(user, self.session)
 
     def get(
         self, user_id: int, deletion_policy: DeletionPolicy = DeletionPolicy.NOT_DELETED
@@ -27,5 +27,7 @@
 #    the new symbol.
 from .checks import *  # noqa: F401,F403
 from .common import *  # noqa: F401,F403
+from .identity import *  # noqa: F401,F403
+from .paging import *  # noqa: F401,F403
 from .resources import *  # noqa: F401,F403
 from .search import *  # noqa: F401,F403
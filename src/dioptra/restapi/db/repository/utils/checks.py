@@ -42,6 +42,7 @@ from dioptra.restapi.db.repository.utils.common import (
     get_resource_snapshot_id,
     get_user_id,
 )
+from dioptra.restapi.db.repository.utils.identity import current_identity
 
 
 def user_exists(session: CompatibleSession[S], user: m.User | int) -> ExistenceResult:
@@ -61,6 +62,10 @@ def user_exists(session: CompatibleSession[S], user: m.User | int) -> ExistenceR
 
     if user_id is None:
         exists = ExistenceResult.DOES_NOT_EXIST
+    elif current_identity(session, user_id, build=False) is not None:
+        # The request's logged in user, which was found to exist and not be
+        # deleted earlier in the request.
+        exists = ExistenceResult.EXISTS
     else:
         # May as well get existence + deletion status in one query.  I think
         # this ought to be more efficient than getting the whole User object
@@ -1162,7 +1167,12 @@ def assert_user_in_group(
 
     # Assume existence checks on user and group were already done, so they are
     # known to exist.
-    membership = session.get(m.GroupMember, (user.user_id, group.group_id))
+    identity = current_identity(session, user)
+
+    if identity is not None:
+        membership = identity.is_member(group.group_id)
+    else:
+        membership = session.get(m.GroupMember, (user.user_id, group.group_id))
 
     if not membership:
         raise e.UserNotInGroupError(user.user_id, group.group_id)
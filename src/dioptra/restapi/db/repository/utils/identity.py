@@ -0,0 +1,304 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""
+Caching of the logged in user's identity: the user id and the user's group
+memberships and managerships.
+
+Identities are cached for the duration of a request, and optionally in a
+process-wide cache keyed by the user's alternative id (the session id used by
+Flask-Login) for DIOPTRA_IDENTITY_CACHE_TTL seconds.  Code which changes group
+memberships, managerships, deletion status, or the alternative id of a user
+must call invalidate_identity().
+
+The shared cache is local to a process, so invalidation does not reach other
+processes, such as other gunicorn workers.  Users loaded from a shared identity
+are checked against their alternative id and deletion status, so a logout,
+password change, or deletion takes effect everywhere at once.  Group membership
+and managership changes made by another process take effect once the cached
+identity expires.
+"""
+
+import dataclasses
+import threading
+import time
+from typing import Final
+
+import sqlalchemy as sa
+from flask import current_app, g, has_app_context, has_request_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session, scoped_session
+
+import dioptra.restapi.db.models as m
+from dioptra.restapi.db.repository.utils.common import (
+    CompatibleSession,
+    S,
+    get_user_id,
+)
+
+IDENTITY_CACHE_TTL_CONFIG: Final[str] = "DIOPTRA_IDENTITY_CACHE_TTL"
+_REQUEST_IDENTITY_ATTR: Final[str] = "_dioptra_identity"
+_INVALIDATED_USER_IDS_KEY: Final[str] = "dioptra_invalidated_user_ids"
+
+
+@dataclasses.dataclass(frozen=True)
+class Identity:
+    """
+    A snapshot of a non-deleted user's identity and group relationships.
+    """
+
+    user_id: int
+    alternative_id: str
+    member_group_ids: frozenset[int]
+    manager_group_ids: frozenset[int]
+
+    def is_member(self, group_id: int) -> bool:
+        return group_id in self.member_group_ids
+
+    def is_manager(self, group_id: int) -> bool:
+        return group_id in self.manager_group_ids
+
+
+class SharedIdentityCache:
+    """
+    A thread-safe, process-wide cache of identities with a time-to-live.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[float, Identity]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, alternative_id: str, ttl: float) -> Identity | None:
+        """
+        Get a cached identity.
+
+        Args:
+            alternative_id: A user's alternative ID
+            ttl: The maximum age of the cached identity, in seconds
+
+        Returns:
+            An identity, or None if it is not cached or has expired
+        """
+        with self._lock:
+            entry = self._entries.get(alternative_id)
+
+            if entry is None:
+                return None
+
+            cached_on, identity = entry
+
+            if time.monotonic() - cached_on > ttl:
+                del self._entries[alternative_id]
+                return None
+
+            return identity
+
+    def put(self, identity: Identity) -> None:
+        with self._lock:
+            self._entries[identity.alternative_id] = (time.monotonic(), identity)
+
+    def invalidate(self, user_id: int) -> None:
+        """
+        Remove all cached identities of a user.
+
+        Args:
+            user_id: A user ID
+        """
+        with self._lock:
+            self._entries = {
+                alternative_id: entry
+                for alternative_id, entry in self._entries.items()
+                if entry[1].user_id != user_id
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+SHARED_IDENTITY_CACHE: Final[SharedIdentityCache] = SharedIdentityCache()
+
+
+def build_identity(session: CompatibleSession[S], user: m.User) -> Identity:
+    """
+    Look up the group memberships and managerships of a user.
+
+    Args:
+        session: An SQLAlchemy session
+        user: An existing, non-deleted user
+
+    Returns:
+        The user's identity
+    """
+    member_stmt = sa.select(m.GroupMember.group_id).where(
+        m.GroupMember.user_id == user.user_id
+    )
+    manager_stmt = sa.select(m.GroupManager.group_id).where(
+        m.GroupManager.user_id == user.user_id
+    )
+
+    return Identity(
+        user_id=user.user_id,
+        alternative_id=str(user.alternative_id),
+        member_group_ids=frozenset(session.scalars(member_stmt)),
+        manager_group_ids=frozenset(session.scalars(manager_stmt)),
+    )
+
+
+def _shared_cache_ttl() -> float | None:
+    if not has_app_context():
+        return None
+
+    ttl = current_app.config.get(IDENTITY_CACHE_TTL_CONFIG)
+
+    return ttl if ttl else None
+
+
+def get_shared_identity(alternative_id: str) -> Identity | None:
+    """
+    Get an identity from the shared cache.
+
+    Args:
+        alternative_id: A user's alternative ID
+
+    Returns:
+        The identity, or None if the shared cache is disabled or the identity
+        is not cached
+    """
+    if (ttl := _shared_cache_ttl()) is None:
+        return None
+
+    return SHARED_IDENTITY_CACHE.get(alternative_id, ttl)
+
+
+def shared_identity_cache_enabled() -> bool:
+    return _shared_cache_ttl() is not None
+
+
+def cache_identity(identity: Identity, share: bool = True) -> None:
+    """
+    Cache an identity for the current request, and in the shared cache if it
+    is enabled.
+
+    Args:
+        identity: The identity of the request's logged in user
+        share: Whether to also store the identity in the shared cache.  Pass
+            False for identities taken from the shared cache, so that they
+            expire a fixed time after they were looked up.
+    """
+    if has_request_context():
+        setattr(g, _REQUEST_IDENTITY_ATTR, identity)
+
+    if share and shared_identity_cache_enabled():
+        SHARED_IDENTITY_CACHE.put(identity)
+
+
+def current_identity(
+    session: CompatibleSession[S], user: m.User | int, build: bool = True
+) -> Identity | None:
+    """
+    Get the cached identity of a user, if the user is the logged in user of
+    the current request.  The identity is looked up on first use and reused
+    for the rest of the request.
+
+    Args:
+        session: An SQLAlchemy session
+        user: A User object or user_id integer primary key value
+        build: Whether to look up the identity if it is not already cached
+
+    Returns:
+        The user's identity, or None if the user is not the logged in user of
+        the current request, or the identity is not cached and build is False
+    """
+    if not has_request_context():
+        return None
+
+    user_id = get_user_id(user)
+    identity: Identity | None = g.get(_REQUEST_IDENTITY_ATTR)
+
+    if identity is not None and identity.user_id == user_id:
+        return identity
+
+    if not build or user_id is None:
+        return None
+
+    # Imported here since Flask-Login is only needed within requests
+    from flask_login import current_user
+
+    request_user = current_user._get_current_object()  # type: ignore
+
+    if (
+        not isinstance(request_user, m.User)
+        or request_user.user_id != user_id
+        or request_user.is_deleted
+    ):
+        return None
+
+    identity = build_identity(session, request_user)
+    cache_identity(identity)
+
+    return identity
+
+
+def invalidate_identity(
+    user: m.User | int, session: CompatibleSession[S] | None = None
+) -> None:
+    """
+    Discard the cached identities of a user, in the current request and the
+    shared cache.
+
+    Args:
+        user: A User object or user_id integer primary key value
+        session: The SQLAlchemy session making the change.  If given, the
+            shared cache is cleared again once the session commits, since a
+            concurrent request may cache the old identity before then.
+    """
+    user_id = get_user_id(user)
+
+    if user_id is None:
+        return
+
+    if has_request_context():
+        identity: Identity | None = g.get(_REQUEST_IDENTITY_ATTR)
+
+        if identity is not None and identity.user_id == user_id:
+            g.pop(_REQUEST_IDENTITY_ATTR)
+
+    SHARED_IDENTITY_CACHE.invalidate(user_id)
+
+    if session is not None:
+        if isinstance(session, scoped_session):
+            session = session()
+
+        session.info.setdefault(_INVALIDATED_USER_IDS_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_identities(session: Session) -> None:
+    for user_id in session.info.pop(_INVALIDATED_USER_IDS_KEY, ()):
+        SHARED_IDENTITY_CACHE.invalidate(user_id)
+
+
+__all__ = [
+    "Identity",
+    "SHARED_IDENTITY_CACHE",
+    "build_identity",
+    "cache_identity",
+    "current_identity",
+    "get_shared_identity",
+    "invalidate_identity",
+    "shared_identity_cache_enabled",
+]
@@ -0,0 +1,332 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""
+Keyset ("cursor") pagination support.
+
+Offset pagination requires the database to walk past every row before the
+start of the requested page, and is usually paired with a count(*) query over
+the whole result set.  Both get slow on large tables.  Keyset pagination
+instead remembers the sort key of the last row returned, and asks for the rows
+which sort after it.  With a suitable index, that is cheap regardless of how
+deep into the result set the page is.
+
+Rows are ordered by the requested sort column, with the resource snapshot ID
+as a tiebreaker so that the ordering is total.  NULL sort values are treated
+as smaller than any non-NULL value, on all database backends.
+"""
+
+import base64
+import binascii
+import dataclasses
+import datetime
+import json
+import typing
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+import dioptra.restapi.errors as e
+from dioptra.restapi.db.repository.utils.common import CompatibleSession, S
+
+
+@dataclasses.dataclass(frozen=True)
+class PageCursor:
+    """
+    A position within a keyset-paginated result set.
+
+    A cursor with a snapshot_id of None denotes the start of the result set.
+    Otherwise, the cursor identifies a row by its sort key, and the page
+    consists of the rows which follow it (or precede it, if backward is True).
+    """
+
+    sort_value: typing.Any = None
+    snapshot_id: int | None = None
+    backward: bool = False
+
+    @property
+    def is_start(self) -> bool:
+        return self.snapshot_id is None
+
+
+class PageCursors(typing.NamedTuple):
+    """
+    The cursors for the pages adjacent to a page of keyset-paginated results.
+    A cursor is None if there is no page in that direction.
+    """
+
+    next: PageCursor | None
+    prev: PageCursor | None
+
+
+def _encode_sort_value(value: typing.Any) -> typing.Any:
+    if isinstance(value, datetime.datetime):
+        return {"dt": value.isoformat()}
+
+    return value
+
+
+def _decode_sort_value(value: typing.Any) -> typing.Any:
+    if isinstance(value, dict):
+        return datetime.datetime.fromisoformat(value["dt"])
+
+    return value
+
+
+def encode_page_cursor(
+    cursor: PageCursor, sort_by: str | None, descending: bool
+) -> str:
+    """
+    Encode a cursor as an opaque, URL-safe token.  The sort criteria are
+    included so that a token can't be replayed against a differently sorted
+    result set.
+
+    Args:
+        cursor: The cursor to encode
+        sort_by: The sort criterion the cursor applies to
+        descending: Whether the sort order is descending
+
+    Returns:
+        A token string
+    """
+    if cursor.is_start:
+        return ""
+
+    payload = {
+        "s": sort_by or None,
+        "d": bool(descending),
+        "k": _encode_sort_value(cursor.sort_value),
+        "i": cursor.snapshot_id,
+        "b": cursor.backward,
+    }
+
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@typing.overload
+def decode_page_cursor(
+    token: str, sort_by: str | None, descending: bool
+) -> PageCursor: ...
+
+
+@typing.overload
+def decode_page_cursor(token: None, sort_by: str | None, descending: bool) -> None: ...
+
+
+def decode_page_cursor(
+    token: str | None, sort_by: str | None, descending: bool
+) -> PageCursor | None:
+    """
+    Decode a token produced by encode_page_cursor().  An empty token decodes
+    to a cursor pointing at the start of the result set.
+
+    Args:
+        token: The token to decode, or None if cursor-based paging was not
+            requested
+        sort_by: The sort criterion of the current request
+        descending: Whether the current request sorts in descending order
+
+    Returns:
+        A PageCursor, or None if token is None
+
+    Raises:
+        QueryParameterValidationError: if the token is malformed, or was
+            produced for a different sort order
+    """
+    if token is None:
+        return None
+
+    if not token:
+        return PageCursor()
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor = PageCursor(
+            sort_value=_decode_sort_value(payload["k"]),
+            snapshot_id=int(payload["i"]),
+            backward=bool(payload["b"]),
+        )
+        token_sort_by = payload["s"]
+        token_descending = bool(payload["d"])
+
+    except (
+        binascii.Error,
+        UnicodeError,
+        ValueError,
+        KeyError,
+        TypeError,
+    ) as err:
+        raise e.QueryParameterValidationError("cursor", "format") from err
+
+    if token_sort_by != (sort_by or None) or token_descending != bool(descending):
+        raise e.QueryParameterValidationError(
+            "cursor", "sort order", sortBy=sort_by, descending=descending
+        )
+
+    return cursor
+
+
+def _keyset_order_by(
+    sort_column: typing.Any, tiebreaker: typing.Any, scan_descending: bool
+) -> list[typing.Any]:
+    order_by = []
+    if scan_descending:
+        if sort_column is not None:
+            order_by.append(sort_column.desc().nulls_last())
+        order_by.append(tiebreaker.desc())
+    else:
+        if sort_column is not None:
+            order_by.append(sort_column.asc().nulls_first())
+        order_by.append(tiebreaker.asc())
+
+    return order_by
+
+
+def _keyset_after(
+    sort_column: typing.Any,
+    tiebreaker: typing.Any,
+    scan_descending: bool,
+    cursor: PageCursor,
+) -> sa.ColumnElement[bool]:
+    """
+    Build a WHERE clause expression selecting rows which come after the given
+    cursor, in the scan direction.
+    """
+    if scan_descending:
+        tiebreaker_after = tiebreaker < cursor.snapshot_id
+    else:
+        tiebreaker_after = tiebreaker > cursor.snapshot_id
+
+    if sort_column is None:
+        return tiebreaker_after
+
+    value = cursor.sort_value
+    if scan_descending:
+        if value is None:
+            after = sa.and_(sort_column.is_(None), tiebreaker_after)
+        else:
+            after = sa.or_(
+                sort_column < value,
+                sort_column.is_(None),
+                sa.and_(sort_column == value, tiebreaker_after),
+            )
+    else:
+        if value is None:
+            after = sa.or_(
+                sa.and_(sort_column.is_(None), tiebreaker_after),
+                sort_column.is_not(None),
+            )
+        else:
+            after = sa.or_(
+                sort_column > value,
+                sa.and_(sort_column == value, tiebreaker_after),
+            )
+
+    return after
+
+
+def get_keyset_page(
+    session: CompatibleSession[S],
+    stmt: sa.Select,
+    sort_column: typing.Any,
+    tiebreaker: typing.Any,
+    descending: bool,
+    cursor: PageCursor,
+    page_length: int,
+) -> tuple[Sequence[typing.Any], PageCursors]:
+    """
+    Fetch one page of a keyset-paginated query.
+
+    Args:
+        session: An SQLAlchemy session
+        stmt: A SELECT statement of a single entity, with all filtering
+            applied, but no ordering, offset or limit
+        sort_column: The column to sort by, or None to sort by the tiebreaker
+            only
+        tiebreaker: A unique column used to totally order rows which share a
+            sort value, normally the resource snapshot ID
+        descending: Whether to sort in descending order
+        cursor: The position of the page to fetch
+        page_length: Maximum number of rows in the page; use <= 0 for
+            unlimited length
+
+    Returns:
+        A 2-tuple including the page of entities, in sort order, and the
+        cursors for the adjacent pages
+    """
+    # A backward page is fetched by scanning the sort order in reverse, then
+    # flipping the result.
+    scan_descending = descending != cursor.backward
+
+    sort_key_column = (
+        sort_column.label("_page_sort_key") if sort_column is not None else None
+    )
+    page_stmt = stmt.add_columns(
+        *([sort_key_column] if sort_key_column is not None else []),
+        tiebreaker.label("_page_tiebreaker"),
+    )
+
+    if not cursor.is_start:
+        page_stmt = page_stmt.where(
+            _keyset_after(sort_column, tiebreaker, scan_descending, cursor)
+        )
+
+    page_stmt = page_stmt.order_by(
+        *_keyset_order_by(sort_column, tiebreaker, scan_descending)
+    )
+
+    # Fetch one extra row, to find out whether there is more to come without
+    # having to count.
+    if page_length > 0:
+        page_stmt = page_stmt.limit(page_length + 1)
+
+    rows = list(session.execute(page_stmt).unique().all())
+    has_more = page_length > 0 and len(rows) > page_length
+    if has_more:
+        rows = rows[:page_length]
+
+    if cursor.backward:
+        rows.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, not cursor.is_start
+
+    def row_cursor(row: sa.Row, backward: bool) -> PageCursor:
+        return PageCursor(
+            sort_value=row._page_sort_key if sort_key_column is not None else None,
+            snapshot_id=row._page_tiebreaker,
+            backward=backward,
+        )
+
+    next_cursor = prev_cursor = None
+    if rows:
+        if has_next:
+            next_cursor = row_cursor(rows[-1], backward=False)
+        if has_prev:
+            prev_cursor = row_cursor(rows[0], backward=True)
+
+    return [row[0] for row in rows], PageCursors(next=next_cursor, prev=prev_cursor)
+
+
+__all__ = [
+    "PageCursor",
+    "PageCursors",
+    "decode_page_cursor",
+    "encode_page_cursor",
+    "get_keyset_page",
+]
@@ -46,6 +46,11 @@ from dioptra.restapi.db.repository.utils.common import (
     get_group_id,
     get_resource_id,
 )
+from dioptra.restapi.db.repository.utils.paging import (
+    PageCursor,
+    PageCursors,
+    get_keyset_page,
+)
 from dioptra.restapi.db.repository.utils.search import construct_sql_query_filters
 
 # May be bound to a resource-type-specific ResourceSnapshot subclass,
@@ -771,20 +776,13 @@ def get_by_filters_paged(
     if group_id is not None:
         assert_group_exists(session, group_id, DeletionPolicy.NOT_DELETED)
 
-    count_stmt = (
-        sa.select(sa.func.count())
-        .select_from(snap_class)
-        .join(m.Resource)
-        .where(snap_class.resource_snapshot_id == m.Resource.latest_snapshot_id)
+    count_stmt = _filter_latest_snapshots_stmt(
+        sa.select(sa.func.count()).select_from(snap_class),
+        snap_class,
+        group_id,
+        sql_filter,
+        deletion_policy,
     )
-
-    if group_id is not None:
-        count_stmt = count_stmt.where(m.Resource.group_id == group_id)
-
-    if sql_filter is not None:
-        count_stmt = count_stmt.where(sql_filter)
-
-    count_stmt = apply_resource_deletion_policy(count_stmt, deletion_policy)
     current_count = session.scalar(count_stmt)
 
     # For mypy: a "SELECT count(*)..." query should never return NULL.
@@ -794,20 +792,10 @@ def get_by_filters_paged(
     if current_count == 0:
         snaps = []
     else:
-        page_stmt = (
-            sa.select(snap_class)
-            .join(m.Resource)
-            .where(snap_class.resource_snapshot_id == m.Resource.latest_snapshot_id)
+        page_stmt = _filter_latest_snapshots_stmt(
+            sa.select(snap_class), snap_class, group_id, sql_filter, deletion_policy
         )
 
-        if group_id is not None:
-            page_stmt = page_stmt.where(m.Resource.group_id == group_id)
-
-        if sql_filter is not None:
-            page_stmt = page_stmt.where(sql_filter)
-
-        page_stmt = apply_resource_deletion_policy(page_stmt, deletion_policy)
-
         if sort_by:
             sort_criteria = sortable_fields[sort_by]
             if descending:
@@ -826,6 +814,119 @@ def get_by_filters_paged(
     return snaps, current_count
 
 
+def get_by_filters_keyset_paged(
+    session: CompatibleSession[S],
+    snap_class: typing.Type[ResourceT],
+    sortable_fields: dict[str, typing.Any],
+    searchable_fields: dict[str, typing.Any],
+    group: m.Group | int | None,
+    filters: list[dict],
+    cursor: PageCursor,
+    page_length: int,
+    sort_by: str | None,
+    descending: bool,
+    count_total: bool = True,
+    deletion_policy: DeletionPolicy = DeletionPolicy.NOT_DELETED,
+) -> tuple[Sequence[ResourceT], int | None, PageCursors]:
+    """
+    Get some resources according to search criteria, using keyset pagination.
+    This is like get_by_filters_paged(), except that the page is located by a
+    cursor rather than a row index, and counting the matching resources is
+    optional.
+
+    Args:
+        session: An SQLAlchemy session
+        snap_class: A ResourceSnapshot subclass, which represents which type
+            of resource to get
+        sortable_fields: Determines the legal values for the "sort_by"
+            argument, see get_by_filters_paged()
+        searchable_fields: Determines the legal filters in the "filters"
+            argument, see get_by_filters_paged()
+        group: Limit resources to those owned by this group; None to not limit
+            the search
+        filters: Search criteria, see parse_search_text()
+        cursor: The position of the page within the results
+        page_length: Maximum number of rows in the page; use <= 0 for
+            unlimited length
+        sort_by: Sort criterion; must be a key of sortable_fields.  None
+            to sort by resource snapshot ID.
+        descending: Whether to sort in descending order
+        count_total: Whether to count the total number of matching resources.
+            Counting requires a scan over all matching rows, which callers may
+            prefer to skip.
+        deletion_policy: Whether to look at deleted resources, non-deleted
+            resources, or all resources
+
+    Returns:
+        A 3-tuple including the page of resources, total count of matching
+        resources which exist (None if count_total is False), and the cursors
+        for the adjacent pages
+
+    Raises:
+        SearchParseError: if filters includes a non-searchable field
+        SortParameterValidationError: if sort_by is a non-sortable field
+        EntityDoesNotExistError: if the given group does not exist
+        EntityDeletedError: if the given group is deleted
+    """
+    sql_filter = construct_sql_query_filters(filters, searchable_fields)
+    if sort_by and sort_by not in sortable_fields:
+        raise e.SortParameterValidationError("resource", sort_by)
+    group_id = None if group is None else get_group_id(group)
+
+    if group_id is not None:
+        assert_group_exists(session, group_id, DeletionPolicy.NOT_DELETED)
+
+    current_count = None
+    if count_total:
+        count_stmt = _filter_latest_snapshots_stmt(
+            sa.select(sa.func.count()).select_from(snap_class),
+            snap_class,
+            group_id,
+            sql_filter,
+            deletion_policy,
+        )
+        current_count = session.scalar(count_stmt)
+
+    page_stmt = _filter_latest_snapshots_stmt(
+        sa.select(snap_class), snap_class, group_id, sql_filter, deletion_policy
+    )
+    snaps, cursors = get_keyset_page(
+        session,
+        page_stmt,
+        sortable_fields[sort_by] if sort_by else None,
+        snap_class.resource_snapshot_id,
+        descending,
+        cursor,
+        page_length,
+    )
+
+    return snaps, current_count, cursors
+
+
+def _filter_latest_snapshots_stmt(
+    stmt: sa.Select,
+    snap_class: typing.Type[ResourceT],
+    group_id: int | None,
+    sql_filter: typing.Any,
+    deletion_policy: DeletionPolicy,
+) -> sa.Select:
+    """
+    Restrict a snapshot select statement to latest snapshots matching the
+    given owner, search filter and deletion policy.
+    """
+    stmt = stmt.join(m.Resource).where(
+        snap_class.resource_snapshot_id == m.Resource.latest_snapshot_id
+    )
+
+    if group_id is not None:
+        stmt = stmt.where(m.Resource.group_id == group_id)
+
+    if sql_filter is not None:
+        stmt = stmt.where(sql_filter)
+
+    return apply_resource_deletion_policy(stmt, deletion_policy)
+
+
 __all__ = [
     "ResourceLockType",
     "ResourceT",
@@ -833,6 +934,7 @@ __all__ = [
     "append_resource_children",
     "apply_resource_deletion_policy",
     "delete_resource",
+    "get_by_filters_keyset_paged",
     "get_by_filters_paged",
     "get_latest_child_snapshots",
     "get_latest_snapshots",
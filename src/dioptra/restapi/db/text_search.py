@@ -0,0 +1,319 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Indexed text search over frequently searched columns of the Dioptra database.
+
+The search query language matches values using SQL LIKE patterns, which a regular
+B-tree index cannot serve when the pattern begins with a wildcard. This module
+maintains trigram indexes for the columns listed in TEXT_SEARCH_INDEXES and compiles
+pattern matches against those columns so that the index is used:
+
+- PostgreSQL: a GIN index using the pg_trgm gin_trgm_ops operator class, which serves
+  LIKE patterns directly.
+- SQLite: an external content FTS5 table using the trigram tokenizer. FTS5 does not
+  use its index when LIKE has an ESCAPE clause, so candidate rows are first selected
+  from the FTS5 table using the pattern with its escapes relaxed, and the exact
+  pattern is then checked against the original column.
+
+Columns without an index are matched with a plain LIKE.
+"""
+
+import dataclasses
+import functools
+import re
+import sqlite3
+from typing import Any, Final
+
+import sqlalchemy as sa
+import sqlalchemy.sql.expression as sae
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.visitors import InternalTraversal
+
+LIKE_ESCAPE_CHAR: Final[str] = "/"
+
+POSTGRES_DIALECT: Final[str] = "postgresql"
+SQLITE_DIALECT: Final[str] = "sqlite"
+
+
+@dataclasses.dataclass(frozen=True)
+class TextSearchIndex(object):
+    """A trigram index over a text column.
+
+    Attributes:
+        table_name: The name of the table containing the indexed column.
+        column_name: The name of the indexed column.
+        key_column_name: The name of the table's integer primary key column. SQLite
+            uses it as the rowid of the FTS5 table.
+    """
+
+    table_name: str
+    column_name: str
+    key_column_name: str
+
+    @property
+    def index_name(self) -> str:
+        """The name of the PostgreSQL GIN index."""
+        return f"ix_{self.table_name}_{self.column_name}_trgm"
+
+    @property
+    def fts_table_name(self) -> str:
+        """The name of the SQLite FTS5 table."""
+        return f"{self.table_name}_{self.column_name}_fts"
+
+
+TEXT_SEARCH_INDEXES: Final[tuple[TextSearchIndex, ...]] = (
+    TextSearchIndex("resource_snapshots", "description", "resource_snapshot_id"),
+    TextSearchIndex("plugin_file_contents", "contents", "plugin_file_contents_id"),
+    TextSearchIndex("tags", "name", "tag_id"),
+)
+
+_INDEXES_BY_COLUMN: Final[dict[tuple[str, str], TextSearchIndex]] = {
+    (index.table_name, index.column_name): index for index in TEXT_SEARCH_INDEXES
+}
+
+_LIKE_ESCAPE_REGEX: Final[re.Pattern] = re.compile(
+    re.escape(LIKE_ESCAPE_CHAR) + "(.)", re.DOTALL
+)
+
+
+@functools.cache
+def sqlite_supports_text_search() -> bool:
+    """Check whether the SQLite library supports FTS5 with the trigram tokenizer.
+
+    Returns:
+        True if FTS5 trigram tables can be created, False otherwise.
+    """
+    connection = sqlite3.connect(":memory:")
+
+    try:
+        connection.execute(
+            "CREATE VIRTUAL TABLE probe USING fts5(value, tokenize='trigram')"
+        )
+
+    except sqlite3.OperationalError:
+        return False
+
+    finally:
+        connection.close()
+
+    return True
+
+
+class TextMatch(sae.ColumnElement[bool]):
+    """A LIKE pattern match against a column that has a text search index.
+
+    Use text_match() to construct this expression.
+    """
+
+    __visit_name__ = "text_match"
+    inherit_cache = True
+    type = sa.Boolean()
+
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("key_column", InternalTraversal.dp_clauseelement),
+        ("pattern", InternalTraversal.dp_clauseelement),
+        ("candidate_pattern", InternalTraversal.dp_clauseelement),
+        ("fts_table_name", InternalTraversal.dp_string),
+    ]
+
+    def __init__(
+        self,
+        column: sa.ColumnClause[Any],
+        key_column: sa.ColumnClause[Any],
+        pattern: str,
+        fts_table_name: str,
+    ) -> None:
+        self.column = column
+        self.key_column = key_column
+        self.pattern = sa.literal(pattern)
+        self.candidate_pattern = sa.literal(_LIKE_ESCAPE_REGEX.sub(r"\1", pattern))
+        self.fts_table_name = fts_table_name
+
+
+@compiles(TextMatch)
+def _compile_text_match(element: TextMatch, compiler, **kw) -> str:
+    return compiler.process(
+        element.column.like(element.pattern, escape=LIKE_ESCAPE_CHAR), **kw
+    )
+
+
+@compiles(TextMatch, SQLITE_DIALECT)
+def _compile_text_match_sqlite(element: TextMatch, compiler, **kw) -> str:
+    if not sqlite_supports_text_search():
+        return _compile_text_match(element, compiler, **kw)
+
+    column_name = element.column.name
+    fts_table = sa.table(
+        element.fts_table_name, sa.column("rowid"), sa.column(column_name)
+    )
+    candidates = sa.select(fts_table.c.rowid).where(
+        fts_table.c[column_name].like(element.candidate_pattern)
+    )
+    return compiler.process(
+        sa.and_(
+            element.key_column.in_(candidates),
+            element.column.like(element.pattern, escape=LIKE_ESCAPE_CHAR),
+        ),
+        **kw,
+    )
+
+
+def text_match(column: Any, pattern: str) -> sae.ColumnElement[bool]:
+    """Match a text column against a LIKE pattern.
+
+    The pattern uses "/" as its escape character, which is the format produced by
+    the search query parser. The match uses a text search index when one exists for
+    the column and falls back to a plain LIKE otherwise.
+
+    Args:
+        column: The column or mapped attribute to match.
+        pattern: The LIKE pattern.
+
+    Returns:
+        An expression usable in the WHERE clause of a SELECT statement.
+    """
+    expression = column.expression
+    table = getattr(expression, "table", None)
+
+    # Unwrap aliases so that they are matched against the underlying table's indexes
+    base_table = getattr(table, "element", table)
+    index = _INDEXES_BY_COLUMN.get(
+        (getattr(base_table, "name", None), getattr(expression, "name", None))
+    )
+
+    if table is None or index is None:
+        return expression.like(pattern, escape=LIKE_ESCAPE_CHAR)
+
+    return TextMatch(
+        column=expression,
+        key_column=table.c[index.key_column_name],
+        pattern=pattern,
+        fts_table_name=index.fts_table_name,
+    )
+
+
+def create_text_search_indexes(connection: sa.Connection) -> None:
+    """Create the text search indexes that are supported by the database.
+
+    Existing indexes are left in place and indexes over tables that do not exist are
+    skipped. On SQLite, the FTS5 tables are rebuilt from the contents of the indexed
+    columns.
+
+    Args:
+        connection: The database connection to use.
+    """
+    dialect_name = connection.dialect.name
+    inspector = sa.inspect(connection)
+    indexes = [
+        index for index in TEXT_SEARCH_INDEXES if inspector.has_table(index.table_name)
+    ]
+
+    for index in indexes:
+        for statement in get_create_statements(dialect_name, index):
+            connection.exec_driver_sql(statement)
+
+
+def drop_text_search_indexes(connection: sa.Connection) -> None:
+    """Drop the text search indexes created by create_text_search_indexes().
+
+    Args:
+        connection: The database connection to use.
+    """
+    dialect_name = connection.dialect.name
+
+    for index in TEXT_SEARCH_INDEXES:
+        for statement in get_drop_statements(dialect_name, index):
+            connection.exec_driver_sql(statement)
+
+
+def get_create_statements(dialect_name: str, index: TextSearchIndex) -> list[str]:
+    """Get the SQL statements that create a text search index.
+
+    The Alembic migrations also use these statements, with the indexes that existed
+    at their revision, so the index definitions are kept in one place.
+
+    Args:
+        dialect_name: The name of the database dialect.
+        index: The text search index to create.
+
+    Returns:
+        The statements to execute in order, or an empty list if the database does
+        not support text search indexes.
+    """
+    if dialect_name == POSTGRES_DIALECT:
+        return [
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            f"CREATE INDEX IF NOT EXISTS {index.index_name} ON {index.table_name} "
+            f"USING gin ({index.column_name} gin_trgm_ops)",
+        ]
+
+    if dialect_name == SQLITE_DIALECT and sqlite_supports_text_search():
+        return _sqlite_create_statements(index)
+
+    return []
+
+
+def get_drop_statements(dialect_name: str, index: TextSearchIndex) -> list[str]:
+    """Get the SQL statements that drop a text search index.
+
+    Args:
+        dialect_name: The name of the database dialect.
+        index: The text search index to drop.
+
+    Returns:
+        The statements to execute in order, or an empty list if the database does
+        not support text search indexes.
+    """
+    if dialect_name == POSTGRES_DIALECT:
+        return [f"DROP INDEX IF EXISTS {index.index_name}"]
+
+    if dialect_name == SQLITE_DIALECT:
+        return _sqlite_drop_statements(index)
+
+    return []
+
+
+def _sqlite_create_statements(index: TextSearchIndex) -> list[str]:
+    fts, table = index.fts_table_name, index.table_name
+    column, key = index.column_name, index.key_column_name
+    insert_new = f"INSERT INTO {fts}(rowid, {column}) VALUES (new.{key}, new.{column});"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {column}) "
+        f"VALUES ('delete', old.{key}, old.{column});"
+    )
+
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column}, "
+        f"content='{table}', content_rowid='{key}', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column}, {key} "
+        f"ON {table} BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def _sqlite_drop_statements(index: TextSearchIndex) -> list[str]:
+    fts = index.fts_table_name
+    return [
+        f"DROP TRIGGER IF EXISTS {fts}_ai",
+        f"DROP TRIGGER IF EXISTS {fts}_ad",
+        f"DROP TRIGGER IF EXISTS {fts}_au",
+        f"DROP TABLE IF EXISTS {fts}",
+    ]
@@ -373,6 +373,19 @@ class JobInvalidStatusTransitionError(DioptraError):
         super().__init__("The requested job status update is invalid.")
 
 
+class JobSchedulingNotSupportedError(DioptraError):
+    """The workers cannot run jobs with the requested priority or fair share."""
+
+    def __init__(self, priority: str, fair_share: str):
+        super().__init__(
+            "The workers do not support job priorities or fair-share queues, so jobs "
+            "must use the default priority on a queue without fair share "
+            f"(priority={priority}, fairShare={fair_share})."
+        )
+        self.priority = priority
+        self.fair_share = fair_share
+
+
 class JobParameterMissingError(DioptraError):
     """The Parameter is missing a value."""
 
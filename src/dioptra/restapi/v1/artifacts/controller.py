@@ -32,6 +32,7 @@ from injector import inject
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import models
+from dioptra.restapi.db.repository.utils import decode_page_cursor
 from dioptra.restapi.errors import QueryParameterValidationError
 from dioptra.restapi.routes import V1_ARTIFACTS_ROUTE
 from dioptra.restapi.utils import verify_filename_is_safe
@@ -44,6 +45,8 @@ from dioptra.restapi.v1.shared.snapshots.controller import (
 )
 
 from .schema import (
+    ArtifactBatchCreateRequestSchema,
+    ArtifactBatchSchema,
     ArtifactContentsGetQueryParameters,
     ArtifactFileSchema,
     ArtifactGetQueryParameters,
@@ -94,8 +97,11 @@ class ArtifactEndpoint(Resource):
         page_length = parsed_query_params["page_length"]
         sort_by_string = parsed_query_params["sort_by"]
         descending = parsed_query_params["descending"]
+        cursor = decode_page_cursor(
+            parsed_query_params["cursor"], sort_by_string, descending
+        )
 
-        artifacts, total_num_artifacts = self._artifact_service.get(
+        artifacts, total_num_artifacts, cursors = self._artifact_service.get(
             group_id=group_id,
             search_string=search_string,
             output_params=output_params,
@@ -103,6 +109,8 @@ class ArtifactEndpoint(Resource):
             page_length=page_length,
             sort_by_string=sort_by_string,
             descending=descending,
+            cursor=cursor,
+            count_total=parsed_query_params["count_total"],
             log=log,
         )
         return utils.build_paging_envelope(
@@ -117,6 +125,7 @@ class ArtifactEndpoint(Resource):
             total_num_elements=total_num_artifacts,
             sort_by=sort_by_string,
             descending=descending,
+            cursors=cursors,
         )
 
     @login_required
@@ -142,6 +151,46 @@ class ArtifactEndpoint(Resource):
         return utils.build_artifact(artifact)
 
 
+@api.route(":batch")
+class ArtifactBatchEndpoint(Resource):
+    @inject
+    def __init__(self, artifact_service: ArtifactService, *args, **kwargs) -> None:
+        """Initialize the Artifact batch resource.
+
+        All arguments are provided via dependency injection.
+
+        Args:
+            artifact_service: A ArtifactService object.
+        """
+        self._artifact_service = artifact_service
+        super().__init__(*args, **kwargs)
+
+    @login_required
+    @accepts(schema=ArtifactBatchCreateRequestSchema, api=api)
+    @responds(schema=ArtifactBatchSchema, api=api)
+    def post(self):
+        """Creates a batch of Artifact resources produced by a Job.
+
+        The artifacts are created together: if any artifact is invalid, none are
+        created.
+        """
+        log = LOGGER.new(
+            request_id=str(uuid.uuid4()),
+            resource="ArtifactBatchEndpoint",
+            request_type="POST",
+        )
+        log.debug("Request received")
+        parsed_obj = request.parsed_obj  # type: ignore
+
+        artifacts = self._artifact_service.create_batch(
+            group_id=parsed_obj["group_id"],
+            job_id=parsed_obj["job_id"],
+            artifacts=parsed_obj["artifacts"],
+            log=log,
+        )
+        return {"data": [utils.build_artifact(artifact) for artifact in artifacts]}
+
+
 @api.route("/<int:id>")
 @api.param("id", "ID for the Artifact resource.")
 class ArtifactIdEndpoint(Resource):
@@ -19,7 +19,7 @@
 from typing import List
 
 import structlog
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate
 from marshmallow.exceptions import ValidationError
 from structlog.stdlib import BoundLogger
 
@@ -28,6 +28,7 @@ from dioptra.restapi.v1.file_types import FileTypes
 from dioptra.restapi.v1.plugins.schema import ArtifactTaskSchema
 from dioptra.restapi.v1.schemas import (
     BasePageSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     PagingQueryParametersSchema,
     SearchQueryParametersSchema,
@@ -181,6 +182,54 @@ class ArtifactSchema(
     )
 
 
+class ArtifactBatchItemSchema(ArtifactMutableFieldsSchema):
+    """The schema for one Artifact in a batch of Artifacts."""
+
+    artifactUri = fields.String(
+        attribute="artifact_uri",
+        metadata={
+            "description": "URL pointing to the location of the Artifact resource."
+        },
+        validate=validate_artifact_url,
+        required=True,
+    )
+
+
+class ArtifactBatchCreateRequestSchema(Schema):
+    """The schema for registering a batch of Artifact resources produced by a Job."""
+
+    groupId = fields.Integer(
+        attribute="group_id",
+        data_key="group",
+        metadata={"description": "ID of the Group that will own the Artifacts."},
+        required=True,
+    )
+    jobId = fields.Integer(
+        attribute="job_id",
+        data_key="job",
+        metadata={"description": "id of the job that produced the Artifacts"},
+        required=True,
+    )
+    artifacts = fields.Nested(
+        ArtifactBatchItemSchema,
+        attribute="artifacts",
+        many=True,
+        validate=validate.Length(min=1),
+        metadata={"description": "The Artifacts to register."},
+        required=True,
+    )
+
+
+class ArtifactBatchSchema(Schema):
+    """The schema for a batch of registered Artifact resources."""
+
+    data = fields.Nested(
+        ArtifactSchema,
+        many=True,
+        metadata={"description": "The created Artifact resources, in request order."},
+    )
+
+
 class ArtifactPageSchema(BasePageSchema):
     """The paged schema for the data stored in an Artifact resource."""
 
@@ -237,6 +286,7 @@ class DelimitedIntegerList(fields.Field):
 
 class ArtifactGetQueryParameters(
     PagingQueryParametersSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     SearchQueryParametersSchema,
     SortByGetQueryParametersSchema,
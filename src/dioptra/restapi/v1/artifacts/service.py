@@ -16,16 +16,23 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The server-side functions that perform artifact endpoint operations."""
 
+from collections.abc import Sequence
 from typing import Any, Final, cast
 
 import structlog
 from flask_login import current_user
 from injector import inject
-from sqlalchemy import Integer, Select, func, select
+from sqlalchemy import Select, func, select
 from sqlalchemy.orm import aliased
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import db, models
+from dioptra.restapi.db.repository.utils import (
+    PageCursor,
+    PageCursors,
+    get_keyset_page,
+)
+from dioptra.restapi.db.text_search import text_match
 from dioptra.restapi.errors import (
     BackendDatabaseError,
     DioptraError,
@@ -50,8 +57,8 @@ LOGGER: BoundLogger = structlog.stdlib.get_logger()
 RESOURCE_TYPE: Final[str] = "artifact"
 SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
     "artifactUri": lambda x: models.Artifact.uri.like(x, escape="/"),
-    "description": lambda x: models.Artifact.description.like(x, escape="/"),
-    "tag": lambda x: models.Artifact.tags.any(models.Tag.name.like(x, escape="/")),
+    "description": lambda x: text_match(models.Artifact.description, x),
+    "tag": lambda x: models.Artifact.tags.any(text_match(models.Tag.name, x)),
 }
 SORTABLE_FIELDS: Final[dict[str, Any]] = {
     "uri": models.Artifact.uri,
@@ -221,6 +228,70 @@ class ArtifactService(object):
 
         return utils.ArtifactDict(artifact=new_artifact, has_draft=False)
 
+    def create_batch(
+        self,
+        group_id: int,
+        job_id: int,
+        artifacts: list[dict[str, Any]],
+        **kwargs,
+    ) -> list[utils.ArtifactDict]:
+        """Create a batch of artifacts produced by a job.
+
+        All artifacts are created in a single transaction. If any artifact is
+        invalid, no artifacts are created.
+
+        Args:
+            group_id: The group that will own the artifacts.
+            job_id: The job which owns/produced the artifacts.
+            artifacts: A list of dictionaries with the "artifact_uri", "description",
+                "plugin_snapshot_id", and "task_id" of each artifact. These have the
+                same meaning as the matching arguments of create().
+
+        Returns:
+            The newly created artifact objects, in the order of the artifacts
+            argument.
+
+        Raises:
+            EntityExistsError: If an artifact already exists or the batch repeats a
+                uri.
+            MLFlowError: If the mlflow run id does not exist.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        new_artifacts: dict[str, utils.ArtifactDict] = {}
+
+        try:
+            for artifact in artifacts:
+                uri = artifact["artifact_uri"]
+
+                if uri in new_artifacts:
+                    db.session.flush()
+                    raise EntityExistsError(
+                        RESOURCE_TYPE,
+                        new_artifacts[uri]["artifact"].resource_id,
+                        uri=uri,
+                    )
+
+                new_artifacts[uri] = self.create(
+                    uri=uri,
+                    description=artifact.get("description"),
+                    group_id=group_id,
+                    job_id=job_id,
+                    plugin_snapshot_id=artifact.get("plugin_snapshot_id"),
+                    task_id=artifact.get("task_id"),
+                    commit=False,
+                    log=log,
+                )
+
+        except Exception:
+            # Discard the artifacts created before the invalid one
+            db.session.rollback()
+            raise
+
+        db.session.commit()
+        log.debug("Artifact batch registration successful", count=len(new_artifacts))
+
+        return list(new_artifacts.values())
+
     def get(
         self,
         group_id: int | None,
@@ -230,8 +301,10 @@ class ArtifactService(object):
         page_length: int,
         sort_by_string: str,
         descending: bool,
+        cursor: PageCursor | None = None,
+        count_total: bool = True,
         **kwargs,
-    ) -> Any:
+    ) -> tuple[list[utils.ArtifactDict], int | None, PageCursors | None]:
         """Fetch a list of artifacts, optionally filtering by search string and paging
         parameters.
 
@@ -245,10 +318,15 @@ class ArtifactService(object):
             page_length: The maximum number of artifacts to be returned.
             sort_by_string: The name of the column to sort.
             descending: Boolean indicating whether to sort by descending or not.
+            cursor: If provided, the page is located with this cursor (keyset paging)
+                and page_index is ignored.
+            count_total: Whether to count the total number of artifacts matching the
+                query. Only cursor-based paging can skip the count.
 
         Returns:
-            A tuple containing a list of artifacts and the total number of artifacts
-            matching the query.
+            A tuple containing a list of artifacts, the total number of artifacts
+            matching the query (None if not counted), and the cursors for the
+            adjacent pages (None unless cursor-based paging is used).
 
         Raises:
             SearchNotImplementedError: If a search string is provided.
@@ -268,32 +346,15 @@ class ArtifactService(object):
                 construct_sql_query_filters(search_string, SEARCHABLE_FIELDS)
             )
 
-        stmt = (
-            select(func.count(models.Artifact.resource_id))
-            .join(models.Resource)
-            .where(
-                *filters,
-                models.Resource.is_deleted == False,  # noqa: E712
-                models.Resource.latest_snapshot_id
-                == models.Artifact.resource_snapshot_id,
-            )
-        )
-
-        if output_params:
-            stmt = self._apply_ouput_params_filter(stmt, output_params)
-
-        total_num_artifacts = db.session.scalars(stmt).first()
+        if sort_by_string and sort_by_string not in SORTABLE_FIELDS:
+            raise SortParameterValidationError(RESOURCE_TYPE, sort_by_string)
 
-        if total_num_artifacts is None:
-            log.error(
-                "The database query returned a None when counting the number of "
-                "groups when it should return a number.",
-                sql=str(stmt),
-            )
-            raise BackendDatabaseError
+        total_num_artifacts: int | None = None
+        if cursor is None or count_total:
+            total_num_artifacts = self._count(filters, output_params, log=log)
 
-        if total_num_artifacts == 0:
-            return [], total_num_artifacts
+            if total_num_artifacts == 0:
+                return [], 0, None if cursor is None else PageCursors(None, None)
 
         # get latest artifact snapshots
         latest_artifacts_stmt = (
@@ -305,8 +366,6 @@ class ArtifactService(object):
                 models.Resource.latest_snapshot_id
                 == models.Artifact.resource_snapshot_id,
             )
-            .offset(page_index)
-            .limit(page_length)
         )
 
         if output_params:
@@ -314,25 +373,37 @@ class ArtifactService(object):
                 latest_artifacts_stmt, output_params
             )
 
-        if sort_by_string and sort_by_string in SORTABLE_FIELDS:
-            sort_column = SORTABLE_FIELDS[sort_by_string]
-            if descending:
-                sort_column = sort_column.desc()
-            else:
-                sort_column = sort_column.asc()
-            latest_artifacts_stmt = latest_artifacts_stmt.order_by(sort_column)
-        elif sort_by_string and sort_by_string not in SORTABLE_FIELDS:
-            raise SortParameterValidationError(RESOURCE_TYPE, sort_by_string)
+        artifacts: Sequence[models.Artifact]
+        cursors: PageCursors | None = None
+        if cursor is not None:
+            artifacts, cursors = get_keyset_page(
+                db.session,
+                latest_artifacts_stmt,
+                SORTABLE_FIELDS[sort_by_string] if sort_by_string else None,
+                models.Artifact.resource_snapshot_id,
+                descending,
+                cursor,
+                page_length,
+            )
+        else:
+            latest_artifacts_stmt = latest_artifacts_stmt.offset(page_index).limit(
+                page_length
+            )
+
+            if sort_by_string:
+                sort_column = SORTABLE_FIELDS[sort_by_string]
+                if descending:
+                    sort_column = sort_column.desc()
+                else:
+                    sort_column = sort_column.asc()
+                latest_artifacts_stmt = latest_artifacts_stmt.order_by(sort_column)
 
-        artifacts = db.session.scalars(latest_artifacts_stmt).all()
+            artifacts = db.session.scalars(latest_artifacts_stmt).all()
 
-        drafts_stmt = select(
-            models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-        ).where(
-            models.DraftResource.payload["resource_id"]
-            .as_string()
-            .cast(Integer)
-            .in_(tuple(artifact.resource_id for artifact in artifacts)),
+        drafts_stmt = select(models.DraftResource.resource_id).where(
+            models.DraftResource.resource_id.in_(
+                tuple(artifact.resource_id for artifact in artifacts)
+            ),
             models.DraftResource.user_id == current_user.user_id,
         )
         artifacts_dict: dict[int, utils.ArtifactDict] = {
@@ -342,7 +413,38 @@ class ArtifactService(object):
         for resource_id in db.session.scalars(drafts_stmt):
             artifacts_dict[resource_id]["has_draft"] = True
 
-        return list(artifacts_dict.values()), total_num_artifacts
+        return list(artifacts_dict.values()), total_num_artifacts, cursors
+
+    def _count(
+        self, filters: list[Any], output_params: list[int] | None, **kwargs
+    ) -> int:
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+
+        stmt = (
+            select(func.count(models.Artifact.resource_id))
+            .join(models.Resource)
+            .where(
+                *filters,
+                models.Resource.is_deleted == False,  # noqa: E712
+                models.Resource.latest_snapshot_id
+                == models.Artifact.resource_snapshot_id,
+            )
+        )
+
+        if output_params:
+            stmt = self._apply_ouput_params_filter(stmt, output_params)
+
+        total_num_artifacts = db.session.scalars(stmt).first()
+
+        if total_num_artifacts is None:
+            log.error(
+                "The database query returned a None when counting the number of "
+                "groups when it should return a number.",
+                sql=str(stmt),
+            )
+            raise BackendDatabaseError
+
+        return total_num_artifacts
 
     def _apply_ouput_params_filter(
         self, stmt: Select, output_params: list[int]
@@ -445,8 +547,7 @@ class ArtifactIdService(object):
         drafts_stmt = (
             select(models.DraftResource.draft_resource_id)
             .where(
-                models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-                == artifact.resource_id,
+                models.DraftResource.resource_id == artifact.resource_id,
                 models.DraftResource.user_id == current_user.user_id,
             )
             .exists()
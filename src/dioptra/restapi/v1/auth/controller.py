@@ -27,7 +27,12 @@ from flask_restx import Namespace, Resource
 from injector import inject
 from structlog.stdlib import BoundLogger
 
-from .schema import LoginSchema, LogoutQueryParametersSchema, LogoutSchema
+from .schema import (
+    LoginSchema,
+    LogoutQueryParametersSchema,
+    LogoutSchema,
+    TokenSchema,
+)
 from .service import AuthService
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
@@ -95,3 +100,33 @@ class LogoutResource(Resource):
         return self._auth_service.logout(
             everywhere=parsed_query_params["everywhere"], log=log
         )
+
+
+@api.route("/token")
+class TokenResource(Resource):
+    """Methods for the /auth/token endpoint."""
+
+    @inject
+    def __init__(self, auth_service: AuthService, *args, **kwargs) -> None:
+        """Initialize the token resource.
+
+        All arguments are provided via dependency injection.
+
+        Args:
+            auth_service: An AuthService object.
+        """
+        self._auth_service = auth_service
+        super().__init__(*args, **kwargs)
+
+    @login_required
+    @responds(schema=TokenSchema, api=api)
+    def post(self) -> dict[str, Any]:
+        """Create an API token for the current user.
+
+        Must be logged in. A regular logout does not revoke the token, it is only
+        revoked when the user logs out everywhere.
+        """
+        log: BoundLogger = LOGGER.new(
+            request_id=str(uuid.uuid4()), resource="auth/token", request_type="POST"
+        )
+        return self._auth_service.create_token(log=log)
@@ -69,3 +69,40 @@ class LogoutQueryParametersSchema(Schema):
         metadata={"description": "Logout on all devices."},
         load_default=lambda: False,
     )
+
+
+class TokenSchema(Schema):
+    """The response fields used when creating an API token."""
+
+    username = fields.String(
+        attribute="username",
+        metadata={"description": "The account username."},
+        dump_only=True,
+    )
+    token = fields.String(
+        attribute="token",
+        metadata={
+            "description": (
+                "The API token. Send it in an 'Authorization: Bearer <token>' header "
+                "to authenticate requests. A regular logout does not revoke it, only "
+                "logging out everywhere does."
+            )
+        },
+        dump_only=True,
+    )
+    expiresIn = fields.Integer(
+        attribute="expires_in",
+        allow_none=True,
+        metadata={
+            "description": (
+                "The number of seconds the token is valid for. Tokens do not expire "
+                "if null, but are revoked when the user logs out everywhere."
+            )
+        },
+        dump_only=True,
+    )
+    status = fields.String(
+        attribute="status",
+        metadata={"description": "The status of the token request."},
+        dump_only=True,
+    )
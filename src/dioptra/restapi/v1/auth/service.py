@@ -17,21 +17,28 @@
 """The server-side functions that perform auth endpoint operations."""
 
 import datetime
+import hashlib
 import uuid
-from typing import Any
+from typing import Any, Final
 
 import structlog
+from flask import Request, current_app
 from flask_login import current_user, login_user, logout_user
 from injector import inject
+from itsdangerous import BadSignature, URLSafeTimedSerializer
 from structlog.stdlib import BoundLogger
 
-from dioptra.restapi.db.repository.utils import DeletionPolicy
+from dioptra.restapi.db import models
+from dioptra.restapi.db.repository.utils import DeletionPolicy, invalidate_identity
 from dioptra.restapi.db.unit_of_work import UnitOfWork
 from dioptra.restapi.errors import UserDoesNotExistError
-from dioptra.restapi.v1.users.service import UserPasswordService
+from dioptra.restapi.v1.users.service import UserPasswordService, load_user
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
+API_TOKEN_SALT: Final[str] = "dioptra-api-token"
+API_TOKEN_AUTH_SCHEME: Final[str] = "bearer"
+
 
 class AuthService(object):
     """The service methods for user logins and logouts."""
@@ -104,6 +111,7 @@ class AuthService(object):
         if everywhere:
             with self._uow:
                 current_user.alternative_id = uuid.uuid4()
+                invalidate_identity(current_user, self._uow.session)
 
         logout_user()
         log.debug("Logout successful", user_id=user_id, everywhere=everywhere)
@@ -112,3 +120,63 @@ class AuthService(object):
             "username": username,
             "everywhere": everywhere,
         }
+
+    def create_token(self, **kwargs) -> dict[str, Any]:
+        """Create an API token for the current user.
+
+        The token authenticates requests that send it in an "Authorization: Bearer"
+        header. A regular logout does not revoke it. It remains valid until it expires
+        or the user logs out everywhere, which revokes all of the user's tokens and
+        sessions.
+
+        Returns:
+            A dictionary containing the API token.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        token = _get_api_token_serializer().dumps(
+            {"alternative_id": current_user.get_id()}
+        )
+        log.debug("API token created", user_id=current_user.user_id)
+        return {
+            "status": "API token created",
+            "username": current_user.username,
+            "token": token,
+            "expires_in": current_app.config.get("DIOPTRA_API_TOKEN_MAX_AGE"),
+        }
+
+
+def load_user_from_request(request: Request) -> models.User | None:
+    """Load the user associated with the API token of a request.
+
+    This function is intended for use with Flask-Login. Verifying a token only
+    requires an HMAC, so requests authenticated with a token avoid the cost of
+    checking the user's password.
+
+    Args:
+        request: The request, which may carry an "Authorization: Bearer" header.
+
+    Returns:
+        A user object if the request has a valid API token, otherwise None.
+    """
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+
+    if scheme.lower() != API_TOKEN_AUTH_SCHEME or not token.strip():
+        return None
+
+    try:
+        payload = _get_api_token_serializer().loads(
+            token.strip(), max_age=current_app.config.get("DIOPTRA_API_TOKEN_MAX_AGE")
+        )
+
+    except BadSignature:
+        return None
+
+    return load_user(payload["alternative_id"])
+
+
+def _get_api_token_serializer() -> URLSafeTimedSerializer:
+    return URLSafeTimedSerializer(
+        current_app.config["SECRET_KEY"],
+        salt=API_TOKEN_SALT,
+        signer_kwargs={"digest_method": hashlib.sha256},
+    )
@@ -17,15 +17,16 @@
 """The module defining the endpoints for Entrypoint resources."""
 
 import uuid
-from typing import cast
+from typing import Any, cast
 
 import structlog
-from flask import request, send_file
+from flask import Response, request, send_file
 from flask_accepts import accepts, responds
 from flask_login import login_required
 from flask_restx import Namespace, Resource
 from injector import inject
 from structlog.stdlib import BoundLogger
+from werkzeug.http import quote_etag
 
 from dioptra.restapi.db import models
 from dioptra.restapi.routes import V1_ENTRYPOINTS_ROUTE
@@ -50,6 +51,10 @@ from dioptra.restapi.v1.shared.tags.controller import (
     generate_resource_tags_endpoint,
     generate_resource_tags_id_endpoint,
 )
+from dioptra.restapi.v1.shared.task_engine_yaml.cache import (
+    TASK_ENGINE_YAML_CACHE,
+    TaskEngineYamlCacheKey,
+)
 from dioptra.restapi.v1.shared.task_engine_yaml.service import TaskEngineYamlService
 
 from .schema import (
@@ -296,6 +301,11 @@ class EntryPointSnapshotConfigEndpoint(Resource):
 
     @login_required
     def get(self, id: int, snapshotId: int):
+        """Gets the task engine configuration for an entrypoint snapshot.
+
+        The response carries an ETag. Requests with a matching If-None-Match header
+        receive an empty 304 Not Modified response.
+        """
         log = LOGGER.new(
             request_id=str(uuid.uuid4()),
             resource="EntryPoint",
@@ -306,22 +316,45 @@ class EntryPointSnapshotConfigEndpoint(Resource):
         entry_point = self._entrypoint_snapshot_id_service.get(
             entrypoint_id=id, entrypoint_snapshot_id=snapshotId, log=log
         )
-        plugin_files = [
-            plugin_plugin_file
-            for entry_point_plugin in entry_point.entry_point_plugins
-            for plugin_plugin_file in entry_point_plugin.plugin.plugin_plugin_files
-        ]
-        # this call is part of a HACK fully explained in extract_tasks, which is called
-        # internally by build_task_engine_dict, the service call would not be needed
-        # if this issue is more permanantly resolved
-        types = self._entrypoint_snapshot_id_service.get_group_plugin_parameter_types(
-            entry_point.resource.group_id, log=log
-        )
-        return self._yaml_service.build_dict(
-            entry_point=entry_point,  # pyright: ignore
-            plugin_plugin_files=plugin_files,  # pyright: ignore
-            plugin_parameter_types=types,  # pyright: ignore
-            logger=log,
+        group_id = entry_point.resource.group_id
+        snapshot_id_service = self._entrypoint_snapshot_id_service
+        cache_key = TaskEngineYamlCacheKey(
+            entrypoint_snapshot_id=entry_point.resource_snapshot_id,
+            entrypoint_snapshot_created_on=entry_point.created_on,
+            plugin_parameter_types_version=(
+                snapshot_id_service.get_group_plugin_parameter_types_version(
+                    group_id, log=log
+                )
+            ),
+        )
+        headers = {"ETag": quote_etag(cache_key.etag), "Cache-Control": "no-cache"}
+
+        if request.if_none_match.contains(cache_key.etag):
+            return Response(status=304, headers=headers)
+
+        def build_task_engine_dict() -> dict[str, Any]:
+            plugin_files = [
+                plugin_plugin_file
+                for entry_point_plugin in entry_point.entry_point_plugins
+                for plugin_plugin_file in entry_point_plugin.plugin.plugin_plugin_files
+            ]
+            # this call is part of a HACK fully explained in extract_tasks, which is
+            # called internally by build_task_engine_dict, the service call would not be
+            # needed if this issue is more permanantly resolved
+            types = snapshot_id_service.get_group_plugin_parameter_types(
+                group_id, log=log
+            )
+            return self._yaml_service.build_dict(
+                entry_point=entry_point,  # pyright: ignore
+                plugin_plugin_files=plugin_files,  # pyright: ignore
+                plugin_parameter_types=types,  # pyright: ignore
+                logger=log,
+            )
+
+        return (
+            TASK_ENGINE_YAML_CACHE.get_or_build(cache_key, build_task_engine_dict),
+            200,
+            headers,
         )
 
 
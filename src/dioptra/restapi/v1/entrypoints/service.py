@@ -21,11 +21,12 @@ from typing import Any, Final, Iterable
 import structlog
 from flask_login import current_user
 from injector import inject
-from sqlalchemy import Integer, func, select
+from sqlalchemy import func, select
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import db, models
 from dioptra.restapi.db.models.constants import resource_lock_types
+from dioptra.restapi.db.text_search import text_match
 from dioptra.restapi.errors import (
     BackendDatabaseError,
     EntityDoesNotExistError,
@@ -36,6 +37,9 @@ from dioptra.restapi.errors import (
 from dioptra.restapi.utils import find_non_unique
 from dioptra.restapi.v1 import utils
 from dioptra.restapi.v1.groups.service import GroupIdService
+from dioptra.restapi.v1.plugin_parameter_types.service import (
+    RESOURCE_TYPE as PLUGIN_PARAMETER_TYPE_RESOURCE_TYPE,
+)
 from dioptra.restapi.v1.plugins.service import (
     PluginIdsService,
     get_plugin_task_parameter_types_by_id,
@@ -43,6 +47,9 @@ from dioptra.restapi.v1.plugins.service import (
 from dioptra.restapi.v1.queues.service import RESOURCE_TYPE as QUEUE_RESOURCE_TYPE
 from dioptra.restapi.v1.queues.service import QueueIdsService
 from dioptra.restapi.v1.shared.search_parser import construct_sql_query_filters
+from dioptra.restapi.v1.shared.task_engine_yaml.cache import (
+    plugin_parameter_types_version,
+)
 from dioptra.restapi.v1.shared.task_engine_yaml.service import (
     coerce_entrypoint_default_param_types,
 )
@@ -53,10 +60,10 @@ PLUGIN_RESOURCE_TYPE: Final[str] = "entry_point_plugin"
 RESOURCE_TYPE: Final[str] = "entry_point"
 SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
     "name": lambda x: models.EntryPoint.name.like(x, escape="/"),
-    "description": lambda x: models.EntryPoint.description.like(x, escape="/"),
+    "description": lambda x: text_match(models.EntryPoint.description, x),
     "task_graph": lambda x: models.EntryPoint.task_graph.like(x, escape="/"),
     "artifact_graph": lambda x: models.EntryPoint.artifact_graph.like(x, escape="/"),
-    "tag": lambda x: models.EntryPoint.tags.any(models.Tag.name.like(x, escape="/")),
+    "tag": lambda x: models.EntryPoint.tags.any(text_match(models.Tag.name, x)),
 }
 SORTABLE_FIELDS: Final[dict[str, Any]] = {
     "name": models.EntryPoint.name,
@@ -323,13 +330,8 @@ class EntrypointService(object):
                 if resource.resource_type == "queue" and not resource.is_deleted:
                     entrypoint["queues"].append(queues[resource.resource_id])
 
-        drafts_stmt = select(
-            models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-        ).where(
-            models.DraftResource.payload["resource_id"]
-            .as_string()
-            .cast(Integer)
-            .in_(tuple(entrypoint_dicts.keys())),
+        drafts_stmt = select(models.DraftResource.resource_id).where(
+            models.DraftResource.resource_id.in_(tuple(entrypoint_dicts.keys())),
             models.DraftResource.user_id == current_user.user_id,
         )
         for resource_id in db.session.scalars(drafts_stmt):
@@ -412,8 +414,7 @@ class EntrypointIdService(object):
         drafts_stmt = (
             select(models.DraftResource.draft_resource_id)
             .where(
-                models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-                == entrypoint.resource_id,
+                models.DraftResource.resource_id == entrypoint.resource_id,
                 models.DraftResource.user_id == current_user.user_id,
             )
             .exists()
@@ -679,6 +680,29 @@ class EntrypointSnapshotIdService(object):
         )
         return list(db.session.scalars(plugin_parameter_types_stmt).all())
 
+    def get_group_plugin_parameter_types_version(self, group_id: int, **kwargs) -> str:
+        """Get a version stamp for the plugin task parameter types of a group.
+
+        The stamp changes whenever a parameter type in the group is created, modified,
+        or deleted, and is cheaper to compute than loading the parameter types.
+
+        Args:
+            group_id: The group id for which to get the version stamp.
+            log: A structlog logger object to use for logging. A new logger will be
+                created if None.
+
+        Returns:
+            The version stamp of the group's plugin task parameter types.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())  # noqa: F841
+
+        snapshot_ids_stmt = select(models.Resource.latest_snapshot_id).where(
+            models.Resource.resource_type == PLUGIN_PARAMETER_TYPE_RESOURCE_TYPE,
+            models.Resource.is_deleted == False,  # noqa: E712
+            models.Resource.group_id == group_id,
+        )
+        return plugin_parameter_types_version(db.session.scalars(snapshot_ids_stmt))
+
 
 class EntrypointIdPluginsService(object):
     """The service methods for creating and managing entrypoints by their unique id."""
@@ -30,12 +30,15 @@ from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import models
 from dioptra.restapi.db.repository.experiments import ExperimentRepository
+from dioptra.restapi.db.repository.utils import decode_page_cursor
 from dioptra.restapi.routes import V1_EXPERIMENTS_ROUTE
 from dioptra.restapi.v1 import utils
 from dioptra.restapi.v1.entrypoints.schema import EntrypointRefSchema
 from dioptra.restapi.v1.jobs.schema import (
     ExperimentJobGetQueryParameters,
     ExperimentJobsMetricsSchema,
+    JobBatchCreateRequestSchema,
+    JobBatchSchema,
     JobCreateRequestSchema,
     JobMlflowRunSchema,
     JobPageSchema,
@@ -117,14 +120,19 @@ class ExperimentEndpoint(Resource):
         page_length = parsed_query_params["page_length"]
         sort_by_string = parsed_query_params["sort_by"]
         descending = parsed_query_params["descending"]
+        cursor = decode_page_cursor(
+            parsed_query_params["cursor"], sort_by_string, descending
+        )
 
-        experiments, total_num_experiments = self._experiment_service.get(
+        experiments, total_num_experiments, cursors = self._experiment_service.get(
             group_id=group_id,
             search_string=search_string,
             page_index=page_index,
             page_length=page_length,
             sort_by_string=sort_by_string,
             descending=descending,
+            cursor=cursor,
+            count_total=parsed_query_params["count_total"],
             log=log,
         )
         return utils.build_paging_envelope(
@@ -139,6 +147,7 @@ class ExperimentEndpoint(Resource):
             total_num_elements=total_num_experiments,
             sort_by=sort_by_string,
             descending=descending,
+            cursors=cursors,
         )
 
     @login_required
@@ -316,11 +325,62 @@ class ExperimentIdJobEndpoint(Resource):
             description=parsed_obj.get("description", ""),
             timeout=parsed_obj.get("timeout", "60"),
             entrypoint_snapshot_id=parsed_obj["entrypoint_snapshot_id"],
+            priority=parsed_obj["priority"],
             log=log,
         )
         return utils.build_job(job)
 
 
+@api.route("/<int:id>/jobs:batch")
+@api.param("id", "ID for the Experiment resource.")
+class ExperimentIdJobBatchEndpoint(Resource):
+    @inject
+    def __init__(
+        self,
+        experiment_job_service: ExperimentJobService,
+        *args,
+        **kwargs,
+    ) -> None:
+        """Initialize the Job batch resource.
+
+        All arguments are provided via dependency injection.
+
+        Args:
+            experiment_job_service: An ExperimentJobService object.
+        """
+        self._experiment_job_service = experiment_job_service
+        super().__init__(*args, **kwargs)
+
+    @login_required
+    @accepts(schema=JobBatchCreateRequestSchema, api=api)
+    @responds(schema=JobBatchSchema, api=api)
+    def post(self, id: int):
+        """Creates a batch of Job resources under the specified Experiment.
+
+        The jobs share a queue, entry point, and timeout, and are created together:
+        if any job is invalid, none are created.
+        """
+        log = LOGGER.new(
+            request_id=str(uuid.uuid4()),
+            resource="ExperimentIdJobBatchEndpoint",
+            request_type="POST",
+        )
+        parsed_obj = request.parsed_obj  # type: ignore
+
+        jobs = self._experiment_job_service.create_batch(
+            experiment_id=id,
+            queue_id=parsed_obj["queue_id"],
+            entrypoint_id=parsed_obj["entrypoint_id"],
+            jobs=parsed_obj["jobs"],
+            description=parsed_obj.get("description"),
+            timeout=parsed_obj.get("timeout", "24h"),
+            entrypoint_snapshot_id=parsed_obj["entrypoint_snapshot_id"],
+            priority=parsed_obj["priority"],
+            log=log,
+        )
+        return {"data": [utils.build_job(job) for job in jobs]}
+
+
 @api.route("/<int:id>/jobs/<int:jobId>")
 @api.param("id", "ID for the Experiment resource.")
 @api.param("jobId", "ID for the Job resource.")
@@ -20,6 +20,7 @@ from marshmallow import Schema, fields
 
 from dioptra.restapi.v1.schemas import (
     BasePageSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     PagingQueryParametersSchema,
     SearchQueryParametersSchema,
@@ -128,6 +129,7 @@ class ExperimentMetricsGetQueryParameters(
 
 class ExperimentGetQueryParameters(
     PagingQueryParametersSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     SearchQueryParametersSchema,
     SortByGetQueryParametersSchema,
@@ -16,6 +16,7 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The server-side functions that perform experiment endpoint operations."""
 
+from collections.abc import Sequence
 from typing import Any, Final
 
 import structlog
@@ -24,7 +25,11 @@ from injector import inject
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import models
-from dioptra.restapi.db.repository.utils import DeletionPolicy
+from dioptra.restapi.db.repository.utils import (
+    DeletionPolicy,
+    PageCursor,
+    PageCursors,
+)
 from dioptra.restapi.db.unit_of_work import UnitOfWork
 from dioptra.restapi.errors import EntityDoesNotExistError
 from dioptra.restapi.v1 import utils
@@ -135,8 +140,10 @@ class ExperimentService(object):
         page_length: int,
         sort_by_string: str,
         descending: bool,
+        cursor: PageCursor | None = None,
+        count_total: bool = True,
         **kwargs,
-    ) -> tuple[list[utils.ExperimentDict], int]:
+    ) -> tuple[list[utils.ExperimentDict], int | None, PageCursors | None]:
         """Fetch a list of experiments, optionally filtering by search string and paging
         parameters.
 
@@ -147,10 +154,15 @@ class ExperimentService(object):
             page_length: The maximum number of experiments to be returned.
             sort_by_string: The name of the column to sort.
             descending: Boolean indicating whether to sort by descending or not.
+            cursor: If provided, the page is located with this cursor (keyset paging)
+                and page_index is ignored.
+            count_total: Whether to count the total number of experiments matching
+                the query. Only cursor-based paging can skip the count.
 
         Returns:
-            A tuple containing a list of experiments and the total number of experiments
-            matching the query.
+            A tuple containing a list of experiments, the total number of experiments
+            matching the query (None if not counted), and the cursors for the
+            adjacent pages (None unless cursor-based paging is used).
 
         Raises:
             BackEndDatabaseError: If the database query returns a None when counting
@@ -161,17 +173,34 @@ class ExperimentService(object):
 
         search_struct = parse_search_text(search_string)
 
-        experiments, total_num_experiments = (
-            self._uow.experiment_repo.get_by_filters_paged(
-                group_id,
-                search_struct,
-                page_index,
-                page_length,
-                sort_by_string,
-                descending,
-                DeletionPolicy.NOT_DELETED,
+        experiments: Sequence[models.Experiment]
+        total_num_experiments: int | None
+        cursors: PageCursors | None = None
+        if cursor is None:
+            experiments, total_num_experiments = (
+                self._uow.experiment_repo.get_by_filters_paged(
+                    group_id,
+                    search_struct,
+                    page_index,
+                    page_length,
+                    sort_by_string,
+                    descending,
+                    DeletionPolicy.NOT_DELETED,
+                )
+            )
+        else:
+            experiments, total_num_experiments, cursors = (
+                self._uow.experiment_repo.get_by_filters_keyset_paged(
+                    group_id,
+                    search_struct,
+                    cursor,
+                    page_length,
+                    sort_by_string,
+                    descending,
+                    count_total,
+                    DeletionPolicy.NOT_DELETED,
+                )
             )
-        )
 
         experiments_dict: dict[int, utils.ExperimentDict] = {
             experiment.resource_id: utils.ExperimentDict(
@@ -196,7 +225,7 @@ class ExperimentService(object):
         for resource_id in resource_ids_with_drafts:
             experiments_dict[resource_id]["has_draft"] = True
 
-        return list(experiments_dict.values()), total_num_experiments
+        return list(experiments_dict.values()), total_num_experiments, cursors
 
 
 class ExperimentIdService(object):
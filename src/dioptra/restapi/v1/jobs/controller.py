@@ -28,6 +28,7 @@ from injector import inject
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import models
+from dioptra.restapi.db.repository.utils import decode_page_cursor
 from dioptra.restapi.routes import V1_JOBS_ROUTE
 from dioptra.restapi.v1 import utils
 from dioptra.restapi.v1.schemas import IdStatusResponseSchema
@@ -106,14 +107,19 @@ class JobEndpoint(Resource):
         page_length = parsed_query_params["page_length"]
         sort_by_string = parsed_query_params["sort_by"]
         descending = parsed_query_params["descending"]
+        cursor = decode_page_cursor(
+            parsed_query_params["cursor"], sort_by_string, descending
+        )
 
-        jobs, total_num_jobs = self._job_service.get(
+        jobs, total_num_jobs, cursors = self._job_service.get(
             group_id=group_id,
             search_string=search_string,
             page_index=page_index,
             page_length=page_length,
             sort_by_string=sort_by_string,
             descending=descending,
+            cursor=cursor,
+            count_total=parsed_query_params["count_total"],
             log=log,
         )
         return utils.build_paging_envelope(
@@ -128,6 +134,7 @@ class JobEndpoint(Resource):
             total_num_elements=total_num_jobs,
             sort_by=sort_by_string,
             descending=descending,
+            cursors=cursors,
         )
 
 
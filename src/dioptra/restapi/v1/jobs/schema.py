@@ -26,6 +26,7 @@ from marshmallow import Schema, fields, post_dump, post_load, validate
 from dioptra.restapi.v1.artifacts.schema import ArtifactRefSchema
 from dioptra.restapi.v1.schemas import (
     BasePageSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     PagingQueryParametersSchema,
     SearchQueryParametersSchema,
@@ -33,8 +34,10 @@ from dioptra.restapi.v1.schemas import (
     generate_base_resource_ref_schema,
     generate_base_resource_schema,
 )
+from dioptra.rq.scheduling import PRIORITIES, PRIORITY_DEFAULT
 
 ALLOWED_METRIC_NAME_REGEX = re.compile(r"^([A-Z]|[A-Z_][A-Z0-9_]+)$", flags=re.IGNORECASE)  # fmt: skip
+JOB_BATCH_MAX_SIZE = 1000
 
 
 JobRefSchema = generate_base_resource_ref_schema("Job")
@@ -331,6 +334,134 @@ class JobCreateRequestSchema(JobSchema):
         required=False,
         load_default=None,
     )
+    priority = fields.String(
+        attribute="priority",
+        metadata={
+            "description": (
+                "The priority of the job on its queue, one of high, default, or low. "
+                "Workers run higher priority jobs first. Only the fair-share worker "
+                "of dioptra-worker-v1 runs jobs with the high or low priority, so "
+                "they are rejected if DIOPTRA_RQ_FAIR_SHARE_WORKER is disabled. If "
+                "omitted, the job will use the default priority."
+            )
+        },
+        validate=validate.OneOf(PRIORITIES),
+        load_default=PRIORITY_DEFAULT,
+    )
+
+
+class JobBatchItemSchema(Schema):
+    """The schema for one Job in a batch of Jobs."""
+
+    description = fields.String(
+        attribute="description",
+        metadata={
+            "description": (
+                "Description of the Job resource. Overrides the description shared "
+                "by the batch."
+            )
+        },
+        load_default=None,
+    )
+    values = fields.Dict(
+        keys=fields.String(),
+        values=fields.String(),
+        attribute="values",
+        allow_none=True,
+        metadata={
+            "description": (
+                "A dictionary of keyword arguments to pass to the Job's Entrypoint."
+            ),
+        },
+        load_default=dict,
+    )
+    artifactValues = fields.Dict(
+        keys=fields.String(),
+        values=fields.Nested(JobArtifactValueSchema),
+        attribute="artifact_values",
+        allow_none=True,
+        metadata={
+            "description": (
+                "A dictionary of artifacts to pass to the Job's Entrypoint."
+            ),
+        },
+        load_default=dict,
+    )
+
+
+class JobBatchCreateRequestSchema(Schema):
+    """The schema for creating a batch of Job resources under an Experiment."""
+
+    queueId = fields.Integer(
+        attribute="queue_id",
+        data_key="queue",
+        metadata={"description": "An integer identifying a registered queue."},
+        required=True,
+    )
+    entrypointId = fields.Integer(
+        attribute="entrypoint_id",
+        data_key="entrypoint",
+        metadata={"description": "An integer identifying a registered entry point."},
+        required=True,
+    )
+    entrypointSnapshotId = fields.Integer(
+        attribute="entrypoint_snapshot_id",
+        data_key="entrypointSnapshot",
+        allow_none=True,
+        metadata={
+            "description": (
+                "An integer identifying a snapshot ID associated with the entrypoint. "
+                "If not specified, the jobs will use the latest version of the "
+                "entrypoint."
+            )
+        },
+        load_default=None,
+    )
+    description = fields.String(
+        attribute="description",
+        metadata={"description": "Description shared by the Job resources."},
+        load_default=None,
+    )
+    timeout = fields.String(
+        attribute="timeout",
+        load_default="24h",
+        metadata={
+            "description": "The maximum alloted time for each job before it times out "
+            "and is stopped. If omitted, the job timeout will default to 24 hours.",
+        },
+    )
+    priority = fields.String(
+        attribute="priority",
+        metadata={
+            "description": (
+                "The priority shared by the jobs on their queue, one of high, default, or low. "
+                "Workers run higher priority jobs first. Only the fair-share worker "
+                "of dioptra-worker-v1 runs jobs with the high or low priority, so "
+                "they are rejected if DIOPTRA_RQ_FAIR_SHARE_WORKER is disabled. If "
+                "omitted, the jobs will use the default priority."
+            )
+        },
+        validate=validate.OneOf(PRIORITIES),
+        load_default=PRIORITY_DEFAULT,
+    )
+    jobs = fields.Nested(
+        JobBatchItemSchema,
+        attribute="jobs",
+        many=True,
+        metadata={"description": "The parameters of each Job to create."},
+        required=True,
+        validate=validate.Length(min=1, max=JOB_BATCH_MAX_SIZE),
+    )
+
+
+class JobBatchSchema(Schema):
+    """The schema for a batch of created Job resources."""
+
+    data = fields.Nested(
+        JobSchema,
+        many=True,
+        metadata={"description": "The created Job resources, in request order."},
+    )
 
 
 class JobPageSchema(BasePageSchema):
@@ -352,6 +483,7 @@ class MetricsSnapshotsGetQueryParameters(
 
 class JobGetQueryParameters(
     PagingQueryParametersSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     SearchQueryParametersSchema,
     SortByGetQueryParametersSchema,
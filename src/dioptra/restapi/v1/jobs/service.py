@@ -22,6 +22,7 @@ from collections.abc import Iterable
 from typing import Any, Final, cast
 
 import structlog
+from flask import current_app
 from flask_login import current_user
 from injector import inject
 from sqlalchemy import delete, func, select
@@ -29,6 +30,12 @@ from sqlalchemy.orm import aliased
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import db, models
+from dioptra.restapi.db.repository.utils import (
+    PageCursor,
+    PageCursors,
+    get_keyset_page,
+)
+from dioptra.restapi.db.text_search import text_match
 from dioptra.restapi.errors import (
     BackendDatabaseError,
     DioptraError,
@@ -39,6 +46,7 @@ from dioptra.restapi.errors import (
     JobInvalidStatusTransitionError,
     JobMlflowRunAlreadySetError,
     JobParameterMissingError,
+    JobSchedulingNotSupportedError,
     SortParameterValidationError,
 )
 from dioptra.restapi.v1 import utils
@@ -65,6 +73,7 @@ from dioptra.restapi.v1.shared.task_engine_yaml.service import (
     check_artifact_param_type_mismatch,
     coerce_entrypoint_param_types,
 )
+from dioptra.rq.scheduling import FAIR_SHARE_NONE, PRIORITY_DEFAULT, get_share_key
 
 from .schema import JobLogSeverity
 
@@ -72,10 +81,10 @@ LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 RESOURCE_TYPE: Final[str] = "job"
 SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
-    "description": lambda x: models.Job.description.like(x),
+    "description": lambda x: text_match(models.Job.description, x),
     "status": lambda x: models.Job.status.like(x),
     "timeout": lambda x: models.Job.timeout.like(x),
-    "tag": lambda x: models.Job.tags.any(models.Tag.name.like(x, escape="/")),
+    "tag": lambda x: models.Job.tags.any(text_match(models.Tag.name, x)),
 }
 SORTABLE_FIELDS: Final[dict[str, Any]] = {
     "id": models.Resource.resource_id,
@@ -147,6 +156,7 @@ class JobService(object):
         description: str,
         timeout: str,
         entrypoint_snapshot_id: int | None = None,
+        priority: str = PRIORITY_DEFAULT,
         **kwargs,
     ) -> utils.JobDict:
         """Create a new job.
@@ -161,6 +171,7 @@ class JobService(object):
             description: The description of the job.
             timeout: The length of time the job will run before timing out.
             group_id: The group that will own the job.
+            priority: The priority of the job on its queue. Defaults to "default".
 
         Returns:
             The newly created job object.
@@ -169,12 +180,140 @@ class JobService(object):
             EntityExistsError: If a job with the given name already exists.
             EntityDoesNotExistError: if any of the values in artifact_value_ids does not
                 correspond with an Artifact
+            JobSchedulingNotSupportedError: If the job has a non-default priority or
+                the queue uses fair share, and the workers do not support them.
         """
         log: BoundLogger = kwargs.get("log", LOGGER.new())
 
-        # Set the default status
-        status = "queued"
+        experiment, queue, entrypoint = self._get_job_submission_targets(
+            experiment_id=experiment_id,
+            queue_id=queue_id,
+            entrypoint_id=entrypoint_id,
+            entrypoint_snapshot_id=entrypoint_snapshot_id,
+            log=log,
+        )
+        _validate_scheduling(queue, priority)
+        new_job = self._build_job(
+            experiment=experiment,
+            queue=queue,
+            entrypoint=entrypoint,
+            values=values,
+            artifact_value_ids=artifact_value_ids,
+            description=description,
+            timeout=timeout,
+            log=log,
+        )
+        db.session.commit()
+        self._rq_service.submit(
+            job_id=new_job.resource_id,
+            experiment_id=experiment_id,
+            queue=queue.name,
+            timeout=timeout,
+            priority=priority,
+            share=_get_share_key(queue, experiment),
+        )
+        log.debug(
+            "Job registration successful",
+            job_id=new_job.resource_id,
+        )
+        return utils.JobDict(
+            job=new_job,
+            artifacts=[],
+            has_draft=False,
+        )
+
+    def create_batch(
+        self,
+        experiment_id: int,
+        queue_id: int,
+        entrypoint_id: int,
+        jobs: list[dict[str, Any]],
+        description: str | None,
+        timeout: str,
+        entrypoint_snapshot_id: int | None = None,
+        priority: str = PRIORITY_DEFAULT,
+        **kwargs,
+    ) -> list[utils.JobDict]:
+        """Create a batch of jobs that share an experiment, queue, and entrypoint.
+
+        The shared inputs are validated once, all jobs are created in a single
+        transaction, and the jobs are enqueued together. If any job is invalid, no
+        jobs are created.
+
+        Args:
+            experiment_id: The unique id for the experiment the jobs are under.
+            queue_id: The unique id for the queue the jobs will execute on.
+            entrypoint_id: The unique id for the entrypoint defining the jobs.
+            jobs: A list of dictionaries with the "values", "artifact_values", and
+                optional "description" of each job.
+            description: The description of jobs that do not set their own.
+            timeout: The length of time each job will run before timing out.
+            entrypoint_snapshot_id: The snapshot of the entrypoint to run. Defaults
+                to the latest snapshot.
+            priority: The priority of the jobs on their queue. Defaults to "default".
+
+        Returns:
+            The newly created job objects, in the order of the jobs argument.
 
+        Raises:
+            JobSchedulingNotSupportedError: If the jobs have a non-default priority or
+                the queue uses fair share, and the workers do not support them.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+
+        experiment, queue, entrypoint = self._get_job_submission_targets(
+            experiment_id=experiment_id,
+            queue_id=queue_id,
+            entrypoint_id=entrypoint_id,
+            entrypoint_snapshot_id=entrypoint_snapshot_id,
+            log=log,
+        )
+        _validate_scheduling(queue, priority)
+        try:
+            new_jobs = [
+                self._build_job(
+                    experiment=experiment,
+                    queue=queue,
+                    entrypoint=entrypoint,
+                    values=job.get("values") or {},
+                    artifact_value_ids=job.get("artifact_values") or {},
+                    description=job.get("description") or description,
+                    timeout=timeout,
+                    log=log,
+                )
+                for job in jobs
+            ]
+        except Exception:
+            # Discard the jobs built before the invalid one
+            db.session.rollback()
+            raise
+
+        db.session.commit()
+        self._rq_service.submit_many(
+            job_ids=[new_job.resource_id for new_job in new_jobs],
+            experiment_id=experiment_id,
+            queue=queue.name,
+            timeout=timeout,
+            priority=priority,
+            share=_get_share_key(queue, experiment),
+        )
+        log.debug(
+            "Job batch registration successful",
+            job_ids=[new_job.resource_id for new_job in new_jobs],
+        )
+        return [
+            utils.JobDict(job=new_job, artifacts=[], has_draft=False)
+            for new_job in new_jobs
+        ]
+
+    def _get_job_submission_targets(
+        self,
+        experiment_id: int,
+        queue_id: int,
+        entrypoint_id: int,
+        entrypoint_snapshot_id: int | None,
+        log: BoundLogger,
+    ) -> tuple[models.Experiment, models.Queue, models.EntryPoint]:
         # Validate the provided experiment_id and fetch the ORM object
         experiment_dict = cast(
             utils.ExperimentDict,
@@ -249,6 +388,22 @@ class JobService(object):
         )
         entrypoint = entrypoint_dict["entry_point"]
 
+        return experiment, queue, entrypoint
+
+    def _build_job(
+        self,
+        experiment: models.Experiment,
+        queue: models.Queue,
+        entrypoint: models.EntryPoint,
+        values: dict[str, str],
+        artifact_value_ids: dict[str, dict[str, int]],
+        description: str | None,
+        timeout: str,
+        log: BoundLogger,
+    ) -> models.Job:
+        # Set the default status
+        status = "queued"
+
         # Validate the keys in values against the registered entrypoint parameter names
         invalid_job_params = list(
             set(values.keys()) - {param.name for param in entrypoint.parameters}
@@ -312,22 +467,8 @@ class JobService(object):
             job_resource=job_resource,
             queue=queue,
         )
-        db.session.commit()
-        self._rq_service.submit(
-            job_id=new_job.resource_id,
-            experiment_id=experiment_id,
-            queue=queue.name,
-            timeout=timeout,
-        )
-        log.debug(
-            "Job registration successful",
-            job_id=new_job.resource_id,
-        )
-        return utils.JobDict(
-            job=new_job,
-            artifacts=[],
-            has_draft=False,
-        )
+
+        return new_job
 
     def _create_entrypoint_artifact_values(
         self,
@@ -398,8 +539,10 @@ class JobService(object):
         page_length: int,
         sort_by_string: str,
         descending: bool,
+        cursor: PageCursor | None = None,
+        count_total: bool = True,
         **kwargs,
-    ) -> tuple[list[utils.JobDict], int]:
+    ) -> tuple[list[utils.JobDict], int | None, PageCursors | None]:
         """Fetch a list of jobs, optionally filtering by search string and paging
         parameters.
 
@@ -410,10 +553,15 @@ class JobService(object):
             page_length: The maximum number of jobs to be returned.
             sort_by_string: The name of the column to sort.
             descending: Boolean indicating whether to sort by descending or not.
+            cursor: If provided, the page is located with this cursor (keyset paging)
+                and page_index is ignored.
+            count_total: Whether to count the total number of jobs matching the
+                query. Only cursor-based paging can skip the count.
 
         Returns:
-            A tuple containing a list of jobs and the total number of jobs matching
-            the query.
+            A tuple containing a list of jobs, the total number of jobs matching the
+            query (None if not counted), and the cursors for the adjacent pages (None
+            unless cursor-based paging is used).
 
         Raises:
             BackendDatabaseError: If the database query returns a None when counting
@@ -432,27 +580,33 @@ class JobService(object):
                 construct_sql_query_filters(search_string, SEARCHABLE_FIELDS)
             )
 
-        stmt = (
-            select(func.count(models.Job.resource_id))
-            .join(models.Resource)
-            .where(
-                *filters,
-                models.Resource.is_deleted == False,  # noqa: E712
-                models.Resource.latest_snapshot_id == models.Job.resource_snapshot_id,
-            )
-        )
-        total_num_jobs = db.session.scalars(stmt).first()
+        if sort_by_string and sort_by_string not in SORTABLE_FIELDS:
+            raise SortParameterValidationError(RESOURCE_TYPE, sort_by_string)
 
-        if total_num_jobs is None:
-            log.error(
-                "The database query returned a None when counting the number of "
-                "groups when it should return a number.",
-                sql=str(stmt),
+        total_num_jobs: int | None = None
+        if cursor is None or count_total:
+            stmt = (
+                select(func.count(models.Job.resource_id))
+                .join(models.Resource)
+                .where(
+                    *filters,
+                    models.Resource.is_deleted == False,  # noqa: E712
+                    models.Resource.latest_snapshot_id
+                    == models.Job.resource_snapshot_id,
+                )
             )
-            raise BackendDatabaseError
+            total_num_jobs = db.session.scalars(stmt).first()
 
-        if total_num_jobs == 0:
-            return [], total_num_jobs
+            if total_num_jobs is None:
+                log.error(
+                    "The database query returned a None when counting the number of "
+                    "groups when it should return a number.",
+                    sql=str(stmt),
+                )
+                raise BackendDatabaseError
+
+            if total_num_jobs == 0:
+                return [], 0, None if cursor is None else PageCursors(None, None)
 
         jobs_stmt = (
             select(models.Job)
@@ -468,22 +622,32 @@ class JobService(object):
                 models.Resource.is_deleted == False,  # noqa: E712
                 models.Resource.latest_snapshot_id == models.Job.resource_snapshot_id,
             )
-            .offset(page_index)
-            .limit(page_length)
         )
 
-        if sort_by_string and sort_by_string in SORTABLE_FIELDS:
+        if cursor is not None:
+            jobs, cursors = get_keyset_page(
+                db.session,
+                jobs_stmt,
+                SORTABLE_FIELDS[sort_by_string] if sort_by_string else None,
+                models.Job.resource_snapshot_id,
+                descending,
+                cursor,
+                page_length,
+            )
+            return _build_job_dict(list(jobs)), total_num_jobs, cursors
+
+        jobs_stmt = jobs_stmt.offset(page_index).limit(page_length)
+
+        if sort_by_string:
             sort_column = SORTABLE_FIELDS[sort_by_string]
             if descending:
                 sort_column = sort_column.desc()
             else:
                 sort_column = sort_column.asc()
             jobs_stmt = jobs_stmt.order_by(sort_column)
-        elif sort_by_string and sort_by_string not in SORTABLE_FIELDS:
-            raise SortParameterValidationError(RESOURCE_TYPE, sort_by_string)
 
         jobs = list(db.session.scalars(jobs_stmt).all())
-        return _build_job_dict(jobs), total_num_jobs
+        return _build_job_dict(jobs), total_num_jobs, None
 
 
 class JobIdService(object):
@@ -860,6 +1024,7 @@ class ExperimentJobService(object):
         description: str,
         timeout: str,
         entrypoint_snapshot_id: int | None = None,
+        priority: str = PRIORITY_DEFAULT,
         **kwargs,
     ) -> utils.JobDict:
         """Create a new job within an experiment.
@@ -874,6 +1039,7 @@ class ExperimentJobService(object):
             description: The description of the job.
             timeout: The length of time the job will run before timing out.
             group_id: The group that will own the job.
+            priority: The priority of the job on its queue. Defaults to "default".
 
         Returns:
             The newly created job object.
@@ -888,6 +1054,49 @@ class ExperimentJobService(object):
             description=description,
             timeout=timeout,
             entrypoint_snapshot_id=entrypoint_snapshot_id,
+            priority=priority,
+            log=log,
+        )
+
+    def create_batch(
+        self,
+        experiment_id: int,
+        queue_id: int,
+        entrypoint_id: int,
+        jobs: list[dict[str, Any]],
+        description: str | None,
+        timeout: str,
+        entrypoint_snapshot_id: int | None = None,
+        priority: str = PRIORITY_DEFAULT,
+        **kwargs,
+    ) -> list[utils.JobDict]:
+        """Create a batch of jobs within an experiment.
+
+        Args:
+            experiment_id: The unique id for the experiment the jobs are under.
+            queue_id: The unique id for the queue the jobs will execute on.
+            entrypoint_id: The unique id for the entrypoint defining the jobs.
+            jobs: A list of dictionaries with the "values", "artifact_values", and
+                optional "description" of each job.
+            description: The description of jobs that do not set their own.
+            timeout: The length of time each job will run before timing out.
+            entrypoint_snapshot_id: The snapshot of the entrypoint to run. Defaults
+                to the latest snapshot.
+            priority: The priority of the jobs on their queue. Defaults to "default".
+
+        Returns:
+            The newly created job objects.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        return self._job_service.create_batch(
+            experiment_id=experiment_id,
+            queue_id=queue_id,
+            entrypoint_id=entrypoint_id,
+            jobs=jobs,
+            description=description,
+            timeout=timeout,
+            entrypoint_snapshot_id=entrypoint_snapshot_id,
+            priority=priority,
             log=log,
         )
 
@@ -1548,6 +1757,32 @@ class JobLogService(object):
         return records, total_count
 
 
+def _validate_scheduling(queue: models.Queue, priority: str) -> None:
+    """Check that the workers listen to the RQ queue a job would be enqueued on.
+
+    Only FairShareWorker listens to the RQ queues of the non-default priorities and of
+    fair-share queues, so jobs that need them are rejected when the
+    DIOPTRA_RQ_FAIR_SHARE_WORKER setting is disabled.
+
+    Raises:
+        JobSchedulingNotSupportedError: If the job has a non-default priority or the
+            queue uses fair share, and the workers do not support them.
+    """
+    if current_app.config["DIOPTRA_RQ_FAIR_SHARE_WORKER"]:
+        return
+
+    if priority != PRIORITY_DEFAULT or queue.fair_share != FAIR_SHARE_NONE:
+        raise JobSchedulingNotSupportedError(priority, queue.fair_share)
+
+
+def _get_share_key(queue: models.Queue, experiment: models.Experiment) -> str | None:
+    return get_share_key(
+        queue.fair_share,
+        user_id=current_user.user_id,
+        group_id=experiment.resource.group_id,
+    )
+
+
 def _build_job_dict(jobs: list[models.Job]) -> list[utils.JobDict]:
     job_dicts: dict[int, utils.JobDict] = {
         job.resource_id: utils.JobDict(
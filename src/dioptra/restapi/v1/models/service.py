@@ -21,11 +21,12 @@ from typing import Any, Final, cast
 import structlog
 from flask_login import current_user
 from injector import inject
-from sqlalchemy import Integer, func, select
+from sqlalchemy import func, select
 from sqlalchemy.orm import aliased
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import db, models
+from dioptra.restapi.db.text_search import text_match
 from dioptra.restapi.errors import (
     BackendDatabaseError,
     EntityDoesNotExistError,
@@ -43,14 +44,12 @@ MODEL_RESOURCE_TYPE: Final[str] = "ml_model"
 MODEL_VERSION_RESOURCE_TYPE: Final[str] = "ml_model_version"
 MODEL_SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
     "name": lambda x: models.MlModel.name.like(x, escape="/"),
-    "description": lambda x: models.MlModel.description.like(x, escape="/"),
-    "tag": lambda x: models.MlModel.tags.any(models.Tag.name.like(x, escape="/")),
+    "description": lambda x: text_match(models.MlModel.description, x),
+    "tag": lambda x: models.MlModel.tags.any(text_match(models.Tag.name, x)),
 }
 MODEL_VERSION_SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
-    "description": lambda x: models.MlModelVersion.description.like(x, escape="/"),
-    "tag": lambda x: models.MlModelVersion.tags.any(
-        models.Tag.name.like(x, escape="/")
-    ),
+    "description": lambda x: text_match(models.MlModelVersion.description, x),
+    "tag": lambda x: models.MlModelVersion.tags.any(text_match(models.Tag.name, x)),
 }
 MODEL_SORTABLE_FIELDS: Final[dict[str, Any]] = {
     "name": models.MlModel.name,
@@ -275,13 +274,8 @@ class ModelService(object):
         for model_version in model_versions:
             models_dict[model_version.model_id]["version"] = model_version
 
-        drafts_stmt = select(
-            models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-        ).where(
-            models.DraftResource.payload["resource_id"]
-            .as_string()
-            .cast(Integer)
-            .in_(
+        drafts_stmt = select(models.DraftResource.resource_id).where(
+            models.DraftResource.resource_id.in_(
                 tuple(model["ml_model"].resource_id for model in models_dict.values())
             ),
             models.DraftResource.user_id == current_user.user_id,
@@ -367,8 +361,7 @@ class ModelIdService(object):
         drafts_stmt = (
             select(models.DraftResource.draft_resource_id)
             .where(
-                models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-                == ml_model.resource_id,
+                models.DraftResource.resource_id == ml_model.resource_id,
                 models.DraftResource.user_id == current_user.user_id,
             )
             .exists()
@@ -645,12 +638,9 @@ class ModelIdVersionsService(object):
         )
 
         drafts_stmt = (
-            select(
-                models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-            )
+            select(models.DraftResource.resource_id)
             .where(
-                models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-                == model_id,
+                models.DraftResource.resource_id == model_id,
                 models.DraftResource.user_id == current_user.user_id,
             )
             .exists()
@@ -29,6 +29,7 @@ from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import models
 from dioptra.restapi.db.repository.types import TypeRepository
+from dioptra.restapi.db.repository.utils import decode_page_cursor
 from dioptra.restapi.routes import V1_PLUGIN_PARAMETER_TYPES_ROUTE
 from dioptra.restapi.v1 import utils
 from dioptra.restapi.v1.schemas import IdStatusResponseSchema
@@ -99,10 +100,14 @@ class PluginParameterTypeEndpoint(Resource):
         page_length = parsed_query_params["page_length"]
         sort_by_string = parsed_query_params["sort_by"]
         descending = parsed_query_params["descending"]
+        cursor = decode_page_cursor(
+            parsed_query_params["cursor"], sort_by_string, descending
+        )
 
         (
             plugin_parameter_types,
             total_num_plugin_param_types,
+            cursors,
         ) = self._plugin_parameter_type_service.get(
             group_id=group_id,
             search_string=search_string,
@@ -110,6 +115,8 @@ class PluginParameterTypeEndpoint(Resource):
             page_length=page_length,
             sort_by_string=sort_by_string,
             descending=descending,
+            cursor=cursor,
+            count_total=parsed_query_params["count_total"],
             log=log,
         )
         return utils.build_paging_envelope(
@@ -124,6 +131,7 @@ class PluginParameterTypeEndpoint(Resource):
             total_num_elements=total_num_plugin_param_types,
             sort_by=sort_by_string,
             descending=descending,
+            cursors=cursors,
         )
 
     @login_required
@@ -20,6 +20,7 @@ from marshmallow import Schema, fields
 
 from dioptra.restapi.v1.schemas import (
     BasePageSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     PagingQueryParametersSchema,
     SearchQueryParametersSchema,
@@ -88,6 +89,7 @@ class PluginParameterTypePageSchema(BasePageSchema):
 
 class PluginParameterTypeGetQueryParameters(
     PagingQueryParametersSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     SearchQueryParametersSchema,
     SortByGetQueryParametersSchema,
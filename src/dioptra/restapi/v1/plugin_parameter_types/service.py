@@ -16,6 +16,7 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The server-side functions that perform plugin parameter type endpoint operations."""
 
+from collections.abc import Sequence
 from typing import Any, Final, Iterable
 
 import structlog
@@ -136,8 +137,12 @@ class PluginParameterTypeService(object):
         page_length: int,
         sort_by_string: str,
         descending: bool,
+        cursor: repoutils.PageCursor | None = None,
+        count_total: bool = True,
         **kwargs,
-    ) -> tuple[list[utils.PluginParameterTypeDict], int]:
+    ) -> tuple[
+        list[utils.PluginParameterTypeDict], int | None, repoutils.PageCursors | None
+    ]:
         """Fetch a list of plugin parameter types, optionally filtering by
         search string and paging parameters.
 
@@ -149,10 +154,17 @@ class PluginParameterTypeService(object):
                 returned.
             sort_by_string: The name of the column to sort.
             descending: Boolean indicating whether to sort by descending or not.
+            cursor: If provided, the page is located with this cursor (keyset paging)
+                and page_index is ignored.
+            count_total: Whether to count the total number of plugin parameter
+                types matching
+                the query. Only cursor-based paging can skip the count.
 
         Returns:
-            A tuple containing a list of plugin parameter types and the total
-            number of plugin parameter types matching the query.
+            A tuple containing a list of plugin parameter types, the total
+            number of plugin parameter types matching the query (None if not
+            counted), and the cursors for the adjacent pages (None unless
+            cursor-based paging is used).
 
         Raises:
             SearchNotImplementedError: If a search string is provided.
@@ -164,15 +176,32 @@ class PluginParameterTypeService(object):
 
         search_struct = parse_search_text(search_string)
 
-        types, total_num_types = self._uow.type_repo.get_by_filters_paged(
-            group_id,
-            search_struct,
-            page_index,
-            page_length,
-            sort_by_string,
-            descending,
-            repoutils.DeletionPolicy.NOT_DELETED,
-        )
+        types: Sequence[models.PluginTaskParameterType]
+        total_num_types: int | None
+        cursors: repoutils.PageCursors | None = None
+        if cursor is None:
+            types, total_num_types = self._uow.type_repo.get_by_filters_paged(
+                group_id,
+                search_struct,
+                page_index,
+                page_length,
+                sort_by_string,
+                descending,
+                repoutils.DeletionPolicy.NOT_DELETED,
+            )
+        else:
+            types, total_num_types, cursors = (
+                self._uow.type_repo.get_by_filters_keyset_paged(
+                    group_id,
+                    search_struct,
+                    cursor,
+                    page_length,
+                    sort_by_string,
+                    descending,
+                    count_total,
+                    repoutils.DeletionPolicy.NOT_DELETED,
+                )
+            )
 
         plugin_parameter_types_dict: dict[int, utils.PluginParameterTypeDict] = {
             plugin_parameter_type.resource_id: utils.PluginParameterTypeDict(
@@ -192,6 +221,7 @@ class PluginParameterTypeService(object):
         return (
             list(plugin_parameter_types_dict.values()),
             total_num_types,
+            cursors,
         )
 
 
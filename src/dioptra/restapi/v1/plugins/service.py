@@ -22,12 +22,19 @@ from typing import Any, Final, Iterable, cast
 import structlog
 from flask_login import current_user
 from injector import inject
-from sqlalchemy import Integer, func, select
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import aliased
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import db, models
 from dioptra.restapi.db.models.constants import resource_lock_types
+from dioptra.restapi.db.models.plugins import hash_plugin_file_contents
+from dioptra.restapi.db.text_search import (
+    POSTGRES_DIALECT,
+    SQLITE_DIALECT,
+    text_match,
+)
 from dioptra.restapi.errors import (
     BackendDatabaseError,
     EntityDoesNotExistError,
@@ -50,14 +57,16 @@ PLUGIN_FILE_RESOURCE_TYPE: Final[str] = "plugin_file"
 PLUGIN_TASK_RESOURCE_TYPE: Final[str] = "plugin_task"
 PLUGIN_SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
     "name": lambda x: models.Plugin.name.like(x, escape="/"),
-    "description": lambda x: models.Plugin.description.like(x, escape="/"),
-    "tag": lambda x: models.Plugin.tags.any(models.Tag.name.like(x, escape="/")),
+    "description": lambda x: text_match(models.Plugin.description, x),
+    "tag": lambda x: models.Plugin.tags.any(text_match(models.Tag.name, x)),
 }
 PLUGIN_FILE_SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
     "filename": lambda x: models.PluginFile.filename.like(x, escape="/"),
-    "description": lambda x: models.PluginFile.description.like(x, escape="/"),
-    "contents": lambda x: models.PluginFile.contents.like(x, escape="/"),
-    "tag": lambda x: models.PluginFile.tags.any(models.Tag.name.like(x, escape="/")),
+    "description": lambda x: text_match(models.PluginFile.description, x),
+    "contents": lambda x: models.PluginFile.contents_blob.has(
+        text_match(models.PluginFileContents.contents, x)
+    ),
+    "tag": lambda x: models.PluginFile.tags.any(text_match(models.Tag.name, x)),
 }
 PLUGIN_SORTABLE_FIELDS: Final[dict[str, Any]] = {
     "name": models.Plugin.name,
@@ -243,13 +252,8 @@ class PluginService(object):
             for plugin in plugins
         }
 
-        drafts_stmt = select(
-            models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-        ).where(
-            models.DraftResource.payload["resource_id"]
-            .as_string()
-            .cast(Integer)
-            .in_(
+        drafts_stmt = select(models.DraftResource.resource_id).where(
+            models.DraftResource.resource_id.in_(
                 tuple(plugin["plugin"].resource_id for plugin in plugins_dict.values())
             ),
             models.DraftResource.user_id == current_user.user_id,
@@ -321,8 +325,7 @@ class PluginIdService(object):
         drafts_stmt = (
             select(models.DraftResource.draft_resource_id)
             .where(
-                models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-                == plugin.resource_id,
+                models.DraftResource.resource_id == plugin.resource_id,
                 models.DraftResource.user_id == current_user.user_id,
             )
             .exists()
@@ -558,13 +561,8 @@ class PluginIdsService(object):
         for plugin_file in plugin_files:
             plugins_dict[plugin_file.plugin_id]["plugin_files"].append(plugin_file)
 
-        drafts_stmt = select(
-            models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-        ).where(
-            models.DraftResource.payload["resource_id"]
-            .as_string()
-            .cast(Integer)
-            .in_(
+        drafts_stmt = select(models.DraftResource.resource_id).where(
+            models.DraftResource.resource_id.in_(
                 tuple(plugin["plugin"].resource_id for plugin in plugins_dict.values())
             ),
             models.DraftResource.user_id == current_user.user_id,
@@ -766,7 +764,7 @@ class PluginIdFileService(object):
         )
         new_plugin_file = models.PluginFile(
             filename=filename,
-            contents=contents,
+            contents_blob=_get_plugin_file_contents(contents),
             description=description,
             resource=resource,
             creator=current_user,
@@ -796,6 +794,131 @@ class PluginIdFileService(object):
             plugin_file=new_plugin_file, plugin=plugin, has_draft=False
         )
 
+    def create_many(
+        self,
+        plugin_id: int,
+        plugin_files: list[dict[str, Any]],
+        replace_existing: bool = False,
+        commit: bool = True,
+        **kwargs,
+    ) -> list[utils.PluginFileDict]:
+        """Creates several PluginFile objects under a single new plugin snapshot.
+
+        Calling create() for each file adds a plugin snapshot per file, each
+        associated with every file registered so far.
+
+        Args:
+            plugin_id: The unique id of the plugin containing the plugin files.
+            plugin_files: A list of dictionaries with the "filename", "contents",
+                "function_tasks", "artifact_tasks", and optional "description" of
+                each plugin file.
+            replace_existing: If True, a plugin file with the same filename as an
+                existing file of the plugin is registered as a new snapshot of that
+                file, keeping its description unless one is given. Defaults to
+                False.
+            commit: If True, commit the transaction. Defaults to True.
+
+        Returns:
+            The newly created plugin file objects, in the order of plugin_files.
+
+        Raises:
+            EntityExistsError: If a plugin file with one of the given filenames
+                already exists and `replace_existing` is False.
+            QueryParameterNotUniqueError: If a filename is given more than once.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log.debug(
+            "Create plugin files", plugin_id=plugin_id, num_files=len(plugin_files)
+        )
+
+        duplicates = find_non_unique("filename", plugin_files)
+        if len(duplicates) > 0:
+            raise QueryParameterNotUniqueError("plugin file", filenames=duplicates)
+
+        if not plugin_files:
+            return []
+
+        plugin_dict = cast(
+            utils.PluginWithFilesDict,
+            self._plugin_id_service.get(plugin_id, error_if_not_found=True),
+        )
+        plugin = plugin_dict["plugin"]
+        current_plugin_files = {
+            plugin_file.filename: plugin_file for plugin_file in plugin.plugin_files
+        }
+
+        new_plugin = models.Plugin(
+            name=plugin.name,
+            description=plugin.description,
+            resource=plugin.resource,
+            creator=current_user,
+        )
+        db.session.add(new_plugin)
+
+        new_plugin_files = []
+        for plugin_file in plugin_files:
+            filename = plugin_file["filename"]
+            existing = current_plugin_files.get(filename)
+
+            if existing is not None and not replace_existing:
+                raise EntityExistsError(
+                    PLUGIN_FILE_RESOURCE_TYPE,
+                    existing.resource_id,
+                    filename=filename,
+                    plugin_id=plugin_id,
+                )
+
+            if existing is None:
+                resource = models.Resource(
+                    resource_type=PLUGIN_FILE_RESOURCE_TYPE,
+                    owner=new_plugin.resource.owner,
+                )
+                description = plugin_file.get("description")
+            else:
+                resource = existing.resource
+                description = plugin_file.get("description", existing.description)
+
+            new_plugin_file = models.PluginFile(
+                filename=filename,
+                contents_blob=_get_plugin_file_contents(plugin_file["contents"]),
+                description=description,
+                resource=resource,
+                creator=current_user,
+            )
+
+            if existing is None:
+                new_plugin_file.parents.append(new_plugin.resource)
+
+            db.session.add(new_plugin_file)
+            _add_plugin_tasks(
+                function_tasks=plugin_file["function_tasks"],
+                artifact_tasks=plugin_file["artifact_tasks"],
+                plugin_file=new_plugin_file,
+                log=log,
+            )
+            current_plugin_files[filename] = new_plugin_file
+            new_plugin_files.append(new_plugin_file)
+
+        _associate_plugin_with_plugin_files(
+            new_plugin, list(current_plugin_files.values())
+        )
+
+        if commit:
+            db.session.commit()
+            log.debug(
+                "Plugin files registration successful",
+                plugin_file_ids=[
+                    plugin_file.resource_id for plugin_file in new_plugin_files
+                ],
+            )
+
+        return [
+            utils.PluginFileDict(
+                plugin_file=plugin_file, plugin=plugin, has_draft=False
+            )
+            for plugin_file in new_plugin_files
+        ]
+
     def get(
         self,
         plugin_id: int,
@@ -916,13 +1039,8 @@ class PluginIdFileService(object):
             for plugin_file in db.session.scalars(latest_plugin_files_stmt).unique()
         }
 
-        drafts_stmt = select(
-            models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-        ).where(
-            models.DraftResource.payload["resource_id"]
-            .as_string()
-            .cast(Integer)
-            .in_(
+        drafts_stmt = select(models.DraftResource.resource_id).where(
+            models.DraftResource.resource_id.in_(
                 tuple(
                     plugin_file["plugin_file"].resource_id
                     for plugin_file in plugin_files_dict.values()
@@ -1159,8 +1277,7 @@ class PluginIdFileIdService(object):
         drafts_stmt = (
             select(models.DraftResource.draft_resource_id)
             .where(
-                models.DraftResource.payload["resource_id"].as_string().cast(Integer)
-                == plugin_file.resource_id,
+                models.DraftResource.resource_id == plugin_file.resource_id,
                 models.DraftResource.user_id == current_user.user_id,
             )
             .exists()
@@ -1243,7 +1360,7 @@ class PluginIdFileIdService(object):
 
         updated_plugin_file = models.PluginFile(
             filename=filename,
-            contents=contents,
+            contents_blob=_get_plugin_file_contents(contents),
             description=description,
             resource=plugin_file.resource,
             creator=current_user,
@@ -1495,3 +1612,41 @@ def _associate_plugin_with_plugin_files(
             plugin=plugin, plugin_file=plugin_file
         )
         db.session.add(plugin_plugin_file)
+
+
+# The INSERT constructs that support ON CONFLICT DO NOTHING, by dialect name
+_DIALECT_INSERTS: Final[dict[str, Any]] = {
+    POSTGRES_DIALECT: postgresql.insert,
+    SQLITE_DIALECT: sqlite.insert,
+}
+
+
+def _get_plugin_file_contents(contents: str) -> models.PluginFileContents:
+    """Get the stored contents of a plugin file, adding them if they are new.
+
+    New contents are inserted with an INSERT ... ON CONFLICT DO NOTHING statement,
+    so a concurrent request that stores the same contents first does not cause a
+    unique constraint violation. The contents are then selected again.
+
+    Args:
+        contents: The contents of the plugin file.
+
+    Returns:
+        The plugin file contents object with the hash of the contents.
+    """
+    contents_hash = hash_plugin_file_contents(contents)
+    stmt = select(models.PluginFileContents).where(
+        models.PluginFileContents.contents_hash == contents_hash
+    )
+    plugin_file_contents = db.session.scalar(stmt)
+
+    if plugin_file_contents is None:
+        insert = _DIALECT_INSERTS[db.session.get_bind().dialect.name]
+        db.session.execute(
+            insert(models.PluginFileContents)
+            .values(contents_hash=contents_hash, contents=contents)
+            .on_conflict_do_nothing(index_elements=["contents_hash"])
+        )
+        plugin_file_contents = db.session.scalars(stmt).one()
+
+    return plugin_file_contents
@@ -21,7 +21,7 @@ from typing import cast
 from urllib.parse import unquote
 
 import structlog
-from flask import request
+from flask import Response, request
 from flask_accepts import accepts, responds
 from flask_login import login_required
 from flask_restx import Namespace, Resource
@@ -30,6 +30,7 @@ from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import models
 from dioptra.restapi.db.repository.queues import QueueRepository
+from dioptra.restapi.db.repository.utils import decode_page_cursor
 from dioptra.restapi.routes import V1_QUEUES_ROUTE
 from dioptra.restapi.v1 import utils
 from dioptra.restapi.v1.schemas import IdStatusResponseSchema
@@ -46,14 +47,23 @@ from dioptra.restapi.v1.shared.tags.controller import (
     generate_resource_tags_endpoint,
     generate_resource_tags_id_endpoint,
 )
+from dioptra.rq.scheduling import FAIR_SHARE_NONE
 
+from .metrics import PROMETHEUS_CONTENT_TYPE, format_prometheus
 from .schema import (
     QueueGetQueryParameters,
+    QueueMetricsGetQueryParameters,
+    QueueMetricsSchema,
     QueueMutableFieldsSchema,
     QueuePageSchema,
     QueueSchema,
 )
-from .service import RESOURCE_TYPE, QueueIdService, QueueService
+from .service import (
+    RESOURCE_TYPE,
+    QueueIdService,
+    QueueMetricsService,
+    QueueService,
+)
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
@@ -90,14 +100,19 @@ class QueueEndpoint(Resource):
         page_length = parsed_query_params["page_length"]
         sort_by_string = parsed_query_params["sort_by"]
         descending = parsed_query_params["descending"]
+        cursor = decode_page_cursor(
+            parsed_query_params["cursor"], sort_by_string, descending
+        )
 
-        queues, total_num_queues = self._queue_service.get(
+        queues, total_num_queues, cursors = self._queue_service.get(
             group_id=group_id,
             search_string=search_string,
             page_index=page_index,
             page_length=page_length,
             sort_by_string=sort_by_string,
             descending=descending,
+            cursor=cursor,
+            count_total=parsed_query_params["count_total"],
             log=log,
         )
         return utils.build_paging_envelope(
@@ -112,6 +127,7 @@ class QueueEndpoint(Resource):
             total_num_elements=total_num_queues,
             sort_by=sort_by_string,
             descending=descending,
+            cursors=cursors,
         )
 
     @login_required
@@ -128,11 +144,53 @@ class QueueEndpoint(Resource):
             name=parsed_obj["name"],
             description=parsed_obj["description"],
             group_id=parsed_obj["group_id"],
+            fair_share=parsed_obj.get("fair_share", FAIR_SHARE_NONE),
             log=log,
         )
         return utils.build_queue(queue)
 
 
+@api.route("/metrics")
+class QueueMetricsEndpoint(Resource):
+    @inject
+    def __init__(
+        self, queue_metrics_service: QueueMetricsService, *args, **kwargs
+    ) -> None:
+        """Initialize the queue metrics resource.
+
+        All arguments are provided via dependency injection.
+
+        Args:
+            queue_metrics_service: A QueueMetricsService object.
+        """
+        self._queue_metrics_service = queue_metrics_service
+        super().__init__(*args, **kwargs)
+
+    @login_required
+    @accepts(query_params_schema=QueueMetricsGetQueryParameters, api=api)
+    @responds(schema=QueueMetricsSchema, api=api)
+    def get(self):
+        """Gets the job backlog, wait and run times, and worker use of each queue.
+
+        Set format=prometheus to get the metrics in the Prometheus text format.
+        """
+        log = LOGGER.new(
+            request_id=str(uuid.uuid4()), resource="QueueMetrics", request_type="GET"
+        )
+        parsed_query_params = request.parsed_query_params  # type: ignore
+
+        metrics = self._queue_metrics_service.get(
+            window=parsed_query_params["window"], log=log
+        )
+
+        if parsed_query_params["format"] == "prometheus":
+            return Response(
+                format_prometheus(metrics), content_type=PROMETHEUS_CONTENT_TYPE
+            )
+
+        return metrics
+
+
 @api.route("/<int:id>")
 @api.param("id", "ID for the Queue resource.")
 class QueueIdEndpoint(Resource):
@@ -185,6 +243,7 @@ class QueueIdEndpoint(Resource):
                 id,
                 name=parsed_obj["name"],
                 description=parsed_obj["description"],
+                fair_share=parsed_obj.get("fair_share", FAIR_SHARE_NONE),
                 error_if_not_found=True,
                 log=log,
             ),
@@ -0,0 +1,203 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Helpers for summarizing queue metrics and exporting them to Prometheus."""
+
+import math
+from collections.abc import Sequence
+from typing import Any, Final
+
+PROMETHEUS_CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4; charset=utf-8"
+QUANTILES: Final[dict[str, float]] = {"p50": 0.5, "p95": 0.95}
+
+# Prometheus gauge name: (key in the per-queue "rq" dictionary, help text)
+_RQ_GAUGES: Final[dict[str, tuple[str, str]]] = {
+    "dioptra_rq_queue_backlog": ("backlog", "Jobs waiting in the RQ queue."),
+    "dioptra_rq_started_jobs": ("started", "Jobs in the RQ started job registry."),
+    "dioptra_rq_deferred_jobs": ("deferred", "Jobs in the RQ deferred job registry."),
+    "dioptra_rq_scheduled_jobs": (
+        "scheduled",
+        "Jobs in the RQ scheduled job registry.",
+    ),
+    "dioptra_rq_failed_jobs": ("failed", "Jobs in the RQ failed job registry."),
+    "dioptra_rq_workers": ("workers", "RQ workers listening to the queue."),
+    "dioptra_rq_busy_workers": ("busy_workers", "RQ workers running a job."),
+    "dioptra_rq_worker_utilization": (
+        "utilization",
+        "Fraction of the RQ workers listening to the queue that are running a job.",
+    ),
+}
+
+
+def percentile(values: Sequence[float], fraction: float) -> float | None:
+    """Compute a percentile by linear interpolation between the closest ranks.
+
+    Args:
+        values: The values, sorted in ascending order.
+        fraction: The percentile as a fraction between 0 and 1.
+
+    Returns:
+        The percentile, or None if there are no values.
+    """
+    if not values:
+        return None
+
+    position = (len(values) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize_durations(durations: list[float]) -> dict[str, Any]:
+    """Summarize durations with their count, sum, and the percentiles in QUANTILES.
+
+    Args:
+        durations: The durations, in seconds.
+
+    Returns:
+        A dictionary with the count and sum of the durations and each percentile.
+    """
+    values = sorted(durations)
+    summary: dict[str, Any] = {"count": len(values), "sum": float(sum(values))}
+    summary.update(
+        {name: percentile(values, fraction) for name, fraction in QUANTILES.items()}
+    )
+
+    return summary
+
+
+def format_prometheus(metrics: dict[str, Any]) -> str:
+    """Format queue metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics: The queue metrics, as returned by QueueMetricsService.get().
+
+    Returns:
+        The metrics in the Prometheus text format.
+    """
+    lines: list[str] = []
+    queues = metrics["queues"]
+
+    def _metric(name: str, type_: str, help_: str, samples: list[tuple]) -> None:
+        lines.append(f"# HELP {name} {help_}")
+        lines.append(f"# TYPE {name} {type_}")
+
+        for labels, value in samples:
+            if value is None:
+                continue
+
+            label_text = ",".join(
+                f'{key}="{_escape_label(str(label))}"' for key, label in labels.items()
+            )
+            label_text = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{name}{label_text} {_format_value(value)}")
+
+    _metric(
+        "dioptra_queue_jobs",
+        "gauge",
+        "Jobs on the queue by their current status.",
+        [
+            ({"queue": queue["name"], "status": status}, count)
+            for queue in queues
+            for status, count in queue["jobs"].items()
+        ],
+    )
+    _metric(
+        "dioptra_queue_oldest_queued_seconds",
+        "gauge",
+        "Time the oldest queued job on the queue has been waiting.",
+        [
+            ({"queue": queue["name"]}, queue["oldest_queued_seconds"])
+            for queue in queues
+        ],
+    )
+
+    # The durations only cover the jobs in the metrics window, so they can go down
+    # between scrapes and are exported as gauges rather than as a summary, whose sum
+    # and count must only increase.
+    _metric(
+        "dioptra_queue_metrics_window_seconds",
+        "gauge",
+        "Length of the window of the jobs in the queue duration metrics.",
+        [({}, metrics["window"])],
+    )
+
+    for key, name, total_name, count_name, help_, count_help in (
+        (
+            "wait_seconds",
+            "dioptra_queue_wait_seconds",
+            "dioptra_queue_window_wait_seconds",
+            "dioptra_queue_window_started_jobs",
+            "time from queuing to starting the jobs started",
+            "Jobs started on the queue in the metrics window.",
+        ),
+        (
+            "run_seconds",
+            "dioptra_queue_run_seconds",
+            "dioptra_queue_window_run_seconds",
+            "dioptra_queue_window_finished_jobs",
+            "time from starting to finishing the jobs finished",
+            "Jobs finished on the queue in the metrics window.",
+        ),
+    ):
+        _metric(
+            name,
+            "gauge",
+            f"Percentiles of the {help_} on the queue in the metrics window.",
+            [
+                (
+                    {"queue": queue["name"], "quantile": str(fraction)},
+                    queue[key][label],
+                )
+                for queue in queues
+                for label, fraction in QUANTILES.items()
+            ],
+        )
+        _metric(
+            total_name,
+            "gauge",
+            f"Total {help_} on the queue in the metrics window.",
+            [({"queue": queue["name"]}, queue[key]["sum"]) for queue in queues],
+        )
+        _metric(
+            count_name,
+            "gauge",
+            count_help,
+            [({"queue": queue["name"]}, queue[key]["count"]) for queue in queues],
+        )
+
+    for name, (key, help_) in _RQ_GAUGES.items():
+        _metric(
+            name,
+            "gauge",
+            help_,
+            [
+                ({"queue": queue["name"]}, queue["rq"][key])
+                for queue in queues
+                if queue["rq"] is not None
+            ],
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
@@ -16,10 +16,11 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The schemas for serializing/deserializing Queue resources."""
 
-from marshmallow import Schema, fields
+from marshmallow import Schema, fields, validate
 
 from dioptra.restapi.v1.schemas import (
     BasePageSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     PagingQueryParametersSchema,
     SearchQueryParametersSchema,
@@ -27,6 +28,7 @@ from dioptra.restapi.v1.schemas import (
     generate_base_resource_ref_schema,
     generate_base_resource_schema,
 )
+from dioptra.rq.scheduling import FAIR_SHARE_MODES
 
 QueueRefBaseSchema = generate_base_resource_ref_schema("Queue")
 QueueSnapshotRefBaseSchema = generate_base_resource_ref_schema(
@@ -57,14 +59,34 @@ class QueueMutableFieldsSchema(Schema):
 
     name = fields.String(
         attribute="name",
-        metadata={"description": "Name of the Queue resource."},
+        metadata={
+            "description": "Name of the Queue resource. The name cannot contain "
+            "':', which separates the job priority and submitter in the names of "
+            "the RQ queues behind the Queue."
+        },
         required=True,
+        validate=validate.Regexp(
+            r"^[^:]*$", error="The name of a Queue cannot contain ':'."
+        ),
     )
     description = fields.String(
         attribute="description",
         metadata={"description": "Description of the Queue resource."},
         load_default=None,
     )
+    fairShare = fields.String(
+        attribute="fair_share",
+        metadata={
+            "description": "How workers share the Queue between submitters. With "
+            "'user' or 'group', workers take jobs from each submitting user or group "
+            "in turn within a job priority. With 'none', jobs of the same priority "
+            "run in the order they were submitted. Only the fair-share worker of "
+            "dioptra-worker-v1 runs jobs on a Queue with 'user' or 'group', so they "
+            "are rejected if DIOPTRA_RQ_FAIR_SHARE_WORKER is disabled. Defaults to "
+            "'none'."
+        },
+        validate=validate.OneOf(FAIR_SHARE_MODES),
+    )
 
 
 QueueBaseSchema = generate_base_resource_schema("Queue", snapshot=True)
@@ -86,8 +108,160 @@ class QueuePageSchema(BasePageSchema):
 
 class QueueGetQueryParameters(
     PagingQueryParametersSchema,
+    CursorPagingQueryParametersSchema,
     GroupIdQueryParametersSchema,
     SearchQueryParametersSchema,
     SortByGetQueryParametersSchema,
 ):
     """The query parameters for the GET method of the /queues endpoint."""
+
+
+class QueueMetricsGetQueryParameters(Schema):
+    """The query parameters for the GET method of the /queues/metrics endpoint."""
+
+    window = fields.Integer(
+        attribute="window",
+        metadata={
+            "description": (
+                "The length of the window, in seconds, of the jobs used to compute "
+                "queue wait and run durations. Defaults to 1 day."
+            )
+        },
+        load_default=86400,
+        validate=validate.Range(min=1),
+    )
+    format = fields.String(
+        attribute="format",
+        metadata={
+            "description": (
+                'The response format, either "json" or "prometheus" (the '
+                "Prometheus text exposition format). Defaults to json."
+            )
+        },
+        load_default="json",
+        validate=validate.OneOf(["json", "prometheus"]),
+    )
+
+
+class QueueDurationsSchema(Schema):
+    """The schema for a summary of job durations on a queue."""
+
+    count = fields.Integer(
+        attribute="count",
+        metadata={"description": "The number of durations in the summary."},
+    )
+    sum = fields.Float(
+        attribute="sum",
+        metadata={"description": "The total of the durations, in seconds."},
+    )
+    p50 = fields.Float(
+        attribute="p50",
+        allow_none=True,
+        metadata={"description": "The median duration, in seconds."},
+    )
+    p95 = fields.Float(
+        attribute="p95",
+        allow_none=True,
+        metadata={"description": "The 95th percentile duration, in seconds."},
+    )
+
+
+class QueueRQStateSchema(Schema):
+    """The schema for the RQ state of a queue."""
+
+    backlog = fields.Integer(
+        attribute="backlog",
+        metadata={"description": "The number of jobs waiting in the RQ queue."},
+    )
+    started = fields.Integer(
+        attribute="started",
+        metadata={"description": "The number of jobs being run by RQ workers."},
+    )
+    deferred = fields.Integer(
+        attribute="deferred",
+        metadata={"description": "The number of jobs waiting on other jobs."},
+    )
+    scheduled = fields.Integer(
+        attribute="scheduled",
+        metadata={"description": "The number of jobs scheduled for later."},
+    )
+    failed = fields.Integer(
+        attribute="failed",
+        metadata={"description": "The number of jobs in the RQ failed job registry."},
+    )
+    workers = fields.Integer(
+        attribute="workers",
+        metadata={"description": "The number of RQ workers listening to the queue."},
+    )
+    busyWorkers = fields.Integer(
+        attribute="busy_workers",
+        metadata={"description": "The number of RQ workers running a job."},
+    )
+    utilization = fields.Float(
+        attribute="utilization",
+        allow_none=True,
+        metadata={
+            "description": "The fraction of the RQ workers that are running a job."
+        },
+    )
+
+
+class QueueMetricsItemSchema(Schema):
+    """The schema for the metrics of a single queue."""
+
+    id = fields.Integer(
+        attribute="id", metadata={"description": "ID for the Queue resource."}
+    )
+    name = fields.String(
+        attribute="name", metadata={"description": "Name of the Queue resource."}
+    )
+    jobs = fields.Dict(
+        keys=fields.String(),
+        values=fields.Integer(),
+        attribute="jobs",
+        metadata={"description": "The number of jobs on the queue by status."},
+    )
+    oldestQueuedSeconds = fields.Float(
+        attribute="oldest_queued_seconds",
+        allow_none=True,
+        metadata={
+            "description": "How long the oldest queued job has waited, in seconds."
+        },
+    )
+    waitSeconds = fields.Nested(
+        QueueDurationsSchema,
+        attribute="wait_seconds",
+        metadata={"description": "The time from queuing to starting jobs."},
+    )
+    runSeconds = fields.Nested(
+        QueueDurationsSchema,
+        attribute="run_seconds",
+        metadata={"description": "The time from starting to finishing jobs."},
+    )
+    rq = fields.Nested(
+        QueueRQStateSchema,
+        attribute="rq",
+        allow_none=True,
+        metadata={
+            "description": "The RQ state of the queue, null if Redis is unreachable."
+        },
+    )
+
+
+class QueueMetricsSchema(Schema):
+    """The schema for the job backlog and latency metrics of all queues."""
+
+    window = fields.Integer(
+        attribute="window",
+        metadata={"description": "The length of the duration window, in seconds."},
+    )
+    generatedOn = fields.DateTime(
+        attribute="generated_on",
+        metadata={"description": "The time the metrics were computed."},
+    )
+    queues = fields.Nested(
+        QueueMetricsItemSchema,
+        attribute="queues",
+        many=True,
+        metadata={"description": "The metrics of each queue."},
+    )
@@ -16,23 +16,45 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The server-side functions that perform queue endpoint operations."""
 
+import datetime
+from collections import defaultdict
+from collections.abc import Sequence
 from typing import Any, Final
 
 import structlog
 from flask_login import current_user
 from injector import inject
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
 from structlog.stdlib import BoundLogger
 
-from dioptra.restapi.db import models
-from dioptra.restapi.db.repository.utils import DeletionPolicy
+from dioptra.restapi.db import db, models
+from dioptra.restapi.db.repository.utils import (
+    DeletionPolicy,
+    PageCursor,
+    PageCursors,
+)
 from dioptra.restapi.db.unit_of_work import UnitOfWork
 from dioptra.restapi.errors import EntityDoesNotExistError
 from dioptra.restapi.v1 import utils
+from dioptra.restapi.v1.shared.rq_service import RQServiceV1
 from dioptra.restapi.v1.shared.search_parser import parse_search_text
+from dioptra.rq.scheduling import FAIR_SHARE_NONE
+
+from .metrics import summarize_durations
 
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 RESOURCE_TYPE: Final[str] = "queue"
+JOB_STATUSES: Final[tuple[str, ...]] = (
+    "queued",
+    "deferred",
+    "started",
+    "finished",
+    "failed",
+)
+JOB_END_STATUSES: Final[frozenset[str]] = frozenset({"finished", "failed"})
 
 
 class QueueService(object):
@@ -54,6 +76,7 @@ class QueueService(object):
         name: str,
         description: str,
         group_id: int,
+        fair_share: str = FAIR_SHARE_NONE,
         commit: bool = True,
         **kwargs,
     ) -> utils.QueueDict:
@@ -64,6 +87,8 @@ class QueueService(object):
                 unique.
             description: The description of the queue.
             group_id: The group that will own the queue.
+            fair_share: How workers share the queue between submitters, one of
+                "none", "user", or "group". Defaults to "none".
             commit: If True, commit the transaction. Defaults to True.
 
         Returns:
@@ -79,7 +104,11 @@ class QueueService(object):
 
         resource = models.Resource(resource_type=RESOURCE_TYPE, owner=group)
         new_queue = models.Queue(
-            name=name, description=description, resource=resource, creator=current_user
+            name=name,
+            description=description,
+            resource=resource,
+            creator=current_user,
+            fair_share=fair_share,
         )
 
         try:
@@ -106,8 +135,10 @@ class QueueService(object):
         page_length: int,
         sort_by_string: str,
         descending: bool,
+        cursor: PageCursor | None = None,
+        count_total: bool = True,
         **kwargs,
-    ) -> tuple[list[utils.QueueDict], int]:
+    ) -> tuple[list[utils.QueueDict], int | None, PageCursors | None]:
         """Fetch a list of queues, optionally filtering by search string and paging
         parameters.
 
@@ -118,10 +149,15 @@ class QueueService(object):
             page_length: The maximum number of queues to be returned.
             sort_by_string: The name of the column to sort.
             descending: Boolean indicating whether to sort by descending or not.
+            cursor: If provided, the page is located with this cursor (keyset paging)
+                and page_index is ignored.
+            count_total: Whether to count the total number of queues matching
+                the query. Only cursor-based paging can skip the count.
 
         Returns:
-            A tuple containing a list of queues and the total number of queues matching
-            the query.
+            A tuple containing a list of queues, the total number of queues matching
+            the query (None if not counted), and the cursors for the adjacent pages
+            (None unless cursor-based paging is used).
 
         Raises:
             BackendDatabaseError: If the database query returns a None when counting
@@ -132,15 +168,32 @@ class QueueService(object):
 
         search_struct = parse_search_text(search_string)
 
-        queues, total_num_queues = self._uow.queue_repo.get_by_filters_paged(
-            group_id,
-            search_struct,
-            page_index,
-            page_length,
-            sort_by_string,
-            descending,
-            DeletionPolicy.NOT_DELETED,
-        )
+        queues: Sequence[models.Queue]
+        total_num_queues: int | None
+        cursors: PageCursors | None = None
+        if cursor is None:
+            queues, total_num_queues = self._uow.queue_repo.get_by_filters_paged(
+                group_id,
+                search_struct,
+                page_index,
+                page_length,
+                sort_by_string,
+                descending,
+                DeletionPolicy.NOT_DELETED,
+            )
+        else:
+            queues, total_num_queues, cursors = (
+                self._uow.queue_repo.get_by_filters_keyset_paged(
+                    group_id,
+                    search_struct,
+                    cursor,
+                    page_length,
+                    sort_by_string,
+                    descending,
+                    count_total,
+                    DeletionPolicy.NOT_DELETED,
+                )
+            )
 
         queues_dict: dict[int, utils.QueueDict] = {
             queue.resource_id: utils.QueueDict(queue=queue, has_draft=False)
@@ -154,7 +207,7 @@ class QueueService(object):
         for resource_id in resource_ids_with_drafts:
             queues_dict[resource_id]["has_draft"] = True
 
-        return list(queues_dict.values()), total_num_queues
+        return list(queues_dict.values()), total_num_queues, cursors
 
 
 class QueueIdService(object):
@@ -222,6 +275,7 @@ class QueueIdService(object):
         queue_id: int,
         name: str,
         description: str,
+        fair_share: str = FAIR_SHARE_NONE,
         error_if_not_found: bool = False,
         commit: bool = True,
         **kwargs,
@@ -232,6 +286,8 @@ class QueueIdService(object):
             queue_id: The unique id of the queue.
             name: The new name of the queue.
             description: The new description of the queue.
+            fair_share: How workers share the queue between submitters, one of
+                "none", "user", or "group". Defaults to "none".
             error_if_not_found: If True, raise an error if the group is not found.
                 Defaults to False.
             commit: If True, commit the transaction. Defaults to True.
@@ -267,6 +323,7 @@ class QueueIdService(object):
             description=description,
             resource=queue.resource,
             creator=current_user,
+            fair_share=fair_share,
         )
         try:
             self._uow.queue_repo.create_snapshot(new_queue)
@@ -408,3 +465,197 @@ class QueueNameService(object):
             return None
 
         return queue
+
+
+class QueueMetricsService(object):
+    """The service methods for reporting job backlog and latency per queue."""
+
+    @inject
+    def __init__(self, uow: UnitOfWork, rq_service: RQServiceV1) -> None:
+        """Initialize the queue metrics service.
+
+        All arguments are provided via dependency injection.
+
+        Args:
+            uow: A UnitOfWork instance
+            rq_service: An RQServiceV1 object.
+        """
+        self._uow = uow
+        self._rq_service = rq_service
+
+    def get(self, window: int, **kwargs) -> dict[str, Any]:
+        """Report job counts, queue wait and run durations, and RQ state per queue.
+
+        Queue wait is the time from a job being queued to it being started, and run
+        duration is the time from it being started to it finishing or failing. Both
+        are computed from the job's status history, for jobs with a status change
+        within the window.
+
+        Args:
+            window: The length of the reporting window for durations, in seconds.
+
+        Returns:
+            A dictionary with the window, the time of the report, and a list with
+            the metrics of each queue. The "rq" entry of a queue is None if Redis
+            could not be reached.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log.debug("Get queue metrics", window=window)
+
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        queues, _ = self._uow.queue_repo.get_by_filters_paged(
+            None, [], 0, 0, None, False, DeletionPolicy.NOT_DELETED
+        )
+        status_counts = self._get_job_status_counts()
+        wait_seconds, run_seconds = self._get_job_durations(
+            since=now - datetime.timedelta(seconds=window)
+        )
+        rq_states = self._get_rq_states([queue.name for queue in queues], log=log)
+
+        queue_metrics: list[dict[str, Any]] = []
+
+        for queue in queues:
+            counts = status_counts.get(queue.resource_id, {})
+            oldest_queued_on = counts.get("oldest_queued_on")
+            queue_metrics.append(
+                {
+                    "id": queue.resource_id,
+                    "name": queue.name,
+                    "jobs": {status: counts.get(status, 0) for status in JOB_STATUSES},
+                    "oldest_queued_seconds": (
+                        (now - oldest_queued_on).total_seconds()
+                        if oldest_queued_on is not None
+                        else None
+                    ),
+                    "wait_seconds": summarize_durations(
+                        wait_seconds.get(queue.resource_id, [])
+                    ),
+                    "run_seconds": summarize_durations(
+                        run_seconds.get(queue.resource_id, [])
+                    ),
+                    "rq": rq_states.get(queue.name),
+                }
+            )
+
+        return {"window": window, "generated_on": now, "queues": queue_metrics}
+
+    def _get_job_status_counts(self) -> dict[int, dict[str, Any]]:
+        # Count the non-deleted jobs on each queue by their current status. Queues and
+        # jobs are both resource snapshots, so the queue is aliased explicitly.
+        queue_snapshot = aliased(models.Queue, flat=True)
+        stmt = (
+            select(
+                queue_snapshot.resource_id,
+                models.Job.status,
+                func.count(models.Job.resource_id),
+                func.min(models.Job.created_on),
+            )
+            .join(
+                models.Resource,
+                models.Resource.latest_snapshot_id == models.Job.resource_snapshot_id,
+            )
+            .join(
+                models.QueueJob,
+                models.QueueJob.job_resource_id == models.Job.resource_id,
+            )
+            .join(
+                queue_snapshot,
+                queue_snapshot.resource_snapshot_id
+                == models.QueueJob.queue_resource_snapshot_id,
+            )
+            .where(models.Resource.is_deleted == False)  # noqa: E712
+            .group_by(queue_snapshot.resource_id, models.Job.status)
+        )
+        status_counts: dict[int, dict[str, Any]] = defaultdict(dict)
+
+        for queue_id, status, count, oldest_on in db.session.execute(stmt):
+            status_counts[queue_id][status] = count
+
+            if status == "queued":
+                status_counts[queue_id]["oldest_queued_on"] = oldest_on
+
+        return status_counts
+
+    def _get_job_durations(
+        self, since: datetime.datetime
+    ) -> tuple[dict[int, list[float]], dict[int, list[float]]]:
+        # Each job status change is a new job snapshot, so the snapshot creation
+        # times of a job are the times of its status changes.
+        recent_job_ids = select(models.Job.resource_id).where(
+            models.Job.created_on >= since
+        )
+        queue_snapshot = aliased(models.Queue, flat=True)
+        stmt = (
+            select(
+                queue_snapshot.resource_id,
+                models.Job.resource_id,
+                models.Job.status,
+                models.Job.created_on,
+            )
+            .join(
+                models.QueueJob,
+                models.QueueJob.job_resource_id == models.Job.resource_id,
+            )
+            .join(
+                queue_snapshot,
+                queue_snapshot.resource_snapshot_id
+                == models.QueueJob.queue_resource_snapshot_id,
+            )
+            .where(models.Job.resource_id.in_(recent_job_ids))
+            .order_by(
+                models.Job.resource_id,
+                models.Job.created_on,
+                models.Job.resource_snapshot_id,
+            )
+        )
+        wait_seconds: dict[int, list[float]] = defaultdict(list)
+        run_seconds: dict[int, list[float]] = defaultdict(list)
+        job_id: int | None = None
+        queued_on: datetime.datetime | None = None
+        started_on: datetime.datetime | None = None
+
+        for queue_id, snapshot_job_id, status, created_on in db.session.execute(stmt):
+            if snapshot_job_id != job_id:
+                job_id, queued_on, started_on = snapshot_job_id, None, None
+
+            if status == "queued":
+                queued_on, started_on = created_on, None
+
+            elif status == "started":
+                started_on = created_on
+
+                if queued_on is not None and created_on >= since:
+                    wait_seconds[queue_id].append(
+                        (created_on - queued_on).total_seconds()
+                    )
+
+            elif status in JOB_END_STATUSES and started_on is not None:
+                if created_on >= since:
+                    run_seconds[queue_id].append(
+                        (created_on - started_on).total_seconds()
+                    )
+
+                started_on = None
+
+        return wait_seconds, run_seconds
+
+    def _get_rq_states(
+        self, queue_names: list[str], log: BoundLogger
+    ) -> dict[str, dict[str, Any]]:
+        rq_states: dict[str, dict[str, Any]] = {}
+
+        try:
+            for name in queue_names:
+                state = self._rq_service.get_queue_state(name)
+                state["utilization"] = (
+                    state["busy_workers"] / state["workers"]
+                    if state["workers"]
+                    else None
+                )
+                rq_states[name] = state
+
+        except RedisError as err:
+            log.warning("Unable to read the RQ queue state", error=str(err))
+            return {}
+
+        return rq_states
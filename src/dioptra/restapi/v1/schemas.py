@@ -207,6 +207,34 @@ class PagingQueryParametersSchema(Schema):
                 raise ValidationError(f"Must be <= {max_page_size}")
 
 
+class CursorPagingQueryParametersSchema(Schema):
+    """A schema for adding cursor-based paging query parameters to a resource
+    endpoint."""
+
+    cursor = fields.String(
+        attribute="cursor",
+        metadata={
+            "description": (
+                "Opaque token identifying the page to return, as found in the next "
+                "and prev links of a previous response. Pass an empty value to start "
+                "cursor-based paging from the first page. When provided, index is "
+                "ignored."
+            )
+        },
+        load_default=None,
+    )
+    countTotal = fields.Bool(
+        attribute="count_total",
+        metadata={
+            "description": (
+                "Boolean indicating whether to count the total number of results. "
+                "Skipping the count makes requests for large collections faster."
+            )
+        },
+        load_default=True,
+    )
+
+
 class ResourceTypeQueryParametersSchema(Schema):
     """A schema for adding resource_type query parameters to a resource endpoint."""
 
@@ -282,6 +310,13 @@ class ResourceGetQueryParameters(
     """The query parameters for the GET method of the resource endpoints."""
 
 
+class ResourceSnapshotsGetQueryParameters(
+    ResourceGetQueryParameters,
+    CursorPagingQueryParametersSchema,
+):
+    """The query parameters for the GET method of the resource snapshots endpoints."""
+
+
 class IdListSchema(Schema):
     """The schema for a list of IDs."""
 
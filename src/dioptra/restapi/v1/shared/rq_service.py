@@ -14,22 +14,135 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
-from typing import Final
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any, Final
 
 import structlog
 from redis import Redis
+from redis.exceptions import RedisError
+from rq.exceptions import NoSuchJobError
+from rq.job import Job as RQJob
 from rq.queue import Queue as RQQueue
+from rq.worker import Worker as RQWorker
+from rq.worker import WorkerStatus
 from structlog.stdlib import BoundLogger
 
+from dioptra.rq.scheduling import (
+    PRIORITY_DEFAULT,
+    find_rq_queue_names,
+    get_rq_queue_name,
+)
+
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 TIMEOUT_24_HOURS: Final[int] = 24 * 3600
 RUN_V1_DIOPTRA_JOB_FUNC: Final[str] = "dioptra.rq.tasks.run_v1_dioptra_job"
+RUN_RESOURCE_IMPORT_FUNC: Final[str] = "dioptra.rq.tasks.run_resource_import"
+# How long the outcome of a resource import is kept for clients to retrieve
+RESOURCE_IMPORT_RESULT_TTL: Final[int] = 24 * 3600
 
 
-class RQServiceV1(object):
+class EnqueueMetrics(object):
+    """Counters for jobs enqueued by the REST API.
+
+    Attributes:
+        enqueues: The number of enqueue calls that succeeded.
+        failures: The number of enqueue calls that raised an error.
+        jobs: The number of jobs enqueued by the successful calls.
+        seconds_total: The total time spent in enqueue calls.
+        seconds_max: The longest time spent in a single enqueue call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.enqueues = 0
+        self.failures = 0
+        self.jobs = 0
+        self.seconds_total = 0.0
+        self.seconds_max = 0.0
+
+    def record(self, seconds: float, num_jobs: int = 1, failed: bool = False) -> None:
+        """Record an enqueue call.
+
+        Args:
+            seconds: The time spent in the call.
+            num_jobs: The number of jobs the call enqueued.
+            failed: Whether the call raised an error.
+        """
+        with self._lock:
+            if failed:
+                self.failures += 1
+            else:
+                self.enqueues += 1
+                self.jobs += num_jobs
+
+            self.seconds_total += seconds
+            self.seconds_max = max(self.seconds_max, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enqueues": self.enqueues,
+                "failures": self.failures,
+                "jobs": self.jobs,
+                "secondsTotal": self.seconds_total,
+                "secondsMax": self.seconds_max,
+            }
+
+
+class RQQueueCache(object):
+    """A thread-safe cache of RQ queues that share one Redis connection.
+
+    RQServiceV1 objects are created per request. Keeping the queues in a cache owned
+    by the long-lived service configuration avoids rebuilding them for every
+    submission, and all of them draw connections from the same Redis connection
+    pool.
+    """
+
     def __init__(self, redis: Redis) -> None:
         self._redis = redis
+        self._queues: dict[str, RQQueue] = {}
+        self._lock = threading.Lock()
+        self.metrics = EnqueueMetrics()
+
+    @property
+    def redis(self) -> Redis:
+        return self._redis
+
+    def get(self, name: str) -> RQQueue:
+        """Get the queue with the given name, creating it on first use.
+
+        Args:
+            name: The name of the queue.
+
+        Returns:
+            The queue.
+        """
+        with self._lock:
+            queue = self._queues.get(name)
+
+            if queue is None:
+                queue = self._queues[name] = RQQueue(
+                    name, default_timeout=TIMEOUT_24_HOURS, connection=self._redis
+                )
+
+            return queue
+
+    def names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._queues)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._queues.clear()
+
+
+class RQServiceV1(object):
+    def __init__(self, redis: Redis, queues: RQQueueCache | None = None) -> None:
+        self._redis = redis
+        self._queues = queues if queues is not None else RQQueueCache(redis)
 
     def submit(
         self,
@@ -37,13 +150,23 @@ class RQServiceV1(object):
         experiment_id: int,
         queue: str,
         timeout: str | None = None,
+        priority: str = PRIORITY_DEFAULT,
+        share: str | None = None,
     ):
+        """Enqueue a job.
+
+        Args:
+            job_id: The id of the job to enqueue.
+            experiment_id: The id of the experiment the job belongs to.
+            queue: The name of the queue.
+            timeout: The timeout of the job. Defaults to 24 hours.
+            priority: The priority of the job. Defaults to "default".
+            share: The share key of the submitter when the queue uses fair-share
+                dispatch. Defaults to None.
+        """
         log: BoundLogger = LOGGER.new()
 
-        cmd_kwargs = {
-            "job_id": job_id,
-            "experiment_id": experiment_id,
-        }
+        cmd_kwargs = _build_cmd_kwargs(job_id, experiment_id)
 
         log.info(
             "Enqueuing job",
@@ -51,12 +174,221 @@ class RQServiceV1(object):
             job_id=job_id,
             cmd_kwargs=cmd_kwargs,
             timeout=timeout,
+            priority=priority,
+            share=share,
         )
 
-        q = RQQueue(queue, default_timeout=TIMEOUT_24_HOURS, connection=self._redis)
-        q.enqueue(
-            RUN_V1_DIOPTRA_JOB_FUNC,
-            kwargs=cmd_kwargs,
-            job_id=str(job_id),
-            job_timeout=timeout if timeout else TIMEOUT_24_HOURS,
+        q = self._queues.get(get_rq_queue_name(queue, priority, share))
+        start = time.perf_counter()
+
+        try:
+            q.enqueue(
+                RUN_V1_DIOPTRA_JOB_FUNC,
+                kwargs=cmd_kwargs,
+                job_id=str(job_id),
+                job_timeout=timeout if timeout else TIMEOUT_24_HOURS,
+            )
+
+        except Exception:
+            self._queues.metrics.record(time.perf_counter() - start, failed=True)
+            raise
+
+        self._queues.metrics.record(time.perf_counter() - start)
+
+    def submit_many(
+        self,
+        job_ids: Sequence[int],
+        experiment_id: int,
+        queue: str,
+        timeout: str | None = None,
+        priority: str = PRIORITY_DEFAULT,
+        share: str | None = None,
+    ):
+        """Enqueue a batch of jobs on the same queue in a single Redis pipeline.
+
+        Args:
+            job_ids: The ids of the jobs to enqueue.
+            experiment_id: The id of the experiment the jobs belong to.
+            queue: The name of the queue.
+            timeout: The timeout of each job. Defaults to 24 hours.
+            priority: The priority of the jobs. Defaults to "default".
+            share: The share key of the submitter when the queue uses fair-share
+                dispatch. Defaults to None.
+        """
+        log: BoundLogger = LOGGER.new()
+
+        log.info(
+            "Enqueuing jobs",
+            function=RUN_V1_DIOPTRA_JOB_FUNC,
+            job_ids=list(job_ids),
+            experiment_id=experiment_id,
+            timeout=timeout,
+            priority=priority,
+            share=share,
         )
+
+        q = self._queues.get(get_rq_queue_name(queue, priority, share))
+        job_datas = [
+            RQQueue.prepare_data(
+                RUN_V1_DIOPTRA_JOB_FUNC,
+                kwargs=_build_cmd_kwargs(job_id, experiment_id),
+                job_id=str(job_id),
+                timeout=timeout if timeout else TIMEOUT_24_HOURS,
+            )
+            for job_id in job_ids
+        ]
+        start = time.perf_counter()
+
+        try:
+            q.enqueue_many(job_datas)
+
+        except Exception:
+            self._queues.metrics.record(time.perf_counter() - start, failed=True)
+            raise
+
+        self._queues.metrics.record(
+            time.perf_counter() - start, num_jobs=len(job_datas)
+        )
+
+    def submit_resource_import(
+        self,
+        import_id: str,
+        queue: str,
+        user_id: int,
+        import_kwargs: dict[str, Any],
+        timeout: str | None = None,
+    ) -> None:
+        """Enqueue a resource import.
+
+        Args:
+            import_id: The id of the resource import, used as the RQ job id.
+            queue: The name of the RQ queue.
+            user_id: The id of the user that requested the import.
+            import_kwargs: The keyword arguments of the import, see
+                dioptra.rq.tasks.run_resource_import.
+            timeout: The timeout of the import. Defaults to 24 hours.
+        """
+        log: BoundLogger = LOGGER.new()
+
+        log.info(
+            "Enqueuing resource import",
+            function=RUN_RESOURCE_IMPORT_FUNC,
+            import_id=import_id,
+            queue=queue,
+            user_id=user_id,
+        )
+
+        q = self._queues.get(queue)
+        start = time.perf_counter()
+
+        try:
+            q.enqueue(
+                RUN_RESOURCE_IMPORT_FUNC,
+                kwargs={"user_id": user_id, **import_kwargs},
+                job_id=import_id,
+                job_timeout=timeout if timeout else TIMEOUT_24_HOURS,
+                result_ttl=RESOURCE_IMPORT_RESULT_TTL,
+                failure_ttl=RESOURCE_IMPORT_RESULT_TTL,
+                meta={"user_id": user_id},
+            )
+
+        except Exception:
+            self._queues.metrics.record(time.perf_counter() - start, failed=True)
+            raise
+
+        self._queues.metrics.record(time.perf_counter() - start)
+
+    def get_resource_import(self, import_id: str) -> RQJob | None:
+        """Get the RQ job of a resource import.
+
+        Args:
+            import_id: The id of the resource import.
+
+        Returns:
+            The RQ job, or None if it does not exist or is not a resource import.
+
+        Raises:
+            RedisError: If Redis cannot be reached.
+        """
+        try:
+            job = RQJob.fetch(import_id, connection=self._redis)
+
+        except NoSuchJobError:
+            return None
+
+        if job.func_name != RUN_RESOURCE_IMPORT_FUNC:
+            return None
+
+        return job
+
+    def get_queue_state(self, queue: str) -> dict[str, Any]:
+        """Report the RQ state of a queue and the workers that listen to it.
+
+        The job counts are summed over the RQ queues for each priority and
+        submitter, see dioptra.rq.scheduling.
+
+        Args:
+            queue: The name of the queue.
+
+        Returns:
+            A dictionary with the number of waiting jobs ("backlog"), the sizes of the
+            started, deferred, scheduled, and failed job registries, and the number
+            of workers and busy workers.
+
+        Raises:
+            RedisError: If Redis cannot be reached.
+        """
+        rq_queues = [
+            self._queues.get(name) for name in find_rq_queue_names(self._redis, queue)
+        ]
+        workers = RQWorker.all(queue=self._queues.get(queue))
+        busy_workers = sum(
+            1 for worker in workers if worker.get_state() == WorkerStatus.BUSY
+        )
+
+        return {
+            "backlog": sum(q.count for q in rq_queues),
+            "started": sum(q.started_job_registry.count for q in rq_queues),
+            "deferred": sum(q.deferred_job_registry.count for q in rq_queues),
+            "scheduled": sum(q.scheduled_job_registry.count for q in rq_queues),
+            "failed": sum(q.failed_job_registry.count for q in rq_queues),
+            "workers": len(workers),
+            "busy_workers": busy_workers,
+        }
+
+    def probe(self) -> dict[str, Any]:
+        """Check that Redis is reachable and report enqueue statistics.
+
+        Returns:
+            A dictionary with the Redis status and round trip time, the connection
+            pool limits, the names of the cached queues, and the enqueue counters.
+        """
+        start = time.perf_counter()
+
+        try:
+            healthy = bool(self._redis.ping())
+
+        except RedisError as err:
+            LOGGER.warning("Redis ping failed", error=str(err))
+            healthy = False
+
+        ping_seconds = time.perf_counter() - start
+        pool = self._redis.connection_pool
+
+        return {
+            "status": "healthy" if healthy else "unhealthy",
+            "pingSeconds": ping_seconds,
+            "pool": {
+                "poolClass": type(pool).__name__,
+                "maxConnections": pool.max_connections,
+            },
+            "queues": self._queues.names(),
+            "enqueue": self._queues.metrics.as_dict(),
+        }
+
+
+def _build_cmd_kwargs(job_id: int, experiment_id: int) -> dict[str, int]:
+    return {
+        "job_id": job_id,
+        "experiment_id": experiment_id,
+    }
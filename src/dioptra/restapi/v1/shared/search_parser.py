@@ -24,7 +24,8 @@ provides support for constructing sqlalchemy WHERE clauses from a parsed query.
 See test_grammar in unit tests for example grammar usage
 """
 
-from typing import Any
+import functools
+from typing import Any, Final
 
 import pyparsing as pp
 from sqlalchemy import and_, or_
@@ -96,11 +97,19 @@ def _define_query_grammar() -> pp.ParserElement:
 
 DIOPTRA_QUERY_GRAMMAR = _define_query_grammar()
 
+# Bounds for the cache of parsed search text. Longer search text is parsed without
+# being cached so that a few large requests cannot dominate the cache's memory.
+SEARCH_TEXT_CACHE_SIZE: Final[int] = 512
+MAX_CACHED_SEARCH_TEXT_LENGTH: Final[int] = 1024
+
 
 def parse_search_text(search_text: str) -> list[dict]:
     """
     Parses the search text into a tokenized list of search terms.
 
+    Parse results are cached by search text, since clients tend to repeat the same
+    searches while paging through results.
+
     Args:
         search_text: the raw search text provided by the user.
 
@@ -114,23 +123,52 @@ def parse_search_text(search_text: str) -> list[dict]:
         SearchParseError: if an error occurs while trying to parse the received string
     """
 
-    formatted_result: list[dict]
-    if not search_text:
-        formatted_result = []
+    if len(search_text) > MAX_CACHED_SEARCH_TEXT_LENGTH:
+        parsed_search = _parse_search_text(search_text)
     else:
-        try:
-            parsed_search = DIOPTRA_QUERY_GRAMMAR.parse_string(
-                search_text, parse_all=True
-            ).as_list()
-        except pp.ParseException as error:
-            raise SearchParseError(error.line, repr(error)) from error
-        formatted_result = []
-        for term in parsed_search:
-            if len(term) > 1 and isinstance(term[1], list):
-                formatted_result.append({"field": term[0], "value": term[1]})
-            else:
-                formatted_result.append({"field": None, "value": term})
-    return formatted_result
+        parsed_search = _parse_search_text_cached(search_text)
+
+    # Build new containers so that callers cannot modify the cached parse results
+    return [{"field": field, "value": list(value)} for field, value in parsed_search]
+
+
+def _parse_search_text(
+    search_text: str,
+) -> tuple[tuple[str | None, tuple[str, ...]], ...]:
+    """
+    Parses the search text into an immutable sequence of (field, value) pairs.
+
+    Args:
+        search_text: the raw search text provided by the user.
+
+    Returns:
+        A tuple of (field, value) pairs, see parse_search_text().
+
+    Raises:
+        SearchParseError: if an error occurs while trying to parse the received string
+    """
+    if not search_text:
+        return ()
+
+    try:
+        parsed_search = DIOPTRA_QUERY_GRAMMAR.parse_string(
+            search_text, parse_all=True
+        ).as_list()
+    except pp.ParseException as error:
+        raise SearchParseError(error.line, repr(error)) from error
+
+    formatted_result: list[tuple[str | None, tuple[str, ...]]] = []
+    for term in parsed_search:
+        if len(term) > 1 and isinstance(term[1], list):
+            formatted_result.append((term[0], tuple(term[1])))
+        else:
+            formatted_result.append((None, tuple(term)))
+    return tuple(formatted_result)
+
+
+_parse_search_text_cached = functools.lru_cache(maxsize=SEARCH_TEXT_CACHE_SIZE)(
+    _parse_search_text
+)
 
 
 def construct_sql_search_value(search_term: list[str], fuzzy: bool = False) -> str:
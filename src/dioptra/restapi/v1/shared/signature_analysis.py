@@ -19,11 +19,15 @@ Extract task plugin function signature information from Python source code.
 """
 
 import ast as ast_module  # how many variables named "ast" might we have...
+import copy
+import hashlib
 import itertools
 import re
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Container, Iterator, Optional, Union
+from typing import Any, Container, Final, Iterator, Optional, Union
 
 from dioptra.restapi.errors import InvalidPythonError
 from dioptra.task_engine import type_registry
@@ -36,6 +40,13 @@ _PYTHON_TO_DIOPTRA_TYPE_NAME = {
     "None": "null",
 }
 
+# The maximum number of source files with cached signatures, see
+# get_cached_plugin_signatures()
+SIGNATURE_CACHE_SIZE: Final[int] = 256
+
+_signature_cache: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+_signature_cache_lock = threading.Lock()
+
 
 def _is_constant(ast: ast_module.AST, value: Any) -> bool:
     """
@@ -742,3 +753,50 @@ def get_plugin_signatures_from_file(
     python_source = filepath.read_text(encoding=encoding)
 
     return get_plugin_signatures(python_source, filepath)
+
+
+def get_cached_plugin_signatures(python_source: str) -> list[dict[str, Any]]:
+    """
+    Extract plugin signatures like get_plugin_signatures(), reusing the result of
+    a previous analysis of the same source code.
+
+    Results are keyed by a SHA-256 hash of the source code, so unchanged files
+    are not parsed again. The least recently used results are evicted once more
+    than SIGNATURE_CACHE_SIZE files are cached.
+
+    Args:
+        python_source: Some Python source code
+
+    Returns:
+        A list of function signature information data structures, as dicts.
+        The caller may modify them without affecting the cache.
+
+    Raises:
+        InvalidPythonError: If the python code cannot be parsed
+    """
+    key = hashlib.sha256(python_source.encode("utf-8")).hexdigest()
+
+    with _signature_cache_lock:
+        signatures = _signature_cache.get(key)
+
+        if signatures is not None:
+            _signature_cache.move_to_end(key)
+            return copy.deepcopy(signatures)
+
+    # Parse outside of the lock, so that large files do not block other requests
+    signatures = list(get_plugin_signatures(python_source))
+
+    with _signature_cache_lock:
+        _signature_cache[key] = signatures
+        _signature_cache.move_to_end(key)
+
+        while len(_signature_cache) > SIGNATURE_CACHE_SIZE:
+            _signature_cache.popitem(last=False)
+
+    return copy.deepcopy(signatures)
+
+
+def clear_signature_cache() -> None:
+    """Remove all results cached by get_cached_plugin_signatures()."""
+    with _signature_cache_lock:
+        _signature_cache.clear()
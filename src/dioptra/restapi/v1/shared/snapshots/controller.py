@@ -30,8 +30,9 @@ from marshmallow import Schema
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import models
+from dioptra.restapi.db.repository.utils import PageCursors, decode_page_cursor
 from dioptra.restapi.v1 import utils
-from dioptra.restapi.v1.schemas import ResourceGetQueryParameters
+from dioptra.restapi.v1.schemas import ResourceSnapshotsGetQueryParameters
 
 from .service import ResourceSnapshotsIdService, ResourceSnapshotsService
 
@@ -90,7 +91,7 @@ def generate_resource_snapshots_endpoint(
             super().__init__(*args, **kwargs)
 
         @login_required
-        @accepts(query_params_schema=ResourceGetQueryParameters, api=api)
+        @accepts(query_params_schema=ResourceSnapshotsGetQueryParameters, api=api)
         @responds(schema=page_schema, model_name=model_name, api=api)
         def get(self, id: int):
             """Gets the Snapshots for the resource."""
@@ -102,15 +103,18 @@ def generate_resource_snapshots_endpoint(
             search_string = unquote(parsed_query_params["search"])
             page_index = parsed_query_params["index"]
             page_length = parsed_query_params["page_length"]
+            cursor = decode_page_cursor(parsed_query_params["cursor"], None, False)
 
-            snapshots, total_num_snapshots = cast(
-                tuple[list[dict[str, Any]], int],
+            snapshots, total_num_snapshots, cursors = cast(
+                tuple[list[dict[str, Any]], int | None, PageCursors | None],
                 self._snapshots_service.get(
                     resource_id=id,
                     search_string=search_string,
                     page_index=page_index,
                     page_length=page_length,
                     error_if_not_found=True,
+                    cursor=cursor,
+                    count_total=parsed_query_params["count_total"],
                     log=log,
                 ),
             )
@@ -124,6 +128,7 @@ def generate_resource_snapshots_endpoint(
                 index=page_index,
                 length=page_length,
                 total_num_elements=total_num_snapshots,
+                cursors=cursors,
             )
 
     return ResourceSnapshotsEndpoint
@@ -256,7 +261,7 @@ def generate_nested_resource_snapshots_endpoint(
             super().__init__(*args, **kwargs)
 
         @login_required
-        @accepts(query_params_schema=ResourceGetQueryParameters, api=api)
+        @accepts(query_params_schema=ResourceSnapshotsGetQueryParameters, api=api)
         @responds(schema=page_schema, model_name=model_name, api=api)
         def get(self, id: int, **kwargs):
             """Gets the Snapshots for the resource."""
@@ -277,15 +282,18 @@ def generate_nested_resource_snapshots_endpoint(
             search_string = unquote(parsed_query_params["search"])
             page_index = parsed_query_params["index"]
             page_length = parsed_query_params["page_length"]
+            cursor = decode_page_cursor(parsed_query_params["cursor"], None, False)
 
-            snapshots, total_num_snapshots = cast(
-                tuple[list[models.ResourceSnapshot], int],
+            snapshots, total_num_snapshots, cursors = cast(
+                tuple[list[models.ResourceSnapshot], int | None, PageCursors | None],
                 self._snapshots_service.get(
                     resource_id=kwargs[resource_id],
                     search_string=search_string,
                     page_index=page_index,
                     page_length=page_length,
                     error_if_not_found=True,
+                    cursor=cursor,
+                    count_total=parsed_query_params["count_total"],
                     log=log,
                 ),
             )
@@ -300,6 +308,7 @@ def generate_nested_resource_snapshots_endpoint(
                 index=page_index,
                 length=page_length,
                 total_num_elements=total_num_snapshots,
+                cursors=cursors,
             )
 
     return ResourceSnapshotsEndpoint
@@ -16,6 +16,7 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The server-side functions that perform snapshots sub endpoint operations."""
 
+from collections.abc import Sequence
 from typing import Any, Type
 
 import structlog
@@ -24,6 +25,11 @@ from sqlalchemy import func, select
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import db, models
+from dioptra.restapi.db.repository.utils import (
+    PageCursor,
+    PageCursors,
+    get_keyset_page,
+)
 from dioptra.restapi.errors import BackendDatabaseError, EntityDoesNotExistError
 from dioptra.restapi.v1.shared.search_parser import construct_sql_query_filters
 
@@ -56,8 +62,10 @@ class ResourceSnapshotsService(object):
         page_index: int,
         page_length: int,
         error_if_not_found: bool = False,
+        cursor: PageCursor | None = None,
+        count_total: bool = True,
         **kwargs,
-    ) -> tuple[list[dict[str, Any]], int] | None:
+    ) -> tuple[list[dict[str, Any]], int | None, PageCursors | None] | None:
         """Fetch a list of snapshots of a resource.
 
         Args:
@@ -67,10 +75,16 @@ class ResourceSnapshotsService(object):
             page_length: The maximum number of snapshots to be returned.
             error_if_not_found: If True, raise an error if the resource is not found.
                 Defaults to False.
+            cursor: If provided, the page is located with this cursor (keyset paging)
+                and page_index is ignored.
+            count_total: Whether to count the total number of snapshots matching the
+                query. Only cursor-based paging can skip the count.
 
         Returns:
-            The list of resource snapshots of the resource object if found, otherwise
-                None.
+            A tuple containing the list of resource snapshots of the resource object,
+                the total number of snapshots matching the query (None if not
+                counted), and the cursors for the adjacent pages (None unless
+                cursor-based paging is used). None if the resource is not found.
 
         Raises:
             EntityDoesNotExistError: If the resource is not found and
@@ -99,27 +113,29 @@ class ResourceSnapshotsService(object):
                 construct_sql_query_filters(search_string, self._searchable_fields)
             )
 
-        stmt = (
-            select(func.count(self.resource_model.resource_id))  # type: ignore
-            .join(models.Resource)
-            .where(
-                *filters,
-                models.Resource.resource_id == resource_id,
-                models.Resource.is_deleted == False,  # noqa: E712
+        total_num_snapshots: int | None = None
+        if cursor is None or count_total:
+            stmt = (
+                select(func.count(self.resource_model.resource_id))  # type: ignore
+                .join(models.Resource)
+                .where(
+                    *filters,
+                    models.Resource.resource_id == resource_id,
+                    models.Resource.is_deleted == False,  # noqa: E712
+                )
             )
-        )
-        total_num_snapshots = db.session.scalars(stmt).unique().first()
+            total_num_snapshots = db.session.scalars(stmt).unique().first()
 
-        if total_num_snapshots is None:
-            log.error(
-                "The database query returned a None when counting the number of "
-                "snapshots when it should return a number.",
-                sql=str(stmt),
-            )
-            raise BackendDatabaseError
+            if total_num_snapshots is None:
+                log.error(
+                    "The database query returned a None when counting the number of "
+                    "snapshots when it should return a number.",
+                    sql=str(stmt),
+                )
+                raise BackendDatabaseError
 
-        if total_num_snapshots == 0:
-            return [], total_num_snapshots
+            if total_num_snapshots == 0:
+                return [], 0, None if cursor is None else PageCursors(None, None)
 
         stmt = (
             select(self.resource_model)
@@ -129,16 +145,33 @@ class ResourceSnapshotsService(object):
                 models.Resource.resource_id == resource_id,
                 models.Resource.is_deleted == False,  # noqa: E712
             )
-            .order_by(self.resource_model.created_on)
-            .offset(page_index)
-            .limit(page_length)
         )
+
+        page: Sequence[models.ResourceSnapshot]
+        cursors: PageCursors | None = None
+        if cursor is not None:
+            page, cursors = get_keyset_page(
+                db.session,
+                stmt,
+                self.resource_model.created_on,
+                self.resource_model.resource_snapshot_id,
+                False,
+                cursor,
+                page_length,
+            )
+        else:
+            stmt = (
+                stmt.order_by(self.resource_model.created_on)
+                .offset(page_index)
+                .limit(page_length)
+            )
+            page = db.session.scalars(stmt).unique().all()
+
         snapshots = [
-            {self._resource_type: snapshot, "has_draft": None}
-            for snapshot in db.session.scalars(stmt).unique()
+            {self._resource_type: snapshot, "has_draft": None} for snapshot in page
         ]
 
-        return snapshots, total_num_snapshots
+        return snapshots, total_num_snapshots, cursors
 
 
 class ResourceSnapshotsIdService(object):
@@ -0,0 +1,146 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""A memoized store for the task engine dictionaries built for entrypoint snapshots.
+
+The task engine dictionary of an entrypoint snapshot is deterministic, except for the
+"indirect" plugin parameter types, which are the latest snapshots of the parameter
+types in the entrypoint's group (see TaskEngineYamlService.extract_tasks). Entries are
+therefore keyed by the entrypoint snapshot and a version stamp of the group's
+parameter types.
+"""
+
+import datetime
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Final
+
+from dioptra.restapi.__version__ import __version__ as DIOPTRA_VERSION
+
+TASK_ENGINE_YAML_CACHE_SIZE: Final[int] = 256
+
+
+def plugin_parameter_types_version(snapshot_ids: Iterable[int]) -> str:
+    """Compute a version stamp for a set of plugin parameter type snapshots.
+
+    Args:
+        snapshot_ids: The snapshot ids of the plugin parameter types.
+
+    Returns:
+        A hex digest that changes whenever the set of snapshots changes.
+    """
+    digest = hashlib.sha256()
+
+    for snapshot_id in sorted(snapshot_ids):
+        digest.update(f"{snapshot_id},".encode())
+
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class TaskEngineYamlCacheKey(object):
+    """The key of a task engine dictionary in the cache.
+
+    Attributes:
+        entrypoint_snapshot_id: The id of the entrypoint snapshot.
+        entrypoint_snapshot_created_on: The creation time of the entrypoint snapshot.
+            Guards against reused ids, for example after the database is reset.
+        plugin_parameter_types_version: The version stamp of the group's plugin
+            parameter types, see plugin_parameter_types_version().
+    """
+
+    entrypoint_snapshot_id: int
+    entrypoint_snapshot_created_on: datetime.datetime
+    plugin_parameter_types_version: str
+
+    @property
+    def etag(self) -> str:
+        """An entity tag for the task engine dictionary identified by this key."""
+        digest = hashlib.sha256(
+            (
+                f"{DIOPTRA_VERSION}:{self.entrypoint_snapshot_id}:"
+                f"{self.entrypoint_snapshot_created_on.isoformat()}:"
+                f"{self.plugin_parameter_types_version}"
+            ).encode()
+        )
+        return digest.hexdigest()[:32]
+
+
+class TaskEngineYamlCache(object):
+    """A thread-safe, least recently used cache of task engine dictionaries.
+
+    The cached dictionaries are shared between requests and must not be modified.
+    """
+
+    def __init__(self, maxsize: int = TASK_ENGINE_YAML_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: The maximum number of task engine dictionaries to keep.
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[TaskEngineYamlCacheKey, dict[str, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(
+        self,
+        key: TaskEngineYamlCacheKey,
+        build: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Get a task engine dictionary from the cache, building it on a miss.
+
+        Args:
+            key: The key of the task engine dictionary.
+            build: A function that builds the task engine dictionary.
+
+        Returns:
+            The task engine dictionary.
+        """
+        with self._lock:
+            task_engine_dict = self._entries.get(key)
+
+            if task_engine_dict is not None:
+                self._entries.move_to_end(key)
+                return task_engine_dict
+
+        # Build outside the lock, concurrent misses for the same key build the same
+        # dictionary
+        task_engine_dict = build()
+
+        with self._lock:
+            self._entries[key] = task_engine_dict
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        return task_engine_dict
+
+    def clear(self) -> None:
+        """Remove all task engine dictionaries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+TASK_ENGINE_YAML_CACHE: Final[TaskEngineYamlCache] = TaskEngineYamlCache()
@@ -26,6 +26,7 @@ from sqlalchemy import func, select
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import db, models
+from dioptra.restapi.db.text_search import text_match
 from dioptra.restapi.errors import (
     BackendDatabaseError,
     EntityDoesNotExistError,
@@ -39,7 +40,7 @@ LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 RESOURCE_TYPE: Final[str] = "tag"
 SEARCHABLE_FIELDS: Final[dict[str, Any]] = {
-    "name": lambda x: models.Tag.name.like(x),
+    "name": lambda x: text_match(models.Tag.name, x),
 }
 SORTABLE_FIELDS: Final[dict[str, Any]] = {
     "name": models.Tag.name,
@@ -26,7 +26,14 @@ from injector import inject
 from structlog.stdlib import BoundLogger
 
 from dioptra.restapi.db import models
-from dioptra.restapi.db.repository.utils import DeletionPolicy
+from dioptra.restapi.db.repository.utils import (
+    DeletionPolicy,
+    build_identity,
+    cache_identity,
+    get_shared_identity,
+    invalidate_identity,
+    shared_identity_cache_enabled,
+)
 from dioptra.restapi.db.unit_of_work import UnitOfWork
 from dioptra.restapi.errors import (
     NoCurrentUserError,
@@ -515,6 +522,7 @@ class UserPasswordService(object):
         timestamp = datetime.datetime.now(tz=datetime.timezone.utc)
         user.password = self._password_service.hash(password=new_password, log=log)
         user.alternative_id = uuid.uuid4()
+        invalidate_identity(user, self._uow.session)
         user.last_modified_on = timestamp
         user.password_expire_on = timestamp + datetime.timedelta(
             days=DAYS_TO_EXPIRE_PASSWORD_DEFAULT
@@ -545,6 +553,9 @@ def load_user(user_id: str) -> models.User | None:
     needed to support the "logout everywhere" functionality and provides a mechanism for
     expiring sessions.
 
+    If the shared identity cache is enabled (see DIOPTRA_IDENTITY_CACHE_TTL), a cached
+    identity for the alternative ID lets the user be loaded by primary key, and the
+    user's group memberships are reused for the request's permission checks.
 
     Args:
         user_id: A string containing a UUID that matches the user's alternative ID.
@@ -554,6 +565,26 @@ def load_user(user_id: str) -> models.User | None:
     """
     # Should injection be used for UnitOfWork here?
     uow = UnitOfWork()
+    identity = get_shared_identity(user_id)
+
+    if identity is not None:
+        user = uow.session.get(models.User, identity.user_id)
+
+        # The identity may be stale if the user logged out everywhere, changed
+        # their password, or was deleted in another process
+        if (
+            user is not None
+            and not user.is_deleted
+            and str(user.alternative_id) == user_id
+        ):
+            cache_identity(identity, share=False)
+            return user
+
+        invalidate_identity(identity.user_id)
+
     user = uow.user_repo.get_by_alternative_id(uuid.UUID(user_id))
 
+    if user is not None and shared_identity_cache_enabled():
+        cache_identity(build_identity(uow.session, user))
+
     return user
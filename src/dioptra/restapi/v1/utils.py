@@ -22,6 +22,11 @@ from urllib.parse import urlencode, urlunparse
 from marshmallow import Schema
 
 from dioptra.restapi.db import models
+from dioptra.restapi.db.repository.utils.paging import (
+    PageCursor,
+    PageCursors,
+    encode_page_cursor,
+)
 from dioptra.restapi.routes import V1_ROOT
 
 ARTIFACTS: Final[str] = "artifacts"
@@ -1001,6 +1006,7 @@ def build_queue(queue_dict: QueueDict) -> dict[str, Any]:
         "snapshot_id": queue.resource_snapshot_id,
         "name": queue.name,
         "description": queue.description,
+        "fair_share": queue.fair_share,
         "user": build_user_ref(queue.creator),
         "group": build_group_ref(queue.resource.owner),
         "created_on": queue.resource.created_on,
@@ -1266,9 +1272,10 @@ def build_paging_envelope(
     draft_type: str | None,
     index: int,
     length: int,
-    total_num_elements: int,
+    total_num_elements: int | None,
     sort_by: Optional[str] = None,
     descending: Optional[bool] = None,
+    cursors: PageCursors | None = None,
 ) -> dict[str, Any]:
     """Build the paging envelope for a response.
 
@@ -1282,57 +1289,65 @@ def build_paging_envelope(
         draft_type: The type of drafts to return.
         index: The starting index of the current page.
         length: The number of results to return per page.
-        total_num_elements: The total number of elements in the collection.
+        total_num_elements: The total number of elements in the collection. May be
+            None when cursor-based paging is used and the count was skipped.
         sort_by: The name of the column to sort.
         descending: Boolean indicating whether to sort by descending or not.
+        cursors: The cursors for the pages adjacent to the current page. If
+            provided, the next and prev links use cursor-based paging instead of
+            page indices.
 
     Returns:
         The paging envelope for the response.
     """
-    has_prev = index > 0
-    has_next = total_num_elements > index + length
+    if cursors is None:
+        # For mypy: the count is required for index-based paging.
+        assert total_num_elements is not None
+        has_prev = index > 0
+        has_next = total_num_elements > index + length
+    else:
+        has_prev = cursors.prev is not None
+        has_next = cursors.next is not None
+
     is_complete = not has_next
 
+    def paging_url(page_index: int, cursor: PageCursor | None) -> str:
+        return build_paging_url(
+            route_prefix,
+            group_id=group_id,
+            search=query,
+            draft_type=draft_type,
+            index=page_index,
+            length=length,
+            cursor=(
+                None
+                if cursor is None
+                else encode_page_cursor(cursor, sort_by, bool(descending))
+            ),
+            sort_by=sort_by if cursor is not None else None,
+            descending=descending if cursor is not None else None,
+            count_total=total_num_elements is not None,
+        )
+
     paged_data = {
         "index": index,
         "is_complete": is_complete,
         "total_num_results": total_num_elements,
         "sort_by": sort_by,
         "descending": descending,
-        "first": build_paging_url(
-            route_prefix,
-            group_id=group_id,
-            search=query,
-            draft_type=draft_type,
-            index=0,
-            length=length,
-        ),
+        "first": paging_url(0, None if cursors is None else PageCursor()),
         "data": [build_fn(x) for x in data],
     }
 
     if has_prev:
-        prev_index = max(index - length, 0)
-        prev_url = build_paging_url(
-            route_prefix,
-            group_id=group_id,
-            search=query,
-            draft_type=draft_type,
-            index=prev_index,
-            length=length,
+        paged_data["prev"] = paging_url(
+            max(index - length, 0), None if cursors is None else cursors.prev
         )
-        paged_data["prev"] = prev_url
 
     if has_next:
-        next_index = index + length
-        next_url = build_paging_url(
-            route_prefix,
-            group_id=group_id,
-            search=query,
-            draft_type=draft_type,
-            index=next_index,
-            length=length,
+        paged_data["next"] = paging_url(
+            index + length, None if cursors is None else cursors.next
         )
-        paged_data["next"] = next_url
 
     return paged_data
 
@@ -1344,6 +1359,10 @@ def build_paging_url(
     draft_type: str | None,
     index: int,
     length: int,
+    cursor: str | None = None,
+    sort_by: str | None = None,
+    descending: bool | None = None,
+    count_total: bool = True,
 ) -> str:
     """Build a URL for a paged resource endpoint.
 
@@ -1353,11 +1372,21 @@ def build_paging_url(
         draft_type: The type of drafts to return.
         index: The starting index of the current page.
         length: The number of results to return per page.
+        cursor: The optional cursor token of the page. If provided, it replaces the
+            index in the URL.
+        sort_by: The optional name of the column to sort.
+        descending: The optional sort direction.
+        count_total: Whether the total number of results should be counted.
 
     Returns:
         A quoted URL string for the paged resource endpoint.
     """
-    query_params: dict[str, Any] = {"index": index, "pageLength": length}
+    query_params: dict[str, Any]
+
+    if cursor is None:
+        query_params = {"index": index, "pageLength": length}
+    else:
+        query_params = {"cursor": cursor, "pageLength": length}
 
     if group_id:
         query_params["groupId"] = group_id
@@ -1368,6 +1397,15 @@ def build_paging_url(
     if draft_type:
         query_params["draft_type"] = draft_type
 
+    if sort_by:
+        query_params["sortBy"] = sort_by
+
+    if descending is not None:
+        query_params["descending"] = str(descending).lower()
+
+    if not count_total:
+        query_params["countTotal"] = "false"
+
     return build_url(route_prefix, query_params)
 
 
@@ -16,10 +16,12 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The module defining the endpoints for Workflow resources."""
 
+import json
 import uuid
+from http import HTTPStatus
 
 import structlog
-from flask import request
+from flask import Response, request
 from flask_accepts import accepts, responds
 from flask_login import login_required
 from flask_restx import Namespace, Resource
@@ -32,6 +34,7 @@ from dioptra.restapi.v1.schemas import IdStatusResponseSchema
 from .schema import (
     ResourceImportResolveNameConflictsStrategy,
     ResourceImportSchema,
+    ResourceImportStatusSchema,
     SignatureAnalysisOutputSchema,
     SignatureAnalysisSchema,
     ValidateEntrypointRequestSchema,
@@ -39,6 +42,7 @@ from .schema import (
 )
 from .service import (
     DraftCommitService,
+    ResourceImportJobService,
     ResourceImportService,
     SignatureAnalysisService,
     ValidateEntrypointService,
@@ -85,7 +89,11 @@ class SignatureAnalysisEndpoint(Resource):
 class ResourceImport(Resource):
     @inject
     def __init__(
-        self, resource_import_service: ResourceImportService, *args, **kwargs
+        self,
+        resource_import_service: ResourceImportService,
+        resource_import_job_service: ResourceImportJobService,
+        *args,
+        **kwargs,
     ) -> None:
         """Initialize the workflow resource.
 
@@ -93,8 +101,10 @@ class ResourceImport(Resource):
 
         Args:
             resource_import_service: A ResourceImportService object.
+            resource_import_job_service: A ResourceImportJobService object.
         """
         self._resource_import_service = resource_import_service
+        self._resource_import_job_service = resource_import_job_service
         super().__init__(*args, **kwargs)
 
     @login_required
@@ -108,7 +118,11 @@ class ResourceImport(Resource):
     )
     @accepts(form_schema=ResourceImportSchema, api=api)
     def post(self):
-        """Import resources from an external source."""
+        """Import resources from an external source.
+
+        Set runAsync to run the import as a background job. The response then holds
+        the id of the import, see GET /workflows/resourceImport/{id}.
+        """
         log = LOGGER.new(  # noqa: F841
             request_id=str(uuid.uuid4()), resource="ResourceImport", request_type="POST"
         )
@@ -118,6 +132,19 @@ class ResourceImport(Resource):
             parsed_form["resolve_name_conflicts_strategy"]
         )
 
+        if parsed_form["run_async"]:
+            import_status = self._resource_import_job_service.submit(
+                group_id=parsed_form["group_id"],
+                source_type=parsed_form["source_type"],
+                git_url=parsed_form.get("git_url", None),
+                archive_file=request.files.get("archiveFile", None),
+                files=request.files.getlist("files", None),
+                config_path=parsed_form["config_path"],
+                conflict_strat=conflict_strat,
+                log=log,
+            )
+            return ResourceImportStatusSchema().dump(import_status), HTTPStatus.ACCEPTED
+
         return self._resource_import_service.import_resources(
             group_id=parsed_form["group_id"],
             source_type=parsed_form["source_type"],
@@ -130,6 +157,82 @@ class ResourceImport(Resource):
         )
 
 
+@api.route("/resourceImport/<string:id>")
+@api.param("id", "ID for the resource import.")
+class ResourceImportIdEndpoint(Resource):
+    @inject
+    def __init__(
+        self, resource_import_job_service: ResourceImportJobService, *args, **kwargs
+    ) -> None:
+        """Initialize the workflow resource.
+
+        All arguments are provided via dependency injection.
+
+        Args:
+            resource_import_job_service: A ResourceImportJobService object.
+        """
+        self._resource_import_job_service = resource_import_job_service
+        super().__init__(*args, **kwargs)
+
+    @login_required
+    @responds(schema=ResourceImportStatusSchema, api=api)
+    def get(self, id: str):
+        """Gets the progress and result of a resource import submitted with runAsync."""
+        log = LOGGER.new(
+            request_id=str(uuid.uuid4()),
+            resource="ResourceImportId",
+            request_type="GET",
+            import_id=id,
+        )
+        return self._resource_import_job_service.get(id, log=log)
+
+
+@api.route("/resourceImport/<string:id>/events")
+@api.param("id", "ID for the resource import.")
+class ResourceImportIdEventsEndpoint(Resource):
+    @inject
+    def __init__(
+        self, resource_import_job_service: ResourceImportJobService, *args, **kwargs
+    ) -> None:
+        """Initialize the workflow resource.
+
+        All arguments are provided via dependency injection.
+
+        Args:
+            resource_import_job_service: A ResourceImportJobService object.
+        """
+        self._resource_import_job_service = resource_import_job_service
+        super().__init__(*args, **kwargs)
+
+    @login_required
+    def get(self, id: str):
+        """Streams the progress of a resource import as server-sent events.
+
+        An event is sent with the status of the import each time it changes. The
+        stream ends after the import has finished or failed, or with an 'expired' or
+        'timed_out' event if the import's job expired or the stream reached its
+        maximum duration.
+        """
+        log = LOGGER.new(
+            request_id=str(uuid.uuid4()),
+            resource="ResourceImportIdEvents",
+            request_type="GET",
+            import_id=id,
+        )
+        statuses = self._resource_import_job_service.stream(id, log=log)
+        schema = ResourceImportStatusSchema()
+
+        def _format_events():
+            for status in statuses:
+                yield f"data: {json.dumps(schema.dump(status))}\n\n"
+
+        return Response(
+            _format_events(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
+
+
 @api.route("/draftCommit/<int:id>")
 @api.param("id", "ID for the Draft resource.")
 class DraftCommitEndpoint(Resource):
@@ -193,6 +193,14 @@ class ResourceImportSchema(Schema):
         by_value=True,
         load_default=ResourceImportResolveNameConflictsStrategy.FAIL.value,
     )
+    runAsync = fields.Boolean(
+        attribute="run_async",
+        metadata={
+            "description": "If true, run the import as a background job and respond "
+            "at once with the import's id, which can be used to follow its progress."
+        },
+        load_default=False,
+    )
 
     @validates_schema
     def validate_source(self, data, **kwargs):
@@ -234,6 +242,81 @@ class ResourceImportSchema(Schema):
             )
 
 
+class ResourceImportProgressSchema(Schema):
+    """The progress of a resource import."""
+
+    stage = fields.String(
+        attribute="stage",
+        metadata={"description": "The current stage of the import."},
+        dump_only=True,
+    )
+    filesParsed = fields.Integer(
+        attribute="files_parsed",
+        metadata={
+            "description": "The number of configuration, plugin, and entrypoint files "
+            "read."
+        },
+        dump_only=True,
+    )
+    resourcesStaged = fields.Integer(
+        attribute="resources_staged",
+        metadata={
+            "description": "The number of plugin parameter types, plugins, plugin "
+            "files, and entrypoints added to the import, which are not yet committed."
+        },
+        dump_only=True,
+    )
+    resourcesRegistered = fields.Integer(
+        attribute="resources_registered",
+        metadata={
+            "description": "The number of plugin parameter types, plugins, plugin "
+            "files, and entrypoints registered. Resources are counted once the import "
+            "has committed."
+        },
+        dump_only=True,
+    )
+
+
+class ResourceImportStatusSchema(Schema):
+    """The status of a resource import running as a background job."""
+
+    id = fields.String(
+        attribute="id",
+        metadata={"description": "The unique identifier of the resource import."},
+        dump_only=True,
+    )
+    status = fields.String(
+        attribute="status",
+        metadata={
+            "description": "The status of the background job ('queued', 'started', "
+            "'finished', 'failed', etc.). The last event of a stream that ends before "
+            "the import has the status 'expired' or 'timed_out'."
+        },
+        dump_only=True,
+    )
+    progress = fields.Nested(
+        ResourceImportProgressSchema,
+        attribute="progress",
+        metadata={"description": "The progress of the resource import."},
+        dump_only=True,
+    )
+    result = fields.Dict(
+        attribute="result",
+        metadata={
+            "description": "The summary of the imported resources, once the import "
+            "has finished."
+        },
+        allow_none=True,
+        dump_only=True,
+    )
+    error = fields.String(
+        attribute="error",
+        metadata={"description": "The reason the import or its stream did not finish."},
+        allow_none=True,
+        dump_only=True,
+    )
+
+
 class ValidateEntrypointRequestSchema(Schema):
     """The proposed inputs for an Entrypoint resource to be validated."""
 
@@ -16,7 +16,10 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 """The server-side functions that perform workflows endpoint operations."""
 
+import time
+import uuid
 from collections import defaultdict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from hashlib import sha256
 from io import BytesIO
@@ -28,8 +31,11 @@ import jsonschema
 import structlog
 import tomli as toml
 import yaml
-from injector import inject
-from sqlalchemy import select
+from flask import Flask, current_app
+from flask_login import current_user, login_user
+from injector import Injector, inject
+from rq.exceptions import NoSuchJobError
+from rq.job import JobStatus
 from structlog.stdlib import BoundLogger
 from werkzeug.datastructures import FileStorage
 
@@ -71,7 +77,8 @@ from dioptra.restapi.v1.shared.resource_service import (
     ResourceIdService,
     ResourceService,
 )
-from dioptra.restapi.v1.shared.signature_analysis import get_plugin_signatures
+from dioptra.restapi.v1.shared.rq_service import RQServiceV1
+from dioptra.restapi.v1.shared.signature_analysis import get_cached_plugin_signatures
 from dioptra.restapi.v1.shared.task_engine_yaml.service import TaskEngineYamlService
 from dioptra.restapi.v1.utils import PluginParameterTypeDict, PluginWithFilesDict
 from dioptra.sdk.utilities.paths import set_cwd
@@ -92,6 +99,34 @@ DIOPTRA_RESOURCES_SCHEMA: Final[dict] = read_json_file(
     "dioptra.restapi.v1.workflows", "dioptra-resources.schema.json"
 )
 
+RESOURCE_IMPORT_TYPE: Final[str] = "resource import"
+
+# The stages of a resource import, in order
+IMPORT_STAGE_QUEUED: Final[str] = "queued"
+IMPORT_STAGE_READING_SOURCE: Final[str] = "reading_source"
+IMPORT_STAGE_REGISTERING_PLUGIN_PARAM_TYPES: Final[str] = (
+    "registering_plugin_param_types"
+)
+IMPORT_STAGE_REGISTERING_PLUGINS: Final[str] = "registering_plugins"
+IMPORT_STAGE_REGISTERING_ENTRYPOINTS: Final[str] = "registering_entrypoints"
+IMPORT_STAGE_COMMITTING: Final[str] = "committing"
+IMPORT_STAGE_DONE: Final[str] = "done"
+
+# RQ job statuses after which a resource import makes no further progress
+IMPORT_FINAL_STATUSES: Final[frozenset[str]] = frozenset(
+    {
+        JobStatus.FINISHED.value,
+        JobStatus.FAILED.value,
+        JobStatus.STOPPED.value,
+        JobStatus.CANCELED.value,
+    }
+)
+
+# The statuses of the last event of a resource import stream that ended before the
+# import did, see ResourceImportJobService.stream()
+IMPORT_STREAM_EXPIRED: Final[str] = "expired"
+IMPORT_STREAM_TIMED_OUT: Final[str] = "timed_out"
+
 VALID_ENTRYPOINT_PARAM_TYPES: Final[set[str]] = {
     "string",
     "float",
@@ -122,7 +157,7 @@ class SignatureAnalysisService(object):
         )
         endpoint_analyses = [
             _create_endpoint_analysis_dict(signature)
-            for signature in get_plugin_signatures(python_source=python_code)
+            for signature in get_cached_plugin_signatures(python_code)
         ]
         return {"tasks": endpoint_analyses}
 
@@ -150,6 +185,64 @@ def _create_endpoint_analysis_dict(
     }
 
 
+class ResourceImportProgress(object):
+    """The progress of a resource import.
+
+    Attributes:
+        stage: The current stage of the import.
+        files_parsed: The number of configuration, plugin, and entrypoint files read.
+        resources_staged: The number of plugin parameter types, plugins, plugin
+            files, and entrypoints added to the import's transaction, which are not
+            yet committed.
+        resources_registered: The number of resources committed by the import.
+    """
+
+    def __init__(
+        self, on_update: Callable[["ResourceImportProgress"], None] | None = None
+    ) -> None:
+        """Initialize the progress of a resource import.
+
+        Args:
+            on_update: A function called with the progress after every change.
+                Defaults to None.
+        """
+        self._on_update = on_update
+        self.stage = IMPORT_STAGE_QUEUED
+        self.files_parsed = 0
+        self.resources_staged = 0
+        self.resources_registered = 0
+
+    def set_stage(self, stage: str) -> None:
+        self.stage = stage
+        self._notify()
+
+    def add_files_parsed(self, count: int = 1) -> None:
+        self.files_parsed += count
+        self._notify()
+
+    def add_resources_staged(self, count: int = 1) -> None:
+        self.resources_staged += count
+        self._notify()
+
+    def set_committed(self) -> None:
+        """Count the staged resources as registered once the import has committed."""
+        self.resources_registered += self.resources_staged
+        self.resources_staged = 0
+        self._notify()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "files_parsed": self.files_parsed,
+            "resources_staged": self.resources_staged,
+            "resources_registered": self.resources_registered,
+        }
+
+    def _notify(self) -> None:
+        if self._on_update is not None:
+            self._on_update(self)
+
+
 class ResourceImportService(object):
     """The service methods for packaging job files for download."""
 
@@ -235,15 +328,21 @@ class ResourceImportService(object):
             files: The contents of the upload if source_type is "upload_files"
             config_path: The path to the toml configuration file in the import source.
             conflict_strat: The strategy for resolving name conflicts.
+            progress: A ResourceImportProgress object that tracks the progress of the
+                import. Optional keyword argument.
 
         Returns:
             A message summarizing imported resources
         """
         log: BoundLogger = kwargs.get("log", LOGGER.new())
+        progress: ResourceImportProgress = kwargs.get(
+            "progress", ResourceImportProgress()
+        )
         log.debug("Import resources", group_id=group_id)
 
         with TemporaryDirectory() as tmp_dir, set_cwd(tmp_dir):
             working_dir = Path(tmp_dir)
+            progress.set_stage(IMPORT_STAGE_READING_SOURCE)
 
             if source_type == ResourceImportSourceTypes.UPLOAD_ARCHIVE:
                 hash: str = self._read_from_archive(archive_file, working_dir)
@@ -253,22 +352,30 @@ class ResourceImportService(object):
                 hash = self._read_from_git(git_url, working_dir)
 
             config = self._load_config_file(working_dir / config_path)
+            progress.add_files_parsed()
 
             # all resources are relative to the config file directory
             with set_cwd((working_dir / config_path).parent):
+                progress.set_stage(IMPORT_STAGE_REGISTERING_PLUGIN_PARAM_TYPES)
                 param_types = self._register_plugin_param_types(
                     group_id,
                     config.get("plugin_param_types", []),
                     conflict_strat,
                     log=log,
                 )
+                progress.add_resources_staged(len(param_types))
+
+                progress.set_stage(IMPORT_STAGE_REGISTERING_PLUGINS)
                 plugins = self._register_plugins(
                     group_id,
                     config.get("plugins", []),
                     param_types,
                     conflict_strat,
                     log=log,
+                    progress=progress,
                 )
+
+                progress.set_stage(IMPORT_STAGE_REGISTERING_ENTRYPOINTS)
                 entrypoints = self._register_entrypoints(
                     group_id,
                     config.get("entrypoints", []),
@@ -276,9 +383,13 @@ class ResourceImportService(object):
                     param_types,
                     conflict_strat,
                     log=log,
+                    progress=progress,
                 )
 
+        progress.set_stage(IMPORT_STAGE_COMMITTING)
         db.session.commit()
+        progress.set_committed()
+        progress.set_stage(IMPORT_STAGE_DONE)
 
         return {
             "message": "successfully imported",
@@ -516,6 +627,7 @@ class ResourceImportService(object):
         param_types: dict[str, models.PluginTaskParameterType],
         conflict_strat: ResourceImportResolveNameConflictsStrategy,
         log: BoundLogger,
+        progress: ResourceImportProgress,
     ) -> dict[str, models.PluginTaskParameterType]:
         """
         Registers a list of Plugins and their PluginFiles.
@@ -525,6 +637,7 @@ class ResourceImportService(object):
             plugins_config: A list of dictionaries describing a plugin and its tasks
             param_types: A dictionary mapping param type name to the ORM object
             conflict_strat: The strategy for resolving name conflicts.
+            progress: The progress of the import.
 
         Returns:
             A dictionary mapping newly registered Plugin names to the ORM objects
@@ -543,7 +656,6 @@ class ResourceImportService(object):
 
         plugins = {}
         for plugin in plugins_config:
-            existing_files = {}
             if conflict_strat == ResourceImportResolveNameConflictsStrategy.FAIL:
                 plugin_dict = self._plugin_service.create(
                     name=Path(plugin["path"]).stem,
@@ -569,22 +681,6 @@ class ResourceImportService(object):
                             log=log,
                         ),
                     )
-                    latest_plugin_files_stmt = (
-                        select(models.PluginFile)
-                        .join(models.Resource)
-                        .where(
-                            models.PluginFile.plugin_id == existing.resource_id,
-                            models.Resource.is_deleted == False,  # noqa: E712
-                            models.Resource.latest_snapshot_id
-                            == models.PluginFile.resource_snapshot_id,
-                        )
-                    )
-                    existing_files = {
-                        plugin_file.filename: plugin_file
-                        for plugin_file in db.session.scalars(
-                            latest_plugin_files_stmt
-                        ).unique()
-                    }
                 else:
                     plugin_dict = self._plugin_service.create(
                         name=Path(plugin["path"]).stem,
@@ -611,6 +707,7 @@ class ResourceImportService(object):
                 )
 
             plugins[plugin_dict["plugin"].name] = plugin_dict["plugin"]
+            progress.add_resources_staged()
 
             db.session.flush()
 
@@ -625,6 +722,7 @@ class ResourceImportService(object):
                 param_types=param_types,
                 is_function_task=False,
             )
+            plugin_files = []
             for plugin_file_path in Path(plugin["path"]).rglob("[!.]*.py"):
                 filename = str(plugin_file_path.relative_to(plugin["path"]))
                 if not ALLOWED_PLUGIN_FILENAME_REGEX.fullmatch(filename):
@@ -646,85 +744,33 @@ class ResourceImportService(object):
                         reason=str(e),
                     ) from e
 
-                self._register_plugin_file(
-                    plugin_dict["plugin"].resource_id,
-                    filename,
-                    contents,
-                    function_tasks[filename],
-                    artifact_tasks[filename],
-                    conflict_strat,
-                    existing_files,
-                    log,
+                plugin_files.append(
+                    {
+                        "filename": filename,
+                        "contents": contents,
+                        "function_tasks": function_tasks[filename],
+                        "artifact_tasks": artifact_tasks[filename],
+                    }
                 )
+                progress.add_files_parsed()
+
+            # Register all of the files in a single plugin snapshot, with files that
+            # already exist replaced under the update strategy
+            self._plugin_id_file_service.create_many(
+                plugin_id=plugin_dict["plugin"].resource_id,
+                plugin_files=plugin_files,
+                replace_existing=(
+                    conflict_strat == ResourceImportResolveNameConflictsStrategy.UPDATE
+                ),
+                commit=False,
+                log=log,
+            )
+            progress.add_resources_staged(len(plugin_files))
 
         db.session.flush()
 
         return plugins
 
-    def _register_plugin_file(
-        self,
-        plugin_id: int,
-        filename: str,
-        contents: str,
-        function_tasks: list,
-        artifact_tasks: list,
-        conflict_strat,
-        existing_plugin_files,
-        log: BoundLogger,
-    ):
-        """Registers a PluginFile according to the spcified conflict strategy.
-
-        Args:
-            plugin_id: The identifier of the Plugin this file belongs to
-            filename: The python filename
-            contents: The contents of the python file
-            function_tasks: The function task definitions from the toml config file.
-            function_tasks: The artifact task definitions from the toml config file.
-            conflict_strat: The strategy for resolving name conflicts
-
-        Returns:
-            The registered PluginFile ORM object
-        """
-        if (
-            conflict_strat == ResourceImportResolveNameConflictsStrategy.FAIL
-            or conflict_strat == ResourceImportResolveNameConflictsStrategy.OVERWRITE
-        ):
-            return self._plugin_id_file_service.create(
-                plugin_id=plugin_id,
-                filename=filename,
-                contents=contents,
-                description=None,
-                function_tasks=function_tasks,
-                artifact_tasks=artifact_tasks,
-                commit=False,
-                log=log,
-            )
-        elif conflict_strat == ResourceImportResolveNameConflictsStrategy.UPDATE:
-            existing = existing_plugin_files.get(filename, None)
-            if existing:
-                return self._plugin_id_file_id_service.modify(
-                    plugin_id=plugin_id,
-                    plugin_file_id=existing.resource_id,
-                    filename=filename,
-                    contents=contents,
-                    description=existing.description,
-                    function_tasks=function_tasks,
-                    artifact_tasks=artifact_tasks,
-                    commit=False,
-                    log=log,
-                )
-            else:
-                return self._plugin_id_file_service.create(
-                    plugin_id=plugin_id,
-                    filename=filename,
-                    contents=contents,
-                    description=None,
-                    function_tasks=function_tasks,
-                    artifact_tasks=artifact_tasks,
-                    commit=False,
-                    log=log,
-                )
-
     def _register_entrypoints(  # noqa: C901
         self,
         group_id: int,
@@ -733,6 +779,7 @@ class ResourceImportService(object):
         param_types,
         conflict_strat: ResourceImportResolveNameConflictsStrategy,
         log: BoundLogger,
+        progress: ResourceImportProgress,
     ) -> dict[str, models.EntryPoint]:
         """
         Registers a list of Entrypoints
@@ -743,6 +790,7 @@ class ResourceImportService(object):
             plugins: A dictionary mapping Plugin names to the ORM objects
             param_types: A dictionary mapping param type name to the ORM object
             conflict_strat: The strategy for resolving name conflicts.
+            progress: The progress of the import.
 
         Returns:
             A dictionary mapping newly registered Entrypoint names to ORM object
@@ -787,6 +835,8 @@ class ResourceImportService(object):
                     reason=str(e),
                 ) from e
 
+            progress.add_files_parsed()
+
             params = ResourceImportService._build_entrypoint_params_list(
                 entrypoint.get("params", [])
             )
@@ -908,6 +958,7 @@ class ResourceImportService(object):
             entrypoints[entrypoint_dict["entry_point"].name] = entrypoint_dict[
                 "entry_point"
             ]
+            progress.add_resources_staged()
 
         db.session.flush()
 
@@ -1095,6 +1146,333 @@ class ResourceImportService(object):
             )
 
 
+class ResourceImportJobService(object):
+    """The service methods for running resource imports as background jobs."""
+
+    @inject
+    def __init__(self, rq_service: RQServiceV1) -> None:
+        """Initialize the resource import job service.
+
+        All arguments are provided via dependency injection.
+
+        Args:
+            rq_service: An RQServiceV1 object.
+        """
+        self._rq_service = rq_service
+
+    def submit(
+        self,
+        group_id: int,
+        source_type: ResourceImportSourceTypes,
+        git_url: str | None,
+        archive_file: FileStorage | None,
+        files: list[FileStorage] | None,
+        config_path: str,
+        conflict_strat: ResourceImportResolveNameConflictsStrategy,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Enqueue a resource import on the resource import queue.
+
+        Uploaded files are read into the job, so that the worker running the import
+        does not need access to the files of this request. As the job is stored in
+        Redis, the total size of the uploads is limited by the
+        DIOPTRA_RESOURCE_IMPORT_MAX_UPLOAD_SIZE setting.
+
+        Args:
+            group_id: The group to import resources into
+            source_type: The source to import from (either "upload" or "git")
+            git_url: The url to the git repository if source_type is "git"
+            archive_file: The contents of the upload if source_type is "upload_archive"
+            files: The contents of the upload if source_type is "upload_files"
+            config_path: The path to the toml configuration file in the import source.
+            conflict_strat: The strategy for resolving name conflicts.
+
+        Returns:
+            The status of the queued resource import.
+
+        Raises:
+            ImportFailedError: If no archive file was uploaded, or the uploads are
+                larger than the maximum upload size.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        max_upload_size = current_app.config["DIOPTRA_RESOURCE_IMPORT_MAX_UPLOAD_SIZE"]
+
+        import_id = str(uuid.uuid4())
+        import_kwargs: dict[str, Any] = {
+            "group_id": group_id,
+            "source_type": source_type.value,
+            "git_url": git_url,
+            "archive_file": None,
+            "files": None,
+            "config_path": config_path,
+            "resolve_name_conflicts_strategy": conflict_strat.value,
+        }
+
+        if source_type == ResourceImportSourceTypes.UPLOAD_ARCHIVE:
+            if archive_file is None:
+                raise ImportFailedError("No archive file was uploaded.")
+
+            import_kwargs["archive_file"] = _read_uploads(
+                [archive_file], max_upload_size
+            )[0]
+
+        elif source_type == ResourceImportSourceTypes.UPLOAD_FILES:
+            import_kwargs["files"] = _read_uploads(files or [], max_upload_size)
+
+        log.debug("Submit resource import", import_id=import_id, group_id=group_id)
+        self._rq_service.submit_resource_import(
+            import_id,
+            queue=current_app.config["DIOPTRA_RESOURCE_IMPORT_QUEUE"],
+            user_id=current_user.user_id,
+            import_kwargs=import_kwargs,
+        )
+
+        return {
+            "id": import_id,
+            "status": JobStatus.QUEUED.value,
+            "progress": ResourceImportProgress().as_dict(),
+            "result": None,
+            "error": None,
+        }
+
+    def get(self, import_id: str, **kwargs) -> dict[str, Any]:
+        """Get the status of a resource import.
+
+        Args:
+            import_id: The id of the resource import.
+
+        Returns:
+            The status, progress, and, once the import has ended, the result or error
+            message of the resource import.
+
+        Raises:
+            EntityDoesNotExistError: If the resource import does not exist or was
+                submitted by another user.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        log.debug("Get resource import", import_id=import_id)
+
+        job = self._rq_service.get_resource_import(import_id)
+
+        if job is None or job.meta.get("user_id") != current_user.user_id:
+            raise EntityDoesNotExistError(RESOURCE_IMPORT_TYPE, import_id=import_id)
+
+        return _build_resource_import_status(job)
+
+    def stream(
+        self,
+        import_id: str,
+        poll_interval: float = 0.5,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> Iterator[dict[str, Any]]:
+        """Follow the status of a resource import until it ends.
+
+        The ownership of the resource import is checked before the first status is
+        yielded. If the RQ job of the import expires or the import is still running
+        after the timeout, a last status is yielded with the status "expired" or
+        "timed_out" and the reason in the error.
+
+        Args:
+            import_id: The id of the resource import.
+            poll_interval: The number of seconds between polls. Defaults to 0.5.
+            timeout: The maximum number of seconds to follow the resource import.
+                Defaults to the DIOPTRA_RESOURCE_IMPORT_STREAM_TIMEOUT setting.
+
+        Returns:
+            An iterator that yields the status of the resource import each time it
+            changes, see get(). The iterator stops after the import has ended, its
+            job has expired, or the timeout has passed.
+
+        Raises:
+            EntityDoesNotExistError: If the resource import does not exist or was
+                submitted by another user.
+        """
+        log: BoundLogger = kwargs.get("log", LOGGER.new())
+        status = self.get(import_id, **kwargs)
+        job = self._rq_service.get_resource_import(import_id)
+
+        if timeout is None:
+            timeout = current_app.config["DIOPTRA_RESOURCE_IMPORT_STREAM_TIMEOUT"]
+
+        deadline = time.monotonic() + timeout
+
+        def _follow() -> Iterator[dict[str, Any]]:
+            nonlocal status
+            yield status
+
+            while job is not None and status["status"] not in IMPORT_FINAL_STATUSES:
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    log.debug("Resource import stream timed out", import_id=import_id)
+                    yield {
+                        **status,
+                        "status": IMPORT_STREAM_TIMED_OUT,
+                        "error": f"The resource import did not end within {timeout} "
+                        "seconds. It may still be running.",
+                    }
+                    return
+
+                time.sleep(min(poll_interval, remaining))
+
+                try:
+                    job.refresh()
+
+                except NoSuchJobError:
+                    log.debug("Resource import job expired", import_id=import_id)
+                    yield {
+                        **status,
+                        "status": IMPORT_STREAM_EXPIRED,
+                        "error": "The resource import job expired before it ended.",
+                    }
+                    return
+
+                latest = _build_resource_import_status(job)
+
+                if latest != status:
+                    status = latest
+                    yield status
+
+        return _follow()
+
+
+def run_resource_import(
+    app: Flask,
+    injector: Injector,
+    user_id: int,
+    group_id: int,
+    source_type: str,
+    config_path: str,
+    resolve_name_conflicts_strategy: str,
+    git_url: str | None = None,
+    archive_file: tuple[str, bytes] | None = None,
+    files: list[tuple[str, bytes]] | None = None,
+    progress: ResourceImportProgress | None = None,
+    **kwargs,
+) -> dict[str, Any]:
+    """Run a resource import submitted with ResourceImportJobService.submit().
+
+    The import runs in a request context of the application, on behalf of the user
+    that submitted it.
+
+    Args:
+        app: The Flask application.
+        injector: The dependency injector of the application.
+        user_id: The id of the user that submitted the import.
+        group_id: The group to import resources into
+        source_type: The source to import from.
+        config_path: The path to the toml configuration file in the import source.
+        resolve_name_conflicts_strategy: The strategy for resolving name conflicts.
+        git_url: The url to the git repository if source_type is "git"
+        archive_file: The filename and contents of the uploaded archive if
+            source_type is "upload_archive".
+        files: The filenames and contents of the uploaded files if source_type is
+            "upload_files".
+        progress: A ResourceImportProgress object that tracks the progress of the
+            import. Defaults to None.
+
+    Returns:
+        A message summarizing imported resources
+
+    Raises:
+        EntityDoesNotExistError: If the user does not exist.
+    """
+    log: BoundLogger = kwargs.get("log", LOGGER.new())
+
+    with app.test_request_context():
+        app.preprocess_request()
+
+        user = db.session.get(models.User, user_id)
+
+        if user is None:
+            raise EntityDoesNotExistError("user", user_id=user_id)
+
+        login_user(user)
+        resource_import_service = injector.get(ResourceImportService)
+
+        return resource_import_service.import_resources(
+            group_id=group_id,
+            source_type=ResourceImportSourceTypes(source_type),
+            git_url=git_url,
+            archive_file=(
+                FileStorage(BytesIO(archive_file[1]), filename=archive_file[0])
+                if archive_file is not None
+                else None
+            ),
+            files=[
+                FileStorage(BytesIO(contents), filename=filename)
+                for filename, contents in files or []
+            ],
+            config_path=config_path,
+            conflict_strat=ResourceImportResolveNameConflictsStrategy(
+                resolve_name_conflicts_strategy
+            ),
+            progress=progress if progress is not None else ResourceImportProgress(),
+            log=log,
+        )
+
+
+def _read_uploads(
+    uploads: list[FileStorage], max_size: int
+) -> list[tuple[str | None, bytes]]:
+    """Read the contents of uploaded files, up to a maximum total size.
+
+    Args:
+        uploads: The uploaded files.
+        max_size: The maximum total number of bytes to read.
+
+    Returns:
+        The filename and contents of each uploaded file.
+
+    Raises:
+        ImportFailedError: If the uploads are larger than max_size.
+    """
+    contents: list[tuple[str | None, bytes]] = []
+    remaining = max_size
+
+    for upload in uploads:
+        # Read one byte past the limit to detect uploads that exceed it
+        data = upload.stream.read(remaining + 1)
+
+        if len(data) > remaining:
+            raise ImportFailedError(
+                "The uploaded files are too large to import in the background.",
+                reason=f"Uploads for a background import are limited to {max_size} "
+                "bytes in total.",
+            )
+
+        remaining -= len(data)
+        contents.append((upload.filename, data))
+
+    return contents
+
+
+def _build_resource_import_status(job: Any) -> dict[str, Any]:
+    """Build the status of a resource import from its RQ job.
+
+    Args:
+        job: The RQ job of the resource import.
+
+    Returns:
+        The status dictionary, see ResourceImportJobService.get().
+    """
+    status = JobStatus(job.get_status(refresh=False)).value
+    result = job.return_value() if status == JobStatus.FINISHED.value else None
+    error = None
+
+    if status in IMPORT_FINAL_STATUSES and status != JobStatus.FINISHED.value:
+        error = job.meta.get("error", f"The resource import {status}.")
+
+    return {
+        "id": job.id,
+        "status": status,
+        "progress": job.meta.get("progress", ResourceImportProgress().as_dict()),
+        "result": result,
+        "error": error,
+    }
+
+
 class DraftCommitService(object):
     """The service methods for commiting a Draft as a new ResourceSnapshot."""
 
@@ -0,0 +1,182 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Naming of the RQ queues behind a Dioptra queue.
+
+A Dioptra queue is backed by one RQ queue per job priority. Jobs with the default
+priority use an RQ queue with the same name as the Dioptra queue, so workers that
+only listen to that name keep working. The other priorities append the priority
+to the name::
+
+    <queue>:high
+    <queue>
+    <queue>:low
+
+When fair-share dispatch is enabled for a queue, each submitter gets their own RQ
+queue per priority, which the worker visits in turn::
+
+    <queue>:<priority>:<share key>
+
+The share key is "user-<id>" or "group-<id>", depending on the queue's fair-share
+mode. Dioptra queue names cannot contain ":", so the RQ queues of two Dioptra queues
+never collide.
+
+Only dioptra.worker.fair_share_worker.FairShareWorker, the default worker class of
+dioptra-worker-v1, listens to the RQ queues with a suffix. A stock "rq worker", or
+one started with another worker class, only runs the jobs with the default priority
+on queues without fair share. Deployments with such workers must disable the
+DIOPTRA_RQ_FAIR_SHARE_WORKER setting of the REST API, which then rejects the jobs
+that would be left on the other RQ queues.
+"""
+
+import re
+from typing import Final
+
+from redis import Redis
+
+from rq.queue import Queue
+
+PRIORITY_HIGH: Final[str] = "high"
+PRIORITY_DEFAULT: Final[str] = "default"
+PRIORITY_LOW: Final[str] = "low"
+
+# Job priorities, from highest to lowest
+PRIORITIES: Final[tuple[str, ...]] = (PRIORITY_HIGH, PRIORITY_DEFAULT, PRIORITY_LOW)
+
+FAIR_SHARE_NONE: Final[str] = "none"
+FAIR_SHARE_USER: Final[str] = "user"
+FAIR_SHARE_GROUP: Final[str] = "group"
+FAIR_SHARE_MODES: Final[tuple[str, ...]] = (
+    FAIR_SHARE_NONE,
+    FAIR_SHARE_USER,
+    FAIR_SHARE_GROUP,
+)
+
+_SUFFIX_REGEX: Final[re.Pattern] = re.compile(
+    rf"^(?P<priority>{'|'.join(PRIORITIES)})"
+    rf"(?::(?P<share>(?:{FAIR_SHARE_USER}|{FAIR_SHARE_GROUP})-\d+))?$"
+)
+
+
+def get_share_key(fair_share: str, user_id: int, group_id: int) -> str | None:
+    """Get the share key that groups a submitter's jobs for fair-share dispatch.
+
+    Args:
+        fair_share: The fair-share mode of the queue.
+        user_id: The id of the user submitting the job.
+        group_id: The id of the group that owns the job.
+
+    Returns:
+        The share key, or None if fair-share dispatch is disabled.
+
+    Raises:
+        ValueError: If the fair-share mode is not recognized.
+    """
+    if fair_share == FAIR_SHARE_NONE:
+        return None
+
+    if fair_share == FAIR_SHARE_USER:
+        return f"{FAIR_SHARE_USER}-{user_id}"
+
+    if fair_share == FAIR_SHARE_GROUP:
+        return f"{FAIR_SHARE_GROUP}-{group_id}"
+
+    raise ValueError(
+        f"Invalid fair-share mode: {fair_share}. Allowed values are {FAIR_SHARE_MODES}."
+    )
+
+
+def get_rq_queue_name(
+    queue: str, priority: str = PRIORITY_DEFAULT, share: str | None = None
+) -> str:
+    """Get the name of the RQ queue that holds a Dioptra queue's jobs.
+
+    Args:
+        queue: The name of the Dioptra queue.
+        priority: The priority of the jobs. Defaults to "default".
+        share: The share key of the submitter, see get_share_key(). Defaults to
+            None.
+
+    Returns:
+        The name of the RQ queue.
+
+    Raises:
+        ValueError: If the priority is not recognized.
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(
+            f"Invalid job priority: {priority}. Allowed values are {PRIORITIES}."
+        )
+
+    if share is not None:
+        return f"{queue}:{priority}:{share}"
+
+    if priority == PRIORITY_DEFAULT:
+        return queue
+
+    return f"{queue}:{priority}"
+
+
+def parse_rq_queue_name(name: str, queue: str) -> tuple[str, str | None] | None:
+    """Match an RQ queue name against the RQ queues of a Dioptra queue.
+
+    Args:
+        name: The name of the RQ queue.
+        queue: The name of the Dioptra queue.
+
+    Returns:
+        A (priority, share key) tuple, or None if the RQ queue does not belong to
+        the Dioptra queue.
+    """
+    if name == queue:
+        return PRIORITY_DEFAULT, None
+
+    if not name.startswith(f"{queue}:"):
+        return None
+
+    match = _SUFFIX_REGEX.match(name[len(queue) + 1 :])
+
+    if match is None:
+        return None
+
+    return match.group("priority"), match.group("share")
+
+
+def find_rq_queue_names(connection: Redis, queue: str) -> list[str]:
+    """Find the RQ queues of a Dioptra queue that exist in Redis.
+
+    The RQ queues for the priorities without a share key are always included.
+
+    Args:
+        connection: The Redis connection.
+        queue: The name of the Dioptra queue.
+
+    Returns:
+        The names of the RQ queues, sorted by name.
+
+    Raises:
+        RedisError: If Redis cannot be reached.
+    """
+    names = {get_rq_queue_name(queue, priority) for priority in PRIORITIES}
+    prefix_length = len(Queue.redis_queue_namespace_prefix)
+
+    for key in connection.smembers(Queue.redis_queues_keys):
+        name = (key.decode() if isinstance(key, bytes) else key)[prefix_length:]
+
+        if parse_rq_queue_name(name, queue) is not None:
+            names.add(name)
+
+    return sorted(names)
@@ -14,6 +14,7 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
+from .run_resource_import import run_resource_import
 from .run_v1_dioptra_job import run_v1_dioptra_job
 
-__all__ = ["run_v1_dioptra_job"]
+__all__ = ["run_resource_import", "run_v1_dioptra_job"]
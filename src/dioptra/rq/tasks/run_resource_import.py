@@ -0,0 +1,115 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""The RQ task that imports resources in the background.
+
+The task runs the import against the REST API database, so the worker needs the same
+database settings as the REST API (DIOPTRA_RESTAPI_ENV and
+DIOPTRA_RESTAPI_DATABASE_URI), and must listen to the resource import queue (see
+DIOPTRA_RESOURCE_IMPORT_QUEUE).
+"""
+
+import os
+import time
+from typing import Any, Final
+
+import structlog
+from structlog.stdlib import BoundLogger
+
+from rq import get_current_job
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+# The minimum number of seconds between saves of the import's progress
+PROGRESS_SAVE_INTERVAL: Final[float] = 0.5
+
+
+def run_resource_import(user_id: int, **import_kwargs: Any) -> dict[str, Any]:
+    """Imports resources on behalf of a user and reports the progress in the job meta.
+
+    Args:
+        user_id: The id of the user that submitted the import.
+        **import_kwargs: The import arguments, see
+            dioptra.restapi.v1.workflows.service.run_resource_import.
+
+    Returns:
+        A message summarizing imported resources.
+    """
+    from injector import Injector
+
+    from dioptra.restapi import create_app
+    from dioptra.restapi.bootstrap import bind_dependencies, register_providers
+    from dioptra.restapi.errors import DioptraError
+    from dioptra.restapi.v1.workflows import service as workflows_service
+
+    job = get_current_job()
+    log = LOGGER.new(import_id=job.id if job is not None else None, user_id=user_id)
+    last_saved = 0.0
+
+    def _save_progress(progress: "workflows_service.ResourceImportProgress") -> None:
+        nonlocal last_saved
+
+        if job is None:
+            return None
+
+        now = time.monotonic()
+
+        # Stage changes are always saved, counter updates at most every interval
+        if (
+            job.meta.get("progress", {}).get("stage") == progress.stage
+            and now - last_saved < PROGRESS_SAVE_INTERVAL
+        ):
+            return None
+
+        job.meta["progress"] = progress.as_dict()
+        job.save_meta()
+        last_saved = now
+
+    progress = workflows_service.ResourceImportProgress(on_update=_save_progress)
+
+    modules: list[Any] = [bind_dependencies]
+    register_providers(modules)
+    injector = Injector(modules)
+    app = create_app(env=os.getenv("DIOPTRA_RESTAPI_ENV", "prod"), injector=injector)
+
+    try:
+        result = workflows_service.run_resource_import(
+            app, injector, user_id=user_id, progress=progress, log=log, **import_kwargs
+        )
+
+    except DioptraError as err:
+        if job is not None:
+            job.meta["error"] = err.to_message()
+            job.save_meta()
+
+        raise
+
+    except Exception as err:
+        log.exception("Resource import failed")
+
+        if job is not None:
+            job.meta["error"] = (
+                f"The resource import failed: {type(err).__name__}: {err}"
+            )
+            job.save_meta()
+
+        raise
+
+    if job is not None:
+        job.meta["progress"] = progress.as_dict()
+        job.save_meta()
+
+    return result
@@ -20,6 +20,10 @@ import structlog
 from structlog.stdlib import BoundLogger
 
 import dioptra.sdk.utilities.run_dioptra_job as run_dioptra_job
+from dioptra.sdk.utilities.auth_client import (
+    get_authenticated_worker_client,
+    share_worker_client,
+)
 from dioptra.sdk.utilities.logging import forward_job_logs_to_api
 from dioptra.sdk.utilities.paths import set_cwd
 
@@ -35,10 +39,13 @@ def run_v1_dioptra_job(job_id: int, experiment_id: int) -> None:  # noqa: C901
     """
     log = LOGGER.new(job_id=job_id, experiment_id=experiment_id)  # noqa: F841
 
-    # Set up a temporary directory and set it as the current working directory
+    # Set up a temporary directory and set it as the current working directory. The
+    # job's log forwarding, the job runner, and the plugins share one authenticated
+    # client.
     with (
         tempfile.TemporaryDirectory() as tempdir,
         set_cwd(tempdir),
+        share_worker_client(get_authenticated_worker_client(log, "json"), "json"),
         forward_job_logs_to_api(job_id),
     ):
         run_dioptra_job.main(
@@ -201,156 +201,9 @@ class TensorflowBoundingBoxesYOLOV1Confluence(BoundingBoxesYOLOV1PostProcessing)
             output = {}
 
             for each_class in class_mapping:
-                dets = np.array(class_mapping[each_class])
-                retain = []
-
-                while dets.size > 0:
-                    confluence_scores: list[npt.NDArray] = []
-                    proximities = []
-
-                    while len(confluence_scores) < np.size(dets, 0):
-                        current_box = len(confluence_scores)
-                        x1 = dets[current_box, 0]
-                        y1 = dets[current_box, 1]
-                        x2 = dets[current_box, 2]
-                        y2 = dets[current_box, 3]
-                        confidence_score = dets[current_box, 4]
-
-                        xx1 = dets[np.arange(len(dets)) != current_box, 0]
-                        yy1 = dets[np.arange(len(dets)) != current_box, 1]
-                        xx2 = dets[np.arange(len(dets)) != current_box, 2]
-                        yy2 = dets[np.arange(len(dets)) != current_box, 3]
-                        cconf = dets[np.arange(len(dets)) != current_box, 4]
-
-                        min_x: npt.NDArray = np.minimum(x1, xx1)
-                        min_y: npt.NDArray = np.minimum(y1, yy1)
-                        max_x: npt.NDArray = np.maximum(x2, xx2)
-                        max_y: npt.NDArray = np.maximum(y2, yy2)
-
-                        x1, y1, x2, y2 = self.normalise_coordinates(
-                            x1,
-                            y1,
-                            x2,
-                            y2,
-                            min_x,
-                            max_x,
-                            min_y,
-                            max_y,
-                        )
-                        xx1, yy1, xx2, yy2 = self.normalise_coordinates(
-                            xx1,
-                            yy1,
-                            xx2,
-                            yy2,
-                            min_x,
-                            max_x,
-                            min_y,
-                            max_y,
-                        )
-
-                        hd_x1, hd_x2, vd_y1, vd_y2 = (
-                            abs(x1 - xx1),
-                            abs(x2 - xx2),
-                            abs(y1 - yy1),
-                            abs(y2 - yy2),
-                        )
-                        proximity = hd_x1 + hd_x2 + vd_y1 + vd_y2
-                        all_proximities = np.ones_like(proximity)
-                        cconf_scores = np.zeros_like(cconf)
-
-                        all_proximities[proximity <= self._confluence_threshold] = (
-                            proximity[proximity <= self._confluence_threshold]
-                        )
-                        cconf_scores[proximity <= self._confluence_threshold] = cconf[
-                            proximity <= self._confluence_threshold
-                        ]
-
-                        if cconf_scores.size > 0:
-                            confluence_score = np.amax(cconf_scores)
-
-                        else:
-                            confluence_score = confidence_score
-
-                        if all_proximities.size > 0:
-                            proximity = (
-                                sum(all_proximities) / all_proximities.size
-                            ) * (1 - confidence_score)
-
-                        else:
-                            proximity = sum(all_proximities) * (1 - confidence_score)
-
-                        confluence_scores.append(confluence_score)
-                        proximities.append(proximity)
-
-                    conf = np.array(confluence_scores)
-                    prox = np.array(proximities)
-
-                    dets_temp = np.concatenate((dets, prox[:, None]), axis=1)
-                    dets_temp = np.concatenate((dets_temp, conf[:, None]), axis=1)
-                    min_idx = np.argmin(dets_temp[:, 5], axis=0)
-                    dets[[0, min_idx], :] = dets[[min_idx, 0], :]
-                    dets_temp[[0, min_idx], :] = dets_temp[[min_idx, 0], :]
-                    dets[0, 4] = dets_temp[0, 6]
-                    retain.append(dets[0, :])
-
-                    x1, y1, x2, y2 = dets[0, 0], dets[0, 1], dets[0, 2], dets[0, 3]
-                    min_x = np.minimum(x1, dets[1:, 0])
-                    min_y = np.minimum(y1, dets[1:, 1])
-                    max_x = np.maximum(x2, dets[1:, 2])
-                    max_y = np.maximum(y2, dets[1:, 3])
-
-                    x1, y1, x2, y2 = self.normalise_coordinates(
-                        x1,
-                        y1,
-                        x2,
-                        y2,
-                        min_x,
-                        max_x,
-                        min_y,
-                        max_y,
-                    )
-                    xx1, yy1, xx2, yy2 = self.normalise_coordinates(
-                        dets[1:, 0],
-                        dets[1:, 1],
-                        dets[1:, 2],
-                        dets[1:, 3],
-                        min_x,
-                        max_x,
-                        min_y,
-                        max_y,
-                    )
-                    md_x1, md_x2, md_y1, md_y2 = (
-                        abs(x1 - xx1),
-                        abs(x2 - xx2),
-                        abs(y1 - yy1),
-                        abs(y2 - yy2),
-                    )
-                    manhattan_distance = md_x1 + md_x2 + md_y1 + md_y2
-                    weights = np.ones_like(manhattan_distance)
-
-                    if self._gaussian:
-                        gaussian_weights = np.exp(
-                            -((1 - manhattan_distance) * (1 - manhattan_distance))
-                            / self._sigma
-                        )
-                        weights[manhattan_distance <= self._confluence_threshold] = (
-                            gaussian_weights[
-                                manhattan_distance <= self._confluence_threshold
-                            ]
-                        )
-
-                    else:
-                        weights[manhattan_distance <= self._confluence_threshold] = (
-                            manhattan_distance[
-                                manhattan_distance <= self._confluence_threshold
-                            ]
-                        )
-
-                    dets[1:, 4] *= weights
-                    to_reprocess = np.where(dets[1:, 4] >= self._score_threshold)[0]
-                    dets = dets[to_reprocess + 1, :]
-
-                output[each_class] = retain
+                output[each_class] = self.retain_class_boxes(
+                    np.array(class_mapping[each_class])
+                )
 
             batch_boxes, batch_scores, batch_labels = self.from_mapping_to_arrays(
                 output
@@ -367,6 +220,107 @@ class TensorflowBoundingBoxesYOLOV1Confluence(BoundingBoxesYOLOV1PostProcessing)
             batch_size=batch_size,
         )
 
+    def retain_class_boxes(self, dets: npt.NDArray) -> list[npt.NDArray]:
+        """
+        Args:
+            dets: array of the bounding boxes of a single class and their class
+                confidence scores, one (x1,y1,x2,y2,score) row per box
+
+        Returns:
+            list of the retained (x1,y1,x2,y2,score) rows, in order of retention
+        """
+        proximities = self.pairwise_proximities(dets)
+        scores = dets[:, 4].copy()
+        remaining = np.arange(len(dets))
+        retain = []
+
+        while remaining.size > 0:
+            num_remaining = remaining.size
+            remaining_scores = scores[remaining]
+            remaining_proximities = proximities[np.ix_(remaining, remaining)]
+            confluent = remaining_proximities <= self._confluence_threshold
+            np.fill_diagonal(confluent, False)
+
+            if num_remaining > 1:
+                confluence_scores = np.amax(
+                    np.where(confluent, remaining_scores, 0.0), axis=1
+                )
+                all_proximities = np.where(confluent, remaining_proximities, 1.0)
+                np.fill_diagonal(all_proximities, 0.0)
+                # cumsum adds the proximities one at a time, so the mean matches
+                # the one computed box by box
+                weighted_proximities = (
+                    np.cumsum(all_proximities, axis=1)[:, -1] / (num_remaining - 1)
+                ) * (1 - remaining_scores)
+
+            else:
+                confluence_scores = remaining_scores
+                weighted_proximities = np.zeros(1)
+
+            min_idx = int(np.argmin(weighted_proximities))
+            remaining[[0, min_idx]] = remaining[[min_idx, 0]]
+            retained = dets[remaining[0]].copy()
+            retained[4] = confluence_scores[min_idx]
+            retain.append(retained)
+
+            others = remaining[1:]
+            manhattan_distance = proximities[remaining[0], others]
+            confluent_others = manhattan_distance <= self._confluence_threshold
+            weights = np.ones_like(manhattan_distance)
+
+            if self._gaussian:
+                gaussian_weights = np.exp(
+                    -((1 - manhattan_distance) * (1 - manhattan_distance)) / self._sigma
+                )
+                weights[confluent_others] = gaussian_weights[confluent_others]
+
+            else:
+                weights[confluent_others] = manhattan_distance[confluent_others]
+
+            scores[others] *= weights
+            remaining = others[scores[others] >= self._score_threshold]
+
+        return retain
+
+    def pairwise_proximities(self, dets: npt.NDArray) -> npt.NDArray:
+        """
+        Args:
+            dets: array of bounding boxes, one (x1,y1,x2,y2,...) row per box
+
+        Returns:
+            matrix of the Manhattan distances between the normalised coordinates
+            of each pair of bounding boxes
+        """
+        box_x1, box_y1, box_x2, box_y2 = (dets[:, idx] for idx in range(4))
+        min_x = np.minimum(box_x1[:, None], box_x1[None, :])
+        min_y = np.minimum(box_y1[:, None], box_y1[None, :])
+        max_x = np.maximum(box_x2[:, None], box_x2[None, :])
+        max_y = np.maximum(box_y2[:, None], box_y2[None, :])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x1, y1, x2, y2 = self.normalise_coordinates(
+                box_x1[:, None],
+                box_y1[:, None],
+                box_x2[:, None],
+                box_y2[:, None],
+                min_x,
+                max_x,
+                min_y,
+                max_y,
+            )
+            xx1, yy1, xx2, yy2 = self.normalise_coordinates(
+                box_x1[None, :],
+                box_y1[None, :],
+                box_x2[None, :],
+                box_y2[None, :],
+                min_x,
+                max_x,
+                min_y,
+                max_y,
+            )
+
+        return abs(x1 - xx1) + abs(x2 - xx2) + abs(y1 - yy1) + abs(y2 - yy2)
+
     def assign_boxes_to_classes(
         self, bounding_boxes: npt.NDArray, classes: npt.NDArray, scores: npt.NDArray
     ) -> dict[int, list[npt.NDArray]]:
@@ -15,10 +15,12 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 from .annotation_data import AnnotationData
+from .cache import AnnotationCache
 from .encodings import AnnotationEncoding, NumpyAnnotationEncoding
 from .pascal_voc import PascalVOCAnnotationData
 
 __all__ = [
+    "AnnotationCache",
     "AnnotationData",
     "AnnotationEncoding",
     "NumpyAnnotationEncoding",
@@ -16,9 +16,9 @@
 # https://creativecommons.org/licenses/by/4.0/legalcode
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from .encodings import BoxesType, LabelsType
+from .encodings import AnnotationEncoding, BoxesType, LabelsType
 
 
 class AnnotationData(metaclass=ABCMeta):
@@ -27,6 +27,10 @@ class AnnotationData(metaclass=ABCMeta):
     def labels(self) -> Dict[str, int]:
         raise NotImplementedError
 
+    @property
+    def encoding(self) -> Optional[AnnotationEncoding]:
+        return None
+
     @abstractmethod
     def get(self, y) -> Tuple[BoxesType, LabelsType]:
         raise NotImplementedError
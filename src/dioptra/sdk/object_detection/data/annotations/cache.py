@@ -0,0 +1,324 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""A columnar cache of parsed annotation files.
+
+Parsing the annotation files of a large dataset on every epoch is slow, so the
+annotations are parsed once, in parallel, and stored as flat arrays:
+
+- boxes: the bounding boxes of all files, one row per box
+- labels: the labels of all files, one entry per box
+- offsets: the index of each file's first box, followed by the total number of
+  boxes, so the boxes of file i are boxes[offsets[i] : offsets[i + 1]]
+
+The arrays are saved to a NumPy .npz file together with a fingerprint of the
+annotation files, labels, and encoding. The cache file is rebuilt when the
+fingerprint no longer matches, which happens when a file is added, removed, or
+modified, or when the labels or the dtypes of the encoded arrays change.
+"""
+
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Final, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import structlog
+from structlog.stdlib import BoundLogger
+
+from .annotation_data import AnnotationData
+from .encodings import BoxesType, LabelsType
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+# Number of annotation files parsed by a worker process at a time
+CHUNK_SIZE: Final[int] = 1000
+
+
+class AnnotationCache(object):
+    """The parsed annotations of a list of annotation files."""
+
+    def __init__(
+        self,
+        filepaths: Sequence[str],
+        boxes: BoxesType,
+        labels: LabelsType,
+        offsets: npt.NDArray,
+    ) -> None:
+        """
+        Args:
+            filepaths: The annotation files, in the order of the offsets.
+            boxes: The bounding boxes of all the files, one row per box.
+            labels: The labels of all the files, one entry per box.
+            offsets: The index of the first box of each file, followed by the
+                total number of boxes.
+        """
+        self._index = {filepath: idx for idx, filepath in enumerate(filepaths)}
+        self._boxes = boxes
+        self._labels = labels
+        self._offsets = offsets
+
+    def __contains__(self, filepath: object) -> bool:
+        return filepath in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, filepath: Union[Path, bytes, str]) -> Tuple[BoxesType, LabelsType]:
+        """
+        Args:
+            filepath: An annotation file in the cache.
+
+        Returns:
+            The encoded bounding boxes and labels of the file.
+
+        Raises:
+            KeyError: If the file is not in the cache.
+        """
+        filepath = filepath.decode() if isinstance(filepath, bytes) else str(filepath)
+        idx = self._index[filepath]
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+
+        return self._boxes[start:end], self._labels[start:end]
+
+    @classmethod
+    def build(
+        cls,
+        annotation_data: AnnotationData,
+        filepaths: Sequence[str],
+        max_workers: int | None = None,
+    ) -> "AnnotationCache":
+        """Parse the annotation files in parallel.
+
+        The files are split into chunks of CHUNK_SIZE files, which are parsed by a
+        pool of worker processes. If there is only one chunk or one worker, the
+        files are parsed in this process.
+
+        Args:
+            annotation_data: The annotation data object that parses the files.
+            filepaths: The annotation files to parse.
+            max_workers: The maximum number of worker processes. Defaults to the
+                number of CPUs.
+
+        Returns:
+            The cache of the parsed annotations.
+        """
+        chunks = [
+            list(filepaths[start : start + CHUNK_SIZE])
+            for start in range(0, len(filepaths), CHUNK_SIZE)
+        ]
+        num_workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+
+        if num_workers <= 1:
+            results = [_read_files(annotation_data, chunk) for chunk in chunks]
+
+        else:
+            # spawn fresh workers, as forking a process that runs TensorFlow is unsafe
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = list(
+                    executor.map(_read_files, [annotation_data] * len(chunks), chunks)
+                )
+
+        LOGGER.info(
+            "Annotation files parsed",
+            num_files=len(filepaths),
+            num_workers=max(num_workers, 1),
+        )
+
+        if not results:
+            boxes, labels = _encode_empty(annotation_data)
+            return cls(
+                filepaths=filepaths,
+                boxes=np.reshape(boxes, (0, 4)),
+                labels=np.reshape(labels, 0),
+                offsets=np.zeros(1, dtype="int64"),
+            )
+
+        counts = np.concatenate([result[2] for result in results])
+
+        return cls(
+            filepaths=filepaths,
+            boxes=np.concatenate([result[0] for result in results]),
+            labels=np.concatenate([result[1] for result in results]),
+            offsets=np.concatenate([[0], np.cumsum(counts)]).astype("int64"),
+        )
+
+    @classmethod
+    def load(
+        cls, path: Path, filepaths: Sequence[str], fingerprint: str
+    ) -> "AnnotationCache | None":
+        """
+        Args:
+            path: The cache file.
+            filepaths: The annotation files the cache file was built from.
+            fingerprint: The fingerprint of the annotation files, labels, and
+                encoding, see fingerprint_annotations().
+
+        Returns:
+            The cache, or None if the cache file does not exist or is stale.
+        """
+        try:
+            with np.load(path, allow_pickle=False) as cache_file:
+                if str(cache_file["fingerprint"]) != fingerprint:
+                    LOGGER.info("Annotations cache is stale", path=str(path))
+                    return None
+
+                return cls(
+                    filepaths=filepaths,
+                    boxes=cache_file["boxes"],
+                    labels=cache_file["labels"],
+                    offsets=cache_file["offsets"],
+                )
+
+        except FileNotFoundError:
+            return None
+
+        except (OSError, KeyError, ValueError) as err:
+            LOGGER.warn("Unable to read annotations cache", path=str(path), error=err)
+            return None
+
+    def save(self, path: Path, fingerprint: str) -> None:
+        """
+        Args:
+            path: The cache file to write.
+            fingerprint: The fingerprint of the annotation files, labels, and
+                encoding, see fingerprint_annotations().
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        # write to a temporary file first, so readers never see a partial file
+        with tmp_path.open("wb") as f:
+            np.savez(
+                f,
+                boxes=self._boxes,
+                labels=self._labels,
+                offsets=self._offsets,
+                fingerprint=np.array(fingerprint),
+            )
+
+        tmp_path.replace(path)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        annotation_data: AnnotationData,
+        filepaths: Sequence[str],
+        path: Path | None = None,
+        max_workers: int | None = None,
+    ) -> "AnnotationCache":
+        """Load the cache file, or rebuild it if it is missing or stale.
+
+        A cache file that cannot be written, for example because the dataset is
+        on a read-only volume, is logged and skipped.
+
+        Args:
+            annotation_data: The annotation data object that parses the files.
+            filepaths: The annotation files.
+            path: The cache file. If not provided, the annotations are parsed
+                without saving them.
+            max_workers: The maximum number of worker processes used to parse the
+                files. Defaults to the number of CPUs.
+
+        Returns:
+            The cache of the parsed annotations.
+        """
+        if path is None:
+            return cls.build(annotation_data, filepaths, max_workers=max_workers)
+
+        fingerprint = fingerprint_annotations(annotation_data, filepaths)
+        cache = cls.load(path, filepaths, fingerprint)
+
+        if cache is not None:
+            LOGGER.info("Annotations cache loaded", path=str(path))
+            return cache
+
+        cache = cls.build(annotation_data, filepaths, max_workers=max_workers)
+
+        try:
+            cache.save(path, fingerprint)
+
+        except OSError as err:
+            LOGGER.warn("Unable to save annotations cache", path=str(path), error=err)
+
+        else:
+            LOGGER.info("Annotations cache saved", path=str(path))
+
+        return cache
+
+
+def fingerprint_annotations(
+    annotation_data: AnnotationData, filepaths: Sequence[str]
+) -> str:
+    """Fingerprint a list of annotation files and how they are parsed.
+
+    The fingerprint covers the path, size, and modification time of each file, so
+    it changes when a file is added, removed, renamed, or modified, without reading
+    the files. It also covers the labels and the dtypes of the boxes and labels
+    produced by the encoding, if the annotation data has one.
+
+    Args:
+        annotation_data: The annotation data object that parses the files.
+        filepaths: The annotation files.
+
+    Returns:
+        The hex digest of the fingerprint.
+    """
+    digest = hashlib.sha256()
+    digest.update(repr(sorted(annotation_data.labels.items())).encode())
+
+    boxes, labels = _encode_empty(annotation_data)
+    digest.update(f"{boxes.dtype}\0{labels.dtype}\n".encode())
+
+    for filepath in filepaths:
+        stat = os.stat(filepath)
+        digest.update(f"{filepath}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+
+    return digest.hexdigest()
+
+
+def _encode_empty(annotation_data: AnnotationData) -> Tuple[BoxesType, LabelsType]:
+    """Encode no boxes to find the dtypes of the encoded arrays."""
+    if annotation_data.encoding is None:
+        return np.zeros((0, 4), dtype="float32"), np.zeros(0, dtype="int32")
+
+    return annotation_data.encoding.encode([], [])
+
+
+def _read_files(
+    annotation_data: AnnotationData, filepaths: Sequence[str]
+) -> Tuple[BoxesType, LabelsType, npt.NDArray]:
+    """Parse annotation files and return their boxes, labels, and box counts."""
+    boxes: list[BoxesType] = []
+    labels: list[LabelsType] = []
+    counts = np.zeros(len(filepaths), dtype="int64")
+
+    for idx, filepath in enumerate(filepaths):
+        file_boxes, file_labels = annotation_data.get(filepath)
+        boxes.append(np.reshape(file_boxes, (-1, 4)))
+        labels.append(np.reshape(file_labels, -1))
+        counts[idx] = len(file_labels)
+
+    if not boxes:
+        return np.zeros((0, 4), dtype="float32"), np.zeros(0, dtype="int32"), counts
+
+    return np.concatenate(boxes), np.concatenate(labels), counts
@@ -41,6 +41,10 @@ class PascalVOCAnnotationData(AnnotationData):
     def labels(self) -> Dict[str, int]:
         return self._labels
 
+    @property
+    def encoding(self) -> AnnotationEncoding:
+        return self._encoding
+
     def get(self, y: Union[Path, bytes, str]) -> Tuple[BoxesType, LabelsType]:
         boxes, classes = self.read_file(filepath=y)
         encoded_boxes, encoded_classes = self._encoding.encode(boxes, classes)
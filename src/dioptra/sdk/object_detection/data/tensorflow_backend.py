@@ -15,6 +15,7 @@
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
 
+import hashlib
 from pathlib import Path
 from typing import Callable, Iterable, List, Optional, Sequence, Tuple, cast
 
@@ -31,10 +32,12 @@ from dioptra.sdk.object_detection.bounding_boxes import (
 )
 
 from .annotations import (
+    AnnotationCache,
     AnnotationData,
     NumpyAnnotationEncoding,
     PascalVOCAnnotationData,
 )
+from .annotations.encodings import BoxesType, LabelsType
 from .images import TensorflowImageData
 from .object_detection_data import ObjectDetectionData
 
@@ -71,6 +74,9 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
         images_dirname: str = "images",
         annotations_dirname: str = "annotations",
         seed: Optional[int] = None,
+        cache_annotations: bool = True,
+        annotations_cache_directory: Optional[Path] = None,
+        annotations_cache_workers: Optional[int] = None,
     ) -> None:
         self._annotation_data = annotation_data
         self._bounding_boxes_batched_grid = bounding_boxes_batched_grid
@@ -88,6 +94,10 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
         self._images_dirname = images_dirname
         self._annotations_dirname = annotations_dirname
         self._seed = seed
+        self._cache_annotations = cache_annotations
+        self._annotations_cache_directory = annotations_cache_directory
+        self._annotations_cache_workers = annotations_cache_workers
+        self._annotations_caches: dict[str, AnnotationCache] = {}
 
         self._training_annotations_filepaths: list[str] | None = None
         self._training_images_filepaths: list[str] | None = None
@@ -113,6 +123,9 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
         annotations_dirname: str = "annotations",
         augmentations_seed: Optional[int] = None,
         shuffle_seed: Optional[int] = None,
+        cache_annotations: bool = True,
+        annotations_cache_directory: Path | str | None = None,
+        annotations_cache_workers: Optional[int] = None,
     ) -> "TensorflowObjectDetectionData":
         annotation_data_registry: dict[str, Callable[[], PascalVOCAnnotationData]] = {
             "pascal_voc": lambda: PascalVOCAnnotationData(
@@ -159,6 +172,9 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
             Path(validation_directory) if validation_directory else None
         )
         testing_directory = Path(testing_directory) if testing_directory else None
+        annotations_cache_directory = (
+            Path(annotations_cache_directory) if annotations_cache_directory else None
+        )
 
         return TensorflowObjectDetectionData(
             annotation_data=annotation_data_object,
@@ -177,6 +193,9 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
             images_dirname=images_dirname,
             annotations_dirname=annotations_dirname,
             seed=shuffle_seed,
+            cache_annotations=cache_annotations,
+            annotations_cache_directory=annotations_cache_directory,
+            annotations_cache_workers=annotations_cache_workers,
         )
 
     @property
@@ -196,6 +215,9 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
         if self.training_images_directory is None:
             return None
 
+        self.load_annotations_cache(
+            self.training_annotations_directory, self.training_annotations_filepaths
+        )
         dataset = self.create_dataset(
             self.training_images_filepaths, self.training_annotations_filepaths
         )
@@ -219,6 +241,9 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
         if self.validation_images_directory is None:
             return None
 
+        self.load_annotations_cache(
+            self.validation_annotations_directory, self.validation_annotations_filepaths
+        )
         dataset = self.create_dataset(
             self.validation_images_filepaths, self.validation_annotations_filepaths
         )
@@ -234,6 +259,9 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
         if self.testing_images_directory is None:
             return None
 
+        self.load_annotations_cache(
+            self.testing_annotations_directory, self.testing_annotations_filepaths
+        )
         dataset = self.create_dataset(
             self.testing_images_filepaths, self.testing_annotations_filepaths
         )
@@ -414,9 +442,59 @@ class TensorflowObjectDetectionData(ObjectDetectionData):
     def load_annotations(self, y: Tensor) -> tuple[Tensor, Tensor]:
         return cast(
             tuple[Tensor, Tensor],
-            tf.numpy_function(self._annotation_data.get, [y], [tf.float32, tf.int32]),
+            tf.numpy_function(self._get_annotations, [y], [tf.float32, tf.int32]),
         )
 
+    def load_annotations_cache(
+        self,
+        annotations_directory: Optional[Path],
+        annotations_filepaths: Optional[List[str]],
+    ) -> None:
+        """Parse the annotation files of a dataset split ahead of the pipeline.
+
+        The annotations are loaded from the cache file of the split, which is
+        (re)built if it is missing or stale, see AnnotationCache.load_or_build().
+        The cache file is stored in the annotations cache directory if one is set,
+        and next to the annotations directory otherwise.
+
+        Args:
+            annotations_directory: The annotations directory of the split.
+            annotations_filepaths: The annotation files of the split.
+        """
+        if (
+            not self._cache_annotations
+            or annotations_directory is None
+            or annotations_filepaths is None
+            or str(annotations_directory) in self._annotations_caches
+        ):
+            return None
+
+        cache_directory = (
+            self._annotations_cache_directory or annotations_directory.parent
+        )
+        directory_digest = hashlib.sha256(str(annotations_directory).encode())
+        cache_filepath = cache_directory / (
+            f".{annotations_directory.name}-{directory_digest.hexdigest()[:16]}.npz"
+        )
+
+        self._annotations_caches[str(annotations_directory)] = (
+            AnnotationCache.load_or_build(
+                annotation_data=self._annotation_data,
+                filepaths=annotations_filepaths,
+                path=cache_filepath,
+                max_workers=self._annotations_cache_workers,
+            )
+        )
+
+    def _get_annotations(self, y: bytes) -> Tuple[BoxesType, LabelsType]:
+        filepath = y.decode()
+
+        for cache in self._annotations_caches.values():
+            if filepath in cache:
+                return cache.get(filepath)
+
+        return self._annotation_data.get(y)
+
     def load_xy_data_factory(
         self, training: bool = False
     ) -> Callable[[Tensor, Tensor], tuple[Tensor, Tensor, Tensor, Tensor, Tensor]]:
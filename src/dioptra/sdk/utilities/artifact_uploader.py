@@ -0,0 +1,141 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Upload a job's artifacts to its MLflow run on a bounded pool of threads.
+
+The task engine hands each artifact to the uploader as soon as it is serialized, so
+uploads overlap with the rest of the job instead of running one at a time after it
+finishes. Once the job is done, wait() returns the uploaded artifacts, which are then
+registered with the Dioptra API in a single batch request.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from types import TracebackType
+from typing import TYPE_CHECKING, Final, Type, TypedDict
+
+import structlog
+from structlog.stdlib import BoundLogger
+
+from dioptra.task_engine.task_engine import ArtifactOutputEntry
+
+if TYPE_CHECKING:
+    from mlflow.tracking import MlflowClient
+
+LOGGER: BoundLogger = structlog.stdlib.get_logger()
+
+DEFAULT_MAX_WORKERS: Final[int] = 4
+
+
+class UploadedArtifact(TypedDict):
+    """An artifact that was uploaded to the MLflow run.
+
+    Attributes:
+        artifact: The artifact output entry produced by the task engine.
+        uri: The URI of the uploaded artifact.
+    """
+
+    artifact: ArtifactOutputEntry
+    uri: str
+
+
+class ArtifactUploader(object):
+    """Uploads artifacts to an MLflow run on a bounded pool of threads.
+
+    The uploader is a context manager. Leaving the context waits for the uploads in
+    progress to finish, and cancels the queued uploads if the context exits with an
+    exception.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        client: "MlflowClient | None" = None,
+    ) -> None:
+        """Initialize the uploader.
+
+        Args:
+            run_id: The id of the MLflow run to upload the artifacts to.
+            max_workers: The maximum number of artifacts to upload at once. Defaults
+                to DEFAULT_MAX_WORKERS.
+            client: The MLflow client to upload with. Defaults to a client for the
+                current tracking URI.
+        """
+        # mlflow is slow to import, so defer it until an upload is needed
+        from mlflow.tracking import MlflowClient
+
+        self._run_id = run_id
+        self._client = client if client is not None else MlflowClient()
+        self._artifact_uri = self._client.get_run(run_id).info.artifact_uri
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="artifact-upload"
+        )
+        self._futures: list[Future[UploadedArtifact]] = []
+
+    def __enter__(self) -> "ArtifactUploader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def submit(self, artifact: ArtifactOutputEntry) -> None:
+        """Queue an artifact for upload.
+
+        Args:
+            artifact: The artifact output entry produced by the task engine.
+        """
+        self._futures.append(self._executor.submit(self._upload, artifact))
+
+    def wait(self) -> list[UploadedArtifact]:
+        """Wait for all queued uploads to finish.
+
+        Returns:
+            The uploaded artifacts, in the order they were submitted.
+
+        Raises:
+            Exception: The error raised by the first failed upload.
+        """
+        return [future.result() for future in self._futures]
+
+    def _upload(self, artifact: ArtifactOutputEntry) -> UploadedArtifact:
+        from mlflow.utils.uri import append_to_uri_path
+
+        local_path = Path(artifact["path"])
+        artifact_path = f"{artifact['name']}/{PurePosixPath(artifact['path']).name}"
+
+        # keep directory artifacts as directories
+        if local_path.is_dir():
+            self._client.log_artifacts(
+                self._run_id, local_dir=str(local_path), artifact_path=artifact_path
+            )
+
+        else:
+            self._client.log_artifact(
+                self._run_id, local_path=str(local_path), artifact_path=artifact["name"]
+            )
+
+        LOGGER.debug("Artifact uploaded", name=artifact["name"], path=artifact_path)
+
+        return UploadedArtifact(
+            artifact=artifact,
+            uri=append_to_uri_path(self._artifact_uri, artifact_path),
+        )
@@ -14,9 +14,19 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
+"""Authenticated Dioptra clients for code running on a worker.
+
+Each call to get_authenticated_worker_client() outside of a job builds a new client
+and logs in. Within a job, run_dioptra_job seeds a job-scoped registry with its
+authenticated client using share_worker_client(), and the plugins of the job reuse
+that client and its connection pool instead of logging in again.
+"""
+
 import logging
 import os
-from typing import Any, Final, Literal
+import threading
+from contextlib import contextmanager
+from typing import Any, Final, Iterator, Literal
 
 from structlog.stdlib import BoundLogger
 
@@ -26,30 +36,137 @@ from dioptra.client import (
     connect_response_dioptra_client,
 )
 from dioptra.client.base import DioptraResponseProtocol
+from dioptra.client.sessions import (
+    BaseDioptraRequestsSession,
+    DioptraRequestsSession,
+    DioptraRequestsSessionJson,
+)
 
 ENV_DIOPTRA_API: Final[str] = "DIOPTRA_API"
 ENV_DIOPTRA_WORKER_USERNAME: Final[str] = "DIOPTRA_WORKER_USERNAME"
 ENV_DIOPTRA_WORKER_PASSWORD: Final[str] = "DIOPTRA_WORKER_PASSWORD"
+ENV_DIOPTRA_WORKER_TOKEN: Final[str] = "DIOPTRA_WORKER_TOKEN"
+
+ClientType = Literal["json", "response"]
+WorkerClient = DioptraClient[DioptraResponseProtocol] | DioptraClient[dict[str, Any]]
+
+# The authenticated clients of the running job, by client type
+_worker_clients: dict[str, WorkerClient] = {}
+_worker_clients_lock = threading.Lock()
 
 
 def get_authenticated_worker_client(
     log: logging.Logger | BoundLogger,
-    client_type: Literal["json", "response"] = "response",
-) -> DioptraClient[DioptraResponseProtocol] | DioptraClient[dict[str, Any]]:
-    if (username := os.getenv(ENV_DIOPTRA_WORKER_USERNAME)) is None:
-        log.error(f"{ENV_DIOPTRA_WORKER_USERNAME} environment variable is not set")
-        raise ValueError(
-            f"{ENV_DIOPTRA_WORKER_USERNAME} environment variable is not set"
-        )
-
-    if (password := os.getenv(ENV_DIOPTRA_WORKER_PASSWORD)) is None:
-        log.error(f"{ENV_DIOPTRA_WORKER_PASSWORD} environment variable is not set")
-        raise ValueError(
-            f"{ENV_DIOPTRA_WORKER_PASSWORD} environment variable is not set"
-        )
+    client_type: ClientType = "response",
+) -> WorkerClient:
+    """Get a Dioptra client that is authenticated as the worker.
+
+    Within a job, the client shared by share_worker_client() is returned. A client of
+    the other type shares its connection and authentication. Outside of a job, a new
+    client is built and authenticated using the DIOPTRA_WORKER_TOKEN environment
+    variable, or the DIOPTRA_WORKER_USERNAME and DIOPTRA_WORKER_PASSWORD environment
+    variables if no token is set.
+
+    Args:
+        log: The logger to use for reporting errors.
+        client_type: Whether the client returns JSON-like dictionaries ("json") or
+            response objects ("response"). Defaults to "response".
+
+    Returns:
+        An authenticated Dioptra client.
+
+    Raises:
+        ValueError: If a new client is needed and the environment variables for the
+            API address or the worker's credentials are not set.
+    """
+    with _worker_clients_lock:
+        client = _worker_clients.get(client_type)
+
+        if client is None and _worker_clients:
+            client = _share_client(next(iter(_worker_clients.values())), client_type)
+            _worker_clients[client_type] = client
+
+    if client is not None:
+        return client
+
+    return _login_worker_client(log, client_type)
+
+
+@contextmanager
+def share_worker_client(
+    client: WorkerClient, client_type: ClientType
+) -> Iterator[WorkerClient]:
+    """Share an authenticated client with the code running within a job.
+
+    While the context is active, get_authenticated_worker_client() returns the
+    client instead of logging in again. If a client is already shared, it is kept
+    and the given client is not used.
+
+    Args:
+        client: An authenticated Dioptra client.
+        client_type: The type of the client, either "json" or "response".
+
+    Yields:
+        The shared client of the given type.
+    """
+    with _worker_clients_lock:
+        previous = dict(_worker_clients)
+
+        if not _worker_clients:
+            _worker_clients[client_type] = client
+
+    try:
+        yield get_authenticated_worker_client(logging.getLogger(__name__), client_type)
+
+    finally:
+        with _worker_clients_lock:
+            _worker_clients.clear()
+            _worker_clients.update(previous)
+
+
+def _share_client(source: WorkerClient, client_type: ClientType) -> WorkerClient:
+    """Build a client of the given type that shares the connection of a client."""
+    if not isinstance(source.session, BaseDioptraRequestsSession):
+        raise TypeError("The shared worker client does not use a requests session.")
+
+    session: DioptraRequestsSessionJson | DioptraRequestsSession
+    client: WorkerClient
+
+    if client_type == "json":
+        session = DioptraRequestsSessionJson(source.session.url)
+        client = DioptraClient[dict[str, Any]](session=session)
+    else:
+        session = DioptraRequestsSession(source.session.url)
+        client = DioptraClient[DioptraResponseProtocol](session=session)
+
+    session.share_connection(source.session)
+    return client
+
+
+def _login_worker_client(
+    log: logging.Logger | BoundLogger, client_type: ClientType
+) -> WorkerClient:
+    """Build a new client and authenticate it as the worker."""
+    credentials: tuple[str, str] | None = None
+
+    # Prefer an API token, which avoids the password check a login requires
+    if (token := os.getenv(ENV_DIOPTRA_WORKER_TOKEN)) is None:
+        if (username := os.getenv(ENV_DIOPTRA_WORKER_USERNAME)) is None:
+            log.error(f"{ENV_DIOPTRA_WORKER_USERNAME} environment variable is not set")
+            raise ValueError(
+                f"{ENV_DIOPTRA_WORKER_USERNAME} environment variable is not set"
+            )
+
+        if (password := os.getenv(ENV_DIOPTRA_WORKER_PASSWORD)) is None:
+            log.error(f"{ENV_DIOPTRA_WORKER_PASSWORD} environment variable is not set")
+            raise ValueError(
+                f"{ENV_DIOPTRA_WORKER_PASSWORD} environment variable is not set"
+            )
+
+        credentials = (username, password)
 
     # Instantiate a Dioptra client and login using worker's authentication details
-    client: DioptraClient[DioptraResponseProtocol] | DioptraClient[dict[str, Any]]
+    client: WorkerClient
     try:
         if client_type == "json":
             client = connect_json_dioptra_client()
@@ -60,6 +177,10 @@ def get_authenticated_worker_client(
         log.error(f"{ENV_DIOPTRA_API} environment variable is not set")
         raise ValueError(f"{ENV_DIOPTRA_API} environment variable is not set") from None
 
-    client.auth.login(username=username, password=password)
+    if credentials is None:
+        client.auth.use_token(token)
+
+    else:
+        client.auth.login(username=credentials[0], password=credentials[1])
 
     return client
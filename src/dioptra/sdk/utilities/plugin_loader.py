@@ -0,0 +1,212 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Load artifact task plugins into an isolated import namespace.
+
+Each artifact plugin snapshot is imported once, as a package named after the
+snapshot under the ARTIFACT_PLUGINS_PACKAGE namespace, for example::
+
+    dioptra_artifact_plugins.p3_17
+
+The packages are found by a meta path finder instead of through sys.path. Plugins
+with the same name but different snapshots, such as a plugin used to serialize the
+job's artifacts and an older snapshot used to deserialize an artifact parameter, can
+therefore be loaded side by side. Modules within a plugin must import each other
+using relative imports.
+"""
+
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType, TracebackType
+from typing import Final, Sequence, Type
+
+from dioptra.sdk.api.artifact import ArtifactTaskInterface
+
+ARTIFACT_PLUGINS_PACKAGE: Final[str] = "dioptra_artifact_plugins"
+
+
+def get_artifact_plugin_package_name(plugin_id: int, plugin_snapshot_id: int) -> str:
+    """Get the name of the package that an artifact plugin snapshot is imported as.
+
+    Args:
+        plugin_id: The id of the plugin.
+        plugin_snapshot_id: The snapshot id of the plugin.
+
+    Returns:
+        The fully qualified name of the package.
+    """
+    return f"{ARTIFACT_PLUGINS_PACKAGE}.p{plugin_id}_{plugin_snapshot_id}"
+
+
+class _ArtifactPluginFinder(importlib.abc.MetaPathFinder):
+    """A finder for the artifact plugin packages registered with a loader.
+
+    The finder only resolves the namespace package and the plugin packages. The
+    modules within a plugin package are found through the package's __path__.
+    """
+
+    def __init__(self) -> None:
+        self.paths: dict[str, Path] = {}
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> importlib.machinery.ModuleSpec | None:
+        if fullname == ARTIFACT_PLUGINS_PACKAGE:
+            spec = importlib.machinery.ModuleSpec(fullname, None, is_package=True)
+            spec.submodule_search_locations = []
+            return spec
+
+        plugin_dir = self.paths.get(fullname)
+
+        if plugin_dir is None:
+            return None
+
+        init_file = plugin_dir / "__init__.py"
+
+        if init_file.exists():
+            return importlib.util.spec_from_file_location(
+                fullname, init_file, submodule_search_locations=[str(plugin_dir)]
+            )
+
+        spec = importlib.machinery.ModuleSpec(fullname, None, is_package=True)
+        spec.submodule_search_locations = [str(plugin_dir)]
+        return spec
+
+
+class ArtifactPluginLoader(object):
+    """Imports artifact plugin snapshots once and caches their artifact tasks.
+
+    Use the loader as a context manager. Its finder is installed when entering the
+    context. When exiting, the finder is removed and the plugin modules imported by
+    this loader are unloaded. Modules imported by other loaders are left in place.
+    """
+
+    def __init__(self) -> None:
+        self._finder = _ArtifactPluginFinder()
+        self._tasks: dict[tuple[str, str, str], Type[ArtifactTaskInterface] | None] = {}
+        self._modules: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ArtifactPluginLoader":
+        sys.meta_path.insert(0, self._finder)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the finder and unload the plugin modules this loader imported."""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+        for name in self._modules:
+            sys.modules.pop(name, None)
+
+        # The namespace package is shared by all loaders, so it is only unloaded
+        # once no other loader can import into it
+        if not any(
+            isinstance(finder, _ArtifactPluginFinder) for finder in sys.meta_path
+        ):
+            sys.modules.pop(ARTIFACT_PLUGINS_PACKAGE, None)
+
+        self._finder.paths.clear()
+        self._modules.clear()
+        self._tasks.clear()
+
+    def add_plugin(self, plugin_id: int, plugin_snapshot_id: int, path: Path) -> None:
+        """Register the directory that holds an artifact plugin snapshot.
+
+        A snapshot that is already registered keeps its first directory, so each
+        snapshot is imported only once.
+
+        Args:
+            plugin_id: The id of the plugin.
+            plugin_snapshot_id: The snapshot id of the plugin.
+            path: The directory containing the plugin's files.
+        """
+        package_name = get_artifact_plugin_package_name(plugin_id, plugin_snapshot_id)
+        self._finder.paths.setdefault(package_name, path.resolve())
+
+    def get_task(
+        self,
+        plugin_id: int,
+        plugin_snapshot_id: int,
+        filename: str,
+        task_name: str,
+    ) -> Type[ArtifactTaskInterface] | None:
+        """Get an artifact task class from a registered artifact plugin snapshot.
+
+        Args:
+            plugin_id: The id of the plugin.
+            plugin_snapshot_id: The snapshot id of the plugin.
+            filename: The name of the plugin file that defines the task, with or
+                without the ".py" suffix.
+            task_name: The name of the artifact task.
+
+        Returns:
+            The artifact task class, or None if the plugin file does not define an
+            artifact task with the given name.
+
+        Raises:
+            ModuleNotFoundError: If the plugin snapshot is not registered or the
+                plugin file does not exist.
+        """
+        package_name = get_artifact_plugin_package_name(plugin_id, plugin_snapshot_id)
+        module_name = f"{package_name}.{Path(filename).stem}"
+        key = (package_name, module_name, task_name)
+
+        with self._lock:
+            if key not in self._tasks:
+                if package_name not in self._finder.paths:
+                    raise ModuleNotFoundError(
+                        f"Artifact plugin snapshot is not registered: {package_name}",
+                        name=package_name,
+                    )
+
+                loaded = set(sys.modules)
+                module = importlib.import_module(module_name)
+                self._modules.update(
+                    name
+                    for name in sys.modules.keys() - loaded
+                    if self._is_plugin_module(name)
+                )
+                task = getattr(module, task_name, None)
+                self._tasks[key] = (
+                    task
+                    if isinstance(task, type)
+                    and issubclass(task, ArtifactTaskInterface)
+                    else None
+                )
+
+            return self._tasks[key]
+
+    def _is_plugin_module(self, name: str) -> bool:
+        """Check whether a module belongs to a plugin registered with this loader."""
+        package_name = ".".join(name.split(".", 2)[:2])
+        return package_name in self._finder.paths
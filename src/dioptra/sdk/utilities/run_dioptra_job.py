@@ -24,24 +24,29 @@ from typing import (
     Any,
     Final,
     Iterable,
+    Iterator,
     Mapping,
     MutableMapping,
     cast,
 )
 
-import mlflow
 import structlog
 import yaml
 from structlog.stdlib import BoundLogger
 
-from dioptra.client import DioptraClient, connect_json_dioptra_client
+from dioptra.client import DioptraClient
 from dioptra.client.base import StatusCodeError
 from dioptra.client.utils import FileTypes
 from dioptra.sdk.api.artifact import ArtifactTaskInterface
-from dioptra.sdk.utilities.contexts import env_vars, import_temp
+from dioptra.sdk.utilities.artifact_uploader import ArtifactUploader, UploadedArtifact
+from dioptra.sdk.utilities.auth_client import (
+    get_authenticated_worker_client,
+    share_worker_client,
+)
+from dioptra.sdk.utilities.contexts import env_vars
+from dioptra.sdk.utilities.plugin_loader import ArtifactPluginLoader
 from dioptra.task_engine.issues import IssueSeverity
 from dioptra.task_engine.task_engine import (
-    ArtifactOutputEntry,
     ArtifactTaskEntry,
     run_experiment,
 )
@@ -50,9 +55,6 @@ from dioptra.task_engine.validation import SCHEMA_FILENAME, get_json_schema, val
 LOGGER: BoundLogger = structlog.stdlib.get_logger()
 
 DIOPTRA_JOB_ID: Final[str] = "dioptra.jobId"
-ENV_DIOPTRA_API: Final[str] = "DIOPTRA_API"
-ENV_DIOPTRA_WORKER_USERNAME: Final[str] = "DIOPTRA_WORKER_USERNAME"
-ENV_DIOPTRA_WORKER_PASSWORD: Final[str] = "DIOPTRA_WORKER_PASSWORD"
 ENV_MLFLOW_S3_ENDPOINT_URL: Final[str] = "MLFLOW_S3_ENDPOINT_URL"
 ENV_MLFLOW_TRACKING_URI: Final[str] = "MLFLOW_TRACKING_URI"
 
@@ -106,16 +108,21 @@ def standalone() -> None:
 
     job_yaml = _load_job_yaml(context.yaml_path(entrypoint_name))
     _validate_yaml(job_yaml, log)
-    _run_job(
-        context=context,
-        job_parameters=_load_json(context.parameters_file),
-        job_yaml=job_yaml,
-        artifact_parameters=_load_json(context.artifact_parameters_file),
-        artifact_tasks=_build_artifact_tasks(
-            context=context, plugins=_load_json(context.artifact_plugins_file), log=log
-        ),
-        log=log,
-    )
+    artifact_plugins = _load_json(context.artifact_plugins_file)
+
+    with ArtifactPluginLoader() as plugin_loader:
+        _add_artifact_plugins(context, artifact_plugins, plugin_loader)
+        _run_job(
+            context=context,
+            job_parameters=_load_json(context.parameters_file),
+            job_yaml=job_yaml,
+            artifact_parameters=_load_json(context.artifact_parameters_file),
+            artifact_tasks=_build_artifact_tasks(
+                plugins=artifact_plugins, plugin_loader=plugin_loader, log=log
+            ),
+            plugin_loader=plugin_loader,
+            log=log,
+        )
 
 
 def main(
@@ -128,9 +135,29 @@ def main(
 
     context.mkdirs()
 
-    # obtain a connection to the dioptra REST API
-    dioptra_client = _get_client(log)
+    # obtain a connection to the dioptra REST API, which the job's plugins share
+    with (
+        share_worker_client(_get_client(log), "json") as dioptra_client,
+        ArtifactPluginLoader() as plugin_loader,
+    ):
+        _run_main(
+            job_id=job_id,
+            experiment_id=experiment_id,
+            context=context,
+            dioptra_client=cast(DioptraClient[dict[str, Any]], dioptra_client),
+            plugin_loader=plugin_loader,
+            log=log,
+        )
 
+
+def _run_main(
+    job_id: int,
+    experiment_id: int,
+    context: Context,
+    dioptra_client: DioptraClient[dict[str, Any]],
+    plugin_loader: ArtifactPluginLoader,
+    log: BoundLogger,
+) -> None:
     try:
         # Set Dioptra Job status to "started"
         dioptra_client.experiments.jobs.set_status(
@@ -181,7 +208,13 @@ def main(
         )
 
         _save_as_json(context.artifact_plugins_file, params=artifact_plugins)
-        _create_engine_schema(context=context, plugins=artifact_plugins, log=log)
+        _add_artifact_plugins(context, artifact_plugins, plugin_loader)
+        _create_engine_schema(
+            context=context,
+            plugins=artifact_plugins,
+            plugin_loader=plugin_loader,
+            log=log,
+        )
         _validate_yaml(job_yaml, log)
 
         # now download plugin-ins
@@ -221,8 +254,9 @@ def main(
             job_parameters=job_parameters,
             artifact_parameters=artifact_params,
             artifact_tasks=_build_artifact_tasks(
-                context=context, plugins=artifact_plugins, log=log
+                plugins=artifact_plugins, plugin_loader=plugin_loader, log=log
             ),
+            plugin_loader=plugin_loader,
             logger=log,
         )
     except Exception as e:
@@ -238,29 +272,10 @@ def main(
 
 
 def _get_client(log: BoundLogger) -> DioptraClient[dict[str, Any]]:
-    if (username := os.getenv(ENV_DIOPTRA_WORKER_USERNAME)) is None:
-        log.error(f"{ENV_DIOPTRA_WORKER_USERNAME} environment variable is not set")
-        raise ValueError(
-            f"{ENV_DIOPTRA_WORKER_USERNAME} environment variable is not set"
-        )
-
-    if (password := os.getenv(ENV_DIOPTRA_WORKER_PASSWORD)) is None:
-        log.error(f"{ENV_DIOPTRA_WORKER_PASSWORD} environment variable is not set")
-        raise ValueError(
-            f"{ENV_DIOPTRA_WORKER_PASSWORD} environment variable is not set"
-        )
-
-    # Instantiate a Dioptra client and login using worker's authentication details
-    try:
-        client = connect_json_dioptra_client()
-
-    except ValueError:
-        log.error(f"{ENV_DIOPTRA_API} environment variable is not set")
-        raise ValueError(f"{ENV_DIOPTRA_API} environment variable is not set") from None
-
-    client.auth.login(username=username, password=password)
-
-    return client
+    # need to cast because return type can't be inferred at runtime
+    return cast(
+        DioptraClient[dict[str, Any]], get_authenticated_worker_client(log, "json")
+    )
 
 
 def _validate_environment(log: BoundLogger) -> None:
@@ -328,32 +343,28 @@ def _register_artifacts(
     group_id: int,
     job_id: int,
     dioptra_client: DioptraClient[dict[str, Any]],
-    artifact_results_file: Path,
+    uploaded_artifacts: list[UploadedArtifact],
 ) -> None:
-    # load up the artifacts.json file
-    artifacts: list[ArtifactOutputEntry] = []
-    if artifact_results_file.exists():
-        artifacts = cast(
-            list[ArtifactOutputEntry],
-            _load_json(filepath=artifact_results_file).get("artifacts", []),
-        )
-    for artifact in artifacts:
-        artifact_path_name = PurePosixPath(artifact["path"]).name
-        # add artifact to mlflow
-        mlflow.log_artifact(local_path=artifact["path"], artifact_path=artifact["name"])
-        uri = mlflow.get_artifact_uri(f"{artifact['name']}/{artifact_path_name}")
-        # add artifact to dioptra_client
-        dioptra_client.artifacts.create(
-            group_id=group_id,
-            job_id=job_id,
-            artifact_uri=uri,
-            plugin_snapshot_id=artifact["task_plugin_snapshot_id"],
-            task_id=artifact["task_id"],
-            description=(
-                f"Artifact, {artifact['name']}, generated and stored as part of job, "
-                f"{job_id}"
-            ),
-        )
+    if not uploaded_artifacts:
+        return None
+
+    # register all of the job's artifacts with a single request
+    dioptra_client.artifacts.create_batch(
+        group_id=group_id,
+        job_id=job_id,
+        artifacts=[
+            {
+                "artifact_uri": uploaded["uri"],
+                "plugin_snapshot_id": uploaded["artifact"]["task_plugin_snapshot_id"],
+                "task_id": uploaded["artifact"]["task_id"],
+                "description": (
+                    f"Artifact, {uploaded['artifact']['name']}, generated and stored "
+                    f"as part of job, {job_id}"
+                ),
+            }
+            for uploaded in uploaded_artifacts
+        ],
+    )
 
 
 def _run_job(
@@ -362,6 +373,7 @@ def _run_job(
     job_parameters: MutableMapping[str, Any],
     artifact_parameters: MutableMapping[str, Any],
     artifact_tasks: dict[str, ArtifactTaskEntry],
+    plugin_loader: ArtifactPluginLoader,
     log: BoundLogger,
 ) -> None:
     """Run the job.
@@ -384,6 +396,7 @@ def _run_job(
             plugins_dir=context.plugins_dir,
             serialize_dir=context.serialize_dir,
             deserialize_dir=context.deserialize_dir,
+            plugin_loader=plugin_loader,
         )
 
         log.info("=== Run succeeded ===")
@@ -403,6 +416,7 @@ def _run_tracked_job(
     job_parameters: MutableMapping[str, Any],
     artifact_parameters: MutableMapping[str, Any],
     artifact_tasks: dict[str, ArtifactTaskEntry],
+    plugin_loader: ArtifactPluginLoader,
     logger: BoundLogger,
 ) -> None:
     """Run the job and start tracking the run in MLflow tracking server.
@@ -416,6 +430,9 @@ def _run_tracked_job(
         logger: A structlog logger instance. If not provided, a new logger
             will be created
     """
+    # mlflow takes over a second to import, so only import it when tracking a run
+    import mlflow
+
     active_run = mlflow.start_run()
 
     try:
@@ -427,8 +444,12 @@ def _run_tracked_job(
         mlflow.log_params(cast(dict[str, Any], job_parameters))
 
         # plug-ins might need the job id for things like metrics
-        # should consider an alternate way to enable this functionality in the future
-        with env_vars({"__JOB_ID": str(job_id)}):
+        # should consider an alternate way to enable this functionality in the future.
+        # Artifacts start uploading as soon as they are serialized.
+        with (
+            env_vars({"__JOB_ID": str(job_id)}),
+            ArtifactUploader(run_id=active_run.info.run_id) as uploader,
+        ):
             run_experiment(
                 experiment_desc=job_yaml,
                 global_parameters=job_parameters,
@@ -438,12 +459,16 @@ def _run_tracked_job(
                 plugins_dir=context.plugins_dir,
                 serialize_dir=context.serialize_dir,
                 deserialize_dir=context.deserialize_dir,
+                plugin_loader=plugin_loader,
+                on_artifact=uploader.submit,
             )
+            uploaded_artifacts = uploader.wait()
+
         _register_artifacts(
             group_id=group_id,
             job_id=job_id,
             dioptra_client=dioptra_client,
-            artifact_results_file=context.artifacts_results_file,
+            uploaded_artifacts=uploaded_artifacts,
         )
         logger.info("=== Run succeeded ===")
         mlflow.end_run()
@@ -454,73 +479,79 @@ def _run_tracked_job(
         raise e
 
 
+def _add_artifact_plugins(
+    context: Context,
+    plugins: Iterable[dict[str, Any]],
+    plugin_loader: ArtifactPluginLoader,
+) -> None:
+    for plugin in plugins:
+        plugin_loader.add_plugin(
+            plugin_id=plugin["id"],
+            plugin_snapshot_id=plugin["snapshotId"],
+            path=context.serialize_dir / plugin["name"],
+        )
+
+
+def _iter_artifact_tasks(
+    plugins: Iterable[dict[str, Any]],
+    plugin_loader: ArtifactPluginLoader,
+    log: BoundLogger,
+) -> Iterator[tuple[dict[str, Any], dict[str, Any], type[ArtifactTaskInterface]]]:
+    # run through the artifact plugins, which the loader imports only once
+    for plugin in plugins:
+        for file in plugin["files"]:
+            for artifact_task in file["tasks"]["artifacts"]:
+                task = plugin_loader.get_task(
+                    plugin_id=plugin["id"],
+                    plugin_snapshot_id=plugin["snapshotId"],
+                    filename=file["filename"],
+                    task_name=artifact_task["name"],
+                )
+                if task is None:
+                    log.error(
+                        f"Failed to locate artifact task: {artifact_task['name']}"
+                    )
+                    exit(1)
+                yield plugin, artifact_task, task
+
+
 def _build_artifact_tasks(
-    context: Context, plugins: Iterable[dict[str, Any]], log: BoundLogger
+    plugins: Iterable[dict[str, Any]],
+    plugin_loader: ArtifactPluginLoader,
+    log: BoundLogger,
 ) -> dict[str, ArtifactTaskEntry]:
     result: dict[str, ArtifactTaskEntry] = {}
 
-    # run through the artifact plugins
-    for plugin in plugins:
-        plugin_name: str = plugin["name"]
-        for file in plugin["files"]:
-            filename = Path(file["filename"]).stem
-            # only temporarily import - might clash with deserialization
-            with import_temp(
-                f"{plugin_name}.{filename}", context.serialize_dir
-            ) as plugin_file:
-                for artifact_task in file["tasks"]["artifacts"]:
-                    task = getattr(plugin_file, artifact_task["name"], None)
-                    if task is None:
-                        log.error(
-                            f"Failed to locate artifact task: {artifact_task['name']}"
-                        )
-                        exit(1)
-                    if issubclass(task, ArtifactTaskInterface):
-                        result[task.__name__] = ArtifactTaskEntry(
-                            task=task,
-                            plugin_snapshot_id=plugin["snapshotId"],
-                            task_id=artifact_task["id"],
-                        )
+    for plugin, artifact_task, task in _iter_artifact_tasks(
+        plugins, plugin_loader, log
+    ):
+        result[task.__name__] = ArtifactTaskEntry(
+            task=task,
+            plugin_snapshot_id=plugin["snapshotId"],
+            task_id=artifact_task["id"],
+        )
     return result
 
 
 def _create_engine_schema(
-    context: Context, plugins: Iterable[dict[str, Any]], log: BoundLogger
+    context: Context,
+    plugins: Iterable[dict[str, Any]],
+    plugin_loader: ArtifactPluginLoader,
+    log: BoundLogger,
 ) -> None:
     task_names = []
     allof = []
-    # run through the artifact plugins
-    for plugin in plugins:
-        plugin_name: str = plugin["name"]
-        for file in plugin["files"]:
-            filename = Path(file["filename"]).stem
-            # only temporarily import - might clash with deserialization
-            with import_temp(
-                f"{plugin_name}.{filename}", context.serialize_dir
-            ) as plugin_file:
-                for artifact_task in file["tasks"]["artifacts"]:
-                    task = getattr(plugin_file, artifact_task["name"], None)
-                    if task is None:
-                        log.error(
-                            f"Failed to locate artifact task: {artifact_task['name']}"
-                        )
-                        exit(1)
-                    if issubclass(task, ArtifactTaskInterface):
-                        task_names.append(task.__name__)
-                        validation = task.validation()
-                        if validation is not None:
-                            allof.append(
-                                {
-                                    "if": {
-                                        "properties": {"name": {"const": task.__name__}}
-                                    },
-                                    "then": {
-                                        "properties": {
-                                            "args": {"properties": validation}
-                                        }
-                                    },
-                                }
-                            )
+
+    for _, _, task in _iter_artifact_tasks(plugins, plugin_loader, log):
+        task_names.append(task.__name__)
+        validation = task.validation()
+        if validation is not None:
+            allof.append(
+                {
+                    "if": {"properties": {"name": {"const": task.__name__}}},
+                    "then": {"properties": {"args": {"properties": validation}}},
+                }
+            )
     # create final validation schema
     engine_schema = get_json_schema(default=True)
     engine_schema["$defs"]["artifact_task"]["properties"]["name"]["enum"] = task_names
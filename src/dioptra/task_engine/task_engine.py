@@ -18,8 +18,10 @@ import collections
 import itertools
 import json
 import logging
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path, PurePosixPath
+from types import TracebackType
 from typing import Any, NotRequired, Type, TypedDict, Union, cast
 
 import dioptra.pyplugs
@@ -36,7 +38,8 @@ from dioptra.sdk.exceptions.task_engine import (
     TaskPluginNotFoundError,
     UnresolvableReferenceError,
 )
-from dioptra.sdk.utilities.contexts import import_temp, sys_path_dirs
+from dioptra.sdk.utilities.contexts import sys_path_dirs
+from dioptra.sdk.utilities.plugin_loader import ArtifactPluginLoader
 from dioptra.task_engine import util
 
 
@@ -529,6 +532,7 @@ def _load_artifact_parameters(
     deserialize_dir: Path,
     artifacts_dir: Path,
     artifact_parameters: MutableMapping[str, Any],
+    plugin_loader: ArtifactPluginLoader,
 ) -> dict[str, Any]:
     log = _get_logger()
 
@@ -539,57 +543,64 @@ def _load_artifact_parameters(
         task_info = info["artifact_task"]
         plugin_name = f"{task_info['plugin_id']}_{task_info['plugin_snapshot_id']}"
         outputs = task_info["outputs"]
-        file_name = Path(task_info["file_name"])
-        with import_temp(
-            f"{plugin_name}.{file_name.stem}", deserialize_dir
-        ) as artifact_task:
-            task = cast(
-                ArtifactTaskInterface | None,
-                getattr(artifact_task, task_info["task_name"], None),
+        # the loader imports each plugin snapshot once, reusing the snapshots that
+        # were loaded to serialize the job's artifacts
+        plugin_loader.add_plugin(
+            plugin_id=task_info["plugin_id"],
+            plugin_snapshot_id=task_info["plugin_snapshot_id"],
+            path=deserialize_dir / plugin_name,
+        )
+        task = plugin_loader.get_task(
+            plugin_id=task_info["plugin_id"],
+            plugin_snapshot_id=task_info["plugin_snapshot_id"],
+            filename=task_info["file_name"],
+            task_name=task_info["task_name"],
+        )
+        if task is None:
+            log.error(
+                f"Failed to locate artifact task: {task_info['task_name']} in "
+                f"plugin: {plugin_name} for artifact parameter: {name}"
             )
-            if task is None:
-                log.error(
-                    f"Failed to locate artifact task: {task_info['task_name']} in "
-                    f"plugin: {plugin_name} for artifact parameter: {name}"
+            exit(1)
+        uri_name = PurePosixPath(info["artifact_uri"]).name
+        value = task.deserialize(
+            working_dir=artifacts_dir / artifact_dir, path=uri_name
+        )
+        result[name] = {}
+        num_expected_outputs = len(outputs)
+        if num_expected_outputs == 1:
+            result[name][outputs[0]["name"]] = value
+        else:
+            # Task plugin return value must be iterable.
+            if not util.is_iterable(value):
+                raise NonIterableTaskOutputError(value, f"artifacts.{name}")
+
+            # Support more general iterables as return values from tasks, which may
+            # not be len()-able.  If we can get a length, then we can sanity check
+            # the number of output names given against the number of output values
+            # produced by the task, and produce a warning if they don't match.
+            try:
+                num_outputs = len(value)
+            except TypeError:
+                num_outputs = None
+
+            if num_outputs is not None and num_outputs != num_expected_outputs:
+                log.warning(
+                    "Different numbers of outputs and expected outputs for "
+                    'artifact parameter "%s": %d != %d',
+                    name,
+                    num_outputs,
+                    num_expected_outputs,
                 )
-                exit(1)
-            uri_name = PurePosixPath(info["artifact_uri"]).name
-            value = value = task.deserialize(
-                working_dir=artifacts_dir / artifact_dir, path=uri_name
-            )
-            result[name] = {}
-            num_expected_outputs = len(outputs)
-            if num_expected_outputs == 1:
-                result[name][outputs[0]["name"]] = value
-            else:
-                # Task plugin return value must be iterable.
-                if not util.is_iterable(value):
-                    raise NonIterableTaskOutputError(value, f"artifacts.{name}")
-
-                # Support more general iterables as return values from tasks, which may
-                # not be len()-able.  If we can get a length, then we can sanity check
-                # the number of output names given against the number of output values
-                # produced by the task, and produce a warning if they don't match.
-                try:
-                    num_outputs = len(value)
-                except TypeError:
-                    num_outputs = None
-
-                if num_outputs is not None and num_outputs != num_expected_outputs:
-                    log.warning(
-                        "Different numbers of outputs and expected outputs for "
-                        'artifact parameter "%s": %d != %d',
-                        name,
-                        num_outputs,
-                        num_expected_outputs,
-                    )
-                for param, output_value in zip(outputs, value):
-                    result[name][param["name"]] = output_value
+            for param, output_value in zip(outputs, value):
+                result[name][param["name"]] = output_value
 
     return result
 
 
-def _run_steps(context: EngineContext) -> None:
+def _run_steps(
+    context: EngineContext, on_step: Callable[[str], None] | None = None
+) -> None:
     log = _get_logger()
     step_order = context.get_ordered_steps()
     log.debug("Step order:\n  %s", "\n  ".join(step_order))
@@ -623,33 +634,128 @@ def _run_steps(context: EngineContext) -> None:
                 e.context_step_name = step_name
             raise
 
+        if on_step is not None:
+            on_step(step_name)
 
-def _handle_artifacts(
-    artifacts: dict[str, ArtifactNode],
+
+def _serialize_artifact(
+    name: str,
+    artifact: ArtifactNode,
+    contents: Any,
     context: EngineContext,
-) -> list[ArtifactOutputEntry]:
-    result: list[ArtifactOutputEntry] = []
-    for name, artifact in artifacts.items():
-        contents = _resolve_task_parameter_value(artifact["contents"], context)
-        task_name = artifact["task"]["name"]
-        # search through plug-ins to find the correct artifact task based on the name
-        entry = context.find_artifact_task(task_name)
-        args: dict[str, Any] = {}
-        if "args" in artifact["task"]:
-            args = artifact["task"]["args"]
-
-        path = entry["task"].serialize(Path.cwd(), name, contents, **args)
-
-        result.append(
-            ArtifactOutputEntry(
-                name=name,
-                task_plugin_snapshot_id=entry["plugin_snapshot_id"],
-                task_id=entry["task_id"],
-                path=path.as_posix(),
-            )
+    on_artifact: Callable[[ArtifactOutputEntry], None] | None = None,
+) -> ArtifactOutputEntry:
+    task_name = artifact["task"]["name"]
+    # search through plug-ins to find the correct artifact task based on the name
+    entry = context.find_artifact_task(task_name)
+    args: dict[str, Any] = {}
+    if "args" in artifact["task"]:
+        args = artifact["task"]["args"]
+
+    path = entry["task"].serialize(Path.cwd(), name, contents, **args)
+    output = ArtifactOutputEntry(
+        name=name,
+        task_plugin_snapshot_id=entry["plugin_snapshot_id"],
+        task_id=entry["task_id"],
+        path=path.as_posix(),
+    )
+
+    # hand off the artifact, e.g. to start uploading it, before serializing the
+    # next one
+    if on_artifact is not None:
+        on_artifact(output)
+
+    return output
+
+
+class _ArtifactSerializer(object):
+    """
+    Serializes artifact outputs on a background thread while the steps run.
+    Each artifact is serialized as soon as the steps it depends on are done,
+    see util.get_artifact_steps().  The serializer is a context manager;
+    leaving the context waits for the serialization in progress to finish, and
+    cancels the queued ones if the context exits with an exception.
+    """
+
+    def __init__(
+        self,
+        artifacts: dict[str, ArtifactNode],
+        context: EngineContext,
+        on_artifact: Callable[[ArtifactOutputEntry], None] | None = None,
+    ):
+        self._artifacts = artifacts
+        self._context = context
+        self._on_artifact = on_artifact
+        self._waiting_on = util.get_artifact_steps(artifacts, context.graph)
+        self._futures: dict[str, Future[ArtifactOutputEntry]] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="artifact-serialize"
         )
 
-    return result
+    def __enter__(self) -> "_ArtifactSerializer":
+        # artifacts which don't depend on any step can be serialized right away
+        self._submit_ready()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+
+    def step_done(self, step_name: str) -> None:
+        """
+        Record that a step has run, and queue the artifacts that no longer
+        wait on any step.
+
+        Args:
+            step_name: The name of the step which has run
+        """
+        for steps in self._waiting_on.values():
+            steps.discard(step_name)
+
+        self._submit_ready()
+
+    def wait(self) -> list[ArtifactOutputEntry]:
+        """
+        Wait for all artifacts to be serialized.
+
+        Returns:
+            The artifact output entries, in artifact definition order
+
+        Raises:
+            Exception: The error raised by the first failed serialization
+        """
+        # any artifact still waiting refers to a step which did not run
+        for steps in self._waiting_on.values():
+            steps.clear()
+
+        self._submit_ready()
+
+        return [self._futures[name].result() for name in self._artifacts]
+
+    def _submit_ready(self) -> None:
+        ready = [name for name, steps in self._waiting_on.items() if not steps]
+
+        for name in ready:
+            del self._waiting_on[name]
+            artifact = self._artifacts[name]
+
+            # resolve the contents on this thread, since the step outputs are
+            # only safe to read from the thread running the steps
+            contents = _resolve_task_parameter_value(
+                artifact["contents"], self._context
+            )
+            self._futures[name] = self._executor.submit(
+                _serialize_artifact,
+                name,
+                artifact,
+                contents,
+                self._context,
+                self._on_artifact,
+            )
 
 
 def run_experiment(
@@ -661,6 +767,8 @@ def run_experiment(
     plugins_dir: Path,
     serialize_dir: Path,
     deserialize_dir: Path,
+    plugin_loader: ArtifactPluginLoader | None = None,
+    on_artifact: Callable[[ArtifactOutputEntry], None] | None = None,
 ) -> None:
     """
     Run an experiment via a declarative experiment description.
@@ -670,14 +778,32 @@ def run_experiment(
             equivalent
         global_parameters: External parameter values to use in the
             experiment, as a dict
+        plugin_loader: The loader of the artifact plugins used by the job. If not
+            provided, a loader is created for the artifact parameters of this run.
+        on_artifact: A function called with each artifact output as soon as it is
+            serialized. Artifacts are serialized on a background thread while the
+            remaining steps run, so the function must be safe to call from another
+            thread. If not provided, the artifact outputs are only recorded in the
+            artifacts.json file.
     """
     log = _get_logger()
 
-    loaded_artifacts_params = _load_artifact_parameters(
-        artifacts_dir=artifacts_dir,
-        deserialize_dir=deserialize_dir,
-        artifact_parameters=artifact_parameters,
-    )
+    if plugin_loader is None:
+        with ArtifactPluginLoader() as plugin_loader:
+            loaded_artifacts_params = _load_artifact_parameters(
+                artifacts_dir=artifacts_dir,
+                deserialize_dir=deserialize_dir,
+                artifact_parameters=artifact_parameters,
+                plugin_loader=plugin_loader,
+            )
+
+    else:
+        loaded_artifacts_params = _load_artifact_parameters(
+            artifacts_dir=artifacts_dir,
+            deserialize_dir=deserialize_dir,
+            artifact_parameters=artifact_parameters,
+            plugin_loader=plugin_loader,
+        )
 
     context = EngineContext(
         experiment_desc=experiment_desc,
@@ -686,15 +812,20 @@ def run_experiment(
         artifact_tasks=artifact_tasks,
     )
 
-    # add the plug-ins directory and cycle through the steps
+    artifacts = context.get_artifacts()
+
+    # add the plug-ins directory and cycle through the steps, serializing the
+    # artifacts in the background as the steps they depend on finish.  The
+    # artifact tasks come from the plugin loader, so the serialize directory
+    # isn't added: its modules could shadow the task plug-ins' modules.
     with sys_path_dirs(dirs=(str(plugins_dir),)):
-        _run_steps(context)
+        if artifacts is None:
+            _run_steps(context)
 
-    # handle artifacts
-    with sys_path_dirs(dirs=(str(serialize_dir),)):
-        artifacts = context.get_artifacts()
-        if artifacts is not None:
-            artifacts_result = _handle_artifacts(artifacts, context)
+        else:
+            with _ArtifactSerializer(artifacts, context, on_artifact) as serializer:
+                _run_steps(context, on_step=serializer.step_done)
+                artifacts_result = serializer.wait()
 
             # output the artifacts.json file
             with open(".dioptra/artifacts.json", "w") as file:
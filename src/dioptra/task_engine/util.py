@@ -280,6 +280,56 @@ def get_sorted_steps(step_graph: Mapping[str, Any]) -> list[str]:
     return sorted_steps
 
 
+def get_artifact_steps(
+    artifacts: Mapping[str, Any], step_graph: Mapping[str, Any]
+) -> dict[str, set[str]]:
+    """
+    Find the steps which must have run before each artifact output can be
+    serialized.  These are the steps the artifact contents refer to, and all
+    steps downstream of those steps.  A downstream step may modify an output
+    it is given in place, or be given the same object via the output of an
+    intermediate step, so the contents are only final once every downstream
+    step has run.
+
+    Args:
+        artifacts: Artifact output definitions, as a mapping from artifact name
+            to artifact definition.
+        step_graph: Step definitions, as a mapping from step name to step
+            definition.
+
+    Returns:
+        A mapping from artifact name to a set of step names
+    """
+    step_users: dict[str, set[str]] = {step_name: set() for step_name in step_graph}
+
+    for step_name, step_def in step_graph.items():
+        explicit_deps = step_def.get("dependencies", [])
+        if isinstance(explicit_deps, str):
+            explicit_deps = [explicit_deps]
+
+        for dep_step_name in _get_step_references(step_def, step_graph.keys()):
+            step_users[dep_step_name].add(step_name)
+
+        for dep_step_name in explicit_deps:
+            if dep_step_name in step_users:
+                step_users[dep_step_name].add(step_name)
+
+    artifact_steps = {}
+    for artifact_name, artifact in artifacts.items():
+        steps: set[str] = set()
+        to_visit = list(_get_step_references(artifact["contents"], step_graph.keys()))
+
+        while to_visit:
+            step_name = to_visit.pop()
+            if step_name not in steps:
+                steps.add(step_name)
+                to_visit.extend(step_users[step_name])
+
+        artifact_steps[artifact_name] = steps
+
+    return artifact_steps
+
+
 def input_def_get_name_type(in_def: Mapping[str, Any]) -> tuple[str, str]:
     """
     Get a parameter name and type from a task input parameter definition.
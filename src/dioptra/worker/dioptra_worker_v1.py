@@ -34,10 +34,17 @@ _REQUIRED_ENV = {
     "MLFLOW_TRACKING_URI",
     "MLFLOW_S3_ENDPOINT_URL",
     "DIOPTRA_API",
-    "DIOPTRA_WORKER_USERNAME",
-    "DIOPTRA_WORKER_PASSWORD",
 }
 
+# The worker authenticates with an API token or, if unset, a username and password
+_TOKEN_ENV = "DIOPTRA_WORKER_TOKEN"
+_CREDENTIALS_ENV = {"DIOPTRA_WORKER_USERNAME", "DIOPTRA_WORKER_PASSWORD"}
+
+# Dispatches jobs by priority and fair share unless another worker class is given
+# with --worker-class or RQ_WORKER_CLASS. Other worker classes only run the jobs with
+# the default priority on queues without fair share, see dioptra.rq.scheduling.
+_WORKER_CLASS = "dioptra.worker.fair_share_worker.FairShareWorker"
+
 
 def _setup_logging() -> None:
     configure_structlog_for_worker()
@@ -47,6 +54,15 @@ def _setup_logging() -> None:
     set_logging_level(os.getenv("DIOPTRA_RQ_WORKER_LOG_LEVEL", default="INFO"))
 
 
+def _get_worker_args(args: list[str]) -> list[str]:
+    if "RQ_WORKER_CLASS" in os.environ or any(
+        arg == "-w" or arg.startswith("--worker-class") for arg in args
+    ):
+        return args
+
+    return ["--worker-class", _WORKER_CLASS, *args]
+
+
 def main() -> int:
     _setup_logging()
     log = logging.getLogger("dioptra-worker")
@@ -55,7 +71,12 @@ def main() -> int:
     # We know what functions will be executed through rq and what they
     # require, so we may as well check that before starting up the worker.
     # Better to error out as early as possible.
-    unset_vars = _REQUIRED_ENV - os.environ.keys()
+    required_env = _REQUIRED_ENV
+
+    if _TOKEN_ENV not in os.environ:
+        required_env = required_env | _CREDENTIALS_ENV
+
+    unset_vars = required_env - os.environ.keys()
     if unset_vars:
         exit_status = 1
         log.fatal("Environment variables must be set: %s", ", ".join(unset_vars))
@@ -66,7 +87,17 @@ def main() -> int:
         # that seems appropriate, although I don't think the worker function
         # is written to return anything, and we presently don't need to
         # specially handle any of the exceptions.
-        rq.cli.worker(standalone_mode=False)
+        args = _get_worker_args(sys.argv[1:])
+
+        if _WORKER_CLASS not in (*args, os.getenv("RQ_WORKER_CLASS")):
+            log.warning(
+                "A worker class other than %s only runs jobs with the default "
+                "priority on queues without fair share. Disable "
+                "DIOPTRA_RQ_FAIR_SHARE_WORKER in the REST API to reject other jobs.",
+                _WORKER_CLASS,
+            )
+
+        rq.cli.worker(args=args, standalone_mode=False)
 
     return exit_status
 
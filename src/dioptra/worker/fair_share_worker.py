@@ -0,0 +1,165 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""An RQ worker that dispatches Dioptra jobs by priority and fair share.
+
+The worker is started with the names of Dioptra queues and listens to all of the RQ
+queues behind them, see dioptra.rq.scheduling. Jobs are dequeued from the highest
+priority that has jobs waiting, and within a priority the worker visits the RQ
+queues of the submitters in turn, so that a large sweep from one submitter does not
+starve the others.
+"""
+
+import bisect
+import time
+from typing import Any, Final
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rq.queue import Queue
+from rq.worker import Worker
+
+from dioptra.rq.scheduling import PRIORITIES, find_rq_queue_names, parse_rq_queue_name
+
+DEFAULT_REFRESH_INTERVAL: Final[int] = 5
+
+
+class FairShareWorker(Worker):
+    """A worker that round-robins across submitters within each job priority.
+
+    The RQ queues of new submitters are discovered every refresh_interval seconds.
+    Submitter queues with no waiting jobs are left out of the dequeue until the next
+    refresh.
+    """
+
+    refresh_interval: int = DEFAULT_REFRESH_INTERVAL
+
+    def __init__(self, queues, *args, **kwargs) -> None:
+        super().__init__(queues, *args, **kwargs)
+        self._dioptra_queues = [queue.name for queue in self.queues]
+        self._priorities: dict[str, str] = {}
+        self._last_served: dict[str, str] = {}
+        self._set_queues(
+            {name: parse_rq_queue_name(name, name)[0] for name in self._dioptra_queues}
+        )
+
+    def refresh_queues(self) -> None:
+        """Update the RQ queues the worker listens to from Redis.
+
+        Raises:
+            RedisError: If Redis cannot be reached.
+        """
+        priorities: dict[str, str] = {}
+        shared: list[str] = []
+
+        for queue in self._dioptra_queues:
+            for name in find_rq_queue_names(self.connection, queue):
+                priority, share = parse_rq_queue_name(name, queue)  # type: ignore
+                priorities[name] = priority
+
+                if share is not None:
+                    shared.append(name)
+
+        if shared:
+            pipeline = self.connection.pipeline()
+
+            for name in shared:
+                pipeline.llen(f"{Queue.redis_queue_namespace_prefix}{name}")
+
+            for name, count in zip(shared, pipeline.execute()):
+                if count == 0:
+                    del priorities[name]
+
+        self._set_queues(priorities)
+
+    def reorder_queues(self, reference_queue: Queue) -> None:
+        priority = self._priorities.get(reference_queue.name)
+
+        if priority is not None:
+            self._last_served[priority] = reference_queue.name
+
+        self._ordered_queues = self._order_queues()
+
+    def dequeue_job_and_maintain_ttl(
+        self, timeout: int | None, max_idle_time: int | None = None
+    ) -> tuple[Any, Queue] | None:
+        if timeout is None:
+            # Burst mode does not block, so there is nothing to wait for
+            self._try_refresh_queues()
+            return super().dequeue_job_and_maintain_ttl(timeout, max_idle_time)
+
+        idle_since = time.monotonic()
+
+        while True:
+            self._try_refresh_queues()
+            poll_timeout = min(timeout, self.refresh_interval)
+
+            if max_idle_time is not None:
+                idle_time_left = max_idle_time - (time.monotonic() - idle_since)
+
+                if idle_time_left <= 0:
+                    return None
+
+                poll_timeout = max(1, min(poll_timeout, int(idle_time_left)))
+
+            # The parent returns None once it has been idle for poll_timeout seconds,
+            # which lets newly submitted RQ queues join the dequeue.
+            result = super().dequeue_job_and_maintain_ttl(poll_timeout, poll_timeout)
+
+            if result is not None:
+                return result
+
+    def _try_refresh_queues(self) -> None:
+        try:
+            self.refresh_queues()
+
+        except RedisConnectionError as err:
+            # Keep the current queues, the parent retries the connection
+            self.log.warning("Worker %s: could not refresh queues: %s", self.name, err)
+
+    def _set_queues(self, priorities: dict[str, str]) -> None:
+        queues = {queue.name: queue for queue in self.queues}
+        self.queues = [
+            queues.get(name)
+            or self.queue_class(
+                name=name,
+                connection=self.connection,
+                job_class=self.job_class,
+                serializer=self.serializer,
+                death_penalty_class=self.death_penalty_class,
+            )
+            for name in sorted(priorities)
+        ]
+        self._priorities = priorities
+        self._ordered_queues = self._order_queues()
+
+    def _order_queues(self) -> list[Queue]:
+        queues = {queue.name: queue for queue in self.queues}
+        ordered: list[Queue] = []
+
+        for priority in PRIORITIES:
+            names = sorted(
+                name for name, value in self._priorities.items() if value == priority
+            )
+            last_served = self._last_served.get(priority)
+
+            if last_served is not None:
+                # Start after the last queue served, even if it has since emptied
+                position = bisect.bisect_right(names, last_served)
+                names = names[position:] + names[:position]
+
+            ordered.extend(queues[name] for name in names)
+
+        return ordered
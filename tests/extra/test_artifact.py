@@ -20,14 +20,18 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from shutil import rmtree
 
+import numpy as np
 import pandas as pd
 import pytest
 from artifacts.tasks import (
+    ArrowDataFrameReader,
     BytesArtifactTask,
     DataframeArtifactTask,
     DirectoryArtifactTask,
     FileArtifactError,
     FileArtifactTask,
+    NumpyArrayArtifactTask,
+    NumpyArraysArtifactTask,
     StringArtifactTask,
 )
 
@@ -184,6 +188,55 @@ def test_directory_task(name: str, ext: str, dir: DirTest):
         rmtree(work_dir)
 
 
+def test_directory_task_zstd():
+    pytest.importorskip("zstandard")
+    work_dir = Path.cwd() / "tmp"
+    dir = DirTest("dir1", [FileTest("file1")], [DirTest("sub1", [FileTest("file2")])])
+    create_artifact(work_dir, dir)
+    result = DirectoryArtifactTask.serialize(
+        work_dir, "artifact1", dir.name, tarball_write_mode="w:zst"
+    )
+    assert result == (work_dir / "artifact1.tar.zst")
+
+    extracted = DirectoryArtifactTask.deserialize(
+        work_dir / "extracted", result.as_posix()
+    )
+
+    assert extracted == work_dir / "extracted" / "dir1"
+    assert (extracted / "file1").read_text() == "input"
+    assert (extracted / "sub1" / "file2").read_text() == "input"
+
+    if cleanup:
+        rmtree(work_dir)
+
+
+def test_directory_task_indexed():
+    work_dir = Path.cwd() / "tmp"
+    dir = DirTest("dir1", [FileTest("file1")], [DirTest("sub1", [FileTest("file2")])])
+    create_artifact(work_dir, dir)
+    result = DirectoryArtifactTask.serialize(
+        work_dir, "artifact1", dir.name, indexed=True
+    )
+    assert result == (work_dir / "artifact1.zip")
+
+    archive = DirectoryArtifactTask.deserialize(
+        work_dir / "extracted", result.as_posix()
+    )
+
+    # Members are read from the archive without extracting it
+    assert not (work_dir / "extracted").exists()
+    assert archive.name == "dir1"
+    assert sorted(path.name for path in archive.iterdir()) == ["file1", "sub1"]
+    assert (archive / "sub1" / "file2").read_text() == "input"
+
+    # The caller closes the archive once it is done reading it
+    archive.root.close()
+    assert archive.root.fp is None
+
+    if cleanup:
+        rmtree(work_dir)
+
+
 @pytest.mark.parametrize(
     "name, data", [("artifact1", {"col1": [1, 2], "col2": ["a", "b"]})]
 )
@@ -217,3 +270,82 @@ def test_dataframe_task(name: str, data: dict, format: str, ext: str):
 
     if cleanup:
         rmtree(work_dir)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_dataframe_task_arrow(lazy: bool):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(data={"col1": list(range(10)), "col2": list("abcdefghij")})
+
+    work_dir = Path.cwd() / "tmp"
+    work_dir.mkdir(exist_ok=True)
+    result = DataframeArtifactTask.serialize(
+        work_dir, "artifact1", df, chunk_size=4, lazy=lazy
+    )
+    assert result == (work_dir / "artifact1.arrow")
+
+    des_df = DataframeArtifactTask.deserialize(work_dir, "artifact1.arrow")
+
+    if lazy:
+        assert isinstance(des_df, ArrowDataFrameReader)
+        assert des_df.columns == ["col1", "col2"]
+        assert des_df.num_rows == 10
+
+        batches = list(des_df.iter_batches(columns=["col2"]))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert list(pd.concat(batches)["col2"]) == list(df["col2"])
+
+        des_df = des_df.read()
+
+    assert df.compare(des_df).empty
+
+    if cleanup:
+        rmtree(work_dir)
+
+
+@pytest.mark.parametrize(
+    "mmap_mode, ext, expected_type",
+    [(None, "npy", np.ndarray), ("r", "npydir", np.memmap), ("c", "npydir", np.memmap)],
+)
+def test_numpy_array_task(mmap_mode: str | None, ext: str, expected_type: type):
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+    work_dir = Path.cwd() / "tmp"
+    work_dir.mkdir(exist_ok=True)
+    result = NumpyArrayArtifactTask.serialize(
+        work_dir, "artifact1", array, mmap_mode=mmap_mode
+    )
+    assert result == (work_dir / f"artifact1.{ext}")
+
+    des_array = NumpyArrayArtifactTask.deserialize(work_dir, result.name)
+
+    assert isinstance(des_array, expected_type)
+    np.testing.assert_array_equal(des_array, array)
+
+    if cleanup:
+        rmtree(work_dir)
+
+
+@pytest.mark.parametrize(
+    "mmap_mode, ext, expected_type",
+    [(None, "npz", np.ndarray), ("r", "npydir", np.memmap)],
+)
+def test_numpy_arrays_task(mmap_mode: str | None, ext: str, expected_type: type):
+    arrays = [np.arange(6).reshape(2, 3), np.ones(4, dtype=np.uint8)]
+
+    work_dir = Path.cwd() / "tmp"
+    work_dir.mkdir(exist_ok=True)
+    result = NumpyArraysArtifactTask.serialize(
+        work_dir, "artifact1", arrays, names=["x", "y/z"], mmap_mode=mmap_mode
+    )
+    assert result == (work_dir / f"artifact1.{ext}")
+
+    des_arrays = NumpyArraysArtifactTask.deserialize(work_dir, result.name)
+
+    assert list(des_arrays) == ["x", "y/z"]
+    for des_array, array in zip(des_arrays.values(), arrays):
+        assert isinstance(des_array, expected_type)
+        np.testing.assert_array_equal(des_array, array)
+
+    if cleanup:
+        rmtree(work_dir)
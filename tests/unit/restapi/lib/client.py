@@ -233,6 +233,19 @@ class DioptraFlaskClientSession(DioptraSession[DioptraResponseProtocol]):
         """Close the connection to the API. A no-op for the FlaskClient."""
         pass
 
+    def set_auth_token(self, token: str | None) -> None:
+        """Authenticate subsequent requests with an API token.
+
+        Args:
+            token: The API token to send in an "Authorization: Bearer" header, or None
+                to stop sending the header.
+        """
+        if token is None:
+            self._session.environ_base.pop("HTTP_AUTHORIZATION", None)
+            return None
+
+        self._session.environ_base["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+
     def make_request(
         self,
         method_name: str,
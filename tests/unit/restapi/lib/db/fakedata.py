@@ -22,6 +22,7 @@ from faker import Faker
 from passlib.hash import pbkdf2_sha256
 
 from dioptra.restapi.db import models
+from dioptra.restapi.db.models.plugins import hash_plugin_file_contents
 
 
 @dataclass
@@ -256,14 +257,14 @@ class FakeData(object):
         )
         init_plugin_file = models.PluginFile(
             filename=plugin_init_file_name,
-            contents="",
+            contents_blob=_plugin_file_contents(""),
             description=plugin_init_file_description,
             resource=init_plugin_file_resource,
             creator=creator,
         )
         plugin_file = models.PluginFile(
             filename=plugin_file_name,
-            contents=plugin_file_contents,
+            contents_blob=_plugin_file_contents(plugin_file_contents),
             description=plugin_file_description,
             resource=plugin_file_resource,
             creator=creator,
@@ -491,3 +492,9 @@ class FakeData(object):
         )
 
         return new_ml_model
+
+
+def _plugin_file_contents(contents: str) -> models.PluginFileContents:
+    return models.PluginFileContents(
+        contents_hash=hash_plugin_file_contents(contents), contents=contents
+    )
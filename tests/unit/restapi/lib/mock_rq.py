@@ -91,6 +91,8 @@ class MockRQQueue(object):
         LOGGER.info("Mocking rq.Queue instance", args=args, kwargs=kwargs)
         self.name = kwargs.get("name") or args[0]
         self.default_timeout = kwargs.get("default_timeout")
+        self.connection = kwargs.get("connection")
+        self.key = f"rq:queue:{self.name}"
 
     def enqueue(self, *args, **kwargs) -> MockRQJob:
         LOGGER.info("Mocking rq.Queue.enqueue() function", args=args, kwargs=kwargs)
@@ -105,3 +107,24 @@ class MockRQQueue(object):
             cmd_kwargs=cmd_kwargs,
             depends_on=depends_on,
         )
+
+    @staticmethod
+    def prepare_data(func, *args, **kwargs) -> Dict[str, Any]:
+        LOGGER.info(
+            "Mocking rq.Queue.prepare_data() function", args=args, kwargs=kwargs
+        )
+        return {"func": func, **kwargs}
+
+    def enqueue_many(self, job_datas, *args, **kwargs) -> list[MockRQJob]:
+        LOGGER.info(
+            "Mocking rq.Queue.enqueue_many() function", args=args, kwargs=kwargs
+        )
+        return [
+            MockRQJob(
+                id=job_data.get("job_id", str(uuid.uuid4())),
+                queue=self.name,
+                job_timeout=job_data.get("timeout"),
+                cmd_kwargs=job_data.get("kwargs"),
+            )
+            for job_data in job_datas
+        ]
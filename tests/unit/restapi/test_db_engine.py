@@ -0,0 +1,169 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import sqlalchemy as sa
+from flask.testing import FlaskClient
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from dioptra.restapi.config import _get_bool
+from dioptra.restapi.db.engine import (
+    InstrumentedQueuePool,
+    build_engine_options,
+    get_pool_metrics,
+    register_sqlite_pragmas,
+)
+
+POOL_CONFIG: dict[str, Any] = {
+    "DIOPTRA_DB_POOL_SIZE": 2,
+    "DIOPTRA_DB_MAX_OVERFLOW": 0,
+    "DIOPTRA_DB_POOL_TIMEOUT": None,
+    "DIOPTRA_DB_POOL_RECYCLE": 1800,
+    "DIOPTRA_DB_POOL_PRE_PING": True,
+    "DIOPTRA_DB_STATEMENT_TIMEOUT": 30000,
+}
+
+SQLITE_CONFIG: dict[str, Any] = {
+    "DIOPTRA_SQLITE_JOURNAL_MODE": "wal",
+    "DIOPTRA_SQLITE_BUSY_TIMEOUT": 5000,
+    "DIOPTRA_SQLITE_SYNCHRONOUS": "normal",
+}
+
+
+@pytest.fixture
+def sqlite_file_engine(tmp_path: Path) -> Iterator[sa.Engine]:
+    """An instrumented engine for a file-based SQLite database."""
+    config = {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}"}
+    config.update(POOL_CONFIG)
+    config.update(SQLITE_CONFIG)
+    config["DIOPTRA_DB_POOL_TIMEOUT"] = 0.1
+    engine = sa.create_engine(
+        config["SQLALCHEMY_DATABASE_URI"], **build_engine_options(config)
+    )
+    register_sqlite_pragmas(engine, config)
+
+    yield engine
+
+    engine.dispose()
+
+
+def test_engine_options_in_memory_sqlite_are_empty() -> None:
+    config = {"SQLALCHEMY_DATABASE_URI": "sqlite://", **POOL_CONFIG}
+    assert build_engine_options(config) == {}
+
+
+def test_engine_options_file_sqlite() -> None:
+    config = {"SQLALCHEMY_DATABASE_URI": "sqlite:////tmp/dioptra.db", **POOL_CONFIG}
+    assert build_engine_options(config) == {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": 2,
+        "max_overflow": 0,
+        "pool_recycle": 1800,
+    }
+
+
+def test_engine_options_postgres() -> None:
+    config = {
+        "SQLALCHEMY_DATABASE_URI": "postgresql+psycopg://user:pw@db:5432/dioptra",
+        **POOL_CONFIG,
+    }
+    assert build_engine_options(config) == {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": 2,
+        "max_overflow": 0,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "connect_args": {"options": "-c statement_timeout=30000"},
+    }
+
+
+def test_sqlite_pragmas_are_set_on_connect(sqlite_file_engine: sa.Engine) -> None:
+    with sqlite_file_engine.connect() as conn:
+        journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+        busy_timeout = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+        synchronous = conn.exec_driver_sql("PRAGMA synchronous").scalar()
+
+    assert journal_mode == "wal"
+    assert busy_timeout == 5000
+    assert synchronous == 1  # NORMAL
+
+
+def test_pool_metrics_record_checkouts_and_timeouts(
+    sqlite_file_engine: sa.Engine,
+) -> None:
+    with sqlite_file_engine.connect(), sqlite_file_engine.connect():
+        metrics = get_pool_metrics(sqlite_file_engine)
+        assert metrics["checkedOut"] == 2
+
+        with pytest.raises(PoolTimeoutError):
+            sqlite_file_engine.connect()
+
+    metrics = get_pool_metrics(sqlite_file_engine)
+    assert metrics["poolClass"] == "InstrumentedQueuePool"
+    assert metrics["size"] == 2
+    assert metrics["checkedOut"] == 0
+    assert metrics["checkouts"] == 2
+    assert metrics["checkoutTimeouts"] == 1
+    assert metrics["waitSecondsMax"] >= 0.1
+
+
+def test_pool_metrics_survive_dispose(sqlite_file_engine: sa.Engine) -> None:
+    with sqlite_file_engine.connect():
+        pass
+
+    sqlite_file_engine.dispose()
+    assert get_pool_metrics(sqlite_file_engine)["checkouts"] == 1
+
+
+def test_health_db_endpoint(client: FlaskClient) -> None:
+    response = client.get("/health/db")
+    assert response.status_code == 200
+    assert "poolClass" in response.get_json()["pool"]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, False),
+        ("", False),
+        ("true", True),
+        ("1", True),
+        ("Yes", True),
+        ("false", False),
+        ("0", False),
+        ("OFF", False),
+    ],
+)
+def test_get_bool_parses_disable_pool_pre_ping(
+    monkeypatch: pytest.MonkeyPatch, value: str | None, expected: bool
+) -> None:
+    if value is None:
+        monkeypatch.delenv("DIOPTRA_DB_DISABLE_POOL_PRE_PING", raising=False)
+    else:
+        monkeypatch.setenv("DIOPTRA_DB_DISABLE_POOL_PRE_PING", value)
+
+    assert _get_bool("DIOPTRA_DB_DISABLE_POOL_PRE_PING") is expected
+
+
+def test_get_bool_rejects_invalid_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DIOPTRA_DB_DISABLE_POOL_PRE_PING", "maybe")
+
+    with pytest.raises(ValueError):
+        _get_bool("DIOPTRA_DB_DISABLE_POOL_PRE_PING")
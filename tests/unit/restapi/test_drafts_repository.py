@@ -350,6 +350,8 @@ def test_drafts_create_draft_resource(
 
     db_session.commit()
 
+    assert draft.resource_id is None
+
 
 def test_drafts_create_draft_resource_group_not_exist(
     drafts_repo, account, draft_content
@@ -517,6 +519,42 @@ def test_drafts_create_draft_modification(
     drafts_repo.create_draft_modification(draft)
     db_session.commit()
 
+    assert draft.resource_id == queue.resource_id
+
+
+def test_drafts_create_draft_modification_payload_changed(
+    db_session: DBSession, drafts_repo, fake_data, account
+):
+    queue = fake_data.queue(account.user, account.group)
+
+    db_session.add_all([account.user, account.group, queue])
+    db_session.commit()
+
+    toplevel_data = {
+        "resource_data": {
+            "draft": "stuff",
+            "number": 5,
+        },
+        "resource_id": None,
+        "resource_snapshot_id": None,
+        "base_resource_id": None,
+    }
+
+    draft = m.DraftResource(
+        "queue",
+        toplevel_data,
+        account.group,
+        account.user,
+    )
+    draft.payload["resource_id"] = queue.resource_id
+    draft.payload["resource_snapshot_id"] = queue.resource_snapshot_id
+
+    drafts_repo.create_draft_modification(draft)
+    db_session.commit()
+
+    assert draft.resource_id == queue.resource_id
+    assert drafts_repo.has_draft_modification(queue, account.user)
+
 
 def test_drafts_create_draft_modification_user_not_exist(
     db_session: DBSession, drafts_repo, fake_data, account
@@ -0,0 +1,222 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import time
+import uuid
+
+import pytest
+from flask import Flask, g
+from flask_login import login_user
+from sqlalchemy.orm.session import Session as DBSession
+
+from dioptra.restapi.db.models import Group, UserLock
+from dioptra.restapi.db.models.constants import user_lock_types
+from dioptra.restapi.db.repository.utils import (
+    SHARED_IDENTITY_CACHE,
+    ExistenceResult,
+    Identity,
+    assert_user_in_group,
+    build_identity,
+    current_identity,
+    get_shared_identity,
+    invalidate_identity,
+    user_exists,
+)
+from dioptra.restapi.errors import UserNotInGroupError
+from dioptra.restapi.v1.users.service import load_user
+
+
+@pytest.fixture
+def identity_cache_ttl(flask_app: Flask):
+    flask_app.config["DIOPTRA_IDENTITY_CACHE_TTL"] = 60
+    yield 60
+    flask_app.config["DIOPTRA_IDENTITY_CACHE_TTL"] = None
+    SHARED_IDENTITY_CACHE.clear()
+
+
+@pytest.fixture
+def logged_in(flask_app: Flask, account):
+    with flask_app.test_request_context():
+        login_user(account.user)
+        yield account
+        g.pop("_dioptra_identity", None)
+
+
+def test_identity_cached_for_request(logged_in, db_session: DBSession):
+    user = logged_in.user
+
+    identity = current_identity(db_session, user)
+
+    assert identity is not None
+    assert identity.member_group_ids == {logged_in.group.group_id}
+    assert identity.manager_group_ids == {logged_in.group.group_id}
+    assert current_identity(db_session, user.user_id) is identity
+    assert user_exists(db_session, user) is ExistenceResult.EXISTS
+
+    assert_user_in_group(db_session, user, logged_in.group)
+
+
+def test_identity_not_cached_for_other_users(
+    logged_in, db_session: DBSession, fake_data
+):
+    other = fake_data.account()
+    db_session.add(other.group)
+    db_session.commit()
+
+    assert current_identity(db_session, other.user) is None
+
+    with pytest.raises(UserNotInGroupError):
+        assert_user_in_group(db_session, other.user, logged_in.group)
+
+
+def test_identity_invalidated_by_membership_changes(
+    logged_in, group_repo, db_session: DBSession, fake_data
+):
+    other = fake_data.account()
+    db_session.add(other.group)
+    db_session.commit()
+    user = logged_in.user
+
+    with pytest.raises(UserNotInGroupError):
+        assert_user_in_group(db_session, user, other.group)
+
+    group_repo.add_member(other.group, user, read=True)
+    db_session.commit()
+
+    assert_user_in_group(db_session, user, other.group)
+
+    group_repo.remove_member(other.group, user)
+    db_session.commit()
+
+    with pytest.raises(UserNotInGroupError):
+        assert_user_in_group(db_session, user, other.group)
+
+
+def test_identity_invalidated_by_group_creation(
+    logged_in, group_repo, db_session: DBSession
+):
+    user = logged_in.user
+    assert current_identity(db_session, user) is not None
+
+    group = Group("identity_group", user)
+    group_repo.create(group)
+    db_session.commit()
+
+    identity = current_identity(db_session, user)
+
+    assert identity is not None
+    assert identity.is_member(group.group_id)
+    assert identity.is_manager(group.group_id)
+
+
+def test_load_user_uses_shared_identity(
+    logged_in, identity_cache_ttl, user_repo, db_session: DBSession
+):
+    user = logged_in.user
+    alternative_id = str(user.alternative_id)
+
+    assert get_shared_identity(alternative_id) is None
+    assert load_user(alternative_id) == user
+
+    identity = get_shared_identity(alternative_id)
+    assert identity is not None
+    assert identity.user_id == user.user_id
+
+    assert load_user(alternative_id) == user
+
+    user_repo.delete(user)
+    db_session.commit()
+
+    assert get_shared_identity(alternative_id) is None
+    assert load_user(alternative_id) is None
+
+
+def test_load_user_rejects_stale_shared_identity(
+    logged_in, identity_cache_ttl, db_session: DBSession
+):
+    user = logged_in.user
+    alternative_id = str(user.alternative_id)
+    assert load_user(alternative_id) == user
+
+    # Log out everywhere in another process, which can't clear this process's
+    # shared cache
+    user.alternative_id = uuid.uuid4()
+    db_session.commit()
+
+    assert get_shared_identity(alternative_id) is not None
+    assert load_user(alternative_id) is None
+    assert get_shared_identity(alternative_id) is None
+
+
+def test_load_user_rejects_deleted_user_with_shared_identity(
+    logged_in, identity_cache_ttl, db_session: DBSession
+):
+    user = logged_in.user
+    alternative_id = str(user.alternative_id)
+    assert load_user(alternative_id) == user
+
+    # Delete the user in another process
+    db_session.add(UserLock(user_lock_types.DELETE, user))
+    db_session.commit()
+    db_session.expire(user)
+
+    assert get_shared_identity(alternative_id) is not None
+    assert load_user(alternative_id) is None
+
+
+def test_identity_invalidated_after_commit(
+    logged_in, identity_cache_ttl, db_session: DBSession
+):
+    user = logged_in.user
+    alternative_id = str(user.alternative_id)
+    identity = build_identity(db_session, user)
+
+    invalidate_identity(user, db_session)
+
+    # A concurrent request caches the identity before the change is committed
+    SHARED_IDENTITY_CACHE.put(identity)
+    assert get_shared_identity(alternative_id) == identity
+
+    db_session.commit()
+
+    assert get_shared_identity(alternative_id) is None
+
+
+def test_shared_identity_cache_expires():
+    identity = Identity(
+        user_id=1,
+        alternative_id="alt",
+        member_group_ids=frozenset({1}),
+        manager_group_ids=frozenset(),
+    )
+
+    SHARED_IDENTITY_CACHE.put(identity)
+
+    try:
+        assert SHARED_IDENTITY_CACHE.get("alt", ttl=60) == identity
+
+        time.sleep(0.01)
+
+        assert SHARED_IDENTITY_CACHE.get("alt", ttl=0.001) is None
+        assert SHARED_IDENTITY_CACHE.get("alt", ttl=60) is None
+
+        SHARED_IDENTITY_CACHE.put(identity)
+        SHARED_IDENTITY_CACHE.invalidate(1)
+
+        assert SHARED_IDENTITY_CACHE.get("alt", ttl=60) is None
+
+    finally:
+        SHARED_IDENTITY_CACHE.clear()
@@ -32,6 +32,7 @@ from dioptra.restapi.errors import (
     EntityDoesNotExistError,
     EntityExistsError,
     MismatchedResourceTypeError,
+    QueryParameterValidationError,
     ReadOnlyLockError,
     SearchParseError,
     SortParameterValidationError,
@@ -2157,3 +2158,151 @@ def test_filter_unsupported_field(db_session):
             descending=False,
             deletion_policy=utils.DeletionPolicy.NOT_DELETED,
         )
+
+
+def _keyset_pages(db_session, sort_by, descending, page_length, count_total=True):
+    """
+    Page forward through all queues with keyset paging, returning the list of
+    pages, the counts, and the cursors returned with the last page.
+    """
+    pages = []
+    counts = []
+    cursor = utils.PageCursor()
+    while cursor is not None:
+        results, count, cursors = utils.get_by_filters_keyset_paged(
+            db_session,
+            models.Queue,
+            QueueRepository.SORTABLE_FIELDS,
+            QueueRepository.SEARCHABLE_FIELDS,
+            group=None,
+            filters=[],
+            cursor=cursor,
+            page_length=page_length,
+            sort_by=sort_by,
+            descending=descending,
+            count_total=count_total,
+            deletion_policy=utils.DeletionPolicy.NOT_DELETED,
+        )
+        pages.append(results)
+        counts.append(count)
+        cursor = cursors.next
+
+    return pages, counts, cursors
+
+
+@pytest.mark.parametrize(
+    "sort_by, sort_key",
+    [
+        (None, lambda q: q.resource_snapshot_id),
+        ("name", lambda q: q.name),
+        ("createdOn", lambda q: (q.created_on, q.resource_snapshot_id)),
+        ("description", lambda q: q.description),
+    ],
+)
+@pytest.mark.parametrize("descending", [False, True])
+def test_filter_keyset_paging(
+    db_session, queue_filter_setup, sort_by, sort_key, descending
+):
+    pages, counts, last_cursors = _keyset_pages(db_session, sort_by, descending, 3)
+
+    assert [len(page) for page in pages] == [3, 3, 3, 1]
+    assert counts == [10, 10, 10, 10]
+    assert last_cursors.next is None
+    assert last_cursors.prev is not None
+
+    sorted_queues = sorted(queue_filter_setup, key=sort_key, reverse=descending)
+    assert list(itertools.chain.from_iterable(pages)) == sorted_queues
+
+    # Now walk back from the last page to the first
+    cursor = last_cursors.prev
+    for expected_page in reversed(pages[:-1]):
+        results, _, cursors = utils.get_by_filters_keyset_paged(
+            db_session,
+            models.Queue,
+            QueueRepository.SORTABLE_FIELDS,
+            QueueRepository.SEARCHABLE_FIELDS,
+            group=None,
+            filters=[],
+            cursor=cursor,
+            page_length=3,
+            sort_by=sort_by,
+            descending=descending,
+        )
+        assert results == expected_page
+        assert cursors.next is not None
+        cursor = cursors.prev
+
+    assert cursor is None
+
+
+def test_filter_keyset_paging_null_sort_values(db_session, queue_filter_setup):
+    for queue in queue_filter_setup[::3]:
+        queue.description = None
+    db_session.commit()
+
+    def sort_key(q):
+        # NULLs sort before any other value
+        return (q.description is not None, q.description or "", q.resource_snapshot_id)
+
+    for descending in (False, True):
+        pages, _, _ = _keyset_pages(db_session, "description", descending, 2)
+        sorted_queues = sorted(queue_filter_setup, key=sort_key, reverse=descending)
+        assert list(itertools.chain.from_iterable(pages)) == sorted_queues
+
+
+def test_filter_keyset_paging_skip_count(db_session, queue_filter_setup):
+    pages, counts, _ = _keyset_pages(db_session, "name", False, 4, count_total=False)
+
+    assert [len(page) for page in pages] == [4, 4, 2]
+    assert counts == [None, None, None]
+
+
+def test_filter_keyset_unsupported_sort(db_session):
+    with pytest.raises(SortParameterValidationError):
+        utils.get_by_filters_keyset_paged(
+            db_session,
+            models.Queue,
+            QueueRepository.SORTABLE_FIELDS,
+            QueueRepository.SEARCHABLE_FIELDS,
+            group=None,
+            filters=[],
+            cursor=utils.PageCursor(),
+            page_length=0,
+            sort_by="wrong",
+            descending=False,
+        )
+
+
+@pytest.mark.parametrize(
+    "sort_value",
+    [None, 7, "Zelda", datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.UTC)],
+)
+def test_page_cursor_round_trip(sort_value):
+    cursor = utils.PageCursor(sort_value=sort_value, snapshot_id=42, backward=True)
+    token = utils.encode_page_cursor(cursor, "name", True)
+
+    assert utils.decode_page_cursor(token, "name", True) == cursor
+
+
+def test_page_cursor_start():
+    assert utils.encode_page_cursor(utils.PageCursor(), "name", False) == ""
+    assert utils.decode_page_cursor("", "name", False).is_start
+    assert utils.decode_page_cursor(None, "name", False) is None
+
+
+def test_page_cursor_sort_mismatch():
+    token = utils.encode_page_cursor(
+        utils.PageCursor(sort_value="Zelda", snapshot_id=1), "name", False
+    )
+
+    with pytest.raises(QueryParameterValidationError):
+        utils.decode_page_cursor(token, "name", True)
+
+    with pytest.raises(QueryParameterValidationError):
+        utils.decode_page_cursor(token, "description", False)
+
+
+@pytest.mark.parametrize("token", ["not a cursor", "e30", "!!!"])
+def test_page_cursor_malformed(token):
+    with pytest.raises(QueryParameterValidationError):
+        utils.decode_page_cursor(token, None, False)
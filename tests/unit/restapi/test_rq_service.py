@@ -0,0 +1,113 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import pytest
+from flask.testing import FlaskClient
+from redis import BlockingConnectionPool, ConnectionPool, Redis
+from redis.exceptions import RedisError
+
+import dioptra.restapi.v1.shared.rq_service as rq_service
+from dioptra.restapi.bootstrap import RQServiceConfiguration, create_redis_connection
+from dioptra.restapi.v1.shared.rq_service import RQQueueCache, RQServiceV1
+
+from .lib import mock_rq
+
+
+@pytest.fixture
+def unreachable_redis() -> Redis:
+    return Redis.from_url("redis://localhost:1", socket_connect_timeout=0.1)
+
+
+def test_queue_cache_reuses_queues(unreachable_redis: Redis) -> None:
+    queues = RQQueueCache(unreachable_redis)
+
+    queue = queues.get("tensorflow_cpu")
+
+    assert queues.get("tensorflow_cpu") is queue
+    assert queues.get("pytorch_cpu") is not queue
+    assert queue.connection is unreachable_redis
+    assert queues.names() == ["pytorch_cpu", "tensorflow_cpu"]
+
+
+def test_rq_services_share_queue_cache(unreachable_redis: Redis, monkeypatch) -> None:
+    monkeypatch.setattr(rq_service, "RQQueue", mock_rq.MockRQQueue)
+    configuration = RQServiceConfiguration(redis=unreachable_redis)
+
+    for job_id in range(3):
+        service = RQServiceV1(configuration.redis, queues=configuration.queues)
+        service.submit(job_id=job_id, experiment_id=1, queue="tensorflow_cpu")
+
+    service.submit_many(job_ids=[3, 4], experiment_id=1, queue="tensorflow_cpu")
+    metrics = configuration.queues.metrics.as_dict()
+
+    assert configuration.queues.names() == ["tensorflow_cpu"]
+    assert metrics["enqueues"] == 4
+    assert metrics["jobs"] == 5
+    assert metrics["failures"] == 0
+
+
+def test_rq_service_records_enqueue_failures(unreachable_redis: Redis) -> None:
+    service = RQServiceV1(unreachable_redis)
+
+    with pytest.raises(RedisError):
+        service.submit(job_id=1, experiment_id=1, queue="tensorflow_cpu")
+
+    probe = service.probe()
+
+    assert probe["status"] == "unhealthy"
+    assert probe["queues"] == ["tensorflow_cpu"]
+    assert probe["enqueue"]["failures"] == 1
+    assert probe["enqueue"]["enqueues"] == 0
+
+
+def test_create_redis_connection_defaults(monkeypatch) -> None:
+    monkeypatch.delenv("RQ_REDIS_MAX_CONNECTIONS", raising=False)
+    monkeypatch.setenv("RQ_REDIS_URI", "redis://localhost:6379/0")
+
+    pool = create_redis_connection().connection_pool
+
+    assert type(pool) is ConnectionPool
+
+
+def test_create_redis_connection_with_pool_options(monkeypatch) -> None:
+    monkeypatch.setenv("RQ_REDIS_URI", "redis://localhost:6379/0")
+    monkeypatch.setenv("RQ_REDIS_MAX_CONNECTIONS", "8")
+    monkeypatch.setenv("RQ_REDIS_POOL_TIMEOUT", "2.5")
+    monkeypatch.setenv("RQ_REDIS_SOCKET_TIMEOUT", "5")
+    monkeypatch.setenv("RQ_REDIS_SOCKET_CONNECT_TIMEOUT", "1")
+
+    pool = create_redis_connection().connection_pool
+
+    assert isinstance(pool, BlockingConnectionPool)
+    assert pool.max_connections == 8
+    assert pool.timeout == 2.5
+    assert pool.connection_kwargs["socket_timeout"] == 5.0
+    assert pool.connection_kwargs["socket_connect_timeout"] == 1.0
+
+
+def test_create_redis_connection_rejects_invalid_values(monkeypatch) -> None:
+    monkeypatch.setenv("RQ_REDIS_MAX_CONNECTIONS", "many")
+
+    with pytest.raises(ValueError):
+        create_redis_connection()
+
+
+def test_health_rq_endpoint(client: FlaskClient) -> None:
+    response = client.get("/health/rq")
+    probe = response.get_json()
+
+    assert response.status_code == (200 if probe["status"] == "healthy" else 503)
+    assert set(probe) == {"status", "pingSeconds", "pool", "queues", "enqueue"}
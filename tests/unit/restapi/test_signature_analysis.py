@@ -14,7 +14,17 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
-from dioptra.restapi.v1.shared.signature_analysis import get_plugin_signatures
+import hashlib
+
+import pytest
+
+import dioptra.restapi.v1.shared.signature_analysis as signature_analysis
+from dioptra.restapi.errors import InvalidPythonError
+from dioptra.restapi.v1.shared.signature_analysis import (
+    clear_signature_cache,
+    get_cached_plugin_signatures,
+    get_plugin_signatures,
+)
 
 
 def test_plugin_recognition_1():
@@ -338,3 +348,63 @@ def do_things(arg1: Optional[str], arg2: int = 123):
             ],
         }
     ]
+
+
+def test_cached_signatures(monkeypatch):
+    source = """\
+from dioptra import pyplugs
+
+@pyplugs.register
+def do_things(arg1: int) -> str:
+    pass
+"""
+    calls = []
+
+    def counting_get_plugin_signatures(python_source, filepath=None):
+        calls.append(python_source)
+        return get_plugin_signatures(python_source, filepath)
+
+    clear_signature_cache()
+    monkeypatch.setattr(
+        signature_analysis, "get_plugin_signatures", counting_get_plugin_signatures
+    )
+
+    signatures = get_cached_plugin_signatures(source)
+    assert signatures == list(get_plugin_signatures(source))
+
+    # Modifying a result does not affect the cached copy
+    signatures[0]["name"] = "modified"
+    assert get_cached_plugin_signatures(source)[0]["name"] == "do_things"
+    assert len(calls) == 1
+
+    get_cached_plugin_signatures(source + "\n")
+    assert len(calls) == 2
+
+    clear_signature_cache()
+
+
+def test_cached_signatures_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(signature_analysis, "SIGNATURE_CACHE_SIZE", 2)
+    clear_signature_cache()
+
+    sources = [f"x = {i}\n" for i in range(3)]
+    get_cached_plugin_signatures(sources[0])
+    get_cached_plugin_signatures(sources[1])
+    get_cached_plugin_signatures(sources[0])
+    get_cached_plugin_signatures(sources[2])
+
+    assert list(signature_analysis._signature_cache) == [
+        hashlib.sha256(source.encode("utf-8")).hexdigest()
+        for source in (sources[0], sources[2])
+    ]
+
+    clear_signature_cache()
+
+
+def test_cached_signatures_invalid_python():
+    clear_signature_cache()
+
+    with pytest.raises(InvalidPythonError):
+        get_cached_plugin_signatures("def")
+
+    assert len(signature_analysis._signature_cache) == 0
@@ -0,0 +1,150 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from collections.abc import Iterator
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
+
+from dioptra.restapi.db import models
+from dioptra.restapi.db.text_search import (
+    create_text_search_indexes,
+    drop_text_search_indexes,
+    sqlite_supports_text_search,
+    text_match,
+)
+
+requires_fts5 = pytest.mark.skipif(
+    not sqlite_supports_text_search(),
+    reason="SQLite library does not support FTS5 with the trigram tokenizer",
+)
+
+TAG_NAMES = [
+    "tensorflow_cpu",
+    "tensorflowXcpu",
+    "PyTorch",
+    "100% sure",
+    "a/b",
+    "ab",
+]
+
+
+@pytest.fixture
+def tags_engine() -> Iterator[sa.Engine]:
+    """An engine for a database with a minimal tags table and its text search index."""
+    engine = sa.create_engine("sqlite://")
+    metadata = sa.MetaData()
+    tags = sa.Table(
+        "tags",
+        metadata,
+        sa.Column("tag_id", sa.Integer, primary_key=True),
+        sa.Column("name", sa.Text, nullable=False),
+    )
+
+    with engine.begin() as conn:
+        metadata.create_all(conn)
+        conn.execute(sa.insert(tags), [{"name": name} for name in TAG_NAMES])
+        create_text_search_indexes(conn)
+
+    yield engine
+
+    engine.dispose()
+
+
+def _matching_names(conn: sa.Connection, pattern: str) -> list[str]:
+    tags = sa.table("tags", sa.column("tag_id"), sa.column("name"))
+    stmt = (
+        sa.select(tags.c.name)
+        .where(text_match(models.Tag.name, pattern))
+        .order_by(tags.c.tag_id)
+    )
+    return list(conn.scalars(stmt))
+
+
+def test_text_match_unindexed_column_uses_like() -> None:
+    expr = text_match(models.Queue.name, "%gpu%")
+    sql = str(expr.compile(dialect=sqlite.dialect()))
+    assert "LIKE" in sql
+    assert "_fts" not in sql
+
+
+def test_text_match_indexed_column_postgresql_uses_like() -> None:
+    expr = text_match(models.Tag.name, "%gpu%")
+    sql = str(expr.compile(dialect=postgresql.dialect()))
+    assert sql == "tags.name LIKE %(param_1)s ESCAPE '/'"
+
+
+@requires_fts5
+def test_text_match_indexed_column_sqlite_uses_fts() -> None:
+    expr = text_match(models.Tag.name, "%gpu%")
+    sql = str(expr.compile(dialect=sqlite.dialect()))
+    assert "tags_name_fts" in sql
+    assert "tags.name LIKE ? ESCAPE '/'" in sql
+
+
+@requires_fts5
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("%tensorflow/_cpu%", ["tensorflow_cpu"]),
+        ("%tensorflow%", ["tensorflow_cpu", "tensorflowXcpu"]),
+        ("%torch%", ["PyTorch"]),
+        ("%100/%%", ["100% sure"]),
+        ("%a//b%", ["a/b"]),
+        ("%b%", ["a/b", "ab"]),
+        ("ab", ["ab"]),
+        ("PyTorc_", ["PyTorch"]),
+        ("%missing%", []),
+    ],
+)
+def test_text_match_sqlite_matches_like(
+    tags_engine: sa.Engine, pattern: str, expected: list[str]
+) -> None:
+    tags = sa.table("tags", sa.column("tag_id"), sa.column("name"))
+
+    with tags_engine.connect() as conn:
+        like_names = list(
+            conn.scalars(
+                sa.select(tags.c.name)
+                .where(tags.c.name.like(pattern, escape="/"))
+                .order_by(tags.c.tag_id)
+            )
+        )
+        assert like_names == expected
+        assert _matching_names(conn, pattern) == expected
+
+
+@requires_fts5
+def test_text_search_index_follows_table_changes(tags_engine: sa.Engine) -> None:
+    tags = sa.table("tags", sa.column("tag_id"), sa.column("name"))
+
+    with tags_engine.begin() as conn:
+        conn.execute(sa.update(tags).where(tags.c.name == "PyTorch").values(name="jax"))
+        conn.execute(sa.delete(tags).where(tags.c.name == "ab"))
+        conn.execute(sa.insert(tags).values(name="torchvision"))
+
+        assert _matching_names(conn, "%torch%") == ["torchvision"]
+        assert _matching_names(conn, "%ja%") == ["jax"]
+        assert _matching_names(conn, "ab") == []
+
+
+@requires_fts5
+def test_drop_text_search_indexes(tags_engine: sa.Engine) -> None:
+    with tags_engine.begin() as conn:
+        drop_text_search_indexes(conn)
+        assert not sa.inspect(conn).has_table("tags_name_fts")
+        conn.execute(sa.text("INSERT INTO tags (name) VALUES ('after drop')"))
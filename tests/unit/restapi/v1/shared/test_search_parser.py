@@ -25,6 +25,7 @@ import pytest
 from dioptra.restapi.errors import SearchParseError
 from dioptra.restapi.v1.shared.search_parser import (
     DIOPTRA_QUERY_GRAMMAR,
+    MAX_CACHED_SEARCH_TEXT_LENGTH,
     construct_sql_query_filters,
     construct_sql_search_value,
     parse_search_text,
@@ -148,3 +149,34 @@ def test_construct_sql_query_filters() -> None:
             search_string="test:some_value",
             searchable_fields=QueueRepository.SEARCHABLE_FIELDS,
         )
+
+
+def test_parse_search_text_cache() -> None:
+    search_text = "name:tensorflow*,gpu queue"
+    expected = [
+        {"field": "name", "value": ["tensorflow", "*"]},
+        {"field": None, "value": ["gpu", "queue"]},
+    ]
+
+    first = parse_search_text(search_text)
+    assert first == expected
+
+    # modifying a result must not leak into later results for the same search text
+    first[0]["value"].append("extra")
+    first.pop()
+    assert parse_search_text(search_text) == expected
+
+
+def test_parse_search_text_long_search_text() -> None:
+    search_text = ",".join(["term"] * (MAX_CACHED_SEARCH_TEXT_LENGTH // 4))
+    assert len(search_text) > MAX_CACHED_SEARCH_TEXT_LENGTH
+
+    result = parse_search_text(search_text)
+    assert len(result) == MAX_CACHED_SEARCH_TEXT_LENGTH // 4
+    assert all(term == {"field": None, "value": ["term"]} for term in result)
+
+
+def test_parse_search_text_cache_does_not_hide_errors() -> None:
+    for _ in range(2):
+        with pytest.raises(SearchParseError):
+            parse_search_text("bad=assignment")
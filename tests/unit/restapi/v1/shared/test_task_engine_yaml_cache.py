@@ -0,0 +1,89 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import datetime
+
+from dioptra.restapi.v1.shared.task_engine_yaml.cache import (
+    TaskEngineYamlCache,
+    TaskEngineYamlCacheKey,
+    plugin_parameter_types_version,
+)
+
+CREATED_ON = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _key(snapshot_id: int, types_version: str = "v1") -> TaskEngineYamlCacheKey:
+    return TaskEngineYamlCacheKey(
+        entrypoint_snapshot_id=snapshot_id,
+        entrypoint_snapshot_created_on=CREATED_ON,
+        plugin_parameter_types_version=types_version,
+    )
+
+
+def test_plugin_parameter_types_version_ignores_order() -> None:
+    assert plugin_parameter_types_version([3, 1, 2]) == plugin_parameter_types_version(
+        [1, 2, 3]
+    )
+    assert plugin_parameter_types_version([1, 2]) != plugin_parameter_types_version(
+        [1, 2, 3]
+    )
+    assert plugin_parameter_types_version([1, 23]) != plugin_parameter_types_version(
+        [12, 3]
+    )
+
+
+def test_cache_key_etag_depends_on_all_fields() -> None:
+    etags = {
+        _key(1).etag,
+        _key(2).etag,
+        _key(1, types_version="v2").etag,
+        TaskEngineYamlCacheKey(
+            entrypoint_snapshot_id=1,
+            entrypoint_snapshot_created_on=CREATED_ON + datetime.timedelta(seconds=1),
+            plugin_parameter_types_version="v1",
+        ).etag,
+    }
+    assert len(etags) == 4
+    assert _key(1).etag == _key(1).etag
+
+
+def test_cache_builds_once_per_key() -> None:
+    cache = TaskEngineYamlCache()
+    calls: list[int] = []
+
+    def build() -> dict[str, int]:
+        calls.append(1)
+        return {"calls": len(calls)}
+
+    assert cache.get_or_build(_key(1), build) == {"calls": 1}
+    assert cache.get_or_build(_key(1), build) == {"calls": 1}
+    assert cache.get_or_build(_key(1, types_version="v2"), build) == {"calls": 2}
+    assert len(calls) == 2
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = TaskEngineYamlCache(maxsize=2)
+    cache.get_or_build(_key(1), lambda: {"id": 1})
+    cache.get_or_build(_key(2), lambda: {"id": 2})
+    cache.get_or_build(_key(1), lambda: {"id": -1})
+    cache.get_or_build(_key(3), lambda: {"id": 3})
+
+    assert len(cache) == 2
+    assert cache.get_or_build(_key(1), lambda: {"id": -1}) == {"id": 1}
+    assert cache.get_or_build(_key(2), lambda: {"id": -2}) == {"id": -2}
+
+    cache.clear()
+    assert len(cache) == 0
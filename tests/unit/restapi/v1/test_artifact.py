@@ -281,6 +281,77 @@ def test_create_artifact(
     )
 
 
+def test_create_artifact_batch(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_jobs: dict[str, Any],
+    mlflow_artifact_uris: dict[str, str],
+) -> None:
+    """Test that a batch of artifacts can be registered in a single request.
+
+    Given an authenticated user and two uris that have been logged to mlflow for the
+    same job, this test validates the following sequence of actions:
+
+    - The user registers both artifacts in one batch request.
+    - The response lists the created artifacts in request order.
+    - The user is able to retrieve each artifact using its id.
+    """
+    job_id = registered_jobs["job1"]["id"]
+    group_id = auth_account["groups"][0]["id"]
+    uris = [mlflow_artifact_uris["artifact1"], mlflow_artifact_uris["artifact2"]]
+
+    response = dioptra_client.artifacts.create_batch(
+        group_id=group_id,
+        job_id=job_id,
+        artifacts=[
+            {"artifact_uri": uri, "description": f"Artifact {index}."}
+            for index, uri in enumerate(uris)
+        ],
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    artifacts = response.json()["data"]
+    assert len(artifacts) == len(uris)
+
+    for index, (artifact, uri) in enumerate(zip(artifacts, uris)):
+        assert_artifact_response_contents_matches_expectations(
+            response=artifact,
+            expected_contents={
+                "artifactUri": uri,
+                "description": f"Artifact {index}.",
+                "user_id": auth_account["id"],
+                "group_id": group_id,
+                "job": job_id,
+                "isDir": False,
+                "task": {},
+            },
+        )
+        assert_retrieving_artifact_by_id_works(
+            dioptra_client, artifact_id=artifact["id"], expected=artifact
+        )
+
+
+def test_cannot_register_artifact_batch_with_repeated_uri(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_jobs: dict[str, Any],
+    mlflow_artifact_uris: dict[str, str],
+) -> None:
+    """Test that a batch repeating a uri fails without registering any artifacts."""
+    uri = mlflow_artifact_uris["artifact1"]
+
+    response = dioptra_client.artifacts.create_batch(
+        group_id=auth_account["groups"][0]["id"],
+        job_id=registered_jobs["job1"]["id"],
+        artifacts=[{"artifact_uri": uri}, {"artifact_uri": uri}],
+    )
+    assert response.status_code == HTTPStatus.CONFLICT
+
+    assert_retrieving_artifacts_works(
+        dioptra_client, expected=[], group_id=auth_account["groups"][0]["id"]
+    )
+
+
 def test_artifacts_get_all(
     dioptra_client: DioptraClient[DioptraResponseProtocol],
     auth_account: dict[str, Any],
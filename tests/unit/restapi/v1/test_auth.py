@@ -0,0 +1,93 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Test suite for API token authentication.
+
+This module contains a set of tests that validate that API tokens can be created by a
+logged in user and that the tokens identify the user until they expire or are revoked.
+"""
+
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from flask import Flask, request
+
+from dioptra.client.base import DioptraResponseProtocol
+from dioptra.client.client import DioptraClient
+from dioptra.restapi.v1.auth.service import load_user_from_request
+
+
+def _load_token_user(flask_app: Flask, token: str) -> Any:
+    with flask_app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        return load_user_from_request(request)
+
+
+def test_api_token_identifies_user(
+    flask_app: Flask,
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+) -> None:
+    """Test that an API token identifies the user that created it."""
+    response = dioptra_client.auth.create_token()
+    assert response.status_code == HTTPStatus.OK
+    token_response = response.json()
+    assert token_response["username"] == auth_account["username"]
+    assert token_response["expiresIn"] is None
+
+    user = _load_token_user(flask_app, token_response["token"])
+    assert user is not None
+    assert user.username == auth_account["username"]
+
+
+def test_api_token_rejects_invalid_tokens(
+    flask_app: Flask,
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+) -> None:
+    """Test that tampered tokens and other authorization schemes are rejected."""
+    token = dioptra_client.auth.create_token().json()["token"]
+    assert _load_token_user(flask_app, token[:-2] + "xx") is None
+    assert _load_token_user(flask_app, "") is None
+
+    with flask_app.test_request_context(headers={"Authorization": f"Basic {token}"}):
+        assert load_user_from_request(request) is None
+
+
+def test_api_token_is_revoked_by_logout_everywhere(
+    flask_app: Flask,
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+) -> None:
+    """Test that logging out everywhere revokes the user's API tokens."""
+    token = dioptra_client.auth.create_token().json()["token"]
+    assert _load_token_user(flask_app, token) is not None
+
+    dioptra_client.auth.logout(everywhere=True)
+    assert _load_token_user(flask_app, token) is None
+
+
+def test_api_token_expires(
+    flask_app: Flask,
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that API tokens are rejected once older than the configured max age."""
+    monkeypatch.setitem(flask_app.config, "DIOPTRA_API_TOKEN_MAX_AGE", -1)
+    token_response = dioptra_client.auth.create_token().json()
+    assert token_response["expiresIn"] == -1
+    assert _load_token_user(flask_app, token_response["token"]) is None
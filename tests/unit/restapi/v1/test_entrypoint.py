@@ -26,9 +26,11 @@ from http import HTTPStatus
 from typing import Any
 
 import pytest
+from flask.testing import FlaskClient
 
 from dioptra.client.base import DioptraResponseProtocol, FieldNameCollisionError
 from dioptra.client.client import DioptraClient
+from dioptra.restapi.routes import V1_ENTRYPOINTS_ROUTE, V1_ROOT
 
 from ..lib import helpers, routines
 from ..test_utils import assert_retrieving_resource_works, assert_searchable_field_works
@@ -1502,3 +1504,48 @@ def test_create_entrypoint_with_none_queues_plugins_params(
         entry_point=none_entry_point,
         assert_message="Failed to create EntryPoint with 3 None entities: [queues=None, plugins=None, parameters=None]",
     )
+
+
+def test_entrypoint_snapshot_config_etag(
+    client: FlaskClient,
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_entrypoints: dict[str, Any],
+) -> None:
+    """Test that the task engine config of an entrypoint snapshot can be revalidated.
+
+    Given an authenticated user and registered entrypoints, this test validates the
+    following sequence of actions:
+
+    - The user retrieves the config of an entrypoint snapshot and gets an ETag
+    - The user retrieves the config again with the ETag and gets a 304 response
+    - The user registers a new plugin parameter type in the entrypoint's group
+    - The user retrieves the config with the old ETag and gets a new config and ETag
+    """
+    entrypoint = registered_entrypoints["entrypoint1"]
+    config_url = (
+        f"/{V1_ROOT}/{V1_ENTRYPOINTS_ROUTE}/{entrypoint['id']}"
+        f"/snapshots/{entrypoint['snapshot']}/config"
+    )
+
+    response = client.get(config_url)
+    assert response.status_code == HTTPStatus.OK
+    etag, _ = response.get_etag()
+    assert etag is not None
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    not_modified = client.get(config_url, headers={"If-None-Match": f'"{etag}"'})
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert not_modified.get_etag() == (etag, False)
+    assert not_modified.data == b""
+
+    dioptra_client.plugin_parameter_types.create(
+        group_id=auth_account["default_group_id"],
+        name="config_etag_type",
+        structure={"list": "string"},
+    )
+
+    modified = client.get(config_url, headers={"If-None-Match": f'"{etag}"'})
+    assert modified.status_code == HTTPStatus.OK
+    assert modified.get_etag()[0] != etag
+    assert modified.get_json() is not None
@@ -28,6 +28,7 @@ from http import HTTPStatus
 from typing import Any
 
 import pytest
+from flask import Flask
 from pytest import MonkeyPatch
 
 from dioptra.client.base import DioptraResponseProtocol
@@ -436,6 +437,215 @@ def test_create_job(
     )
 
 
+def test_create_job_batch(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_queues: dict[str, Any],
+    registered_experiments: dict[str, Any],
+    registered_entrypoints: dict[str, Any],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that a batch of jobs can be registered in one request.
+
+    Given an authenticated user, registered queues, registered experiments, and
+    registered entrypoints, this test validates the following sequence of actions:
+
+    - The user registers a batch of jobs with different parameter values.
+    - The jobs are returned in request order and can be retrieved by id.
+    - A batch with an invalid job is rejected and no jobs are created.
+    """
+    import dioptra.restapi.v1.shared.rq_service as rq_service
+
+    monkeypatch.setattr(rq_service, "RQQueue", mock_rq.MockRQQueue)
+
+    queue_id = registered_queues["queue1"]["id"]
+    experiment_id = registered_experiments["experiment1"]["id"]
+    entrypoint_id = registered_entrypoints["entrypoint1"]["id"]
+    param_name = registered_entrypoints["entrypoint1"]["parameters"][0]["name"]
+    num_jobs_before = dioptra_client.experiments.jobs.get(experiment_id).json()[
+        "totalNumResults"
+    ]
+
+    response = dioptra_client.experiments.jobs.create_batch(
+        experiment_id=experiment_id,
+        entrypoint_id=entrypoint_id,
+        queue_id=queue_id,
+        jobs=[
+            {"values": {param_name: str(value)}, "description": f"sweep {value}"}
+            for value in range(3)
+        ]
+        + [{"values": {param_name: "3"}}],
+        timeout="1h",
+        description="sweep",
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    jobs = response.json()["data"]
+    assert [job["description"] for job in jobs] == [
+        "sweep 0",
+        "sweep 1",
+        "sweep 2",
+        "sweep",
+    ]
+    assert [job["values"][param_name] for job in jobs] == ["0", "1", "2", "3"]
+    assert all(job["timeout"] == "1h" for job in jobs)
+    assert all(job["queue"]["id"] == queue_id for job in jobs)
+
+    for job in jobs:
+        assert_retrieving_job_by_id_works(
+            dioptra_client, job_id=job["id"], expected=job
+        )
+
+    response = dioptra_client.experiments.jobs.create_batch(
+        experiment_id=experiment_id,
+        entrypoint_id=entrypoint_id,
+        queue_id=queue_id,
+        jobs=[{"values": {param_name: "4"}}, {"values": {"not_a_param": "5"}}],
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    num_jobs_after = dioptra_client.experiments.jobs.get(experiment_id).json()[
+        "totalNumResults"
+    ]
+    assert num_jobs_after == num_jobs_before + len(jobs)
+
+
+def test_create_job_with_priority_and_fair_share(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_queues: dict[str, Any],
+    registered_experiments: dict[str, Any],
+    registered_entrypoints: dict[str, Any],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that jobs are enqueued on the RQ queue for their priority and submitter.
+
+    Given an authenticated user, registered queues, registered experiments, and
+    registered entrypoints, this test validates the following sequence of actions:
+
+    - The user submits a high priority job, which is enqueued on the high priority
+      RQ queue.
+    - The user enables per-user fair share on the queue and submits a job and a batch
+      of low priority jobs, which are enqueued on the user's RQ queues.
+    - The user cannot submit a job with an unknown priority.
+    """
+    import dioptra.restapi.v1.shared.rq_service as rq_service
+
+    enqueued: list[tuple[str, str]] = []
+
+    class RecordingRQQueue(mock_rq.MockRQQueue):
+        def enqueue(self, *args, **kwargs):
+            enqueued.append((self.name, kwargs["job_id"]))
+            return super().enqueue(*args, **kwargs)
+
+        def enqueue_many(self, job_datas, *args, **kwargs):
+            enqueued.extend((self.name, job_data["job_id"]) for job_data in job_datas)
+            return super().enqueue_many(job_datas, *args, **kwargs)
+
+    monkeypatch.setattr(rq_service, "RQQueue", RecordingRQQueue)
+
+    user_id = auth_account["id"]
+    queue = registered_queues["queue1"]
+    experiment_id = registered_experiments["experiment1"]["id"]
+    entrypoint_id = registered_entrypoints["entrypoint1"]["id"]
+
+    job = dioptra_client.experiments.jobs.create(
+        experiment_id=experiment_id,
+        entrypoint_id=entrypoint_id,
+        queue_id=queue["id"],
+        priority="high",
+    ).json()
+    assert enqueued[-1] == (f"{queue['name']}:high", str(job["id"]))
+
+    dioptra_client.queues.modify_by_id(
+        queue_id=queue["id"],
+        name=queue["name"],
+        description=queue["description"],
+        fair_share="user",
+    )
+    job = dioptra_client.experiments.jobs.create(
+        experiment_id=experiment_id, entrypoint_id=entrypoint_id, queue_id=queue["id"]
+    ).json()
+    assert enqueued[-1] == (f"{queue['name']}:default:user-{user_id}", str(job["id"]))
+
+    jobs = dioptra_client.experiments.jobs.create_batch(
+        experiment_id=experiment_id,
+        entrypoint_id=entrypoint_id,
+        queue_id=queue["id"],
+        jobs=[{}, {}],
+        priority="low",
+    ).json()["data"]
+    assert enqueued[-2:] == [
+        (f"{queue['name']}:low:user-{user_id}", str(job["id"])) for job in jobs
+    ]
+
+    response = dioptra_client.experiments.jobs.create(
+        experiment_id=experiment_id,
+        entrypoint_id=entrypoint_id,
+        queue_id=queue["id"],
+        priority="urgent",
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_create_job_without_fair_share_worker(
+    flask_app: Flask,
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_queues: dict[str, Any],
+    registered_experiments: dict[str, Any],
+    registered_entrypoints: dict[str, Any],
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Test that jobs the workers cannot run are rejected without the fair-share worker.
+
+    Given an authenticated user, registered queues, registered experiments, and
+    registered entrypoints, and the DIOPTRA_RQ_FAIR_SHARE_WORKER setting disabled,
+    this test validates the following sequence of actions:
+
+    - The user submits a job with the default priority, which is accepted.
+    - The user cannot submit a job or a batch of jobs with a non-default priority.
+    - The user enables per-user fair share on the queue and cannot submit a job.
+    """
+    monkeypatch.setitem(flask_app.config, "DIOPTRA_RQ_FAIR_SHARE_WORKER", False)
+    queue = registered_queues["queue1"]
+    experiment_id = registered_experiments["experiment1"]["id"]
+    entrypoint_id = registered_entrypoints["entrypoint1"]["id"]
+
+    response = dioptra_client.experiments.jobs.create(
+        experiment_id=experiment_id, entrypoint_id=entrypoint_id, queue_id=queue["id"]
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response = dioptra_client.experiments.jobs.create(
+        experiment_id=experiment_id,
+        entrypoint_id=entrypoint_id,
+        queue_id=queue["id"],
+        priority="high",
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    response = dioptra_client.experiments.jobs.create_batch(
+        experiment_id=experiment_id,
+        entrypoint_id=entrypoint_id,
+        queue_id=queue["id"],
+        jobs=[{}, {}],
+        priority="low",
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    dioptra_client.queues.modify_by_id(
+        queue_id=queue["id"],
+        name=queue["name"],
+        description=queue["description"],
+        fair_share="user",
+    )
+    response = dioptra_client.experiments.jobs.create(
+        experiment_id=experiment_id, entrypoint_id=entrypoint_id, queue_id=queue["id"]
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
 def test_create_job_with_empty_values(
     dioptra_client: DioptraClient[DioptraResponseProtocol],
     auth_account: dict[str, Any],
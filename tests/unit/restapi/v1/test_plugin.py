@@ -26,9 +26,12 @@ from http import HTTPStatus
 from typing import Any
 
 import pytest
+from sqlalchemy import func, select
 
 from dioptra.client.base import DioptraResponseProtocol
 from dioptra.client.client import DioptraClient
+from dioptra.restapi.db import db, models
+from dioptra.restapi.db.models.plugins import hash_plugin_file_contents
 from dioptra.restapi.routes import V1_PLUGIN_PARAMETER_TYPES_ROUTE, V1_ROOT
 from dioptra.restapi.v1.shared.resource_service import _plugin_file_payload_adapter
 
@@ -1624,6 +1627,83 @@ def test_manage_plugin_file_snapshots(
     )
 
 
+def test_plugin_file_contents_are_stored_once(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_plugin_with_files: dict[str, Any],
+) -> None:
+    """Test that plugin file snapshots with the same contents share stored contents.
+
+    Given an authenticated user and a registered plugin with three files that have
+    the same contents, this test validates the following sequence of actions:
+
+    - The user renames a plugin file without changing its contents
+    - The contents of the files are stored once, and every snapshot of the files
+      references them by hash
+    """
+    plugin_id = registered_plugin_with_files["plugin"]["id"]
+    plugin_file = registered_plugin_with_files["plugin_file1"]
+    dioptra_client.plugins.files.modify_by_id(
+        plugin_id=plugin_id,
+        plugin_file_id=plugin_file["id"],
+        filename="renamed_" + plugin_file["filename"],
+        contents=plugin_file["contents"],
+        function_tasks=[],
+        description=plugin_file["description"],
+    )
+    contents_hash = hash_plugin_file_contents(plugin_file["contents"])
+
+    num_contents = db.session.scalar(
+        select(func.count()).select_from(models.PluginFileContents)
+    )
+    snapshot_hashes = db.session.scalars(select(models.PluginFile.contents_hash)).all()
+
+    assert num_contents == 1
+    assert len(snapshot_hashes) == 4
+    assert set(snapshot_hashes) == {contents_hash}
+
+
+def test_plugin_file_contents_stored_concurrently(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_plugin_with_files: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that contents stored by a concurrent request are reused.
+
+    The lookup of the existing contents is made to miss, as if another request
+    stored the same contents between the lookup and the insert.
+    """
+    plugin_id = registered_plugin_with_files["plugin"]["id"]
+    plugin_file = registered_plugin_with_files["plugin_file1"]
+    scalar = db.session.scalar
+
+    def miss_plugin_file_contents(statement, *args, **kwargs):
+        if statement.column_descriptions[0]["entity"] is models.PluginFileContents:
+            return None
+
+        return scalar(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db.session, "scalar", miss_plugin_file_contents)
+
+    response = dioptra_client.plugins.files.modify_by_id(
+        plugin_id=plugin_id,
+        plugin_file_id=plugin_file["id"],
+        filename="renamed_" + plugin_file["filename"],
+        contents=plugin_file["contents"],
+        function_tasks=[],
+        description=plugin_file["description"],
+    )
+    monkeypatch.undo()
+
+    num_contents = db.session.scalar(
+        select(func.count()).select_from(models.PluginFileContents)
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert num_contents == 1
+
+
 def test_tag_plugin(
     dioptra_client: DioptraClient[DioptraResponseProtocol],
     auth_account: dict[str, Any],
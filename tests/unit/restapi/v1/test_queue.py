@@ -23,11 +23,15 @@ registered, renamed, deleted, and locked/unlocked as expected through the REST A
 
 from http import HTTPStatus
 from typing import Any
+from urllib.parse import parse_qs, urlparse
 
 import pytest
+from flask.testing import FlaskClient
+from freezegun import freeze_time
 
 from dioptra.client.base import DioptraResponseProtocol
 from dioptra.client.client import DioptraClient
+from dioptra.restapi.v1.queues.metrics import percentile
 
 from ..lib import helpers, routines
 from ..test_utils import assert_retrieving_resource_works
@@ -61,6 +65,7 @@ def assert_queue_response_contents_matches_expectations(
         "hasDraft",
         "name",
         "description",
+        "fairShare",
         "tags",
     }
     assert set(response.keys()) == expected_keys
@@ -70,6 +75,7 @@ def assert_queue_response_contents_matches_expectations(
     assert isinstance(response["snapshot"], int)
     assert isinstance(response["name"], str)
     assert isinstance(response["description"], str)
+    assert isinstance(response["fairShare"], str)
     assert isinstance(response["createdOn"], str)
     assert isinstance(response["snapshotCreatedOn"], str)
     assert isinstance(response["lastModifiedOn"], str)
@@ -78,6 +84,7 @@ def assert_queue_response_contents_matches_expectations(
 
     assert response["name"] == expected_contents["name"]
     assert response["description"] == expected_contents["description"]
+    assert response["fairShare"] == expected_contents.get("fair_share", "none")
 
     assert helpers.is_iso_format(response["createdOn"])
     assert helpers.is_iso_format(response["snapshotCreatedOn"])
@@ -349,6 +356,79 @@ def test_queue_sort(
     )
 
 
+@pytest.mark.parametrize(
+    "sort_by,descending,expected",
+    [
+        ("name", False, ["queue3", "queue1", "queue2"]),
+        ("createdOn", True, ["queue3", "queue2", "queue1"]),
+    ],
+)
+def test_queue_cursor_paging(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_queues: dict[str, Any],
+    sort_by: str,
+    descending: bool,
+    expected: list[str],
+) -> None:
+    """Test that queues can be paged through using cursors.
+
+    Given an authenticated user and registered queues, this test validates the following
+    sequence of actions:
+
+    - The user requests the first page of queues with an empty cursor.
+    - The user follows the next links until no next link is returned.
+    - The user follows the prev link back from the last page.
+    - The queues on the pages match the order in the parametrize lists above.
+    """
+    expected_ids = [registered_queues[name]["id"] for name in expected]
+    response = dioptra_client.queues.get(
+        page_length=2, sort_by=sort_by, descending=descending, cursor=""
+    )
+    assert response.status_code == HTTPStatus.OK
+    first_page = response.json()
+    assert first_page["totalNumResults"] == 3
+    assert [queue["id"] for queue in first_page["data"]] == expected_ids[:2]
+    assert not first_page["isComplete"]
+    assert "prev" not in first_page
+
+    next_cursor = parse_qs(urlparse(first_page["next"]).query)["cursor"][0]
+    response = dioptra_client.queues.get(
+        page_length=2,
+        sort_by=sort_by,
+        descending=descending,
+        cursor=next_cursor,
+        count_total=False,
+    )
+    assert response.status_code == HTTPStatus.OK
+    last_page = response.json()
+    assert last_page["totalNumResults"] is None
+    assert [queue["id"] for queue in last_page["data"]] == expected_ids[2:]
+    assert last_page["isComplete"]
+    assert "next" not in last_page
+
+    prev_cursor = parse_qs(urlparse(last_page["prev"]).query)["cursor"][0]
+    response = dioptra_client.queues.get(
+        page_length=2, sort_by=sort_by, descending=descending, cursor=prev_cursor
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert [queue["id"] for queue in response.json()["data"]] == expected_ids[:2]
+
+
+def test_queue_cursor_paging_rejects_mismatched_sort(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_queues: dict[str, Any],
+) -> None:
+    """Test that a cursor cannot be reused with a different sort order."""
+    response = dioptra_client.queues.get(page_length=1, sort_by="name", cursor="")
+    next_cursor = parse_qs(urlparse(response.json()["next"]).query)["cursor"][0]
+    response = dioptra_client.queues.get(
+        page_length=1, sort_by="name", descending=True, cursor=next_cursor
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
 def test_queue_search_query(
     dioptra_client: DioptraClient[DioptraResponseProtocol],
     auth_account: dict[str, Any],
@@ -475,6 +555,56 @@ def test_rename_queue(
     )
 
 
+def test_queue_fair_share(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+) -> None:
+    """Test that the fair-share mode of a queue can be set and changed.
+
+    Given an authenticated user, this test validates the following sequence of actions:
+
+    - The user registers a queue that shares jobs between users.
+    - The user changes the queue to share jobs between groups.
+    - The user cannot set an unknown fair-share mode.
+    """
+    group_id = auth_account["groups"][0]["id"]
+    queue = dioptra_client.queues.create(
+        group_id=group_id, name="shared_cpu", description="", fair_share="user"
+    ).json()
+    assert queue["fairShare"] == "user"
+
+    queue = dioptra_client.queues.modify_by_id(
+        queue_id=queue["id"], name="shared_cpu", description="", fair_share="group"
+    ).json()
+    assert queue["fairShare"] == "group"
+    assert dioptra_client.queues.get_by_id(queue["id"]).json()["fairShare"] == "group"
+
+    response = dioptra_client.queues.modify_by_id(
+        queue_id=queue["id"], name="shared_cpu", description="", fair_share="everyone"
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_queue_name_cannot_contain_colon(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+) -> None:
+    """Test that a queue name cannot contain the separator of the RQ queue names."""
+    group_id = auth_account["groups"][0]["id"]
+    response = dioptra_client.queues.create(
+        group_id=group_id, name="cpu:high", description=""
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    queue = dioptra_client.queues.create(
+        group_id=group_id, name="cpu", description=""
+    ).json()
+    response = dioptra_client.queues.modify_by_id(
+        queue_id=queue["id"], name="cpu:low", description=""
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
 def test_delete_queue_by_id(
     dioptra_client: DioptraClient[DioptraResponseProtocol],
     auth_account: dict[str, Any],
@@ -671,3 +801,97 @@ def test_tag_queue(
         queue["id"],
         tag_ids=tag_ids,
     )
+
+
+def test_queue_metrics(
+    client: FlaskClient,
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    registered_queues: dict[str, Any],
+    registered_jobs: dict[str, Any],
+) -> None:
+    """Test that the queue metrics report job counts and durations.
+
+    Given an authenticated user and registered jobs, this test validates the following
+    sequence of actions:
+
+    - A job is started one hour after it was queued, and finishes 30 minutes later.
+    - The queue metrics count the jobs on the queue by status, and report the queue
+      wait and run durations of the job.
+    - The same metrics are available in the Prometheus text format.
+    """
+    job = registered_jobs["job1"]
+    queue = registered_queues["queue1"]
+
+    with freeze_time("Apr 1st, 2025 2:00pm"):
+        dioptra_client.experiments.jobs.set_status(
+            experiment_id=job["experiment"]["id"], job_id=job["id"], status="started"
+        )
+
+    with freeze_time("Apr 1st, 2025 2:30pm"):
+        dioptra_client.experiments.jobs.set_status(
+            experiment_id=job["experiment"]["id"], job_id=job["id"], status="finished"
+        )
+
+    with freeze_time("Apr 1st, 2025 3:00pm"):
+        response = dioptra_client.queues.get_metrics(window=86400)
+        prometheus_response = client.get(
+            "/api/v1/queues/metrics", query_string={"format": "prometheus"}
+        )
+
+    assert response.status_code == HTTPStatus.OK
+
+    metrics = {item["name"]: item for item in response.json()["queues"]}
+    queue_metrics = metrics[queue["name"]]
+
+    assert queue_metrics["jobs"] == {
+        "queued": 2,
+        "deferred": 0,
+        "started": 0,
+        "finished": 1,
+        "failed": 0,
+    }
+    assert 7100 < queue_metrics["oldestQueuedSeconds"] <= 7200
+    assert queue_metrics["waitSeconds"]["count"] == 1
+    assert 3500 < queue_metrics["waitSeconds"]["p50"] <= 3600
+    assert queue_metrics["runSeconds"] == {
+        "count": 1,
+        "sum": 1800.0,
+        "p50": 1800.0,
+        "p95": 1800.0,
+    }
+    assert metrics[registered_queues["queue2"]["name"]]["waitSeconds"] == {
+        "count": 0,
+        "sum": 0.0,
+        "p50": None,
+        "p95": None,
+    }
+
+    assert prometheus_response.status_code == HTTPStatus.OK
+    assert prometheus_response.mimetype == "text/plain"
+
+    text = prometheus_response.get_data(as_text=True)
+
+    assert "# TYPE dioptra_queue_run_seconds gauge" in text
+    assert "dioptra_queue_metrics_window_seconds 86400" in text
+    assert f'dioptra_queue_jobs{{queue="{queue["name"]}",status="queued"}} 2' in text
+    assert (
+        f'dioptra_queue_run_seconds{{queue="{queue["name"]}",quantile="0.95"}} 1800.0'
+        in text
+    )
+    assert f'dioptra_queue_window_run_seconds{{queue="{queue["name"]}"}} 1800.0' in text
+    assert f'dioptra_queue_window_finished_jobs{{queue="{queue["name"]}"}} 1' in text
+    assert "dioptra_queue_run_seconds_sum" not in text
+
+
+@pytest.mark.parametrize(
+    "values, fraction, expected",
+    [
+        ([], 0.5, None),
+        ([4.0], 0.95, 4.0),
+        ([1.0, 2.0, 3.0, 4.0], 0.5, 2.5),
+        ([float(value) for value in range(1, 101)], 0.95, 95.05),
+    ],
+)
+def test_percentile(values: list[float], fraction: float, expected) -> None:
+    assert percentile(values, fraction) == pytest.approx(expected)
@@ -21,6 +21,7 @@ functionalities for the queue entity. The tests ensure that the queues can be
 registered, renamed, deleted, and locked/unlocked as expected through the REST API.
 """
 
+import json
 import shutil
 from http import HTTPStatus
 from pathlib import Path
@@ -28,10 +29,23 @@ from tempfile import NamedTemporaryFile
 from typing import Any
 
 import pytest
+from flask import Flask
+from flask.testing import FlaskClient
+from injector import Injector
 
 from dioptra.client import DioptraClient, DioptraFile
 from dioptra.client.base import DioptraResponseProtocol
 from dioptra.client.utils import select_one_or_more_files
+from dioptra.restapi.v1.shared import rq_service
+from dioptra.restapi.v1.workflows.service import (
+    IMPORT_STAGE_DONE,
+    IMPORT_STREAM_EXPIRED,
+    IMPORT_STREAM_TIMED_OUT,
+    ResourceImportProgress,
+    run_resource_import,
+)
+
+from ...lib import mock_rq
 
 # -- Assertions ------------------------------------------------------------------------
 
@@ -141,6 +155,51 @@ def assert_resource_import_overwrite_works(
     assert response.status_code == HTTPStatus.OK
 
 
+class FakeRQJob(object):
+    """A resource import job that has already finished."""
+
+    jobs: dict[str, "FakeRQJob"] = {}
+
+    def __init__(
+        self, id: str, func_name: str, meta: dict[str, Any], result: Any
+    ) -> None:
+        self.id = id
+        self.func_name = func_name
+        self.meta = meta
+        self._result = result
+
+    @classmethod
+    def fetch(cls, id: str, *args, **kwargs) -> "FakeRQJob":
+        if id not in cls.jobs:
+            raise rq_service.NoSuchJobError(id)
+
+        return cls.jobs[id]
+
+    def get_status(self, refresh: bool = True) -> str:
+        return "finished"
+
+    def return_value(self, refresh: bool = False) -> Any:
+        return self._result
+
+    def refresh(self) -> None:
+        pass
+
+
+class RunningFakeRQJob(FakeRQJob):
+    """A resource import job that is still running, until it expires."""
+
+    def __init__(self, *args, expires: bool = False, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._expires = expires
+
+    def get_status(self, refresh: bool = True) -> str:
+        return "started"
+
+    def refresh(self) -> None:
+        if self._expires:
+            raise rq_service.NoSuchJobError(self.id)
+
+
 # -- Tests -----------------------------------------------------------------------------
 
 
@@ -222,6 +281,41 @@ def test_resource_import_update(
     )
 
 
+@pytest.mark.skipif(shutil.which("git") is None, reason="git was not found.")
+def test_resource_import_update_reimport(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    auth_account: dict[str, Any],
+    resources_repo: str,
+):
+    group_id = auth_account["groups"][0]["id"]
+
+    response = dioptra_client.workflows.import_resources(
+        group_id=group_id, source=resources_repo
+    )
+    plugin_id = response.json()["resources"]["plugins"]["hello_world"]
+    files = dioptra_client.plugins.files.get(plugin_id).json()["data"]
+    snapshots = dioptra_client.plugins.snapshots.get(plugin_id).json()["data"]
+
+    response = dioptra_client.workflows.import_resources(
+        group_id=group_id,
+        source=resources_repo,
+        resolve_name_conflicts_strategy="update",
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["resources"]["plugins"]["hello_world"] == plugin_id
+
+    # The files are updated in place, with one new plugin snapshot for the updated
+    # plugin and one for all of its files
+    reimported_files = dioptra_client.plugins.files.get(plugin_id).json()["data"]
+    assert {file["id"]: file["filename"] for file in reimported_files} == {
+        file["id"]: file["filename"] for file in files
+    }
+    assert (
+        len(dioptra_client.plugins.snapshots.get(plugin_id).json()["data"])
+        == len(snapshots) + 2
+    )
+
+
 def test_resource_import_overwrite(
     dioptra_client: DioptraClient[DioptraResponseProtocol],
     auth_account: dict[str, Any],
@@ -273,3 +367,203 @@ def test_resource_import_duplicate_names_fail(
         assert_resource_import_fails_due_to_duplicate_names(
             dioptra_client, group_id, files
         )
+
+
+def test_resource_import_async(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    client: FlaskClient,
+    flask_app: Flask,
+    dependency_injector: Injector,
+    auth_account: dict[str, Any],
+    resources_tar_file: NamedTemporaryFile,
+    resources_import_config: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    enqueued: list[dict[str, Any]] = []
+
+    class RecordingRQQueue(mock_rq.MockRQQueue):
+        def enqueue(self, *args, **kwargs):
+            enqueued.append({"queue": self.name, "args": args, **kwargs})
+            return super().enqueue(*args, **kwargs)
+
+    monkeypatch.setattr(rq_service, "RQQueue", RecordingRQQueue)
+
+    group_id = auth_account["groups"][0]["id"]
+    response = dioptra_client.workflows.import_resources(
+        group_id=group_id, source=resources_tar_file, run_async=True
+    )
+    import_id = response.json()["id"]
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert response.json()["status"] == "queued"
+    assert dioptra_client.plugins.get().json()["data"] == []
+
+    # The import is queued with the uploaded archive for a worker to run
+    assert len(enqueued) == 1
+    assert enqueued[0]["queue"] == flask_app.config["DIOPTRA_RESOURCE_IMPORT_QUEUE"]
+    assert enqueued[0]["args"] == (rq_service.RUN_RESOURCE_IMPORT_FUNC,)
+    assert enqueued[0]["job_id"] == import_id
+    assert enqueued[0]["meta"] == {"user_id": auth_account["id"]}
+
+    updates: list[dict[str, Any]] = []
+    progress = ResourceImportProgress(
+        on_update=lambda progress: updates.append(progress.as_dict())
+    )
+    result = run_resource_import(
+        flask_app, dependency_injector, progress=progress, **enqueued[0]["kwargs"]
+    )
+
+    assert_imported_resources_match_expected(dioptra_client, resources_import_config)
+    # The config file, the four files of the two plugins, and the entrypoint files
+    assert progress.stage == IMPORT_STAGE_DONE
+    assert progress.files_parsed == 1 + 4 + len(resources_import_config["entrypoints"])
+    assert progress.resources_staged == 0
+    assert progress.resources_registered == (
+        len(resources_import_config["plugin_param_types"])
+        + len(resources_import_config["plugins"])
+        + 4
+        + len(resources_import_config["entrypoints"])
+    )
+    assert updates[-1] == progress.as_dict()
+
+    FakeRQJob.jobs = {
+        import_id: FakeRQJob(
+            import_id,
+            func_name=rq_service.RUN_RESOURCE_IMPORT_FUNC,
+            meta={"user_id": auth_account["id"], "progress": progress.as_dict()},
+            result=result,
+        ),
+        "other-user": FakeRQJob(
+            "other-user",
+            func_name=rq_service.RUN_RESOURCE_IMPORT_FUNC,
+            meta={"user_id": auth_account["id"] + 1},
+            result=result,
+        ),
+    }
+    monkeypatch.setattr(rq_service, "RQJob", FakeRQJob)
+
+    response = dioptra_client.workflows.get_resource_import(import_id)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "id": import_id,
+        "status": "finished",
+        "progress": {
+            "stage": IMPORT_STAGE_DONE,
+            "filesParsed": progress.files_parsed,
+            "resourcesStaged": 0,
+            "resourcesRegistered": progress.resources_registered,
+        },
+        "result": result,
+        "error": None,
+    }
+
+    response = client.get(f"/api/v1/workflows/resourceImport/{import_id}/events")
+    assert response.status_code == HTTPStatus.OK
+    assert response.mimetype == "text/event-stream"
+    assert response.get_data(as_text=True).count("data: ") == 1
+
+    for missing_id in ("other-user", "does-not-exist"):
+        response = dioptra_client.workflows.get_resource_import(missing_id)
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    "expires, stream_timeout, expected_status",
+    [(True, 3600, IMPORT_STREAM_EXPIRED), (False, 0, IMPORT_STREAM_TIMED_OUT)],
+)
+def test_resource_import_stream_ends_before_import(
+    client: FlaskClient,
+    flask_app: Flask,
+    auth_account: dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+    expires: bool,
+    stream_timeout: int,
+    expected_status: str,
+):
+    FakeRQJob.jobs = {
+        "running": RunningFakeRQJob(
+            "running",
+            func_name=rq_service.RUN_RESOURCE_IMPORT_FUNC,
+            meta={"user_id": auth_account["id"]},
+            result=None,
+            expires=expires,
+        )
+    }
+    monkeypatch.setattr(rq_service, "RQJob", FakeRQJob)
+    monkeypatch.setitem(
+        flask_app.config, "DIOPTRA_RESOURCE_IMPORT_STREAM_TIMEOUT", stream_timeout
+    )
+
+    response = client.get("/api/v1/workflows/resourceImport/running/events")
+    events = [
+        json.loads(line.removeprefix("data: "))
+        for line in response.get_data(as_text=True).splitlines()
+        if line.startswith("data: ")
+    ]
+
+    assert response.status_code == HTTPStatus.OK
+    assert [event["status"] for event in events] == ["started", expected_status]
+    assert events[-1]["error"] is not None
+
+
+def test_resource_import_async_upload_too_large(
+    dioptra_client: DioptraClient[DioptraResponseProtocol],
+    flask_app: Flask,
+    auth_account: dict[str, Any],
+    resources_tar_file: NamedTemporaryFile,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    enqueued: list[Any] = []
+
+    class RecordingRQQueue(mock_rq.MockRQQueue):
+        def enqueue(self, *args, **kwargs):
+            enqueued.append(kwargs)
+            return super().enqueue(*args, **kwargs)
+
+    monkeypatch.setattr(rq_service, "RQQueue", RecordingRQQueue)
+    monkeypatch.setitem(flask_app.config, "DIOPTRA_RESOURCE_IMPORT_MAX_UPLOAD_SIZE", 16)
+
+    response = dioptra_client.workflows.import_resources(
+        group_id=auth_account["groups"][0]["id"],
+        source=resources_tar_file,
+        run_async=True,
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert enqueued == []
+
+
+def test_resource_import_task_records_unexpected_errors(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    import importlib
+
+    import dioptra.restapi
+    from dioptra.restapi import bootstrap
+    from dioptra.restapi.v1.workflows import service as workflows_service
+
+    task_module = importlib.import_module("dioptra.rq.tasks.run_resource_import")
+
+    class FakeJob(object):
+        id = "import-id"
+
+        def __init__(self) -> None:
+            self.meta: dict[str, Any] = {}
+
+        def save_meta(self) -> None:
+            pass
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("disk full")
+
+    job = FakeJob()
+    monkeypatch.setattr(task_module, "get_current_job", lambda: job)
+    monkeypatch.setattr(bootstrap, "bind_dependencies", lambda binder: None)
+    monkeypatch.setattr(bootstrap, "register_providers", lambda modules: None)
+    monkeypatch.setattr(dioptra.restapi, "create_app", lambda *args, **kwargs: None)
+    monkeypatch.setattr(workflows_service, "run_resource_import", fail)
+
+    with pytest.raises(RuntimeError):
+        task_module.run_resource_import(user_id=1)
+
+    assert job.meta["error"] == "The resource import failed: RuntimeError: disk full"
@@ -0,0 +1,198 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("tensorflow")
+pytest.importorskip("imgaug")
+
+from dioptra.sdk.object_detection.data.annotations import (  # noqa: E402
+    AnnotationCache,
+    AnnotationData,
+    NumpyAnnotationEncoding,
+    PascalVOCAnnotationData,
+    cache,
+)
+
+LABELS = ["cat", "dog"]
+
+
+def _write_annotation(path: Path, objects: list[tuple[str, int, int, int, int]]):
+    object_elements = "".join(
+        f"<object><name>{name}</name><bndbox><xmin>{xmin}</xmin><ymin>{ymin}</ymin>"
+        f"<xmax>{xmax}</xmax><ymax>{ymax}</ymax></bndbox></object>"
+        for name, xmin, ymin, xmax, ymax in objects
+    )
+    path.write_text(
+        "<annotation><size><width>100</width><height>200</height></size>"
+        f"{object_elements}</annotation>"
+    )
+
+
+@pytest.fixture
+def annotation_data() -> PascalVOCAnnotationData:
+    return PascalVOCAnnotationData(labels=LABELS, encoding=NumpyAnnotationEncoding())
+
+
+@pytest.fixture
+def annotation_files(tmp_path: Path) -> list[str]:
+    annotations_dir = tmp_path / "annotations"
+    annotations_dir.mkdir()
+    filepaths = []
+
+    for idx in range(7):
+        filepath = annotations_dir / f"image_{idx}.xml"
+        # image_0.xml has no objects
+        objects = [
+            (LABELS[(idx + obj) % 2], obj, 2 * obj, 10 + obj, 20 + idx)
+            for obj in range(idx % 4)
+        ]
+        _write_annotation(filepath, objects)
+        filepaths.append(str(filepath))
+
+    return filepaths
+
+
+def _assert_matches_files(
+    annotation_cache: AnnotationCache,
+    annotation_data: PascalVOCAnnotationData,
+    filepaths: list[str],
+) -> None:
+    assert len(annotation_cache) == len(filepaths)
+
+    for filepath in filepaths:
+        boxes, labels = annotation_cache.get(filepath.encode())
+        expected_boxes, expected_labels = annotation_data.get(filepath)
+
+        assert boxes.dtype == expected_boxes.dtype
+        assert labels.dtype == expected_labels.dtype
+        np.testing.assert_array_equal(boxes, expected_boxes.reshape(-1, 4))
+        np.testing.assert_array_equal(labels, expected_labels)
+
+
+def test_build_annotation_cache(annotation_data, annotation_files) -> None:
+    annotation_cache = AnnotationCache.build(annotation_data, annotation_files)
+
+    _assert_matches_files(annotation_cache, annotation_data, annotation_files)
+    assert annotation_cache.get(annotation_files[0])[0].shape == (0, 4)
+    assert "missing.xml" not in annotation_cache
+
+
+def test_build_annotation_cache_in_parallel(
+    annotation_data, annotation_files, monkeypatch
+) -> None:
+    monkeypatch.setattr(cache, "CHUNK_SIZE", 3)
+
+    annotation_cache = AnnotationCache.build(
+        annotation_data, annotation_files, max_workers=2
+    )
+
+    _assert_matches_files(annotation_cache, annotation_data, annotation_files)
+
+
+def test_annotation_cache_file(
+    annotation_data, annotation_files, tmp_path, monkeypatch
+) -> None:
+    cache_path = tmp_path / "cache" / "annotations.npz"
+    AnnotationCache.load_or_build(annotation_data, annotation_files, path=cache_path)
+
+    assert cache_path.exists()
+
+    # a fresh cache file is loaded without parsing the files again
+    def fail_build(*args, **kwargs):
+        raise AssertionError("annotations parsed again")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(AnnotationCache, "build", fail_build)
+        annotation_cache = AnnotationCache.load_or_build(
+            annotation_data, annotation_files, path=cache_path
+        )
+
+    _assert_matches_files(annotation_cache, annotation_data, annotation_files)
+
+    # modifying a file makes the cache file stale
+    _write_annotation(Path(annotation_files[0]), [("dog", 1, 2, 3, 4)])
+    stat = os.stat(annotation_files[0])
+    os.utime(annotation_files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    annotation_cache = AnnotationCache.load_or_build(
+        annotation_data, annotation_files, path=cache_path
+    )
+
+    _assert_matches_files(annotation_cache, annotation_data, annotation_files)
+    assert len(annotation_cache.get(annotation_files[0])[1]) == 1
+
+
+def test_annotation_cache_stale_on_new_labels(annotation_files, tmp_path) -> None:
+    cache_path = tmp_path / "annotations.npz"
+    annotation_data = PascalVOCAnnotationData(
+        labels=LABELS, encoding=NumpyAnnotationEncoding()
+    )
+    AnnotationCache.load_or_build(annotation_data, annotation_files, path=cache_path)
+
+    reordered_annotation_data = PascalVOCAnnotationData(
+        labels=list(reversed(LABELS)), encoding=NumpyAnnotationEncoding()
+    )
+    annotation_cache = AnnotationCache.load_or_build(
+        reordered_annotation_data, annotation_files, path=cache_path
+    )
+
+    _assert_matches_files(annotation_cache, reordered_annotation_data, annotation_files)
+
+
+def test_annotation_cache_stale_on_new_encoding(annotation_files, tmp_path) -> None:
+    cache_path = tmp_path / "annotations.npz"
+    annotation_data = PascalVOCAnnotationData(
+        labels=LABELS, encoding=NumpyAnnotationEncoding()
+    )
+    AnnotationCache.load_or_build(annotation_data, annotation_files, path=cache_path)
+
+    float64_annotation_data = PascalVOCAnnotationData(
+        labels=LABELS,
+        encoding=NumpyAnnotationEncoding(boxes_dtype="float64", labels_dtype="int64"),
+    )
+    annotation_cache = AnnotationCache.load_or_build(
+        float64_annotation_data, annotation_files, path=cache_path
+    )
+
+    _assert_matches_files(annotation_cache, float64_annotation_data, annotation_files)
+    assert annotation_cache.get(annotation_files[1])[0].dtype == np.float64
+
+
+def test_annotation_cache_without_encoding(annotation_data, annotation_files) -> None:
+    class UnencodedAnnotationData(AnnotationData):
+        labels = annotation_data.labels
+
+        def get(self, y):
+            return annotation_data.get(y)
+
+        def read_file(self, filepath):
+            return annotation_data.read_file(filepath)
+
+    unencoded_annotation_data = UnencodedAnnotationData()
+    assert unencoded_annotation_data.encoding is None
+    assert cache.fingerprint_annotations(unencoded_annotation_data, annotation_files)
+
+    empty_cache = AnnotationCache.build(unencoded_annotation_data, [])
+    assert len(empty_cache) == 0
+
+    annotation_cache = AnnotationCache.build(
+        unencoded_annotation_data, annotation_files
+    )
+    _assert_matches_files(annotation_cache, annotation_data, annotation_files)
@@ -0,0 +1,196 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+pytest.importorskip("tensorflow")
+
+from dioptra.sdk.object_detection.bounding_boxes.postprocessing import (  # noqa: E402
+    TensorflowBoundingBoxesYOLOV1Confluence,
+)
+
+
+def _normalise(x1, y1, x2, y2, min_x, max_x, min_y, max_y):
+    return (
+        (x1 - min_x) / (max_x - min_x),
+        (y1 - min_y) / (max_y - min_y),
+        (x2 - min_x) / (max_x - min_x),
+        (y2 - min_y) / (max_y - min_y),
+    )
+
+
+def _reference_retain_class_boxes(
+    dets: npt.NDArray,
+    confluence_threshold: float,
+    score_threshold: float,
+    gaussian: bool,
+    sigma: float,
+) -> list[npt.NDArray]:
+    """
+    The box by box Confluence implementation that retain_class_boxes() replaced,
+    kept to check that the vectorized one returns the same boxes and scores.
+    """
+    dets = dets.copy()
+    retain = []
+
+    while dets.size > 0:
+        confluence_scores = []
+        proximities = []
+
+        for current_box in range(len(dets)):
+            x1, y1, x2, y2, confidence_score = dets[current_box]
+            others = dets[np.arange(len(dets)) != current_box]
+            xx1, yy1, xx2, yy2, cconf = others.T
+
+            min_x = np.minimum(x1, xx1)
+            min_y = np.minimum(y1, yy1)
+            max_x = np.maximum(x2, xx2)
+            max_y = np.maximum(y2, yy2)
+
+            x1, y1, x2, y2 = _normalise(x1, y1, x2, y2, min_x, max_x, min_y, max_y)
+            xx1, yy1, xx2, yy2 = _normalise(
+                xx1, yy1, xx2, yy2, min_x, max_x, min_y, max_y
+            )
+
+            proximity = abs(x1 - xx1) + abs(x2 - xx2) + abs(y1 - yy1) + abs(y2 - yy2)
+            confluent = proximity <= confluence_threshold
+            all_proximities = np.where(confluent, proximity, 1.0)
+            cconf_scores = np.where(confluent, cconf, 0.0)
+
+            if cconf_scores.size > 0:
+                confluence_scores.append(np.amax(cconf_scores))
+                proximities.append(
+                    (sum(all_proximities) / all_proximities.size)
+                    * (1 - confidence_score)
+                )
+
+            else:
+                confluence_scores.append(confidence_score)
+                proximities.append(0.0)
+
+        min_idx = int(np.argmin(proximities))
+        dets[[0, min_idx], :] = dets[[min_idx, 0], :]
+        dets[0, 4] = confluence_scores[min_idx]
+        retain.append(dets[0].copy())
+
+        x1, y1, x2, y2 = dets[0, :4]
+        xx1, yy1, xx2, yy2 = dets[1:, :4].T
+        min_x = np.minimum(x1, xx1)
+        min_y = np.minimum(y1, yy1)
+        max_x = np.maximum(x2, xx2)
+        max_y = np.maximum(y2, yy2)
+
+        x1, y1, x2, y2 = _normalise(x1, y1, x2, y2, min_x, max_x, min_y, max_y)
+        xx1, yy1, xx2, yy2 = _normalise(xx1, yy1, xx2, yy2, min_x, max_x, min_y, max_y)
+
+        distance = abs(x1 - xx1) + abs(x2 - xx2) + abs(y1 - yy1) + abs(y2 - yy2)
+        confluent = distance <= confluence_threshold
+
+        if gaussian:
+            weights = np.exp(-((1 - distance) * (1 - distance)) / sigma)
+
+        else:
+            weights = distance
+
+        dets[1:, 4] *= np.where(confluent, weights, 1.0)
+        dets = dets[np.where(dets[1:, 4] >= score_threshold)[0] + 1, :]
+
+    return retain
+
+
+def _make_detections(num_boxes: int, seed: int) -> npt.NDArray:
+    """Make clusters of overlapping boxes, like the raw detections of a model."""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(0.0, 1.0, size=(num_boxes // 8 + 1, 2))
+    box_centers = centers[rng.integers(0, len(centers), size=num_boxes)]
+    box_centers += rng.normal(0.0, 0.02, size=(num_boxes, 2))
+    box_sizes = rng.uniform(0.05, 0.3, size=(num_boxes, 2))
+    scores = rng.uniform(0.05, 1.0, size=(num_boxes, 1))
+
+    dets = np.concatenate(
+        [box_centers - box_sizes / 2, box_centers + box_sizes / 2, scores], axis=1
+    )
+    # include a duplicate box, which ties with the original
+    if num_boxes > 1:
+        dets[1] = dets[0]
+
+    return dets.astype("float32").astype("float64")
+
+
+@pytest.mark.parametrize("gaussian", [False, True])
+@pytest.mark.parametrize(
+    "num_boxes, confluence_threshold, score_threshold",
+    [(1, 0.8, 0.5), (2, 0.8, 0.5), (50, 0.8, 0.5), (200, 0.5, 0.3), (200, 1.2, 0.1)],
+)
+def test_retain_class_boxes_matches_reference(
+    num_boxes: int, confluence_threshold: float, score_threshold: float, gaussian: bool
+) -> None:
+    confluence = TensorflowBoundingBoxesYOLOV1Confluence.on_grid_shape(
+        grid_shape=(7, 7),
+        confluence_threshold=confluence_threshold,
+        score_threshold=score_threshold,
+        gaussian=gaussian,
+    )
+    dets = _make_detections(num_boxes, seed=num_boxes)
+
+    retained = confluence.retain_class_boxes(dets.copy())
+    expected = _reference_retain_class_boxes(
+        dets,
+        confluence_threshold=confluence_threshold,
+        score_threshold=score_threshold,
+        gaussian=gaussian,
+        sigma=0.5,
+    )
+
+    assert len(retained) == len(expected)
+    np.testing.assert_array_equal(np.array(retained), np.array(expected))
+
+
+def test_confluence_batch_output() -> None:
+    confluence = TensorflowBoundingBoxesYOLOV1Confluence.on_grid_shape(
+        grid_shape=(7, 7), min_detection_score=0.0
+    )
+    dets = np.stack([_make_detections(60, seed=0), _make_detections(60, seed=1)])
+    labels = np.tile(np.arange(60, dtype="int32") % 3, (2, 1))
+
+    boxes, scores, classes, detections = confluence.confluence(
+        dets[..., :4].astype("float32"), dets[..., 4].astype("float32"), labels
+    )
+
+    assert boxes.shape[:2] == scores.shape == classes.shape
+    assert boxes.dtype == scores.dtype == np.float32
+    assert classes.dtype == detections.dtype == np.int32
+
+    for batch_idx in range(2):
+        num_detections = detections[batch_idx]
+        expected = [
+            box
+            for label in range(3)
+            for box in _reference_retain_class_boxes(
+                dets[batch_idx][labels[batch_idx] == label],
+                confluence_threshold=0.8,
+                score_threshold=0.5,
+                gaussian=False,
+                sigma=0.5,
+            )
+        ]
+
+        assert num_detections == len(expected)
+        np.testing.assert_allclose(
+            scores[batch_idx, :num_detections], [box[4] for box in expected]
+        )
@@ -0,0 +1,89 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dioptra.sdk.utilities.artifact_uploader import ArtifactUploader
+
+ARTIFACT_URI = "s3://mlflow/1/run1/artifacts"
+
+
+class FakeMlflowClient(object):
+    """Records the artifacts logged to a run, optionally blocking the uploads."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.logged: list[tuple[str, str, str]] = []
+        self.release = threading.Event()
+        self.release.set()
+        self._fail = fail
+
+    def get_run(self, run_id: str) -> SimpleNamespace:
+        return SimpleNamespace(info=SimpleNamespace(artifact_uri=ARTIFACT_URI))
+
+    def log_artifact(self, run_id: str, local_path: str, artifact_path: str) -> None:
+        self.release.wait()
+
+        if self._fail:
+            raise RuntimeError("upload failed")
+
+        self.logged.append(("file", local_path, artifact_path))
+
+    def log_artifacts(self, run_id: str, local_dir: str, artifact_path: str) -> None:
+        self.logged.append(("dir", local_dir, artifact_path))
+
+
+def _entry(name: str, path: Path) -> dict:
+    return {"name": name, "task_plugin_snapshot_id": 1, "task_id": 2, "path": str(path)}
+
+
+def test_uploads_run_in_background_and_keep_submission_order(tmp_path: Path) -> None:
+    (tmp_path / "array.npy").write_bytes(b"")
+    (tmp_path / "checkpoint").mkdir()
+    client = FakeMlflowClient()
+    client.release.clear()
+
+    with ArtifactUploader("run1", max_workers=2, client=client) as uploader:
+        try:
+            uploader.submit(_entry("array", tmp_path / "array.npy"))
+            uploader.submit(_entry("checkpoint", tmp_path / "checkpoint"))
+
+            # submit() returns while the file upload is still blocked
+            assert all(kind != "file" for kind, _, _ in client.logged)
+
+        finally:
+            client.release.set()
+
+        uploaded = uploader.wait()
+
+    assert [item["artifact"]["name"] for item in uploaded] == ["array", "checkpoint"]
+    assert [item["uri"] for item in uploaded] == [
+        f"{ARTIFACT_URI}/array/array.npy",
+        f"{ARTIFACT_URI}/checkpoint/checkpoint",
+    ]
+
+
+def test_wait_raises_upload_errors(tmp_path: Path) -> None:
+    (tmp_path / "array.npy").write_bytes(b"")
+
+    with ArtifactUploader("run1", client=FakeMlflowClient(fail=True)) as uploader:
+        uploader.submit(_entry("array", tmp_path / "array.npy"))
+
+        with pytest.raises(RuntimeError, match="upload failed"):
+            uploader.wait()
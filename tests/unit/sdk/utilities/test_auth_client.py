@@ -0,0 +1,79 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import logging
+
+import pytest
+
+from dioptra.client import connect_json_dioptra_client
+from dioptra.sdk.utilities import auth_client
+from dioptra.sdk.utilities.auth_client import (
+    get_authenticated_worker_client,
+    share_worker_client,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def no_login(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _login_worker_client(*args, **kwargs):
+        raise AssertionError("The worker client logged in again.")
+
+    monkeypatch.setattr(auth_client, "_login_worker_client", _login_worker_client)
+
+
+def test_shared_worker_client_is_reused(no_login) -> None:
+    client = connect_json_dioptra_client("http://localhost")
+    client.auth.use_token("token")
+
+    with share_worker_client(client, "json") as shared_client:
+        assert shared_client is client
+        assert get_authenticated_worker_client(LOGGER, "json") is client
+
+        response_client = get_authenticated_worker_client(LOGGER, "response")
+
+        assert get_authenticated_worker_client(LOGGER, "response") is response_client
+        assert (
+            response_client.session._get_requests_session()
+            is client.session._get_requests_session()
+        )
+        assert (
+            response_client.session._get_requests_session().headers["Authorization"]
+            == "Bearer token"
+        )
+
+    assert auth_client._worker_clients == {}
+
+
+def test_nested_share_keeps_outer_worker_client(no_login) -> None:
+    client = connect_json_dioptra_client("http://localhost")
+    other_client = connect_json_dioptra_client("http://localhost")
+
+    with share_worker_client(client, "json"):
+        with share_worker_client(other_client, "json") as shared_client:
+            assert shared_client is client
+
+        assert get_authenticated_worker_client(LOGGER, "json") is client
+
+
+def test_worker_client_requires_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DIOPTRA_API", "http://localhost")
+    monkeypatch.delenv("DIOPTRA_WORKER_TOKEN", raising=False)
+    monkeypatch.delenv("DIOPTRA_WORKER_USERNAME", raising=False)
+
+    with pytest.raises(ValueError):
+        get_authenticated_worker_client(LOGGER, "json")
@@ -0,0 +1,132 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from dioptra.sdk.api.artifact import ArtifactTaskInterface
+from dioptra.sdk.utilities.plugin_loader import (
+    ARTIFACT_PLUGINS_PACKAGE,
+    ArtifactPluginLoader,
+)
+
+TASKS_MODULE = textwrap.dedent(
+    """
+    from pathlib import Path
+
+    from dioptra.sdk.api.artifact import ArtifactTaskInterface
+
+    from .version import VERSION
+
+    with Path(__file__).with_suffix(".imports").open("a") as f:
+        f.write("imported\\n")
+
+
+    class StringArtifactTask(ArtifactTaskInterface):
+        version = VERSION
+
+        @staticmethod
+        def serialize(working_dir, name, contents, **kwargs):
+            path = (working_dir / name).with_suffix(".txt")
+            path.write_text(contents)
+            return path
+
+        @staticmethod
+        def deserialize(working_dir, path, **kwargs):
+            return (working_dir / path).read_text()
+
+        @staticmethod
+        def validation():
+            return None
+
+
+    NOT_A_TASK = 1
+    """
+)
+
+
+def _write_plugin(root: Path, name: str, version: int) -> Path:
+    plugin_dir = root / name
+    plugin_dir.mkdir(parents=True)
+    (plugin_dir / "__init__.py").write_text("")
+    (plugin_dir / "version.py").write_text(f"VERSION = {version}\n")
+    (plugin_dir / "tasks.py").write_text(TASKS_MODULE)
+    return plugin_dir
+
+
+def test_artifact_plugin_is_imported_once(tmp_path: Path) -> None:
+    plugin_dir = _write_plugin(tmp_path / "serialize", "my_artifacts", version=1)
+
+    with ArtifactPluginLoader() as loader:
+        loader.add_plugin(plugin_id=3, plugin_snapshot_id=17, path=plugin_dir)
+        # A second directory for the same snapshot is ignored
+        loader.add_plugin(plugin_id=3, plugin_snapshot_id=17, path=tmp_path / "other")
+
+        task = loader.get_task(3, 17, "tasks.py", "StringArtifactTask")
+
+        assert task is not None and issubclass(task, ArtifactTaskInterface)
+        assert loader.get_task(3, 17, "tasks", "StringArtifactTask") is task
+        assert loader.get_task(3, 17, "tasks.py", "NOT_A_TASK") is None
+        assert loader.get_task(3, 17, "tasks.py", "MissingTask") is None
+        assert "my_artifacts" not in sys.modules
+
+    assert (plugin_dir / "tasks.imports").read_text() == "imported\n"
+    assert not any(name.startswith(ARTIFACT_PLUGINS_PACKAGE) for name in sys.modules)
+
+
+def test_artifact_plugin_snapshots_are_isolated(tmp_path: Path) -> None:
+    serialize_dir = _write_plugin(tmp_path / "serialize", "my_artifacts", version=2)
+    deserialize_dir = _write_plugin(tmp_path / "deserialize", "3_16", version=1)
+
+    with ArtifactPluginLoader() as loader:
+        loader.add_plugin(plugin_id=3, plugin_snapshot_id=17, path=serialize_dir)
+        loader.add_plugin(plugin_id=3, plugin_snapshot_id=16, path=deserialize_dir)
+        new_task = loader.get_task(3, 17, "tasks.py", "StringArtifactTask")
+        old_task = loader.get_task(3, 16, "tasks.py", "StringArtifactTask")
+
+    assert new_task is not None and old_task is not None
+    assert new_task.version == 2
+    assert old_task.version == 1
+
+
+def test_artifact_plugin_loader_unloads_only_its_modules(tmp_path: Path) -> None:
+    first_dir = _write_plugin(tmp_path / "first", "my_artifacts", version=1)
+    second_dir = _write_plugin(tmp_path / "second", "my_artifacts", version=2)
+
+    with ArtifactPluginLoader() as first_loader:
+        first_loader.add_plugin(plugin_id=3, plugin_snapshot_id=16, path=first_dir)
+        first_loader.get_task(3, 16, "tasks.py", "StringArtifactTask")
+
+        with ArtifactPluginLoader() as second_loader:
+            second_loader.add_plugin(
+                plugin_id=3, plugin_snapshot_id=17, path=second_dir
+            )
+            second_loader.get_task(3, 17, "tasks.py", "StringArtifactTask")
+
+        assert f"{ARTIFACT_PLUGINS_PACKAGE}.p3_17.tasks" not in sys.modules
+        assert f"{ARTIFACT_PLUGINS_PACKAGE}.p3_16.tasks" in sys.modules
+        assert ARTIFACT_PLUGINS_PACKAGE in sys.modules
+
+    assert not any(name.startswith(ARTIFACT_PLUGINS_PACKAGE) for name in sys.modules)
+
+
+def test_unregistered_artifact_plugin_is_not_found(tmp_path: Path) -> None:
+    with ArtifactPluginLoader() as loader:
+        with pytest.raises(ModuleNotFoundError):
+            loader.get_task(3, 17, "tasks.py", "StringArtifactTask")
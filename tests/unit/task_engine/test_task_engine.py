@@ -14,9 +14,12 @@
 #
 # ACCESS THE FULL CC BY 4.0 LICENSE HERE:
 # https://creativecommons.org/licenses/by/4.0/legalcode
+import collections
 import contextlib
 import functools
+import json
 import pathlib
+import threading
 from typing import Any, Callable, Iterator, Mapping, MutableMapping
 
 import pytest
@@ -24,6 +27,7 @@ import pytest
 import dioptra.pyplugs
 import dioptra.pyplugs._plugins
 import dioptra.task_engine.task_engine
+import dioptra.task_engine.util
 from dioptra.sdk.exceptions.task_engine import (
     IllegalOutputReferenceError,
     IllegalPluginNameError,
@@ -37,6 +41,7 @@ from dioptra.sdk.exceptions.task_engine import (
 )
 
 _output = None
+_serialized: dict[str, threading.Event] = collections.defaultdict(threading.Event)
 
 
 def capture_return(f: Callable[..., Any]) -> Callable[..., Any]:
@@ -89,6 +94,38 @@ def hello() -> str:
     return "hello"
 
 
+@capture_return
+def wait_for_artifact(name: str) -> bool:
+    """
+    Simple function which waits for an artifact to be serialized, to register
+    with pyplugs, for testing
+    """
+    return _serialized[name].wait(timeout=10)
+
+
+class TextArtifactTask(object):
+    """Artifact task which writes the contents to a text file, for testing"""
+
+    @staticmethod
+    def serialize(working_dir: pathlib.Path, name: str, contents: Any, **kwargs):
+        if contents == "fail":
+            raise ValueError(contents)
+
+        path = working_dir / f"{name}.txt"
+        path.write_text(str(contents))
+        _serialized[name].set()
+
+        return path
+
+    @staticmethod
+    def deserialize(working_dir: pathlib.Path, path: str, **kwargs) -> Any:
+        return (working_dir / path).read_text()
+
+    @staticmethod
+    def validation() -> dict[str, Any] | None:
+        return None
+
+
 @contextlib.contextmanager
 def pyplugs_register(*funcs: Callable[..., Any]) -> Iterator[None]:
     """
@@ -156,6 +193,7 @@ def require_plugins(
     """
 
     def wrap(f):
+        @functools.wraps(f)
         def wrapper(*args, **kwargs):
             with pyplugs_register(*funcs):
                 return f(*args, **kwargs)
@@ -166,17 +204,23 @@ def require_plugins(
 
 
 def _run_experiment(
-    experiment_desc: Mapping[str, Any], global_parameters: MutableMapping[str, Any]
+    experiment_desc: Mapping[str, Any],
+    global_parameters: MutableMapping[str, Any],
+    on_artifact: Callable[..., None] | None = None,
 ):
+    artifact_tasks = {
+        "text": {"task": TextArtifactTask, "plugin_snapshot_id": 1, "task_id": 2}
+    }
     dioptra.task_engine.task_engine.run_experiment(
         experiment_desc=experiment_desc,
         global_parameters=global_parameters,
         artifact_parameters={},
-        artifact_tasks={},
+        artifact_tasks=artifact_tasks,
         artifacts_dir=pathlib.Path(),
         deserialize_dir=pathlib.Path(),
         plugins_dir=pathlib.Path(),
         serialize_dir=pathlib.Path(),
+        on_artifact=on_artifact,
     )
 
 
@@ -573,3 +617,117 @@ def test_illegal_plugin_name() -> None:
         _run_experiment(experiment_desc=desc, global_parameters={})
 
     assert e.value.plugin_name == "foo"
+
+
+@pytest.fixture
+def artifacts_working_dir(tmp_path, monkeypatch) -> pathlib.Path:
+    (tmp_path / ".dioptra").mkdir()
+    monkeypatch.chdir(tmp_path)
+    _serialized.clear()
+
+    return tmp_path
+
+
+@require_plugins(add, square, wait_for_artifact)
+def test_artifacts_serialized_during_steps(artifacts_working_dir) -> None:
+    desc = {
+        "parameters": {"x": 5},
+        "tasks": {
+            "add": {
+                "plugin": "tests.unit.task_engine.test_task_engine.add",
+                "outputs": {"value": "sometype"},
+            },
+            "square": {
+                "plugin": "tests.unit.task_engine.test_task_engine.square",
+                "outputs": {"value": "sometype"},
+            },
+            "wait_for_artifact": {
+                "plugin": "tests.unit.task_engine.test_task_engine.wait_for_artifact"
+            },
+        },
+        "graph": {
+            "step1": {"add": [1, 2]},
+            "step2": {"square": ["$step1"]},
+            # the last step, which is not downstream of step2, only finishes once
+            # the artifact from step2 has been serialized, which must happen while
+            # the steps are still running
+            "step3": {"wait_for_artifact": ["square"], "dependencies": ["step1"]},
+        },
+        "artifact_outputs": {
+            "square": {"contents": "$step2", "task": {"name": "text"}},
+            "param": {"contents": "$x", "task": {"name": "text"}},
+        },
+    }
+    handed_off = []
+
+    _run_experiment(
+        experiment_desc=desc, global_parameters={}, on_artifact=handed_off.append
+    )
+
+    assert _output is True
+    assert (artifacts_working_dir / "square.txt").read_text() == "9"
+    assert (artifacts_working_dir / "param.txt").read_text() == "5"
+    assert sorted(artifact["name"] for artifact in handed_off) == ["param", "square"]
+
+    with (artifacts_working_dir / ".dioptra" / "artifacts.json").open() as file:
+        artifacts = json.load(file)["artifacts"]
+
+    assert [artifact["name"] for artifact in artifacts] == ["square", "param"]
+    assert artifacts[0]["path"] == (artifacts_working_dir / "square.txt").as_posix()
+
+
+def test_artifact_steps() -> None:
+    graph = {
+        "step1": {"add": [1, 2]},
+        "step2": {"square": ["$step1"]},
+        "step3": {"square": [3]},
+        "step4": {"add": ["$step3", 1], "dependencies": "step2"},
+    }
+    artifacts = {
+        "a": {"contents": "$step1"},
+        "b": {"contents": {"x": "$step3", "y": "$step2.value"}},
+        "c": {"contents": "$param"},
+    }
+
+    artifact_steps = dioptra.task_engine.util.get_artifact_steps(artifacts, graph)
+
+    assert artifact_steps == {
+        "a": {"step1", "step2", "step4"},
+        "b": {"step2", "step3", "step4"},
+        "c": set(),
+    }
+
+
+def test_artifact_steps_downstream() -> None:
+    # tune may modify the object created by init, which it gets through train
+    graph = {
+        "init": {"hello": []},
+        "train": {"square": ["$init"]},
+        "tune": {"square": ["$train"]},
+        "other": {"hello": []},
+    }
+    artifacts = {"model": {"contents": "$init"}}
+
+    artifact_steps = dioptra.task_engine.util.get_artifact_steps(artifacts, graph)
+
+    assert artifact_steps == {"model": {"init", "train", "tune"}}
+
+
+@require_plugins(add)
+def test_artifact_serialize_error(artifacts_working_dir) -> None:
+    desc = {
+        "parameters": {"x": "fail"},
+        "tasks": {
+            "add": {
+                "plugin": "tests.unit.task_engine.test_task_engine.add",
+                "outputs": {"value": "sometype"},
+            }
+        },
+        "graph": {"step1": {"add": [1, 2]}},
+        "artifact_outputs": {"bad": {"contents": "$x", "task": {"name": "text"}}},
+    }
+
+    with pytest.raises(ValueError, match="fail"):
+        _run_experiment(experiment_desc=desc, global_parameters={})
+
+    assert not (artifacts_working_dir / ".dioptra" / "artifacts.json").exists()
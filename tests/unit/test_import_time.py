@@ -0,0 +1,80 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+"""Import-time budgets for the entry points that start up on every job or command.
+
+Each module is imported in a fresh interpreter with ``python -X importtime``. The
+heavy dependencies listed for a module must not be imported with it, and the total
+import time must stay within its budget. The budgets are generous, so that they only
+catch a heavy dependency creeping back into the import chain.
+"""
+
+import subprocess
+import sys
+from typing import Final
+
+import pytest
+
+HEAVY_DEPENDENCIES: Final[tuple[str, ...]] = ("mlflow", "pandas", "tensorflow")
+
+# (module, budget in seconds, dependencies that must not be imported)
+IMPORT_BUDGETS: Final[list[tuple[str, float, tuple[str, ...]]]] = [
+    ("dioptra.client", 1.0, HEAVY_DEPENDENCIES + ("structlog", "jsonschema")),
+    ("dioptra.task_engine.validate", 1.5, HEAVY_DEPENDENCIES + ("pyparsing",)),
+    ("dioptra.worker.dioptra_worker_v1", 2.5, HEAVY_DEPENDENCIES),
+    ("dioptra.sdk.utilities.run_dioptra_job", 2.5, HEAVY_DEPENDENCIES),
+]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import a module in a new interpreter and report the cumulative import times.
+
+    Args:
+        module: The name of the module to import.
+
+    Returns:
+        A dictionary mapping the name of each imported module to its cumulative
+        import time in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+@pytest.mark.parametrize("module, budget, excluded", IMPORT_BUDGETS)
+def test_import_time_is_within_budget(
+    module: str, budget: float, excluded: tuple[str, ...]
+) -> None:
+    times = _import_times(module)
+    imported_excluded = [name for name in excluded if name in times]
+
+    assert imported_excluded == []
+    assert times[module] / 1e6 < budget
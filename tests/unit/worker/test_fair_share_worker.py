@@ -0,0 +1,151 @@
+# This Software (Dioptra) is being made available as a public service by the
+# National Institute of Standards and Technology (NIST), an Agency of the United
+# States Department of Commerce. This software was developed in part by employees of
+# NIST and in part by NIST contractors. Copyright in portions of this software that
+# were developed by NIST contractors has been licensed or assigned to NIST. Pursuant
+# to Title 17 United States Code Section 105, works of NIST employees are not
+# subject to copyright protection in the United States. However, NIST may hold
+# international copyright in software created by its employees and domestic
+# copyright (or licensing rights) in portions of software that were assigned or
+# licensed to NIST. To the extent that NIST holds copyright in this software, it is
+# being made available under the Creative Commons Attribution 4.0 International
+# license (CC BY 4.0). The disclaimers of the CC BY 4.0 license apply to all parts
+# of the software developed or licensed by NIST.
+#
+# ACCESS THE FULL CC BY 4.0 LICENSE HERE:
+# https://creativecommons.org/licenses/by/4.0/legalcode
+from typing import Any
+
+import pytest
+from redis import Redis
+
+import dioptra.worker.fair_share_worker as fair_share_worker
+from dioptra.rq.scheduling import (
+    get_rq_queue_name,
+    get_share_key,
+    parse_rq_queue_name,
+)
+from dioptra.worker.dioptra_worker_v1 import _get_worker_args
+from dioptra.worker.fair_share_worker import FairShareWorker
+
+
+class FakePipeline(object):
+    def __init__(self, lengths: dict[str, int]) -> None:
+        self._lengths = lengths
+        self._keys: list[str] = []
+
+    def llen(self, key: str) -> None:
+        self._keys.append(key)
+
+    def execute(self) -> list[Any]:
+        return [self._lengths[key.removeprefix("rq:queue:")] for key in self._keys]
+
+
+@pytest.fixture
+def worker() -> FairShareWorker:
+    return FairShareWorker(
+        ["cpu"],
+        connection=Redis.from_url("redis://localhost:1"),
+        prepare_for_work=False,
+    )
+
+
+@pytest.mark.parametrize(
+    "priority, share, expected",
+    [
+        ("default", None, "cpu"),
+        ("high", None, "cpu:high"),
+        ("low", None, "cpu:low"),
+        ("default", "user-1", "cpu:default:user-1"),
+        ("high", "group-2", "cpu:high:group-2"),
+    ],
+)
+def test_rq_queue_names(priority: str, share: str | None, expected: str) -> None:
+    name = get_rq_queue_name("cpu", priority, share)
+
+    assert name == expected
+    assert parse_rq_queue_name(name, "cpu") == (priority, share)
+
+
+def test_parse_rq_queue_name_ignores_other_queues() -> None:
+    assert parse_rq_queue_name("gpu:high", "cpu") is None
+    assert parse_rq_queue_name("cpu:urgent", "cpu") is None
+    assert parse_rq_queue_name("cpu:high:team-1", "cpu") is None
+
+
+def test_invalid_priority_and_fair_share_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        get_rq_queue_name("cpu", "urgent")
+
+    with pytest.raises(ValueError):
+        get_share_key("everyone", user_id=1, group_id=2)
+
+
+def test_share_keys() -> None:
+    assert get_share_key("none", user_id=1, group_id=2) is None
+    assert get_share_key("user", user_id=1, group_id=2) == "user-1"
+    assert get_share_key("group", user_id=1, group_id=2) == "group-2"
+
+
+def test_worker_orders_queues_by_priority_then_round_robin(
+    worker: FairShareWorker, monkeypatch
+) -> None:
+    names = [
+        "cpu",
+        "cpu:high",
+        "cpu:low",
+        "cpu:default:user-1",
+        "cpu:default:user-2",
+        "cpu:default:user-3",
+        "cpu:high:user-2",
+    ]
+    monkeypatch.setattr(
+        fair_share_worker, "find_rq_queue_names", lambda connection, queue: names
+    )
+    monkeypatch.setattr(
+        worker.connection,
+        "pipeline",
+        lambda: FakePipeline(
+            {
+                "cpu:default:user-1": 5000,
+                "cpu:default:user-2": 1,
+                "cpu:default:user-3": 0,
+                "cpu:high:user-2": 1,
+            }
+        ),
+    )
+
+    worker.refresh_queues()
+
+    # Submitter queues without waiting jobs are skipped
+    assert [queue.name for queue in worker._ordered_queues] == [
+        "cpu:high",
+        "cpu:high:user-2",
+        "cpu",
+        "cpu:default:user-1",
+        "cpu:default:user-2",
+        "cpu:low",
+    ]
+
+    # After serving user 1, user 2 goes first within the default priority
+    served = next(q for q in worker.queues if q.name == "cpu:default:user-1")
+    worker.reorder_queues(served)
+
+    assert [queue.name for queue in worker._ordered_queues] == [
+        "cpu:high",
+        "cpu:high:user-2",
+        "cpu:default:user-2",
+        "cpu",
+        "cpu:default:user-1",
+        "cpu:low",
+    ]
+
+
+def test_worker_cli_uses_fair_share_worker(monkeypatch) -> None:
+    monkeypatch.delenv("RQ_WORKER_CLASS", raising=False)
+
+    assert _get_worker_args(["cpu"])[:2] == [
+        "--worker-class",
+        "dioptra.worker.fair_share_worker.FairShareWorker",
+    ]
+    assert _get_worker_args(["-w", "rq.Worker", "cpu"]) == ["-w", "rq.Worker", "cpu"]